@@ -0,0 +1,46 @@
+"""Add expiry indexes for the batched session purge
+
+Revision ID: a7b8c9d0e1f3
+Revises: f6a7b8c9d0e2
+Create Date: 2026-10-18 18:00:00.000000
+
+"""
+
+from collections.abc import Sequence
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "a7b8c9d0e1f3"
+down_revision: str | None = "f6a7b8c9d0e2"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+_INDEXES = (
+    ("ix_auth_sessions_expires_at", "auth_sessions"),
+    ("idx_password_reset_tokens_expires_at", "auth_password_reset_tokens"),
+)
+
+
+def upgrade() -> None:
+    # Built concurrently, so logins are not blocked on large session tables
+    with op.get_context().autocommit_block():
+        for name, table in _INDEXES:
+            op.create_index(
+                name,
+                table,
+                ["expires_at"],
+                postgresql_concurrently=True,
+                if_not_exists=True,
+            )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        for name, table in reversed(_INDEXES):
+            op.drop_index(
+                name,
+                table_name=table,
+                postgresql_concurrently=True,
+                if_exists=True,
+            )
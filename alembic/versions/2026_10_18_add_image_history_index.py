@@ -0,0 +1,39 @@
+"""Add index for the keyset-paginated image history
+
+Revision ID: c9d0e1f2a3b5
+Revises: b8c9d0e1f2a4
+Create Date: 2026-10-18 21:00:00.000000
+
+"""
+
+from collections.abc import Sequence
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "c9d0e1f2a3b5"
+down_revision: str | None = "b8c9d0e1f2a4"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+_TABLE = "imagecreator_generated_images"
+_INDEX = "ix_imagecreator_generated_images_user_created"
+
+
+def upgrade() -> None:
+    # Built concurrently, the table may still hold the image data and be large
+    with op.get_context().autocommit_block():
+        op.create_index(
+            _INDEX,
+            _TABLE,
+            ["user_id", "created_at", "id"],
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            _INDEX, table_name=_TABLE, postgresql_concurrently=True, if_exists=True
+        )
@@ -0,0 +1,44 @@
+"""Add storage key of image data kept in the blob storage
+
+Revision ID: b8c9d0e1f2a4
+Revises: a7b8c9d0e1f3
+Create Date: 2026-10-18 19:00:00.000000
+
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "b8c9d0e1f2a4"
+down_revision: str | None = "a7b8c9d0e1f3"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+_TABLE = "imagecreator_generated_images"
+_INDEX = "ix_imagecreator_generated_images_storage_key"
+
+
+def upgrade() -> None:
+    op.add_column(_TABLE, sa.Column("storage_key", sa.String(100), nullable=True))
+    # Built concurrently, the table holds the image data and is large
+    with op.get_context().autocommit_block():
+        op.create_index(
+            _INDEX,
+            _TABLE,
+            ["storage_key"],
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+
+
+def downgrade() -> None:
+    # Rows with a storage key have no data in the database after this
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            _INDEX, table_name=_TABLE, postgresql_concurrently=True, if_exists=True
+        )
+    op.drop_column(_TABLE, "storage_key")
@@ -0,0 +1,56 @@
+"""Add MCP tool schema cache
+
+Revision ID: b2c3d4e5f6a8
+Revises: a1b2c3d4e5f7
+Create Date: 2026-10-18 10:00:00.000000
+
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "b2c3d4e5f6a8"
+down_revision: str | None = "a1b2c3d4e5f7"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    op.add_column(
+        "assistant_mcp_servers",
+        sa.Column("tool_cache_ttl_seconds", sa.Integer(), nullable=True),
+    )
+    op.create_table(
+        "assistant_mcp_tool_cache",
+        sa.Column("id", sa.Integer(), primary_key=True, autoincrement=True),
+        sa.Column("server_id", sa.Integer(), nullable=False),
+        sa.Column("user_id", sa.Integer(), nullable=False),
+        sa.Column("content_hash", sa.String(64), nullable=False),
+        sa.Column("tools", sa.JSON(), nullable=False),
+        sa.Column("fetched_at", sa.DateTime(timezone=True), nullable=False),
+    )
+    op.create_index(
+        "ix_assistant_mcp_tool_cache_server_id",
+        "assistant_mcp_tool_cache",
+        ["server_id"],
+    )
+    op.create_index(
+        "ix_mcp_tool_cache_unique",
+        "assistant_mcp_tool_cache",
+        ["server_id", "user_id"],
+        unique=True,
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_mcp_tool_cache_unique", table_name="assistant_mcp_tool_cache")
+    op.drop_index(
+        "ix_assistant_mcp_tool_cache_server_id",
+        table_name="assistant_mcp_tool_cache",
+    )
+    op.drop_table("assistant_mcp_tool_cache")
+    op.drop_column("assistant_mcp_servers", "tool_cache_ttl_seconds")
@@ -0,0 +1,30 @@
+"""Add password fingerprint to password history
+
+Revision ID: e5f6a7b8c9d1
+Revises: d4e5f6a7b8c0
+Create Date: 2026-10-18 16:00:00.000000
+
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "e5f6a7b8c9d1"
+down_revision: str | None = "d4e5f6a7b8c0"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    op.add_column(
+        "auth_password_history",
+        sa.Column("password_fingerprint", sa.String(64), nullable=True),
+    )
+
+
+def downgrade() -> None:
+    op.drop_column("auth_password_history", "password_fingerprint")
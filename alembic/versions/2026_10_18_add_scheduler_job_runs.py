@@ -0,0 +1,49 @@
+"""Add scheduler job runs
+
+Revision ID: d4e5f6a7b8c0
+Revises: c3d4e5f6a7b9
+Create Date: 2026-10-18 14:00:00.000000
+
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "d4e5f6a7b8c0"
+down_revision: str | None = "c3d4e5f6a7b9"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "scheduler_job_runs",
+        sa.Column("id", sa.Integer(), primary_key=True, autoincrement=True),
+        sa.Column("job_id", sa.String(100), nullable=False),
+        sa.Column("scheduled_at", sa.DateTime(timezone=True), nullable=True),
+        sa.Column("started_at", sa.DateTime(timezone=True), nullable=False),
+        sa.Column("duration_ms", sa.Float(), nullable=False),
+        sa.Column("lag_ms", sa.Float(), nullable=True),
+        sa.Column("status", sa.String(20), nullable=False),
+        sa.Column("rows_processed", sa.Integer(), nullable=True),
+        sa.Column("overran", sa.Boolean(), nullable=False, server_default=sa.false()),
+        sa.Column("error", sa.Text(), nullable=True),
+    )
+    op.create_index(
+        "ix_scheduler_job_runs_job_started",
+        "scheduler_job_runs",
+        ["job_id", "started_at"],
+    )
+    op.create_index(
+        "ix_scheduler_job_runs_started_at", "scheduler_job_runs", ["started_at"]
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_scheduler_job_runs_started_at", table_name="scheduler_job_runs")
+    op.drop_index("ix_scheduler_job_runs_job_started", table_name="scheduler_job_runs")
+    op.drop_table("scheduler_job_runs")
@@ -0,0 +1,29 @@
+"""Add base URL of the endpoint a skill was listed from
+
+Revision ID: d0e1f2a3b4c6
+Revises: c9d0e1f2a3b5
+Create Date: 2026-10-18 21:00:00.000000
+
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "d0e1f2a3b4c6"
+down_revision: str | None = "c9d0e1f2a3b5"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    op.add_column(
+        "assistant_skills", sa.Column("base_url", sa.String(500), nullable=True)
+    )
+
+
+def downgrade() -> None:
+    op.drop_column("assistant_skills", "base_url")
@@ -0,0 +1,48 @@
+"""Add trigram indexes for the user search
+
+Revision ID: f6a7b8c9d0e2
+Revises: e5f6a7b8c9d1
+Create Date: 2026-10-18 17:00:00.000000
+
+"""
+
+from collections.abc import Sequence
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "f6a7b8c9d0e2"
+down_revision: str | None = "e5f6a7b8c9d1"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+_TABLE = "auth_users"
+_COLUMNS = ("name", "email")
+
+
+def upgrade() -> None:
+    op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+    # Built concurrently, so sign-ups and profile edits are not blocked
+    with op.get_context().autocommit_block():
+        for column in _COLUMNS:
+            op.create_index(
+                f"ix_{_TABLE}_{column}_trgm",
+                _TABLE,
+                [column],
+                postgresql_using="gin",
+                postgresql_ops={column: "gin_trgm_ops"},
+                postgresql_concurrently=True,
+                if_not_exists=True,
+            )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        for column in reversed(_COLUMNS):
+            op.drop_index(
+                f"ix_{_TABLE}_{column}_trgm",
+                table_name=_TABLE,
+                postgresql_concurrently=True,
+                if_exists=True,
+            )
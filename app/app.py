@@ -5,6 +5,9 @@ from contextlib import AsyncExitStack, asynccontextmanager
 
 import reflex as rx
 from fastapi import FastAPI
+from reflex.event import Event
+from reflex.middleware import Middleware
+from reflex.state import BaseState
 from starlette.types import ASGIApp
 
 import appkit_mantine as am
@@ -13,15 +16,29 @@ from appkit_assistant.backend.api.mcp_apps_api import (
     router as mcp_apps_router,
 )
 from appkit_assistant.backend.services.file_cleanup_service import FileCleanupService
+from appkit_assistant.backend.services.skill_sync_service import SkillSyncService
 from appkit_assistant.pages import mcp_oauth_callback_page  # noqa: F401
-from appkit_commons.middleware import ForceHTTPSMiddleware
+from appkit_commons.configuration.snapshot import (
+    ConfigSnapshot,
+    ConfigurationSnapshots,
+)
+from appkit_commons.database.instrumentation import track_task_queries
+from appkit_commons.middleware import ForceHTTPSMiddleware, QueryTrackingMiddleware
 from appkit_commons.registry import service_registry
-from appkit_commons.scheduler import PGQueuerScheduler
+from appkit_commons.scheduler import JobHistoryRetentionService, PGQueuerScheduler
 from appkit_imagecreator.backend.generator_registry import generator_registry
 from appkit_imagecreator.backend.image_api import router as image_api_router
+from appkit_imagecreator.backend.image_loader import image_loader
 from appkit_imagecreator.backend.services.image_cleanup_service import (
     ImageCleanupService,
 )
+from appkit_imagecreator.backend.services.image_storage_migration_service import (
+    ImageStorageMigrationService,
+)
+from appkit_imagecreator.backend.storage.factory import (
+    get_blob_storage,
+    reset_blob_storage,
+)
 from appkit_mcp_bpmn.server import create_bpmn_mcp_server
 from appkit_mcp_charts.server import create_charts_mcp_server
 from appkit_mcp_image.auth import get_verifier
@@ -30,6 +47,10 @@ from appkit_mcp_image.server import create_image_mcp_server
 from appkit_mcp_user.server import create_user_mcp_server
 from appkit_user.authentication.backend.services import (
     SessionCleanupService,
+    close_oauth_service,
+)
+from appkit_user.authentication.backend.session_cache import (
+    configure_session_cache,
 )
 from appkit_user.authentication.pages import (  # noqa: F401
     azure_oauth_callback_page,
@@ -42,7 +63,9 @@ from appkit_user.user_management.pages import (
     create_profile_page,
 )
 
+from app import configuration
 from app.components.navbar import app_navbar
+from app.configuration import ENV_FILE, AppConfig
 
 # Import pages to ensure they are registered
 from app.pages.assistant.admin_assistant import admin_assistant_page  # noqa: F401
@@ -177,6 +200,23 @@ def init_mcp_apps() -> dict[str, ASGIApp]:
 _mcp_apps = init_mcp_apps()
 
 
+async def _apply_reloaded_configuration(
+    old: ConfigSnapshot[AppConfig], new: ConfigSnapshot[AppConfig]
+) -> None:
+    """Re-derive the services that are built once from the configuration.
+
+    Everything else reads the registry on use. Scheduler intervals, the
+    database engine and the MCP servers still need a restart.
+    """
+    if new.app.authentication != old.app.authentication:
+        configure_session_cache(new.app.authentication)
+    old_images, new_images = old.app.imagegenerator, new.app.imagegenerator
+    old_storage = old_images.storage if old_images else None
+    new_storage = new_images.storage if new_images else None
+    if new_storage != old_storage:
+        await reset_blob_storage()
+
+
 @asynccontextmanager
 async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:  # noqa: ARG001
     """Handle application lifespan events (startup and shutdown)."""
@@ -189,16 +229,41 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:  # noqa: ARG001
         await ai_model_registry.initialize()
         await generator_registry.initialize()
 
+        # Reload configuration changes without restarting the workers
+        config_snapshots = ConfigurationSnapshots(
+            AppConfig,
+            env_file=ENV_FILE,
+            initial=configuration,
+            poll_seconds=configuration.app.config_reload_seconds,
+        )
+        config_snapshots.subscribe(_apply_reloaded_configuration)
+        service_registry().register(config_snapshots)
+        config_snapshots.start()
+
+        # All services are registered; make lookups a single dict access
+        service_registry().freeze()
+
         # Start job scheduler
         scheduler = PGQueuerScheduler()
         scheduler.add_service(FileCleanupService())
-        scheduler.add_service(SessionCleanupService(interval_minutes=30))
+        scheduler.add_service(SessionCleanupService())
         scheduler.add_service(ImageCleanupService())
+        if get_blob_storage() is not None:
+            scheduler.add_service(ImageStorageMigrationService())
+        skill_sync = SkillSyncService()
+        if skill_sync.interval_minutes > 0:
+            scheduler.add_service(skill_sync)
+        scheduler.add_service(JobHistoryRetentionService())
         await scheduler.start()
 
         yield
 
         await scheduler.shutdown()
+        await config_snapshots.stop()
+        await image_loader.close()
+        await close_oauth_service()
+        if (blob_storage := get_blob_storage()) is not None:
+            await blob_storage.close()
 
 
 # Create FastAPI app for custom API routes
@@ -217,9 +282,28 @@ def add_https_middleware(asgi_app: ASGIApp) -> ASGIApp:
     return ForceHTTPSMiddleware(asgi_app)
 
 
+def add_query_tracking_middleware(asgi_app: ASGIApp) -> ASGIApp:
+    """Wrap the ASGI app with per-request SQL statement tracking."""
+    return QueryTrackingMiddleware(asgi_app)
+
+
+class QueryTrackingEventMiddleware(Middleware):
+    """Attribute the SQL statements of each Reflex event to that event."""
+
+    async def preprocess(
+        self,
+        app: rx.App,  # noqa: ARG002
+        state: BaseState,  # noqa: ARG002
+        event: Event,
+    ) -> None:
+        # Reflex runs every event in its own task; the scope ends with it
+        track_task_queries(event.name)
+
+
 app = rx.App(
     stylesheets=base_stylesheets,
     style=base_style,
-    api_transformer=[api_app, add_https_middleware],
+    api_transformer=[api_app, add_query_tracking_middleware, add_https_middleware],
 )
+app.add_middleware(QueryTrackingEventMiddleware())
 app.register_lifespan_task(lifespan)
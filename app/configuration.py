@@ -15,6 +15,8 @@ from appkit_user.configuration import AuthenticationConfiguration
 
 logger = logging.getLogger(__name__)
 
+ENV_FILE = "/.env"
+
 
 class AppConfig(ApplicationConfig):
     authentication: AuthenticationConfiguration
@@ -30,5 +32,5 @@ def configure() -> Configuration[AppConfig]:
     logger.debug("--- Configuring application settings ---")
     return service_registry().configure(
         AppConfig,
-        env_file="/.env",
+        env_file=ENV_FILE,
     )
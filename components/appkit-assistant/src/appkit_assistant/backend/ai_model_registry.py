@@ -102,7 +102,10 @@ def _register_openai_client_service(
         )
         return
 
-    service_registry().register_as(
+    registry = service_registry()
+    # Models are reloaded at runtime, after the registry has been frozen
+    registry.allow_late_registration(OpenAIClientService)
+    registry.register_as(
         OpenAIClientService,
         OpenAIClientService(
             api_key=openai_model.api_key,
@@ -15,11 +15,12 @@ import logging
 from typing import Annotated, Any
 
 from fastapi import APIRouter, Cookie, Header, HTTPException
-from fastapi.responses import HTMLResponse
+from fastapi.responses import HTMLResponse, Response
 from pydantic import BaseModel
 
 from appkit_assistant.backend.database.models import MCPServer
 from appkit_assistant.backend.database.repositories import mcp_server_repo
+from appkit_assistant.backend.mcp_resource_cache import etag_matches
 from appkit_assistant.backend.services.mcp_apps_service import (
     McpAppsService,
 )
@@ -122,26 +123,35 @@ async def get_resource(
     uri: str,
     x_user_id: Annotated[str | None, Header()] = None,
     reflex_session: Annotated[str | None, Cookie()] = None,
-) -> HTMLResponse:
+    if_none_match: Annotated[str | None, Header()] = None,
+) -> Response:
     """Fetch an MCP App resource (HTML content) from a server.
 
     Returns the HTML content with text/html content type.
     Resource metadata (CSP, prefersBorder) is forwarded as X-MCP-* headers
     so the McpAppBridge frontend can apply security policies and visual
     preferences without parsing the HTML body.
+
+    Responses carry a strong ETag; a matching ``If-None-Match`` yields a
+    304 without a body. Resources the MCP server declares as versioned are
+    cached by the browser as immutable.
     """
     user_id = _extract_user_id(x_user_id, reflex_session)
     server = await _get_server(server_id)
 
-    resource = await _get_mcp_apps_service().fetch_resource(server, user_id, uri)
-    if not resource:
+    entry = await _get_mcp_apps_service().get_resource(server, user_id, uri)
+    if not entry:
         raise HTTPException(
             status_code=502,
             detail="Failed to fetch resource from MCP server",
         )
+    resource = entry.resource
 
     extra_headers: dict[str, str] = {
         "X-MCP-Resource-URI": resource.uri,
+        "ETag": entry.etag,
+        "Cache-Control": entry.cache_control,
+        "Vary": "X-User-Id",
     }
     if resource.csp is not None:
         extra_headers["X-MCP-CSP"] = _json.dumps(resource.csp)
@@ -150,6 +160,9 @@ async def get_resource(
     if resource.prefers_border is not None:
         extra_headers["X-MCP-Prefers-Border"] = str(resource.prefers_border).lower()
 
+    if etag_matches(if_none_match, entry.etag):
+        return Response(status_code=304, headers=extra_headers)
+
     return HTMLResponse(
         content=resource.html_content,
         headers=extra_headers,
@@ -2,7 +2,7 @@ import json
 from datetime import UTC, datetime
 from typing import Any
 
-from sqlalchemy import DateTime, Index, Integer, String, Text
+from sqlalchemy import JSON, DateTime, Index, Integer, String, Text
 from sqlalchemy.orm import Mapped, mapped_column
 from sqlalchemy.sql import func
 
@@ -57,6 +57,8 @@ class MCPServer(Base):
     required_role: Mapped[str | None] = mapped_column(default=None)
 
     inject_user_id: Mapped[bool] = mapped_column(default=True, nullable=False)
+    # Overrides the default TTL for cached tool schemas; None uses the default
+    tool_cache_ttl_seconds: Mapped[int | None] = mapped_column(default=None)
 
 
 class SystemPrompt(Base):
@@ -134,6 +136,26 @@ class AssistantMCPUserToken(Base):
     )
 
 
+class MCPToolSchemaCache(Base):
+    """Last-known UI tool schemas of an MCP server, per user."""
+
+    __tablename__ = "assistant_mcp_tool_cache"
+    __table_args__ = (
+        Index("ix_mcp_tool_cache_unique", "server_id", "user_id", unique=True),
+    )
+
+    id: Mapped[int] = mapped_column(primary_key=True, autoincrement=True)
+    server_id: Mapped[int] = mapped_column(index=True, nullable=False)
+    user_id: Mapped[int] = mapped_column(nullable=False)
+    content_hash: Mapped[str] = mapped_column(String(64), nullable=False)
+    tools: Mapped[list[dict[str, Any]]] = mapped_column(
+        JSON, default=list, nullable=False
+    )
+    fetched_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), default=lambda: datetime.now(UTC), nullable=False
+    )
+
+
 class AssistantFileUpload(Base):
     """Model for tracking files uploaded to OpenAI for vector search."""
 
@@ -166,6 +188,20 @@ class AssistantFileUpload(Base):
     )
 
 
+class AssistantCleanupCheckpoint(Base):
+    """Progress of an interrupted cleanup run, used to resume it."""
+
+    __tablename__ = "assistant_cleanup_checkpoints"
+
+    id: Mapped[int] = mapped_column(primary_key=True, autoincrement=True)
+    job_id: Mapped[str] = mapped_column(String(100), unique=True, nullable=False)
+    ai_model: Mapped[str] = mapped_column(String(100), default="", nullable=False)
+    last_vector_store_id: Mapped[str | None] = mapped_column(String(255), nullable=True)
+    updated_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), default=lambda: datetime.now(UTC), nullable=False
+    )
+
+
 class UserPrompt(Base):
     """Model for user-defined prompts."""
 
@@ -216,6 +252,7 @@ class Skill(Base):
     api_key_hash: Mapped[str | None] = mapped_column(
         String(64), default=None, index=True
     )
+    base_url: Mapped[str | None] = mapped_column(String(500), default=None)
     last_synced: Mapped[datetime] = mapped_column(
         DateTime(timezone=True), default=lambda: datetime.now(UTC), nullable=False
     )
@@ -1,18 +1,26 @@
 """Repository for MCP server data access operations."""
 
 import logging
+from collections.abc import Iterable
 from datetime import UTC, datetime
 from typing import Any
 
-from sqlalchemy import or_, select
+from sqlalchemy import (
+    ColumnElement,
+    or_,
+    select,
+    tuple_,
+)
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import defer
 
 from appkit_assistant.backend.database.models import (
     AssistantAIModel,
+    AssistantCleanupCheckpoint,
     AssistantFileUpload,
     AssistantThread,
     MCPServer,
+    MCPToolSchemaCache,
     Skill,
     SystemPrompt,
     UserPrompt,
@@ -50,6 +58,72 @@ class MCPServerRepository(BaseRepository[MCPServer, AsyncSession]):
         return list(result.scalars().all())
 
 
+class MCPToolCacheRepository(BaseRepository[MCPToolSchemaCache, AsyncSession]):
+    """Repository class for persisted MCP tool schema cache entries."""
+
+    @property
+    def model_class(self) -> type[MCPToolSchemaCache]:
+        return MCPToolSchemaCache
+
+    async def find_by_server_and_user(
+        self, session: AsyncSession, server_id: int, user_id: int
+    ) -> MCPToolSchemaCache | None:
+        """Retrieve the cached tool schemas of a server for a user."""
+        stmt = select(MCPToolSchemaCache).where(
+            MCPToolSchemaCache.server_id == server_id,
+            MCPToolSchemaCache.user_id == user_id,
+        )
+        result = await session.execute(stmt)
+        return result.scalars().first()
+
+    async def upsert(
+        self,
+        session: AsyncSession,
+        server_id: int,
+        user_id: int,
+        content_hash: str,
+        tools: list[dict[str, Any]],
+        fetched_at: datetime | None = None,
+    ) -> None:
+        """Insert or replace the cached tool schemas with one statement."""
+        await self.bulk_upsert(
+            session,
+            [
+                {
+                    "server_id": server_id,
+                    "user_id": user_id,
+                    "content_hash": content_hash,
+                    "tools": tools,
+                    "fetched_at": fetched_at or datetime.now(UTC),
+                }
+            ],
+            conflict_keys=["server_id", "user_id"],
+        )
+
+    async def touch(
+        self,
+        session: AsyncSession,
+        server_id: int,
+        user_id: int,
+        fetched_at: datetime | None = None,
+    ) -> None:
+        """Mark unchanged cached tool schemas as freshly validated."""
+        await self.bulk_update(
+            session,
+            [
+                MCPToolSchemaCache.server_id == server_id,
+                MCPToolSchemaCache.user_id == user_id,
+            ],
+            {"fetched_at": fetched_at or datetime.now(UTC)},
+        )
+
+    async def delete_by_server_id(self, session: AsyncSession, server_id: int) -> int:
+        """Delete all cached tool schemas of a server."""
+        return await self.bulk_delete(
+            session, MCPToolSchemaCache.server_id == server_id
+        )
+
+
 class SystemPromptRepository(BaseRepository[SystemPrompt, AsyncSession]):
     """Repository class for system prompt database operations.
 
@@ -195,18 +269,28 @@ class ThreadRepository(BaseRepository[AssistantThread, AsyncSession]):
         Returns:
             Number of threads updated.
         """
-        stmt = select(AssistantThread).where(
-            AssistantThread.vector_store_id == vector_store_id
+        return await self.bulk_update(
+            session,
+            AssistantThread.vector_store_id == vector_store_id,
+            {"vector_store_id": None},
         )
-        result = await session.execute(stmt)
-        threads = list(result.scalars().all())
 
-        for thread in threads:
-            thread.vector_store_id = None
-            session.add(thread)
+    async def clear_vector_store_ids(
+        self, session: AsyncSession, vector_store_ids: Iterable[str]
+    ) -> int:
+        """Clear vector_store_id from all threads referencing any of the stores.
 
-        await session.flush()
-        return len(threads)
+        Returns:
+            Number of threads updated.
+        """
+        ids = list(vector_store_ids)
+        if not ids:
+            return 0
+        return await self.bulk_update(
+            session,
+            AssistantThread.vector_store_id.in_(ids),
+            {"vector_store_id": None},
+        )
 
 
 class FileUploadRepository(BaseRepository[AssistantFileUpload, AsyncSession]):
@@ -323,6 +407,68 @@ class FileUploadRepository(BaseRepository[AssistantFileUpload, AsyncSession]):
         await session.flush()
         return files
 
+    async def delete_by_openai_file_ids(
+        self, session: AsyncSession, openai_file_ids: Iterable[str]
+    ) -> int:
+        """Delete all upload records of the given OpenAI files in one statement.
+
+        Returns:
+            Number of deleted records.
+        """
+        ids = list(openai_file_ids)
+        if not ids:
+            return 0
+        return await self.bulk_delete(
+            session, AssistantFileUpload.openai_file_id.in_(ids)
+        )
+
+
+class CleanupCheckpointRepository(
+    BaseRepository[AssistantCleanupCheckpoint, AsyncSession]
+):
+    """Repository class for resumable cleanup checkpoints."""
+
+    @property
+    def model_class(self) -> type[AssistantCleanupCheckpoint]:
+        return AssistantCleanupCheckpoint
+
+    async def find_by_job(
+        self, session: AsyncSession, job_id: str
+    ) -> AssistantCleanupCheckpoint | None:
+        """Retrieve the checkpoint of a job, if a run was interrupted."""
+        stmt = select(AssistantCleanupCheckpoint).where(
+            AssistantCleanupCheckpoint.job_id == job_id
+        )
+        result = await session.execute(stmt)
+        return result.scalars().first()
+
+    async def save(
+        self,
+        session: AsyncSession,
+        job_id: str,
+        ai_model: str,
+        last_vector_store_id: str | None,
+    ) -> None:
+        """Insert or replace the checkpoint of a job with one statement."""
+        await self.bulk_upsert(
+            session,
+            [
+                {
+                    "job_id": job_id,
+                    "ai_model": ai_model,
+                    "last_vector_store_id": last_vector_store_id,
+                    "updated_at": datetime.now(UTC),
+                }
+            ],
+            conflict_keys=["job_id"],
+        )
+
+    async def delete_by_job(self, session: AsyncSession, job_id: str) -> int:
+        """Delete the checkpoint of a job after a completed run."""
+        return await self.bulk_delete(
+            session, AssistantCleanupCheckpoint.job_id == job_id
+        )
+
 
 class UserPromptRepository(BaseRepository[UserPrompt, AsyncSession]):
     """Repository for user prompts (single table design)."""
@@ -572,68 +718,108 @@ class UserPromptRepository(BaseRepository[UserPrompt, AsyncSession]):
         await session.flush()
         return True
 
-    async def find_all_accessible_prompts_filtered(
-        self, session: AsyncSession, user_id: int, filter_text: str = ""
-    ) -> list[dict[str, Any]]:
-        """Find all prompts accessible to the user, filtered by handle.
-
-        Returns user's own prompts and shared prompts from others.
-        Filters by handle.startswith(filter_text) if provided.
-
-        Returns list of dicts with handle, description, prompt_text, mcp_server_ids,
-        is_own.
-        """
-        # Query own prompts
-        own_stmt = select(UserPrompt).where(
+    @staticmethod
+    def _accessible_to(user_id: int) -> ColumnElement[bool]:
+        """Latest prompt versions owned by the user or shared by anyone."""
+        return (UserPrompt.is_latest == True) & or_(  # noqa: E712
             UserPrompt.user_id == user_id,
-            UserPrompt.is_latest == True,  # noqa: E712
+            UserPrompt.is_shared == True,  # noqa: E712
         )
-        if filter_text:
-            own_stmt = own_stmt.where(UserPrompt.handle.startswith(filter_text))
-        own_stmt = own_stmt.order_by(UserPrompt.handle)
 
-        own_result = await session.execute(own_stmt)
-        own_prompts = own_result.scalars().all()
+    @staticmethod
+    def _to_accessible_dict(prompt: UserPrompt, user_id: int) -> dict[str, Any]:
+        return {
+            "id": prompt.id,
+            "user_id": prompt.user_id,
+            "handle": prompt.handle,
+            "description": prompt.description,
+            "prompt_text": prompt.prompt_text,
+            "mcp_server_ids": list(prompt.mcp_server_ids),
+            "skill_ids": list(prompt.skill_ids),
+            "is_own": prompt.user_id == user_id,
+        }
+
+    async def find_latest_accessible_by_handles(
+        self, session: AsyncSession, user_id: int, handles: Iterable[str]
+    ) -> dict[str, UserPrompt]:
+        """Resolve several handles to accessible prompts in a single query.
+
+        Prefers the user's own prompt if both exist with the same handle.
+        Handles without an accessible prompt are missing from the result.
+        """
+        unique_handles = sorted(set(handles))
+        if not unique_handles:
+            return {}
 
-        # Query shared prompts from others
-        shared_stmt = select(UserPrompt).where(
-            UserPrompt.is_shared == True,  # noqa: E712
-            UserPrompt.user_id != user_id,
-            UserPrompt.is_latest == True,  # noqa: E712
+        stmt = (
+            select(UserPrompt)
+            .where(
+                UserPrompt.handle.in_(unique_handles),
+                self._accessible_to(user_id),
+            )
+            # Prefer user's own prompt over shared ones
+            .order_by((UserPrompt.user_id == user_id).desc(), UserPrompt.id)
         )
-        if filter_text:
-            shared_stmt = shared_stmt.where(UserPrompt.handle.startswith(filter_text))
-        shared_stmt = shared_stmt.order_by(UserPrompt.handle)
+        result = await session.execute(stmt)
+        resolved: dict[str, UserPrompt] = {}
+        for prompt in result.scalars():
+            resolved.setdefault(prompt.handle, prompt)
+        return resolved
 
-        shared_result = await session.execute(shared_stmt)
-        shared_prompts = shared_result.scalars().all()
+    async def find_accessible_prompts_page(
+        self,
+        session: AsyncSession,
+        user_id: int,
+        prefix: str = "",
+        limit: int = 50,
+        after: tuple[str, int] | None = None,
+    ) -> list[dict[str, Any]]:
+        """Keyset-paginated listing of prompts accessible to the user.
 
-        # Combine and return as dicts
-        result: list[dict[str, Any]] = [
-            {
-                "handle": p.handle,
-                "description": p.description,
-                "prompt_text": p.prompt_text,
-                "mcp_server_ids": list(p.mcp_server_ids),
-                "skill_ids": list(p.skill_ids),
-                "is_own": True,
-            }
-            for p in own_prompts
-        ]
+        Rows are ordered by ``(handle, id)``. Pass the ``(handle, id)`` of the
+        last row of a page as ``after`` to fetch the next page; this keeps
+        deep pages as cheap as the first one for large shared libraries.
 
-        result.extend(
-            {
-                "handle": p.handle,
-                "description": p.description,
-                "prompt_text": p.prompt_text,
-                "mcp_server_ids": list(p.mcp_server_ids),
-                "skill_ids": list(p.skill_ids),
-                "is_own": False,
-            }
-            for p in shared_prompts
+        Returns list of dicts with id, user_id, handle, description,
+        prompt_text, mcp_server_ids, skill_ids, is_own.
+        """
+        stmt = select(UserPrompt).where(self._accessible_to(user_id))
+        if prefix:
+            stmt = stmt.where(UserPrompt.handle.startswith(prefix, autoescape=True))
+        if after is not None:
+            stmt = stmt.where(tuple_(UserPrompt.handle, UserPrompt.id) > tuple_(*after))
+        stmt = stmt.order_by(UserPrompt.handle, UserPrompt.id).limit(limit)
+
+        result = await session.execute(stmt)
+        return [self._to_accessible_dict(p, user_id) for p in result.scalars()]
+
+    async def find_all_accessible_prompts_filtered(
+        self,
+        session: AsyncSession,
+        user_id: int,
+        filter_text: str = "",
+        limit: int | None = None,
+    ) -> list[dict[str, Any]]:
+        """Find all prompts accessible to the user, filtered by handle.
+
+        Returns user's own prompts followed by shared prompts from others,
+        each group ordered by handle, using a single query.
+        Filters by handle.startswith(filter_text) if provided.
+
+        Returns list of dicts with id, user_id, handle, description,
+        prompt_text, mcp_server_ids, skill_ids, is_own.
+        """
+        stmt = select(UserPrompt).where(self._accessible_to(user_id))
+        if filter_text:
+            stmt = stmt.where(UserPrompt.handle.startswith(filter_text))
+        stmt = stmt.order_by(
+            (UserPrompt.user_id == user_id).desc(), UserPrompt.handle, UserPrompt.id
         )
+        if limit is not None:
+            stmt = stmt.limit(limit)
 
-        return result
+        result = await session.execute(stmt)
+        return [self._to_accessible_dict(p, user_id) for p in result.scalars()]
 
 
 class SkillRepository(BaseRepository[Skill, AsyncSession]):
@@ -708,6 +894,79 @@ class SkillRepository(BaseRepository[Skill, AsyncSession]):
         result = await session.execute(stmt)
         return list(result.scalars().all())
 
+    async def bulk_upsert_remote(
+        self,
+        session: AsyncSession,
+        remote_skills: list[dict[str, Any]],
+        api_key_hash: str | None = None,
+        synced_at: datetime | None = None,
+        base_url: str | None = None,
+    ) -> int:
+        """Insert or update remote skills with INSERT ... ON CONFLICT.
+
+        OpenAI is the leading source — rows match by openai_id only. Existing
+        rows keep their ``active`` flag, ``required_role`` and, when no
+        *api_key_hash* is given, their current ``api_key_hash`` and
+        ``base_url``.
+
+        Returns the number of rows written.
+        """
+        if not remote_skills:
+            return 0
+
+        now = synced_at or datetime.now(UTC)
+        rows = [
+            {
+                "openai_id": remote["id"],
+                "name": remote["name"],
+                "description": remote["description"],
+                "default_version": remote["default_version"],
+                "latest_version": remote["latest_version"],
+                "active": True,
+                "api_key_hash": api_key_hash,
+                "base_url": base_url,
+                "last_synced": now,
+            }
+            for remote in {r["id"]: r for r in remote_skills}.values()
+        ]
+
+        update_columns = [
+            "name",
+            "description",
+            "default_version",
+            "latest_version",
+            "last_synced",
+        ]
+        if api_key_hash:
+            update_columns.extend(["api_key_hash", "base_url"])
+        return await self.bulk_upsert(
+            session, rows, conflict_keys=["openai_id"], update_columns=update_columns
+        )
+
+    async def deactivate_missing(
+        self,
+        session: AsyncSession,
+        keep_openai_ids: Iterable[str],
+        api_key_hash: str | None = None,
+        base_url: str | None = None,
+    ) -> int:
+        """Deactivate active skills not contained in *keep_openai_ids*.
+
+        When *api_key_hash* is given, only skills listed with that API key
+        against *base_url* are affected, so the same key configured for
+        another endpoint keeps its skills. Runs as a single set-based UPDATE.
+
+        Returns the number of deactivated skills.
+        """
+        criteria: list[ColumnElement[bool]] = [
+            Skill.active == True,  # noqa: E712
+            Skill.openai_id.not_in(list(keep_openai_ids)),
+        ]
+        if api_key_hash:
+            criteria.append(Skill.api_key_hash == api_key_hash)
+            criteria.append(Skill.base_url.is_not_distinct_from(base_url))
+        return await self.bulk_update(session, criteria, {"active": False})
+
 
 class UserSkillRepository(BaseRepository[UserSkillSelection, AsyncSession]):
     """Repository for user skill selection operations."""
@@ -880,9 +1139,11 @@ class AIModelRepository(BaseRepository[AssistantAIModel, AsyncSession]):
 
 # Export instances
 mcp_server_repo = MCPServerRepository()
+mcp_tool_cache_repo = MCPToolCacheRepository()
 system_prompt_repo = SystemPromptRepository()
 thread_repo = ThreadRepository()
 file_upload_repo = FileUploadRepository()
+cleanup_checkpoint_repo = CleanupCheckpointRepository()
 user_prompt_repo = UserPromptRepository()
 skill_repo = SkillRepository()
 user_skill_repo = UserSkillRepository()
@@ -0,0 +1,129 @@
+import hashlib
+import json
+import logging
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Final
+
+from appkit_assistant.backend.schemas import McpAppResource
+
+logger = logging.getLogger(__name__)
+
+# Maximum number of (server, user, uri) resources kept per process (LRU).
+MAX_CACHED_RESOURCES: Final[int] = 256
+# Browsers may keep versioned resources for a year without revalidating.
+IMMUTABLE_MAX_AGE_SECONDS: Final[int] = 31_536_000
+
+# (server_id, user_id, uri); user_id is 0 for resources shared by all users
+ResourceCacheKey = tuple[int, int, str]
+SHARED_USER_ID: Final[int] = 0
+
+
+def compute_resource_etag(resource: McpAppResource) -> str:
+    """Return a strong ETag for the body and metadata of a resource."""
+    payload = json.dumps(
+        resource.model_dump(mode="json", exclude={"uri"}),
+        sort_keys=True,
+        separators=(",", ":"),
+    )
+    return f'"{hashlib.sha256(payload.encode()).hexdigest()}"'
+
+
+def etag_matches(if_none_match: str | None, etag: str) -> bool:
+    """Check an ``If-None-Match`` header against an ETag.
+
+    Uses the weak comparison required for ``If-None-Match`` (RFC 9110),
+    so ``W/`` prefixes added by intermediaries still match.
+    """
+    if not if_none_match:
+        return False
+    for raw in if_none_match.split(","):
+        candidate = raw.strip()
+        if candidate == "*":
+            return True
+        if candidate.removeprefix("W/") == etag:
+            return True
+    return False
+
+
+@dataclass(frozen=True, slots=True)
+class CachedResource:
+    """A fetched MCP App resource with its validator."""
+
+    resource: McpAppResource
+    etag: str
+    fetched_at: float
+    ttl_seconds: int
+
+    @property
+    def immutable(self) -> bool:
+        return self.resource.versioned
+
+    @property
+    def cache_control(self) -> str:
+        """Cache-Control header value for browser caching."""
+        if self.immutable:
+            return f"private, max-age={IMMUTABLE_MAX_AGE_SECONDS}, immutable"
+        return "private, no-cache"
+
+    def is_fresh(self, now: float | None = None) -> bool:
+        if self.immutable:
+            return True
+        now = time.monotonic() if now is None else now
+        return now - self.fetched_at < self.ttl_seconds
+
+
+class McpResourceCache:
+    """Bounded per-process cache of MCP App resources.
+
+    Versioned resources never expire; others are refetched after their TTL
+    and keep their ETag as long as the content hash does not change.
+    """
+
+    def __init__(self, max_entries: int = MAX_CACHED_RESOURCES) -> None:
+        self._max_entries = max_entries
+        self._entries: OrderedDict[ResourceCacheKey, CachedResource] = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get_fresh(self, key: ResourceCacheKey) -> CachedResource | None:
+        """Get an entry if it is still fresh and mark it as recently used."""
+        entry = self._entries.get(key)
+        if entry is None or not entry.is_fresh():
+            return None
+        self._entries.move_to_end(key)
+        return entry
+
+    def put(
+        self,
+        key: ResourceCacheKey,
+        resource: McpAppResource,
+        ttl_seconds: int,
+    ) -> CachedResource:
+        """Store a fetched resource and return its cache entry."""
+        entry = CachedResource(
+            resource=resource,
+            etag=compute_resource_etag(resource),
+            fetched_at=time.monotonic(),
+            ttl_seconds=ttl_seconds,
+        )
+        previous = self._entries.get(key)
+        if previous is not None and previous.etag != entry.etag:
+            logger.debug("Resource %s on server %d changed", key[2], key[0])
+
+        self._entries[key] = entry
+        self._entries.move_to_end(key)
+        while len(self._entries) > self._max_entries:
+            self._entries.popitem(last=False)
+        return entry
+
+    def invalidate_server(self, server_id: int) -> None:
+        """Drop all resources of a server."""
+        for key in [k for k in self._entries if k[0] == server_id]:
+            del self._entries[key]
+
+    def clear(self) -> None:
+        """Drop all entries."""
+        self._entries.clear()
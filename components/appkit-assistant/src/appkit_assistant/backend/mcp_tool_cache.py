@@ -0,0 +1,125 @@
+import hashlib
+import json
+import logging
+import time
+from collections import OrderedDict
+from collections.abc import Sequence
+from dataclasses import dataclass, replace
+from typing import Final
+
+from appkit_assistant.backend.schemas import McpAppToolInfo
+
+logger = logging.getLogger(__name__)
+
+# Default TTL for cached tool metadata; servers may override it.
+DEFAULT_TOOL_CACHE_TTL_SECONDS: Final[int] = 300
+# Maximum number of (server, user) entries kept per process (LRU).
+MAX_CACHED_TOOL_LISTS: Final[int] = 512
+
+ToolCacheKey = tuple[int, int]
+
+
+def compute_tools_hash(tools: Sequence[McpAppToolInfo]) -> str:
+    """Return a stable SHA-256 hash (hex) of a tool list."""
+    payload = json.dumps(
+        sorted((tool.model_dump(mode="json") for tool in tools), key=str),
+        sort_keys=True,
+        separators=(",", ":"),
+    )
+    return hashlib.sha256(payload.encode()).hexdigest()
+
+
+@dataclass(frozen=True, slots=True)
+class CachedTools:
+    """Tool list of one (server, user) pair with its validation metadata."""
+
+    tools: tuple[McpAppToolInfo, ...]
+    content_hash: str
+    validated_at: float
+    ttl_seconds: int
+
+    def is_fresh(self, now: float | None = None) -> bool:
+        now = time.monotonic() if now is None else now
+        return now - self.validated_at < self.ttl_seconds
+
+
+class McpToolCache:
+    """Bounded per-process cache of discovered MCP UI tools.
+
+    Features:
+    - LRU bound on the number of cached (server, user) entries
+    - Per-entry TTL, taken from the server configuration
+    - Content hash so revalidation can tell changed from unchanged lists
+    - Invalidation per server when its configuration changes or it is deleted
+    """
+
+    def __init__(self, max_entries: int = MAX_CACHED_TOOL_LISTS) -> None:
+        self._max_entries = max_entries
+        self._entries: OrderedDict[ToolCacheKey, CachedTools] = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, key: object) -> bool:
+        return key in self._entries
+
+    def get(self, key: ToolCacheKey) -> CachedTools | None:
+        """Get an entry, fresh or stale, and mark it as recently used."""
+        entry = self._entries.get(key)
+        if entry is not None:
+            self._entries.move_to_end(key)
+        return entry
+
+    def get_fresh(self, key: ToolCacheKey) -> list[McpAppToolInfo] | None:
+        """Get the tools of an entry only if it is within its TTL."""
+        entry = self.get(key)
+        if entry is None or not entry.is_fresh():
+            return None
+        return list(entry.tools)
+
+    def put(
+        self,
+        key: ToolCacheKey,
+        tools: Sequence[McpAppToolInfo],
+        ttl_seconds: int = DEFAULT_TOOL_CACHE_TTL_SECONDS,
+        content_hash: str | None = None,
+        validated_at: float | None = None,
+    ) -> bool:
+        """Store a tool list.
+
+        Returns:
+            True if the content changed compared to the cached entry.
+        """
+        content_hash = content_hash or compute_tools_hash(tools)
+        validated_at = time.monotonic() if validated_at is None else validated_at
+        previous = self._entries.get(key)
+
+        if previous is not None and previous.content_hash == content_hash:
+            self._entries[key] = replace(
+                previous, validated_at=validated_at, ttl_seconds=ttl_seconds
+            )
+            changed = False
+        else:
+            self._entries[key] = CachedTools(
+                tools=tuple(tools),
+                content_hash=content_hash,
+                validated_at=validated_at,
+                ttl_seconds=ttl_seconds,
+            )
+            changed = True
+
+        self._entries.move_to_end(key)
+        while len(self._entries) > self._max_entries:
+            evicted, _ = self._entries.popitem(last=False)
+            logger.debug("Evicted tool cache entry %s", evicted)
+        return changed
+
+    def invalidate_server(self, server_id: int) -> None:
+        """Drop all entries of a server."""
+        for key in [k for k in self._entries if k[0] == server_id]:
+            del self._entries[key]
+        logger.debug("Tool cache invalidated for server %d", server_id)
+
+    def clear(self) -> None:
+        """Drop all entries."""
+        self._entries.clear()
@@ -2,6 +2,8 @@ from __future__ import annotations
 
 import logging
 import threading
+from collections.abc import Iterable
+from dataclasses import dataclass, field
 from typing import Self
 
 from appkit_assistant.backend.processors.processor_base import ProcessorBase
@@ -9,6 +11,50 @@ from appkit_assistant.backend.schemas import AIModel
 
 logger = logging.getLogger(__name__)
 
+# Memoized role views per index. Role sets come from the configured roles, so
+# there are few distinct ones; the bound only guards against unusual setups.
+MAX_ROLE_VIEWS = 256
+
+
+@dataclass(frozen=True, slots=True)
+class _ModelIndex:
+    """Immutable lookup tables derived from the registered models.
+
+    Rebuilt by ModelManager whenever the set of registered models changes;
+    readers never see a partially built index.
+    """
+
+    version: int
+    sorted_models: tuple[AIModel, ...]
+    # Mutable cache inside the frozen index, bounded by MAX_ROLE_VIEWS
+    role_views: dict[frozenset[str], tuple[AIModel, ...]] = field(default_factory=dict)
+
+    @classmethod
+    def build(cls, version: int, models: Iterable[AIModel]) -> _ModelIndex:
+        sorted_models = tuple(
+            sorted(
+                models,
+                key=lambda model: (
+                    model.icon.lower() if model.icon else "",
+                    model.text.lower(),
+                ),
+            )
+        )
+        return cls(version=version, sorted_models=sorted_models)
+
+    def for_roles(self, roles: frozenset[str]) -> tuple[AIModel, ...]:
+        """Models accessible with the given roles, memoized per role set."""
+        view = self.role_views.get(roles)
+        if view is None:
+            view = tuple(
+                m
+                for m in self.sorted_models
+                if not m.requires_role or m.requires_role in roles
+            )
+            if len(self.role_views) < MAX_ROLE_VIEWS:
+                self.role_views[roles] = view
+        return view
+
 
 class ModelManager:
     """Singleton service manager for AI processing services."""
@@ -32,6 +78,8 @@ class ModelManager:
             self._processors: dict[str, ProcessorBase] = {}
             self._models: dict[str, AIModel] = {}
             self._model_to_processor: dict[str, str] = {}
+            self._version = 0
+            self._index: _ModelIndex | None = None
             self._initialized = True
             logger.debug("ModelManager initialized")
 
@@ -61,6 +109,7 @@ class ModelManager:
                     self._default_model_id = model_id
                     logger.debug("Set first model %s as default", model_id)
 
+        self._invalidate_index()
         logger.debug("Registered processor: %s", processor_name)
 
     def get_processor_for_model(self, model_id: str) -> ProcessorBase | None:
@@ -78,20 +127,51 @@ class ModelManager:
             return self._processors.get(processor_name)
         return None
 
+    @property
+    def version(self) -> int:
+        """Monotonic counter bumped whenever the registered models change."""
+        return self._version
+
+    def _invalidate_index(self) -> None:
+        self._version += 1
+        self._index = None
+
+    def _get_index(self) -> _ModelIndex:
+        index = self._index
+        if index is None or index.version != self._version:
+            with self._lock:
+                index = self._index
+                if index is None or index.version != self._version:
+                    index = _ModelIndex.build(self._version, self._models.values())
+                    self._index = index
+                    logger.debug(
+                        "Rebuilt model index v%d (%d models)",
+                        index.version,
+                        len(index.sorted_models),
+                    )
+        return index
+
     def get_all_models(self) -> list[AIModel]:
         """
         Get all registered models.
 
         Returns:
-            List of all models.
-        """
-        return sorted(
-            self._models.values(),
-            key=lambda model: (
-                model.icon.lower() if model.icon else "",
-                model.text.lower(),
-            ),
-        )
+            List of all models, sorted by icon and name.
+        """
+        return list(self._get_index().sorted_models)
+
+    def get_models_for_roles(self, roles: Iterable[str] | None) -> list[AIModel]:
+        """
+        Get the models a user with the given roles may use.
+
+        Args:
+            roles: Roles of the user; None is treated as no roles.
+
+        Returns:
+            Sorted list of models without a required role or whose
+            required role is contained in ``roles``.
+        """
+        return list(self._get_index().for_roles(frozenset(roles or ())))
 
     def get_model(self, model_id: str) -> AIModel | None:
         """
@@ -159,6 +239,7 @@ class ModelManager:
         ):
             self._default_model_id = None
 
+        self._invalidate_index()
         logger.debug("Unregistered %d processors", len(processor_names))
 
     def clear_all(self) -> None:
@@ -170,4 +251,5 @@ class ModelManager:
         self._models.clear()
         self._model_to_processor.clear()
         self._default_model_id = None
+        self._invalidate_index()
         logger.debug("ModelManager cleared all processors and models")
@@ -187,6 +187,8 @@ class McpAppResource(BaseModel):
     csp: dict[str, str] | None = None
     permissions: dict[str, bool] | None = None
     prefers_border: bool | None = None
+    # Declared immutable by the server (``_meta.ui.versioned``)
+    versioned: bool = False
 
 
 class McpAppViewData(BaseModel):
@@ -7,13 +7,16 @@ Note: HTTP endpoints have been removed for security. Use `run_cleanup()` for
 manual triggers from Reflex UI or internal code.
 """
 
+import asyncio
 import logging
+import time
 from collections.abc import AsyncGenerator
-from typing import Any
+from typing import Any, Final
 
 from openai import AsyncOpenAI, NotFoundError
 
 from appkit_assistant.backend.database.repositories import (
+    cleanup_checkpoint_repo,
     file_upload_repo,
     thread_repo,
 )
@@ -32,11 +35,38 @@ from appkit_commons.scheduler import (
 
 logger = logging.getLogger(__name__)
 
+# Share of the interval a scheduled run may use when no explicit budget is
+# configured, so it ends before the scheduler triggers the next run.
+DERIVED_BUDGET_RATIO: Final[float] = 0.9
+
+_COUNTERS: Final[tuple[str, ...]] = (
+    "vector_stores_checked",
+    "vector_stores_expired",
+    "vector_stores_deleted",
+    "files_found",
+    "files_deleted",
+    "threads_updated",
+)
+
+
+def _new_stats() -> dict[str, Any]:
+    return {
+        **dict.fromkeys(_COUNTERS, 0),
+        "current_vector_store": None,
+        "total_vector_stores": 0,
+        "status": "starting",
+    }
+
 
 class FileCleanupService(ScheduledService):
     """Service for cleaning up expired files and vector stores.
 
-    Delegates actual cleanup operations to FileUploadService.
+    Vector stores are processed in batches: within a batch, expiry checks
+    and deletions run concurrently, bounded by ``cleanup_concurrency``.
+    After each batch, threads are updated with one statement and a
+    checkpoint is saved, so a run that is interrupted or exceeds its time
+    budget resumes where it stopped. Delegates actual cleanup operations to
+    FileUploadService.
     """
 
     job_id = "file_cleanup"
@@ -55,63 +85,100 @@ class FileCleanupService(ScheduledService):
         # Ensure at least 1 minute interval, check if disabled in execute()
         return IntervalTrigger(minutes=max(minutes, 1))
 
-    async def execute(self) -> None:
-        """Execute cleanup for all subscriptions with uploaded files."""
+    def time_budget_seconds(self) -> float | None:
+        """Wall-clock budget of a scheduled run, or None if unlimited."""
+        if self.config.cleanup_time_budget_minutes > 0:
+            return self.config.cleanup_time_budget_minutes * 60
+        if self.config.cleanup_interval_minutes > 0:
+            return self.config.cleanup_interval_minutes * 60 * DERIVED_BUDGET_RATIO
+        return None
+
+    async def execute(self) -> int:
+        """Execute cleanup for all subscriptions with uploaded files.
+
+        Returns:
+            The number of deleted vector stores and files.
+        """
         if self.config.cleanup_interval_minutes <= 0:
             logger.debug("File cleanup is disabled (interval <= 0)")
-            return
+            return 0
+
+        budget = self.time_budget_seconds()
+        deadline = time.monotonic() + budget if budget is not None else None
 
         try:
             logger.info("Starting scheduled file cleanup (all subscriptions)")
             final_stats: dict[str, Any] = {}
 
-            async for progress in self.cleanup_all_subscriptions():
+            async for progress in self.cleanup_all_subscriptions(deadline=deadline):
                 final_stats = progress
 
-            logger.info("Scheduled cleanup completed: %s", final_stats)
+            if final_stats.get("status") == "paused":
+                logger.info(
+                    "Scheduled cleanup paused after its time budget, "
+                    "resuming on next run: %s",
+                    final_stats,
+                )
+            else:
+                logger.info("Scheduled cleanup completed: %s", final_stats)
+            return final_stats.get("vector_stores_deleted", 0) + final_stats.get(
+                "files_deleted", 0
+            )
         except Exception as e:
             logger.error("Scheduled cleanup failed: %s", e)
+            raise
 
     async def cleanup_all_subscriptions(
         self,
+        deadline: float | None = None,
     ) -> AsyncGenerator[dict[str, Any], None]:
         """Iterate distinct ai_model values and clean up each subscription.
 
         For each subscription we build a dedicated OpenAI client using the
         model's own API key / base URL, then run cleanup_expired_files.
+        Subscriptions are processed in order and resume from the saved
+        checkpoint; the checkpoint is removed once all of them completed.
+
+        Args:
+            deadline: ``time.monotonic()`` value after which no new batch is
+                started; the run then ends with status ``paused``.
 
         Yields aggregated progress across all subscriptions.
         """
-        aggregated: dict[str, Any] = {
-            "vector_stores_checked": 0,
-            "vector_stores_expired": 0,
-            "vector_stores_deleted": 0,
-            "files_found": 0,
-            "files_deleted": 0,
-            "threads_updated": 0,
-            "current_vector_store": None,
-            "total_vector_stores": 0,
-            "status": "starting",
-        }
+        aggregated = _new_stats()
 
         async with get_asyncdb_session() as session:
             ai_models = await file_upload_repo.find_distinct_ai_models(
                 session,
             )
+            checkpoint = await cleanup_checkpoint_repo.find_by_job(session, self.job_id)
+            resume_model = checkpoint.ai_model if checkpoint else None
+            resume_after = checkpoint.last_vector_store_id if checkpoint else None
 
         if not ai_models:
             logger.info("No subscriptions with uploaded files found")
+            await self._delete_checkpoint()
             aggregated["status"] = "completed"
             yield aggregated
             return
 
+        if resume_model:
+            logger.info(
+                "Resuming cleanup at subscription %s after vector store %s",
+                resume_model,
+                resume_after,
+            )
+
         logger.info(
             "Cleaning up %d subscription(s): %s",
             len(ai_models),
             ai_models,
         )
 
-        for ai_model in ai_models:
+        for ai_model in sorted(ai_models):
+            if resume_model and ai_model < resume_model:
+                continue
+
             client = await OpenAIClientService.create_client_for_model(
                 ai_model,
             )
@@ -123,28 +190,33 @@ class FileCleanupService(ScheduledService):
                 continue
 
             file_upload_service = FileUploadService(client=client, config=self.config)
+            # Progress of a subscription is cumulative; add it to the totals
+            # of the subscriptions finished before it.
+            base = aggregated.copy()
             async for progress in self.cleanup_expired_files(
-                client, file_upload_service, ai_model=ai_model
+                client,
+                file_upload_service,
+                ai_model=ai_model,
+                resume_after=resume_after if ai_model == resume_model else None,
+                deadline=deadline,
+                checkpoint_job=self.job_id,
             ):
-                # Merge per-subscription progress into aggregated
-                for key in (
-                    "vector_stores_checked",
-                    "vector_stores_expired",
-                    "vector_stores_deleted",
-                    "files_found",
-                    "files_deleted",
-                    "threads_updated",
-                ):
-                    aggregated[key] = aggregated.get(key, 0) + progress.get(key, 0)
+                for key in _COUNTERS:
+                    aggregated[key] = base[key] + progress.get(key, 0)
                 aggregated["status"] = progress.get("status", "checking")
                 aggregated["current_vector_store"] = progress.get(
                     "current_vector_store"
                 )
-                aggregated["total_vector_stores"] += progress.get(
-                    "total_vector_stores", 0
-                )
+                aggregated["total_vector_stores"] = base[
+                    "total_vector_stores"
+                ] + progress.get("total_vector_stores", 0)
                 yield aggregated.copy()
 
+            if aggregated["status"] == "paused":
+                logger.info("All-subscription cleanup paused: %s", aggregated)
+                return
+
+        await self._delete_checkpoint()
         aggregated["status"] = "completed"
         aggregated["current_vector_store"] = None
         logger.info("All-subscription cleanup completed: %s", aggregated)
@@ -155,6 +227,9 @@ class FileCleanupService(ScheduledService):
         client: AsyncOpenAI,
         file_upload_service: FileUploadService,
         ai_model: str = "",
+        resume_after: str | None = None,
+        deadline: float | None = None,
+        checkpoint_job: str | None = None,
     ) -> AsyncGenerator[dict[str, Any], None]:
         """Clean up expired vector stores and their associated files.
 
@@ -162,18 +237,13 @@ class FileCleanupService(ScheduledService):
             client: AsyncOpenAI client for this subscription.
             file_upload_service: Service for deleting vector stores.
             ai_model: If set, only process stores belonging to this model.
+            resume_after: Skip vector stores up to and including this ID.
+            deadline: ``time.monotonic()`` value after which no new batch is
+                started; the run then ends with status ``paused``.
+            checkpoint_job: If set, save a checkpoint under this job ID after
+                each batch.
         """
-        stats = {
-            "vector_stores_checked": 0,
-            "vector_stores_expired": 0,
-            "vector_stores_deleted": 0,
-            "files_found": 0,
-            "files_deleted": 0,
-            "threads_updated": 0,
-            "current_vector_store": None,
-            "total_vector_stores": 0,
-            "status": "starting",
-        }
+        stats = _new_stats()
 
         try:
             async with get_asyncdb_session() as session:
@@ -196,7 +266,12 @@ class FileCleanupService(ScheduledService):
                     )
                 )
 
-                vector_store_ids = list(file_store_ids | thread_store_ids)
+            # Sorted so that a checkpoint identifies the remaining stores
+            vector_store_ids = sorted(file_store_ids | thread_store_ids)
+            if resume_after:
+                vector_store_ids = [
+                    vs_id for vs_id in vector_store_ids if vs_id > resume_after
+                ]
 
             stats["total_vector_stores"] = len(vector_store_ids)
             stats["status"] = "checking"
@@ -206,29 +281,52 @@ class FileCleanupService(ScheduledService):
             )
             yield stats.copy()
 
-            for vs_id in vector_store_ids:
-                stats["current_vector_store"] = vs_id
-                stats["vector_stores_checked"] += 1
+            semaphore = asyncio.Semaphore(max(self.config.cleanup_concurrency, 1))
+            batch_size = max(self.config.cleanup_batch_size, 1)
+
+            for start in range(0, len(vector_store_ids), batch_size):
+                if deadline is not None and time.monotonic() >= deadline:
+                    stats["status"] = "paused"
+                    stats["current_vector_store"] = None
+                    logger.info(
+                        "Cleanup time budget exhausted, %d vector stores left",
+                        len(vector_store_ids) - start,
+                    )
+                    yield stats.copy()
+                    return
+
+                batch = vector_store_ids[start : start + batch_size]
+                stats["current_vector_store"] = batch[0]
                 yield stats.copy()
 
-                is_expired = await self._check_vector_store_expired(client, vs_id)
+                results = await asyncio.gather(
+                    *(
+                        self._cleanup_vector_store(
+                            client, file_upload_service, vs_id, semaphore
+                        )
+                        for vs_id in batch
+                    )
+                )
 
-                if is_expired:
+                expired_ids: list[str] = []
+                for vs_id, result in zip(batch, results, strict=True):
+                    stats["vector_stores_checked"] += 1
+                    if result is None:
+                        continue
+                    expired_ids.append(vs_id)
                     stats["vector_stores_expired"] += 1
-                    stats["status"] = "deleting"
-                    yield stats.copy()
-
-                    # Delegate cleanup to FileUploadService
-                    result = await file_upload_service.delete_vector_store(vs_id)
                     if result["deleted"]:
                         stats["vector_stores_deleted"] += 1
                     stats["files_found"] += result["files_found"]
                     stats["files_deleted"] += result["files_deleted"]
-                    # Clear vector_store_id from associated threads
-                    threads_updated = await self._clear_thread_vector_store_ids(vs_id)
-                    stats["threads_updated"] += threads_updated
-                    stats["status"] = "checking"
-                    yield stats.copy()
+
+                stats["threads_updated"] += await self._complete_batch(
+                    expired_ids,
+                    checkpoint_job=checkpoint_job,
+                    ai_model=ai_model,
+                    last_vector_store_id=batch[-1],
+                )
+                yield stats.copy()
 
             stats["status"] = "completed"
             stats["current_vector_store"] = None
@@ -242,6 +340,32 @@ class FileCleanupService(ScheduledService):
             yield stats.copy()
             raise
 
+    async def _cleanup_vector_store(
+        self,
+        client: AsyncOpenAI,
+        file_upload_service: FileUploadService,
+        vector_store_id: str,
+        semaphore: asyncio.Semaphore,
+    ) -> dict[str, Any] | None:
+        """Delete a vector store if it has expired.
+
+        Failures are logged and skipped so one store cannot abort the run;
+        it is checked again by the next complete run.
+
+        Returns:
+            The deletion result, or None if the store is active or failed.
+        """
+        async with semaphore:
+            try:
+                if not await self._check_vector_store_expired(client, vector_store_id):
+                    return None
+                return await file_upload_service.delete_vector_store(vector_store_id)
+            except Exception as e:
+                logger.warning(
+                    "Failed to clean up vector store %s: %s", vector_store_id, e
+                )
+                return None
+
     async def _check_vector_store_expired(
         self, client: AsyncOpenAI, vector_store_id: str
     ) -> bool:
@@ -272,28 +396,52 @@ class FileCleanupService(ScheduledService):
             )
             return True
 
-    async def _clear_thread_vector_store_ids(self, vector_store_id: str) -> int:
-        """Clear vector_store_id from all threads associated with the store.
+    async def _complete_batch(
+        self,
+        vector_store_ids: list[str],
+        checkpoint_job: str | None = None,
+        ai_model: str = "",
+        last_vector_store_id: str | None = None,
+    ) -> int:
+        """Clear deleted stores from threads and save the checkpoint.
+
+        Both happen in one transaction, so a resumed run never skips a
+        store whose threads still reference it.
 
         Args:
-            vector_store_id: The vector store ID to clear from threads.
+            vector_store_ids: Deleted vector store IDs to clear from threads.
+            checkpoint_job: Job ID to save the checkpoint under, if any.
+            ai_model: Subscription the batch belongs to.
+            last_vector_store_id: Last vector store ID of the batch.
 
         Returns:
             Number of threads updated.
         """
+        if not vector_store_ids and not checkpoint_job:
+            return 0
+
         async with get_asyncdb_session() as session:
-            updated_count = await thread_repo.clear_vector_store_id(
-                session, vector_store_id
+            updated_count = await thread_repo.clear_vector_store_ids(
+                session, vector_store_ids
             )
+            if checkpoint_job:
+                await cleanup_checkpoint_repo.save(
+                    session, checkpoint_job, ai_model, last_vector_store_id
+                )
             await session.commit()
-            logger.debug(
-                "Cleared vector_store_id from %d threads for store %s",
-                updated_count,
-                vector_store_id,
-            )
 
+        logger.debug(
+            "Cleared vector_store_id from %d threads for %d stores",
+            updated_count,
+            len(vector_store_ids),
+        )
         return updated_count
 
+    async def _delete_checkpoint(self) -> None:
+        async with get_asyncdb_session() as session:
+            await cleanup_checkpoint_repo.delete_by_job(session, self.job_id)
+            await session.commit()
+
 
 def get_file_upload_config() -> FileUploadConfig:
     """Get file upload configuration."""
@@ -320,7 +468,7 @@ async def run_cleanup(
 
     Yields:
         Dictionary with cleanup progress including:
-        - status: 'starting', 'checking', 'deleting', 'completed', or 'error'
+        - status: 'starting', 'checking', 'completed', 'paused', or 'error'
         - vector_stores_checked: number checked so far
         - vector_stores_expired: number found expired
         - vector_stores_deleted: number successfully deleted
@@ -58,6 +58,10 @@ class FileUploadService:
         self.client = client
         self.config = config or FileUploadConfig()
         self._max_file_size_bytes = self.config.max_file_size_mb * 1024 * 1024
+        # Shared by all remote deletions of this instance
+        self._delete_semaphore = asyncio.Semaphore(
+            max(self.config.cleanup_concurrency, 1)
+        )
         self._chunk_factory = ChunkFactory("file_upload_service")
 
     async def _recreate_vector_store(
@@ -433,12 +437,14 @@ class FileUploadService:
     ) -> None:
         """Delete files FROM their vector stores (Level 1).
 
+        Runs concurrently, bounded by ``cleanup_concurrency``.
+
         Args:
             vector_store_files: Map of vector_store_id -> list of file_ids.
         """
-        # Delete from each vector store
-        for vs_id, vs_file_ids in vector_store_files.items():
-            for file_id in vs_file_ids:
+
+        async def _delete(vs_id: str, file_id: str) -> None:
+            async with self._delete_semaphore:
                 try:
                     await self.client.vector_stores.files.delete(
                         vector_store_id=vs_id,
@@ -453,18 +459,32 @@ class FileUploadService:
                         e,
                     )
 
+        await asyncio.gather(
+            *(
+                _delete(vs_id, file_id)
+                for vs_id, vs_file_ids in vector_store_files.items()
+                for file_id in vs_file_ids
+            )
+        )
+
     async def _delete_files_from_openai(self, file_ids: list[str]) -> dict[str, bool]:
-        """Delete files from OpenAI (Level 2)."""
-        results = {}
-        for file_id in file_ids:
-            try:
-                await self.client.files.delete(file_id=file_id)
-                logger.debug("Deleted OpenAI file: %s", file_id)
-                results[file_id] = True
-            except Exception as e:
-                logger.warning("Failed to delete OpenAI file %s: %s", file_id, e)
-                results[file_id] = False
-        return results
+        """Delete files from OpenAI (Level 2).
+
+        Runs concurrently, bounded by ``cleanup_concurrency``.
+        """
+
+        async def _delete(file_id: str) -> bool:
+            async with self._delete_semaphore:
+                try:
+                    await self.client.files.delete(file_id=file_id)
+                    logger.debug("Deleted OpenAI file: %s", file_id)
+                    return True
+                except Exception as e:
+                    logger.warning("Failed to delete OpenAI file %s: %s", file_id, e)
+                    return False
+
+        results = await asyncio.gather(*(_delete(file_id) for file_id in file_ids))
+        return dict(zip(file_ids, results, strict=True))
 
     async def _delete_file_db_records(
         self,
@@ -479,26 +499,11 @@ class FileUploadService:
             return
 
         async with get_asyncdb_session() as session:
-            result = await session.execute(
-                select(AssistantFileUpload).where(
-                    AssistantFileUpload.openai_file_id.in_(openai_file_ids)
-                )
+            deleted = await file_upload_repo.delete_by_openai_file_ids(
+                session, openai_file_ids
             )
-            db_files = result.scalars().all()
-
-            for db_file in db_files:
-                try:
-                    await session.delete(db_file)
-                    logger.debug(
-                        "Deleted DB record for file: %s", db_file.openai_file_id
-                    )
-                except Exception as e:
-                    logger.warning(
-                        "Failed to delete DB record for file %s: %s",
-                        db_file.openai_file_id,
-                        e,
-                    )
             await session.commit()
+            logger.debug("Deleted %d DB records for files", deleted)
 
     async def upload_file(
         self,
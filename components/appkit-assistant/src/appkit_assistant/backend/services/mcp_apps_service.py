@@ -7,11 +7,13 @@ Negotiation), discovers UI-enabled tools, fetches ui:// HTML resources,
 and proxies tool calls from app iframes.
 """
 
+import asyncio
 import json
 import logging
 import time
 from contextlib import asynccontextmanager
-from typing import Any
+from datetime import UTC, datetime
+from typing import Any, ClassVar
 
 import httpx
 from mcp import ClientSession  # noqa: F401 - kept for re-export / type hints
@@ -26,6 +28,19 @@ from mcp.types import (
 )
 
 from appkit_assistant.backend.database.models import MCPServer
+from appkit_assistant.backend.database.repositories import mcp_tool_cache_repo
+from appkit_assistant.backend.mcp_resource_cache import (
+    SHARED_USER_ID,
+    CachedResource,
+    McpResourceCache,
+)
+from appkit_assistant.backend.mcp_tool_cache import (
+    DEFAULT_TOOL_CACHE_TTL_SECONDS,
+    CachedTools,
+    McpToolCache,
+    ToolCacheKey,
+    compute_tools_hash,
+)
 from appkit_assistant.backend.schemas import (
     McpAppResource,
     McpAppToolInfo,
@@ -34,12 +49,10 @@ from appkit_assistant.backend.schemas import (
 from appkit_assistant.backend.services.mcp_token_service import (
     MCPTokenService,
 )
+from appkit_commons.database.session import get_asyncdb_session
 
 logger = logging.getLogger(__name__)
 
-# Default TTL for cached tool metadata (seconds)
-_TOOL_CACHE_TTL_S = 300
-
 # Extension identifier per SEP-1865
 _EXTENSION_ID = "io.modelcontextprotocol/ui"
 _SUPPORTED_MIME_TYPE = "text/html;profile=mcp-app"
@@ -93,12 +106,21 @@ class McpAppsService:
     Manages MCP client sessions, discovers UI-enabled tools,
     fetches resources, and proxies tool calls for MCP Apps.
 
-    The tool cache is a class-level dict shared across all instances so
-    that discovery results survive across message submissions.
+    The tool cache is shared across all instances so that discovery results
+    survive across message submissions. The last-known tool list is also
+    persisted, so cold workers start warm. Stale entries are served while
+    they are revalidated in the background; an entry is only replaced when
+    the content hash of the refetched tools differs.
     """
 
-    # Class-level cache: (server_id, user_id) -> (tools, timestamp)
-    _tool_cache: dict[tuple[int, int], tuple[list[McpAppToolInfo], float]] = {}
+    # Class-level cache: (server_id, user_id) -> CachedTools
+    _tool_cache: ClassVar[McpToolCache] = McpToolCache()
+    # Class-level cache: (server_id, resource_uri) -> CachedResource
+    _resource_cache: ClassVar[McpResourceCache] = McpResourceCache()
+    # Keys with a background revalidation in flight
+    _revalidating: ClassVar[set[ToolCacheKey]] = set()
+    # Strong references to background tasks so they are not garbage collected
+    _background_tasks: ClassVar[set[asyncio.Task[None]]] = set()
 
     def __init__(self, token_service: MCPTokenService | None = None) -> None:
         self._token_service = token_service
@@ -130,14 +152,16 @@ class McpAppsService:
 
     def _get_cached_tools(
         self,
-        key: tuple[int, int],
+        key: ToolCacheKey,
     ) -> list[McpAppToolInfo] | None:
         """Retrieve cached UI tools if valid."""
-        if cached := self._tool_cache.get(key):
-            tools, ts = cached
-            if (time.monotonic() - ts) < _TOOL_CACHE_TTL_S:
-                return tools
-        return None
+        return self._tool_cache.get_fresh(key)
+
+    @classmethod
+    def invalidate_server(cls, server_id: int) -> None:
+        """Drop the in-process cached tools and resources of a server."""
+        cls._tool_cache.invalidate_server(server_id)
+        cls._resource_cache.invalidate_server(server_id)
 
     async def _get_auth_headers(
         self,
@@ -157,7 +181,7 @@ class McpAppsService:
                 logger.warning("Invalid headers JSON for server %s", server.name)
 
         # Forward the user identity so MCP servers can scope data
-        if user_id > 0:
+        if server.inject_user_id and user_id > 0:
             headers["x-user-id"] = str(user_id)
 
         # Override with OAuth token if available
@@ -177,31 +201,144 @@ class McpAppsService:
         server: MCPServer,
         user_id: int,
     ) -> list[McpAppToolInfo]:
-        """Discover tools with UI (App) views on an MCP server."""
+        """Discover tools with UI (App) views on an MCP server.
+
+        Served from the in-process cache or, on a cold worker, from the
+        persisted last-known tools. Stale entries are returned immediately
+        and revalidated in the background.
+        """
         if server.id is None:
             return []
 
         cache_key = (server.id, user_id)
-        if tools := self._get_cached_tools(cache_key):
-            return tools
+        entry = self._tool_cache.get(cache_key) or await self._load_persisted(
+            server, user_id
+        )
+        if entry is not None:
+            if not entry.is_fresh():
+                self._schedule_revalidation(server, user_id)
+            return list(entry.tools)
 
         try:
-            async with self._connect_for_apps(server, user_id) as session:
-                ui_tools = await self._list_ui_tools(session, server)
+            return await self._refresh_tools(server, user_id)
+        except Exception:
+            logger.exception(
+                "Failed to discover UI tools on server %s",
+                server.name,
+            )
+            return []
 
-            self._tool_cache[cache_key] = (ui_tools, time.monotonic())
+    async def _refresh_tools(
+        self,
+        server: MCPServer,
+        user_id: int,
+    ) -> list[McpAppToolInfo]:
+        """Fetch the UI tools of a server and update the cache on change."""
+        async with self._connect_for_apps(server, user_id) as session:
+            ui_tools = await self._list_ui_tools(session, server)
+
+        cache_key = (server.id or 0, user_id)
+        content_hash = compute_tools_hash(ui_tools)
+        changed = self._tool_cache.put(
+            cache_key,
+            ui_tools,
+            ttl_seconds=_get_tool_cache_ttl(server),
+            content_hash=content_hash,
+        )
+        await self._persist(cache_key, ui_tools, content_hash, changed)
+
+        if changed:
             logger.info(
                 "Discovered %d UI tools on server %s",
                 len(ui_tools),
                 server.name,
             )
-            return ui_tools
-        except Exception:
-            logger.exception(
-                "Failed to discover UI tools on server %s",
+        return ui_tools
+
+    def _schedule_revalidation(self, server: MCPServer, user_id: int) -> None:
+        """Refresh a stale entry in the background, once per key."""
+        cache_key = (server.id or 0, user_id)
+        if cache_key in self._revalidating:
+            return
+
+        self._revalidating.add(cache_key)
+        task = asyncio.create_task(self._revalidate(server, user_id))
+        self._background_tasks.add(task)
+        task.add_done_callback(self._background_tasks.discard)
+
+    async def _revalidate(self, server: MCPServer, user_id: int) -> None:
+        """Background revalidation; keeps the stale entry on failure."""
+        try:
+            await self._refresh_tools(server, user_id)
+        except Exception as e:
+            logger.warning(
+                "Failed to revalidate UI tools on server %s: %s",
                 server.name,
+                e,
             )
-            return []
+        finally:
+            self._revalidating.discard((server.id or 0, user_id))
+
+    async def _load_persisted(
+        self,
+        server: MCPServer,
+        user_id: int,
+    ) -> CachedTools | None:
+        """Warm the in-process cache from the persisted last-known tools."""
+        try:
+            async with get_asyncdb_session() as session:
+                row = await mcp_tool_cache_repo.find_by_server_and_user(
+                    session, server.id or 0, user_id
+                )
+                if row is None:
+                    return None
+                tools = [McpAppToolInfo.model_validate(t) for t in row.tools]
+                content_hash = row.content_hash
+                fetched_at = row.fetched_at
+        except Exception as e:
+            logger.warning(
+                "Failed to load persisted UI tools for server %s: %s",
+                server.name,
+                e,
+            )
+            return None
+
+        if fetched_at.tzinfo is None:
+            fetched_at = fetched_at.replace(tzinfo=UTC)
+        age = max((datetime.now(UTC) - fetched_at).total_seconds(), 0.0)
+        cache_key = (server.id or 0, user_id)
+        self._tool_cache.put(
+            cache_key,
+            tools,
+            ttl_seconds=_get_tool_cache_ttl(server),
+            content_hash=content_hash,
+            validated_at=time.monotonic() - age,
+        )
+        return self._tool_cache.get(cache_key)
+
+    async def _persist(
+        self,
+        key: ToolCacheKey,
+        tools: list[McpAppToolInfo],
+        content_hash: str,
+        changed: bool,
+    ) -> None:
+        """Persist the tools on change, otherwise only refresh the timestamp."""
+        server_id, user_id = key
+        try:
+            async with get_asyncdb_session() as session:
+                if changed:
+                    await mcp_tool_cache_repo.upsert(
+                        session,
+                        server_id,
+                        user_id,
+                        content_hash,
+                        [tool.model_dump(mode="json") for tool in tools],
+                    )
+                else:
+                    await mcp_tool_cache_repo.touch(session, server_id, user_id)
+        except Exception as e:
+            logger.warning("Failed to persist UI tools for server %d: %s", server_id, e)
 
     async def _list_ui_tools(
         self,
@@ -254,6 +391,7 @@ class McpAppsService:
             csp: dict[str, Any] | None = None
             permissions: dict[str, bool] | None = None
             prefers_border: bool | None = None
+            versioned = False
 
             for content in result.contents:
                 if hasattr(content, "text"):
@@ -266,6 +404,7 @@ class McpAppsService:
                     permissions = ui_meta.get("permissions", permissions)
                     if "prefersBorder" in ui_meta:
                         prefers_border = bool(ui_meta["prefersBorder"])
+                    versioned = versioned or bool(ui_meta.get("versioned"))
 
             return McpAppResource(
                 uri=resource_uri,
@@ -273,6 +412,7 @@ class McpAppsService:
                 csp=csp,
                 permissions=permissions,
                 prefers_border=prefers_border,
+                versioned=versioned,
             )
         except Exception:
             logger.exception(
@@ -282,6 +422,34 @@ class McpAppsService:
             )
             return None
 
+    async def get_resource(
+        self,
+        server: MCPServer,
+        user_id: int,
+        resource_uri: str,
+    ) -> CachedResource | None:
+        """Get an MCP App resource with its ETag, served from cache if fresh.
+
+        Resources are cached per (server, user, uri) since they are fetched
+        with the user's credentials; servers that neither use per-user OAuth
+        nor receive the user ID share one entry. Versioned resources never
+        expire, others are refetched after the server's tool cache TTL.
+        """
+        cache_key = (
+            server.id or 0,
+            _resource_cache_user(server, user_id),
+            resource_uri,
+        )
+        if entry := self._resource_cache.get_fresh(cache_key):
+            return entry
+
+        resource = await self.fetch_resource(server, user_id, resource_uri)
+        if resource is None:
+            return None
+        return self._resource_cache.put(
+            cache_key, resource, ttl_seconds=_get_tool_cache_ttl(server)
+        )
+
     async def proxy_tool_call(
         self,
         server: MCPServer,
@@ -342,6 +510,19 @@ class McpAppsService:
         return {tool.tool_name: tool for tool in tools}
 
 
+def _get_tool_cache_ttl(server: MCPServer) -> int:
+    """Return the tool cache TTL of a server, falling back to the default."""
+    ttl = server.tool_cache_ttl_seconds
+    return ttl if ttl is not None and ttl >= 0 else DEFAULT_TOOL_CACHE_TTL_SECONDS
+
+
+def _resource_cache_user(server: MCPServer, user_id: int) -> int:
+    """User part of the resource cache key; shared for user-agnostic servers."""
+    if server.auth_type == MCPAuthType.OAUTH_DISCOVERY or server.inject_user_id:
+        return user_id
+    return SHARED_USER_ID
+
+
 def _call_tool_result_to_dict(result: CallToolResult) -> dict[str, Any]:
     """Convert a CallToolResult to a serializable dictionary."""
     content_list = [item.model_dump(exclude_none=True) for item in result.content]
@@ -1,5 +1,6 @@
 """Service for interacting with the OpenAI Skills API."""
 
+import asyncio
 import hashlib
 import logging
 from datetime import UTC, datetime
@@ -9,6 +10,7 @@ from sqlalchemy.ext.asyncio import AsyncSession
 
 from appkit_assistant.backend.database.models import Skill
 from appkit_assistant.backend.database.repositories import (
+    ai_model_repo,
     skill_repo,
     user_skill_repo,
 )
@@ -238,7 +240,9 @@ class SkillService:
             openai_id, api_key=api_key, base_url=base_url
         )
         key_hash = compute_api_key_hash(api_key) if api_key else None
-        return await self._upsert_skill(session, remote, api_key_hash=key_hash)
+        return await self._upsert_skill(
+            session, remote, api_key_hash=key_hash, base_url=base_url
+        )
 
     async def sync_all_skills(
         self,
@@ -250,42 +254,61 @@ class SkillService:
 
         When *api_key* is given, only skills for that API key are synced
         and the deactivation pass is limited to skills with the same
-        ``api_key_hash``.
+        ``api_key_hash`` and ``base_url``.
 
         Returns the number of skills synced.
         """
         remote_skills = await self.list_remote_skills(
             api_key=api_key, base_url=base_url
         )
-        remote_ids: set[str] = set()
         key_hash = compute_api_key_hash(api_key) if api_key else None
+        return await self._bulk_sync(session, remote_skills, key_hash, base_url)
 
-        for remote in remote_skills:
-            await self._upsert_skill(session, remote, api_key_hash=key_hash)
-            remote_ids.add(remote["id"])
+    async def sync_skills_for_credentials(
+        self,
+        session: AsyncSession,
+        credentials: list[tuple[str, str | None]],
+    ) -> int:
+        """Sync skills for several API keys.
 
-        # Deactivate local skills that no longer exist remotely
-        if key_hash:
-            all_local = await skill_repo.find_all_by_api_key_hash(session, key_hash)
-        else:
-            all_local = await skill_repo.find_all_ordered_by_name(session)
+        Remote listings run concurrently; each key is then written with one
+        bulk upsert and one deactivation statement. Keys whose listing fails
+        are skipped so their local skills are not deactivated.
 
-        deactivated = 0
-        for local in all_local:
-            if local.openai_id not in remote_ids and local.active:
-                local.active = False
-                session.add(local)
-                deactivated += 1
+        Args:
+            credentials: ``(api_key, base_url)`` pairs; duplicates are ignored.
 
-        await session.flush()
-        total = len(remote_skills)
-        logger.info(
-            "Synced %d skills, deactivated %d stale",
-            total,
-            deactivated,
+        Returns the total number of skills synced.
+        """
+        unique = list(dict.fromkeys(c for c in credentials if c[0]))
+        listings = await asyncio.gather(
+            *(
+                self.list_remote_skills(api_key=api_key, base_url=base_url)
+                for api_key, base_url in unique
+            ),
+            return_exceptions=True,
         )
+
+        total = 0
+        for (api_key, base_url), listing in zip(unique, listings, strict=True):
+            key_hash = compute_api_key_hash(api_key)
+            if isinstance(listing, BaseException):
+                logger.warning(
+                    "Skipping skill sync for key %s…: %s", key_hash[:8], listing
+                )
+                continue
+            total += await self._bulk_sync(session, listing, key_hash, base_url)
         return total
 
+    async def sync_all_model_skills(self, session: AsyncSession) -> int:
+        """Sync skills for every skill-capable model with an API key."""
+        models = await ai_model_repo.find_all_skill_capable(session)
+        credentials = [(m.api_key, m.base_url) for m in models if m.api_key]
+        if not credentials:
+            logger.debug("No skill-capable models with API keys configured")
+            return 0
+        return await self.sync_skills_for_credentials(session, credentials)
+
     async def delete_skill_full(
         self,
         session: AsyncSession,
@@ -320,11 +343,38 @@ class SkillService:
     # Internal
     # ------------------------------------------------------------------
 
+    async def _bulk_sync(
+        self,
+        session: AsyncSession,
+        remote_skills: list[dict],
+        api_key_hash: str | None,
+        base_url: str | None = None,
+    ) -> int:
+        """Upsert *remote_skills* and deactivate the stale local ones."""
+        await skill_repo.bulk_upsert_remote(
+            session, remote_skills, api_key_hash=api_key_hash, base_url=base_url
+        )
+        deactivated = await skill_repo.deactivate_missing(
+            session,
+            {remote["id"] for remote in remote_skills},
+            api_key_hash=api_key_hash,
+            base_url=base_url,
+        )
+
+        total = len(remote_skills)
+        logger.info(
+            "Synced %d skills, deactivated %d stale",
+            total,
+            deactivated,
+        )
+        return total
+
     async def _upsert_skill(
         self,
         session: AsyncSession,
         remote: dict,
         api_key_hash: str | None = None,
+        base_url: str | None = None,
     ) -> Skill:
         """Insert or update a local Skill from remote data.
 
@@ -341,6 +391,7 @@ class SkillService:
             existing.last_synced = now
             if api_key_hash:
                 existing.api_key_hash = api_key_hash
+                existing.base_url = base_url
             session.add(existing)
             await session.flush()
             await session.refresh(existing)
@@ -354,6 +405,7 @@ class SkillService:
             latest_version=remote["latest_version"],
             active=True,
             api_key_hash=api_key_hash,
+            base_url=base_url,
             last_synced=now,
         )
         session.add(skill)
@@ -0,0 +1,67 @@
+"""Scheduled synchronisation of OpenAI skills for all skill-capable models."""
+
+import logging
+
+from appkit_assistant.backend.services.skill_service import get_skill_service
+from appkit_assistant.configuration import AssistantConfig
+from appkit_commons.database.session import get_asyncdb_session
+from appkit_commons.registry import service_registry
+from appkit_commons.scheduler import (
+    IntervalTrigger,
+    ScheduledService,
+    Trigger,
+)
+
+logger = logging.getLogger(__name__)
+
+
+class SkillSyncService(ScheduledService):
+    """Service to keep the local skill table in sync with OpenAI."""
+
+    job_id = "skill_sync"
+    name = "Synchronise OpenAI skills"
+
+    def __init__(self, interval_minutes: int | None = None) -> None:
+        """Initialize the service.
+
+        Args:
+            interval_minutes: How often to run the sync job. Defaults to
+                ``AssistantConfig.skill_sync_interval_minutes``; the job is
+                opt-in and values <= 0 keep it disabled.
+        """
+        if interval_minutes is None:
+            interval_minutes = _get_configured_interval()
+        self.interval_minutes = interval_minutes
+
+    @property
+    def trigger(self) -> Trigger:
+        """Run periodically based on configured interval."""
+        # Ensure at least 1 minute interval, check if disabled in execute()
+        return IntervalTrigger(minutes=max(self.interval_minutes, 1))
+
+    async def execute(self) -> int | None:
+        """Sync the skills of every skill-capable model."""
+        if self.interval_minutes <= 0:
+            logger.debug("Skill sync is disabled (interval <= 0)")
+            return None
+
+        try:
+            logger.info("Running skill sync job")
+            async with get_asyncdb_session() as session:
+                count = await get_skill_service().sync_all_model_skills(session)
+            logger.info("Skill sync completed: %d skills", count)
+            return count
+        except Exception as e:
+            logger.error("Skill sync failed: %s", e)
+            raise
+
+
+def _get_configured_interval() -> int:
+    """Get the sync interval from the registered assistant configuration."""
+    try:
+        config: AssistantConfig | None = service_registry().get(AssistantConfig)
+        if config:
+            return config.skill_sync_interval_minutes
+    except Exception as e:
+        logger.warning("Failed to get assistant config: %s", e)
+    return AssistantConfig.model_fields["skill_sync_interval_minutes"].default
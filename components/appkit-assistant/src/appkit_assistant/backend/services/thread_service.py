@@ -1,5 +1,6 @@
 import logging
 import uuid
+from collections.abc import Iterable
 
 from appkit_assistant.backend.database.models import (
     AssistantThread,
@@ -11,7 +12,7 @@ from appkit_assistant.backend.schemas import (
     ThreadModel,
     ThreadStatus,
 )
-from appkit_commons.database.session import get_asyncdb_session
+from appkit_commons.database.session import get_asyncdb_session, mark_user_write
 
 logger = logging.getLogger(__name__)
 
@@ -26,19 +27,12 @@ class ThreadService:
         self.model_manager = ModelManager()
 
     def create_new_thread(
-        self, current_model: str, user_roles: list[str] | None = None
+        self, current_model: str, user_roles: Iterable[str] | None = None
     ) -> ThreadModel:
         """Create a new ephemeral thread model (not persisted)."""
-        if user_roles is None:
-            user_roles = []
-
-        all_models = self.model_manager.get_all_models()
-
         # Validate or fallback model
         available_model_ids = [
-            m.id
-            for m in all_models
-            if not m.requires_role or m.requires_role in user_roles
+            m.id for m in self.model_manager.get_models_for_roles(user_roles)
         ]
 
         selected_model = current_model
@@ -137,6 +131,7 @@ class ThreadService:
                     )
                     await thread_repo.save(session, new_thread)
 
+            mark_user_write(user_id_val)
             logger.debug("Saved thread to DB: %s", thread.thread_id)
         except Exception as e:
             logger.exception("Error saving thread %s: %s", thread.thread_id, e)
@@ -0,0 +1,230 @@
+import bisect
+import logging
+import time
+from collections import OrderedDict
+from collections.abc import Iterable
+from dataclasses import dataclass
+from typing import Any, Final
+
+from appkit_assistant.backend.database.repositories import user_prompt_repo
+from appkit_commons.database.session import get_asyncdb_read_session
+
+logger = logging.getLogger(__name__)
+
+# Entries are refreshed after this many seconds even without invalidation,
+# so prompts shared from other workers eventually become visible.
+CACHE_TTL_SECONDS: Final[int] = 300
+# Maximum number of users kept in the per-process index (LRU).
+MAX_CACHED_USERS: Final[int] = 1000
+# Users with more accessible prompts than this are only partially indexed;
+# the command palette then searches with the paginated server query.
+MAX_INDEXED_PROMPTS: Final[int] = 2000
+# Page size for server-side prefix searches.
+SEARCH_PAGE_SIZE: Final[int] = 50
+
+
+@dataclass(frozen=True, slots=True)
+class IndexedPrompt:
+    """Latest version of a prompt accessible to a user."""
+
+    handle: str
+    description: str
+    prompt_text: str
+    user_id: int
+    is_own: bool
+    mcp_server_ids: tuple[int, ...] = ()
+    skill_ids: tuple[int, ...] = ()
+    id: int = 0
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> "IndexedPrompt":
+        return cls(
+            handle=data["handle"],
+            description=data.get("description") or "",
+            prompt_text=data.get("prompt_text") or "",
+            user_id=data.get("user_id", 0),
+            is_own=data.get("is_own", False),
+            mcp_server_ids=tuple(data.get("mcp_server_ids") or ()),
+            skill_ids=tuple(data.get("skill_ids") or ()),
+            id=data.get("id", 0),
+        )
+
+
+@dataclass(frozen=True, slots=True)
+class _UserEntry:
+    prompts: tuple[IndexedPrompt, ...]
+    handles: tuple[str, ...]
+    complete: bool
+    loaded_at: float
+
+    @classmethod
+    def build(cls, prompts: Iterable[IndexedPrompt], complete: bool) -> "_UserEntry":
+        # Own prompts first, each group ordered by handle
+        ordered = tuple(sorted(prompts, key=lambda p: (not p.is_own, p.handle)))
+        return cls(
+            prompts=ordered,
+            handles=tuple(sorted({prompt.handle for prompt in ordered})),
+            complete=complete,
+            loaded_at=time.monotonic(),
+        )
+
+    def search(self, prefix: str) -> list[IndexedPrompt]:
+        start = bisect.bisect_left(self.handles, prefix)
+        end = bisect.bisect_left(self.handles, prefix + "\uffff", lo=start)
+        matching = set(self.handles[start:end])
+        return [p for p in self.prompts if p.handle in matching]
+
+
+class UserPromptIndex:
+    """Per-process index of the prompts accessible to each user.
+
+    Features:
+    - One query per user to build the index (own and shared prompts)
+    - Prefix search via binary search over the sorted handles
+    - Handle resolution at submit time with a single ``IN`` query, never
+      from the index
+    - LRU bound on cached users and TTL-based refresh
+    - Explicit invalidation when prompts are saved or deleted; changes to
+      shared prompts expire the other users' entries once the read replica
+      has caught up
+    """
+
+    def __init__(
+        self,
+        ttl_seconds: int = CACHE_TTL_SECONDS,
+        max_users: int = MAX_CACHED_USERS,
+        max_prompts: int = MAX_INDEXED_PROMPTS,
+    ) -> None:
+        self._ttl_seconds = ttl_seconds
+        self._max_users = max_users
+        self._max_prompts = max_prompts
+        self._entries: OrderedDict[int, _UserEntry] = OrderedDict()
+        # Entries loaded before this point expire once it has passed
+        self._shared_settles_at = 0.0
+
+    def _get_valid_entry(self, user_id: int) -> _UserEntry | None:
+        entry = self._entries.get(user_id)
+        if entry is None:
+            return None
+        now = time.monotonic()
+        if (
+            now - entry.loaded_at >= self._ttl_seconds
+            or entry.loaded_at < self._shared_settles_at <= now
+        ):
+            logger.debug("Prompt index for user %d expired", user_id)
+            self._entries.pop(user_id, None)
+            return None
+        self._entries.move_to_end(user_id)
+        return entry
+
+    async def _load(self, user_id: int) -> _UserEntry:
+        async with get_asyncdb_read_session(user_id) as session:
+            rows = await user_prompt_repo.find_all_accessible_prompts_filtered(
+                session, user_id, limit=self._max_prompts + 1
+            )
+
+        complete = len(rows) <= self._max_prompts
+        entry = _UserEntry.build(
+            (IndexedPrompt.from_dict(row) for row in rows[: self._max_prompts]),
+            complete=complete,
+        )
+        self._entries[user_id] = entry
+        self._entries.move_to_end(user_id)
+        while len(self._entries) > self._max_users:
+            self._entries.popitem(last=False)
+
+        logger.debug(
+            "Indexed %d prompts for user %d (complete=%s)",
+            len(entry.prompts),
+            user_id,
+            complete,
+        )
+        return entry
+
+    async def _get_entry(self, user_id: int) -> _UserEntry:
+        return self._get_valid_entry(user_id) or await self._load(user_id)
+
+    async def get_prompts(self, user_id: int) -> list[IndexedPrompt]:
+        """Get the indexed prompts for the user, own prompts first.
+
+        At most ``max_prompts`` are returned; see :meth:`is_complete`.
+        """
+        return list((await self._get_entry(user_id)).prompts)
+
+    async def is_complete(self, user_id: int) -> bool:
+        """Whether all prompts accessible to the user fit into the index."""
+        return (await self._get_entry(user_id)).complete
+
+    async def search(
+        self,
+        user_id: int,
+        prefix: str,
+        limit: int = SEARCH_PAGE_SIZE,
+        after: tuple[str, int] | None = None,
+    ) -> list[IndexedPrompt]:
+        """Find accessible prompts whose handle starts with ``prefix``.
+
+        Results are ordered by ``(handle, id)``; pass those of the last
+        result as ``after`` for the next page. Served from memory; only
+        users whose library exceeds the index size hit the database, using
+        a keyset-paginated query.
+        """
+        entry = await self._get_entry(user_id)
+        if entry.complete:
+            matches = sorted(entry.search(prefix), key=lambda p: (p.handle, p.id))
+            if after is not None:
+                matches = [p for p in matches if (p.handle, p.id) > after]
+            return matches[:limit]
+
+        async with get_asyncdb_read_session(user_id) as session:
+            rows = await user_prompt_repo.find_accessible_prompts_page(
+                session, user_id, prefix=prefix, limit=limit, after=after
+            )
+        return [IndexedPrompt.from_dict(row) for row in rows]
+
+    async def resolve(self, user_id: int, handles: Iterable[str]) -> dict[str, str]:
+        """Resolve command handles to prompt texts with a single query.
+
+        The index is not used: it is only invalidated in the process that
+        changed a prompt, so other workers could still send edited, unshared
+        or deleted prompts.
+
+        Returns:
+            Mapping of handle to prompt text; unknown handles are omitted.
+        """
+        wanted = {handle.lstrip("/") for handle in handles}
+        if not wanted:
+            return {}
+
+        async with get_asyncdb_read_session(user_id) as session:
+            prompts = await user_prompt_repo.find_latest_accessible_by_handles(
+                session, user_id, wanted
+            )
+            return {handle: prompt.prompt_text for handle, prompt in prompts.items()}
+
+    def invalidate(self, user_id: int | None = None) -> None:
+        """Drop cached prompts.
+
+        Args:
+            user_id: Only drop this user's entry. When None, drop all entries.
+        """
+        if user_id is None:
+            self._entries.clear()
+            logger.debug("Prompt index invalidated for all users")
+        else:
+            self._entries.pop(user_id, None)
+            logger.debug("Prompt index invalidated for user %d", user_id)
+
+    def invalidate_shared(self, writer_id: int, lag_seconds: float) -> None:
+        """Drop cached prompts after a shared prompt changed.
+
+        The writer's entry is dropped at once; the writer reads from the
+        primary. Other users read from the replica, so their entries,
+        including ones loaded meanwhile, expire after ``lag_seconds``.
+        """
+        self.invalidate(writer_id)
+        self._shared_settles_at = time.monotonic() + lag_seconds
+
+
+# Global index instance
+user_prompt_index = UserPromptIndex()
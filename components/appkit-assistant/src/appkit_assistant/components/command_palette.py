@@ -216,6 +216,7 @@ def command_palette() -> rx.Component:
                         type="auto",
                         scrollbars="y",
                         max_height="276px",
+                        on_bottom_reached=ThreadState.load_more_commands,
                     ),
                     shadow="md",
                     padding="xs",
@@ -9,6 +9,10 @@ class FileUploadConfig(BaseConfig):
     max_files_per_thread: int = 10
     cleanup_interval_minutes: int = 60
     files_expiration_days: int = 30
+    cleanup_concurrency: int = 8  # Parallel remote checks/deletes per batch
+    cleanup_batch_size: int = 50  # Vector stores per DB update and checkpoint
+    # Wall-clock budget per cleanup run; 0 derives it from the interval
+    cleanup_time_budget_minutes: int = 0
 
 
 class AssistantConfig(BaseConfig):
@@ -16,3 +20,4 @@ class AssistantConfig(BaseConfig):
     default_model: str = (
         ""  # Model ID to select by default; falls back to first available
     )
+    skill_sync_interval_minutes: int = 0  # > 0 enables the sync job (opt-in)
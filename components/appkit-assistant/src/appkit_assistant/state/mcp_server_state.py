@@ -11,8 +11,10 @@ import reflex as rx
 from appkit_assistant.backend.database.models import MCPAuthType, MCPServer
 from appkit_assistant.backend.database.repositories import (
     mcp_server_repo,
+    mcp_tool_cache_repo,
 )
 from appkit_assistant.backend.schemas import MCPServerConfigModel
+from appkit_assistant.backend.services.mcp_apps_service import McpAppsService
 from appkit_commons.database.session import get_asyncdb_session
 
 logger = logging.getLogger(__name__)
@@ -242,6 +244,11 @@ class MCPServerState(rx.State):
                         session, existing_server
                     )
                     updated_name = updated_server.name
+                    # URL or credentials may have changed: drop cached tools
+                    await mcp_tool_cache_repo.delete_by_server_id(
+                        session, updated_server.id
+                    )
+                    McpAppsService.invalidate_server(updated_server.id)
 
             if updated_name:
                 await self.load_servers()
@@ -295,6 +302,8 @@ class MCPServerState(rx.State):
 
                 # Delete server using repository
                 success = await mcp_server_repo.delete_by_id(session, server_id)
+                await mcp_tool_cache_repo.delete_by_server_id(session, server_id)
+                McpAppsService.invalidate_server(server_id)
 
             if success:
                 logger.debug("Deleted MCP server: %s", server_name)
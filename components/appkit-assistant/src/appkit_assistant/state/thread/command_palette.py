@@ -8,9 +8,12 @@ import re
 
 import reflex as rx
 
-from appkit_assistant.backend.database.repositories import user_prompt_repo
 from appkit_assistant.backend.schemas import CommandDefinition
-from appkit_commons.database.session import get_asyncdb_session
+from appkit_assistant.backend.user_prompt_cache import (
+    SEARCH_PAGE_SIZE,
+    IndexedPrompt,
+    user_prompt_index,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -25,7 +28,12 @@ class CommandPaletteMixin:
     ``temp_selected_mcp_servers``, ``server_selection_state``,
     ``available_skills_for_selection``, ``selected_skills``,
     ``temp_selected_skill_ids``, ``skill_selection_state``,
-    ``selected_model_supports_skills``, ``_current_user_id``.
+    ``selected_model_supports_skills``, ``has_more_commands``,
+    ``_commands_complete``, ``_commands_cursor``, ``_current_user_id``.
+
+    ``available_commands`` holds the user's prompt index. If the user can
+    access more prompts than the index holds, the palette is filled with
+    keyset-paginated server searches instead.
     """
 
     @rx.var
@@ -62,53 +70,35 @@ class CommandPaletteMixin:
         the command palette.
         """
         if self._current_user_id:
+            user_prompt_index.invalidate(int(self._current_user_id))
             await self._load_user_prompts_as_commands(int(self._current_user_id))
-            self._update_command_palette(self.prompt)
+            await self._refresh_command_palette(self.prompt)
+
+    @staticmethod
+    def _to_command(prompt: IndexedPrompt) -> CommandDefinition:
+        return CommandDefinition(
+            id=prompt.handle,
+            label=f"/{prompt.handle}",
+            description=prompt.description,
+            icon="" if prompt.is_own else "share",
+            is_editable=prompt.is_own,
+            user_id=prompt.user_id,
+            mcp_server_ids=list(prompt.mcp_server_ids),
+            skill_ids=list(prompt.skill_ids),
+        )
 
     async def _load_user_prompts_as_commands(self, user_id: int) -> None:
-        """Load user prompts from database and convert to CommandDefinitions."""
+        """Load accessible prompts from the prompt index as CommandDefinitions."""
         try:
-            async with get_asyncdb_session() as session:
-                own_prompts = await user_prompt_repo.find_latest_prompts_by_user(
-                    session, user_id
-                )
-                shared_prompts = await user_prompt_repo.find_latest_shared_prompts(
-                    session, user_id
-                )
-
-                self.available_commands = [
-                    CommandDefinition(
-                        id=p.handle,
-                        label=f"/{p.handle}",
-                        description=p.description,
-                        icon="",
-                        is_editable=True,
-                        user_id=user_id,
-                        mcp_server_ids=list(p.mcp_server_ids),
-                        skill_ids=list(p.skill_ids),
-                    )
-                    for p in own_prompts
-                ] + [
-                    CommandDefinition(
-                        id=p["handle"],
-                        label=f"/{p['handle']}",
-                        description=p.get("description", ""),
-                        icon="share",
-                        is_editable=False,
-                        user_id=p.get("user_id", 0),
-                        mcp_server_ids=p.get("mcp_server_ids", []),
-                        skill_ids=p.get("skill_ids", []),
-                    )
-                    for p in shared_prompts
-                ]
-
-                logger.debug(
-                    "Loaded %d commands (%d own, %d shared) for user %d",
-                    len(self.available_commands),
-                    len(own_prompts),
-                    len(shared_prompts),
-                    user_id,
-                )
+            prompts = await user_prompt_index.get_prompts(user_id)
+            self._commands_complete = await user_prompt_index.is_complete(user_id)
+            self.available_commands = [self._to_command(p) for p in prompts]
+
+            logger.debug(
+                "Loaded %d commands for user %d",
+                len(self.available_commands),
+                user_id,
+            )
         except Exception as e:
             logger.error("Error loading user prompts as commands: %s", e)
             self.available_commands = []
@@ -136,6 +126,51 @@ class CommandPaletteMixin:
         self.command_search_prefix = text_after_slash
         self.command_trigger_position = slash_pos
         self.selected_command_index = 0
+        self.has_more_commands = False
+
+    async def _search_commands(self, append: bool = False) -> None:
+        """Fill the palette from a server search of the current prefix.
+
+        Used when the prompt index is incomplete; ``append`` loads the page
+        after the last shown command.
+        """
+        after = self._commands_cursor if append else None
+        try:
+            # One extra row tells whether there is a next page
+            prompts = await user_prompt_index.search(
+                int(self._current_user_id),
+                self.command_search_prefix,
+                limit=SEARCH_PAGE_SIZE + 1,
+                after=after,
+            )
+        except Exception as e:
+            logger.error("Error searching prompts: %s", e)
+            return
+
+        self.has_more_commands = len(prompts) > SEARCH_PAGE_SIZE
+        prompts = prompts[:SEARCH_PAGE_SIZE]
+        commands = [self._to_command(p) for p in prompts]
+        self.filtered_commands = (
+            [*self.filtered_commands, *commands] if append else commands
+        )
+        if prompts:
+            self._commands_cursor = (prompts[-1].handle, prompts[-1].id)
+
+    async def _refresh_command_palette(self, prompt: str) -> None:
+        """Update the palette for ``prompt``, searching the server if needed."""
+        self._update_command_palette(prompt)
+        if (
+            self.show_command_palette
+            and not self._commands_complete
+            and self._current_user_id
+        ):
+            await self._search_commands()
+
+    @rx.event
+    async def load_more_commands(self) -> None:
+        """Append the next page of server search results (infinite scroll)."""
+        if self.show_command_palette and self.has_more_commands:
+            await self._search_commands(append=True)
 
     def _hide_command_palette(self) -> None:
         """Hide the command palette and reset state."""
@@ -144,6 +179,7 @@ class CommandPaletteMixin:
         self.selected_command_index = 0
         self.command_search_prefix = ""
         self.command_trigger_position = 0
+        self.has_more_commands = False
 
     @rx.event
     def navigate_command_palette(self, direction: str) -> None:
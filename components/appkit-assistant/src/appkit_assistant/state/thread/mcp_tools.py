@@ -10,7 +10,7 @@ import reflex as rx
 from appkit_assistant.backend.database.repositories import mcp_server_repo
 from appkit_assistant.backend.schemas import MCPServerConfigModel
 from appkit_commons.database.session import get_asyncdb_session
-from appkit_user.authentication.states import UserSession
+from appkit_user.authentication.states import get_user_permissions
 
 logger = logging.getLogger(__name__)
 
@@ -26,18 +26,14 @@ class McpToolsMixin:
     @rx.event
     async def load_mcp_servers(self) -> None:
         """Load available active MCP servers filtered by user roles."""
-        user_session = await self.get_state(UserSession)
-        user = await user_session.authenticated_user
-        user_roles: list[str] = user.roles if user else []
+        permissions = await get_user_permissions(self)
 
         async with get_asyncdb_session() as session:
             servers = await mcp_server_repo.find_all_active_ordered_by_name(session)
-            filtered_servers = [
+            self.available_mcp_servers = [
                 MCPServerConfigModel.model_validate(s)
-                for s in servers
-                if not s.required_role or s.required_role in user_roles
+                for s in permissions.filter_by_role(servers, lambda s: s.required_role)
             ]
-            self.available_mcp_servers = filtered_servers
 
     @rx.event
     def toggle_tools_modal(self, show: bool) -> None:
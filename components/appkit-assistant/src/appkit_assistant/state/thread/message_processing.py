@@ -17,9 +17,6 @@ from appkit_assistant.backend.database.models import (
     MCPServer,
     ThreadStatus,
 )
-from appkit_assistant.backend.database.repositories import (
-    user_prompt_repo,
-)
 from appkit_assistant.backend.model_manager import ModelManager
 from appkit_assistant.backend.schemas import (
     Chunk,
@@ -34,8 +31,8 @@ from appkit_assistant.backend.services.response_accumulator import (
     ResponseAccumulator,
 )
 from appkit_assistant.backend.services.thread_service import ThreadService
+from appkit_assistant.backend.user_prompt_cache import user_prompt_index
 from appkit_assistant.state.thread_list_state import ThreadListState
-from appkit_commons.database.session import get_asyncdb_session
 from appkit_user.authentication.states import UserSession
 
 logger = logging.getLogger(__name__)
@@ -264,63 +261,45 @@ class MessageProcessingMixin:
 
         return segments
 
-    async def _load_command_prompt_text(
-        self, user_id: int, command_handle: str
-    ) -> str | None:
-        """Load the prompt text for a command from the database."""
+    async def _load_command_prompt_texts(
+        self, user_id: int, command_handles: list[str]
+    ) -> dict[str, str]:
+        """Load the prompt texts for several commands at once."""
         try:
-            handle = command_handle.lstrip("/")
-            async with get_asyncdb_session() as session:
-                prompt = await user_prompt_repo.find_latest_accessible_by_handle(
-                    session, user_id, handle
-                )
-                if prompt:
-                    logger.debug(
-                        "Loaded command prompt for handle '%s'",
-                        handle,
-                    )
-                    return prompt.prompt_text
-
-                logger.debug(
-                    "Command prompt not found for handle '%s'",
-                    handle,
-                )
+            return await user_prompt_index.resolve(user_id, command_handles)
         except Exception as e:
             logger.error(
-                "Error loading command prompt for %s: %s",
-                command_handle,
+                "Error loading command prompts %s: %s",
+                command_handles,
                 e,
             )
-        return None
+        return {}
 
     async def _resolve_command_segments(
         self, segments: list[dict], user_id: int
     ) -> None:
-        """Resolve command handles to text prompts from DB."""
-        for segment in segments:
-            if segment["type"] == "command":
-                try:
-                    text = await self._load_command_prompt_text(
-                        user_id, segment["handle"]
-                    )
-                    segment["resolved_text"] = text
-                    if text:
-                        logger.debug(
-                            "Resolved command %s to prompt text",
-                            segment["handle"],
-                        )
-                    else:
-                        logger.warning(
-                            "Command %s not resolved for user %d",
-                            segment["handle"],
-                            user_id,
-                        )
-                except Exception as e:
-                    logger.error(
-                        "Error resolving command %s: %s",
-                        segment["handle"],
-                        e,
-                    )
+        """Resolve command handles to text prompts with one batched lookup."""
+        commands = [s for s in segments if s["type"] == "command"]
+        if not commands:
+            return
+
+        texts = await self._load_command_prompt_texts(
+            user_id, [s["handle"] for s in commands]
+        )
+        for segment in commands:
+            text = texts.get(segment["handle"].lstrip("/"))
+            segment["resolved_text"] = text
+            if text:
+                logger.debug(
+                    "Resolved command %s to prompt text",
+                    segment["handle"],
+                )
+            else:
+                logger.warning(
+                    "Command %s not resolved for user %d",
+                    segment["handle"],
+                    user_id,
+                )
 
     def _create_user_messages(
         self,
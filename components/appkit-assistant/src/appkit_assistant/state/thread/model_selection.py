@@ -4,13 +4,13 @@ Provides AI model listing, selection, and capability checks.
 """
 
 import logging
-from typing import Any
 
 import reflex as rx
 
 from appkit_assistant.backend.database.models import ThreadStatus
 from appkit_assistant.backend.model_manager import ModelManager
 from appkit_assistant.backend.schemas import AIModel
+from appkit_user.authentication.backend.permissions import Permissions
 
 logger = logging.getLogger(__name__)
 
@@ -79,17 +79,10 @@ class ModelSelectionMixin:
         model = ModelManager().get_model(self.selected_model)
         return model.supports_skills if model else False
 
-    def _setup_models(self, user: Any) -> None:
-        """Setup available AI models based on user roles."""
+    def _setup_models(self, permissions: Permissions) -> None:
+        """Setup available AI models based on the user's permissions."""
         model_manager = ModelManager()
-        all_models = model_manager.get_all_models()
-
-        user_roles = user.roles if user else []
-        self.ai_models = [
-            m
-            for m in all_models
-            if not m.requires_role or m.requires_role in user_roles
-        ]
+        self.ai_models = model_manager.get_models_for_roles(permissions.roles)
 
         # Ensure selected model is still available; keep current selection
         # when possible so refreshes don't disrupt the user's choice.
@@ -16,7 +16,7 @@ from appkit_assistant.backend.services.skill_service import (
     compute_api_key_hash,
 )
 from appkit_commons.database.session import get_asyncdb_session
-from appkit_user.authentication.states import UserSession
+from appkit_user.authentication.states import get_user_permissions
 
 logger = logging.getLogger(__name__)
 
@@ -32,9 +32,7 @@ class SkillsMixin:
     @rx.event
     async def load_available_skills_for_user(self) -> None:
         """Load active skills filtered by user roles and selected model."""
-        user_session = await self.get_state(UserSession)
-        user = await user_session.authenticated_user
-        user_roles: list[str] = user.roles if user else []
+        permissions = await get_user_permissions(self)
 
         async with get_asyncdb_session() as session:
             api_key_hash: str | None = None
@@ -52,12 +50,10 @@ class SkillsMixin:
             else:
                 skills = await skill_repo.find_all_active_ordered_by_name(session)
 
-            filtered = [
+            self.available_skills_for_selection = [
                 SkillModel.model_validate(s)
-                for s in skills
-                if not s.required_role or s.required_role in user_roles
+                for s in permissions.filter_by_role(skills, lambda s: s.required_role)
             ]
-            self.available_skills_for_selection = filtered
 
     @rx.event
     def set_modal_active_tab(self, tab: str | list[str]) -> None:
@@ -18,7 +18,11 @@ import reflex as rx
 from appkit_assistant.backend.database.models import ThreadStatus
 from appkit_assistant.backend.database.repositories import thread_repo
 from appkit_assistant.backend.schemas import ThreadModel
-from appkit_commons.database.session import get_asyncdb_session
+from appkit_commons.database.session import (
+    get_asyncdb_read_session,
+    get_asyncdb_session,
+    mark_user_write,
+)
 from appkit_user.authentication.states import UserSession
 
 if TYPE_CHECKING:
@@ -143,7 +147,7 @@ class ThreadListState(rx.State):
 
         # Fetch threads from database
         try:
-            async with get_asyncdb_session() as session:
+            async with get_asyncdb_read_session(user_id) as session:
                 thread_entities = await thread_repo.find_summaries_by_user(
                     session, user_id
                 )
@@ -284,6 +288,7 @@ class ThreadListState(rx.State):
                 await thread_repo.delete_by_thread_id_and_user(
                     session, thread_id, user_id
                 )
+            mark_user_write(user_id)
 
             async with self:
                 # Remove from list immediately
@@ -66,7 +66,7 @@ from appkit_assistant.state.thread.oauth import OAuthMixin
 from appkit_assistant.state.thread.skills import SkillsMixin
 from appkit_assistant.state.thread_list_state import ThreadListState
 from appkit_commons.registry import service_registry
-from appkit_user.authentication.states import UserSession
+from appkit_user.authentication.states import UserSession, get_user_permissions
 
 logger = logging.getLogger(__name__)
 
@@ -154,6 +154,7 @@ class ThreadState(
     command_search_prefix: str = ""
     command_trigger_position: int = 0
     available_commands: list[CommandDefinition] = []
+    has_more_commands: bool = False
 
     # Thread list integration
     with_thread_list: bool = False
@@ -161,6 +162,10 @@ class ThreadState(
     # Internal state
     _initialized: bool = False
     _current_user_id: str = ""
+    # False if the user's prompt index is truncated; see CommandPaletteMixin
+    _commands_complete: bool = True
+    # (handle, id) of the last command of a server search
+    _commands_cursor: tuple[str, int] | None = None
     _skip_user_message: bool = False
     _pending_file_cleanup: list[str] = []
     _cancel_event: asyncio.Event | None = None
@@ -325,8 +330,9 @@ class ThreadState(
         user_session: UserSession = await self.get_state(UserSession)
         user = await user_session.authenticated_user
         current_user_id = str(user.user_id) if user else ""
+        permissions = await get_user_permissions(self)
 
-        self._setup_models(user)
+        self._setup_models(permissions)
         logger.warning("Models setup complete. Has models: %d", len(self.ai_models))
 
         if self._initialized and self._current_user_id == current_user_id:
@@ -338,7 +344,7 @@ class ThreadState(
 
         self._thread = self._thread_service.create_new_thread(
             current_model=self.selected_model,
-            user_roles=user.roles if user else [],
+            user_roles=permissions.roles,
         )
         self._reset_ui_state()
         self._current_user_id = current_user_id
@@ -392,13 +398,11 @@ class ThreadState(
             logger.debug("Thread already empty, skipping new_thread")
             return
 
-        user_session: UserSession = await self.get_state(UserSession)
-        user = await user_session.authenticated_user
-        user_roles = user.roles if user else []
+        permissions = await get_user_permissions(self)
 
         self._thread = self._thread_service.create_new_thread(
             current_model=self.selected_model,
-            user_roles=user_roles,
+            user_roles=permissions.roles,
         )
         self.messages = []
         self.thinking_items = []
@@ -511,10 +515,10 @@ class ThreadState(
     # -----------------------------------------------------------------
 
     @rx.event
-    def set_prompt(self, prompt: str) -> None:
+    async def set_prompt(self, prompt: str) -> None:
         """Set the current prompt and handle command palette."""
         self.prompt = prompt
-        self._update_command_palette(prompt)
+        await self._refresh_command_palette(prompt)
 
     @rx.event
     def set_suggestions(self, suggestions: list[Suggestion] | list[dict]) -> None:
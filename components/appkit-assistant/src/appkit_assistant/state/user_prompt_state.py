@@ -12,9 +12,14 @@ from appkit_assistant.backend.database.repositories import (
 )
 from appkit_assistant.backend.schemas import MCPServerConfigModel, SkillModel
 from appkit_assistant.backend.services.user_prompt_service import validate_handle
+from appkit_assistant.backend.user_prompt_cache import user_prompt_index
 from appkit_assistant.state.thread_state import ThreadState
-from appkit_commons.database.session import get_asyncdb_session
-from appkit_user.authentication.states import UserSession
+from appkit_commons.database.session import (
+    get_asyncdb_session,
+    mark_user_write,
+    replica_lag_seconds,
+)
+from appkit_user.authentication.states import UserSession, get_user_permissions
 
 logger = logging.getLogger(__name__)
 
@@ -37,6 +42,7 @@ class UserPromptState(State):
     modal_description: str = ""
     modal_prompt: str = ""
     modal_is_shared: bool = False
+    _modal_was_shared: bool = False
     modal_char_count: int = 0
     modal_error: str = ""
     modal_textarea_key: int = 0
@@ -95,6 +101,7 @@ class UserPromptState(State):
         self.modal_description = ""
         self.modal_prompt = ""
         self.modal_is_shared = False
+        self._modal_was_shared = False
         self.modal_char_count = 0
         self.modal_error = ""
         self.modal_textarea_key += 1
@@ -187,34 +194,26 @@ class UserPromptState(State):
 
         Filters by user roles similar to ThreadState.load_mcp_servers().
         """
-        user_session: UserSession = await self.get_state(UserSession)
-        user = await user_session.authenticated_user
-        user_roles: list[str] = user.roles if user else []
+        permissions = await get_user_permissions(self)
 
         async with get_asyncdb_session() as session:
             servers = await mcp_server_repo.find_all_active_ordered_by_name(session)
             # Filter servers by user roles (same logic as ThreadState)
-            filtered_servers = [
+            self.modal_available_mcp_servers = [
                 MCPServerConfigModel.model_validate(s)
-                for s in servers
-                if not s.required_role or s.required_role in user_roles
+                for s in permissions.filter_by_role(servers, lambda s: s.required_role)
             ]
-            self.modal_available_mcp_servers = filtered_servers
 
     async def _load_modal_available_skills(self) -> None:
         """Load available skills for the current user filtered by role."""
-        user_session: UserSession = await self.get_state(UserSession)
-        user = await user_session.authenticated_user
-        user_roles: list[str] = user.roles if user else []
+        permissions = await get_user_permissions(self)
 
         async with get_asyncdb_session() as session:
             skills = await skill_repo.find_all_active_ordered_by_name(session)
-            filtered = [
+            self.modal_available_skills = [
                 SkillModel.model_validate(s)
-                for s in skills
-                if not s.required_role or s.required_role in user_roles
+                for s in permissions.filter_by_role(skills, lambda s: s.required_role)
             ]
-            self.modal_available_skills = filtered
 
     @rx.event
     async def open_edit_modal(self, handle: str) -> None:
@@ -279,6 +278,7 @@ class UserPromptState(State):
                     self.modal_description = latest.description
                     self.modal_prompt = latest.prompt_text
                     self.modal_is_shared = latest.is_shared
+                    self._modal_was_shared = latest.is_shared
                     self.modal_char_count = len(latest.prompt_text)
                     # Filter MCP servers to only those available to current user
                     # Convert int IDs from DB to strings for UI
@@ -371,6 +371,14 @@ class UserPromptState(State):
         """Set modal share toggle."""
         self.modal_is_shared = bool(value)
 
+    def _invalidate_prompt_index(self, user_id: int) -> None:
+        """Drop the cached prompts affected by a change of the modal prompt."""
+        # Shared prompts appear in other users' indexes as well
+        if self.modal_is_shared or self._modal_was_shared:
+            user_prompt_index.invalidate_shared(user_id, replica_lag_seconds())
+        else:
+            user_prompt_index.invalidate(user_id)
+
     async def save_from_modal(self) -> AsyncGenerator[Any, Any]:
         """Save prompt from modal (create new or update existing)."""
         handle = self.modal_handle.strip().lower()
@@ -456,6 +464,8 @@ class UserPromptState(State):
                         skill_ids=skill_ids,
                     )
 
+            mark_user_write(user_id)
+            self._invalidate_prompt_index(user_id)
             self._reset_modal()
             yield ThreadState.reload_commands
 
@@ -486,6 +496,8 @@ class UserPromptState(State):
             async with get_asyncdb_session() as session:
                 await user_prompt_repo.delete_all_versions(session, user_id, handle)
 
+            mark_user_write(user_id)
+            self._invalidate_prompt_index(user_id)
             self._reset_modal()
             yield ThreadState.reload_commands
 
@@ -23,8 +23,10 @@ from appkit_assistant.backend.database.models import (
 )
 from appkit_assistant.backend.database.repositories import (
     AIModelRepository,
+    CleanupCheckpointRepository,
     FileUploadRepository,
     MCPServerRepository,
+    MCPToolCacheRepository,
     SkillRepository,
     SystemPromptRepository,
     ThreadRepository,
@@ -54,6 +56,12 @@ async def mcp_server_repo() -> MCPServerRepository:
     return MCPServerRepository()
 
 
+@pytest_asyncio.fixture
+async def mcp_tool_cache_repo() -> MCPToolCacheRepository:
+    """Provide MCPToolCacheRepository instance."""
+    return MCPToolCacheRepository()
+
+
 @pytest_asyncio.fixture
 async def system_prompt_repo() -> SystemPromptRepository:
     """Provide SystemPromptRepository instance."""
@@ -72,6 +80,12 @@ async def file_upload_repo() -> FileUploadRepository:
     return FileUploadRepository()
 
 
+@pytest_asyncio.fixture
+async def cleanup_checkpoint_repo() -> CleanupCheckpointRepository:
+    """Provide CleanupCheckpointRepository instance."""
+    return CleanupCheckpointRepository()
+
+
 @pytest_asyncio.fixture
 async def user_prompt_repo() -> UserPromptRepository:
     """Provide UserPromptRepository instance."""
@@ -362,6 +362,101 @@ class TestUserPromptRepository:
         assert v1.handle == "new-handle"
         assert v2.handle == "new-handle"
 
+    @pytest.mark.asyncio
+    async def test_find_latest_accessible_by_handles(
+        self,
+        async_session: AsyncSession,
+        user_prompt_factory,
+        user_prompt_repo,
+        query_budget,
+    ) -> None:
+        """Handles resolve in one query, preferring own over shared prompts."""
+        own = await user_prompt_factory(user_id=1, handle="dup")
+        await user_prompt_factory(user_id=2, handle="dup", is_shared=True)
+        shared = await user_prompt_factory(user_id=2, handle="shared", is_shared=True)
+        await user_prompt_factory(user_id=2, handle="private")
+        await user_prompt_factory(user_id=1, handle="old", is_latest=False)
+
+        with query_budget(1):
+            results = await user_prompt_repo.find_latest_accessible_by_handles(
+                async_session, 1, ["dup", "shared", "private", "old", "missing"]
+            )
+
+        assert set(results) == {"dup", "shared"}
+        assert results["dup"].id == own.id
+        assert results["shared"].id == shared.id
+
+    @pytest.mark.asyncio
+    async def test_find_latest_accessible_by_handles_empty(
+        self, async_session: AsyncSession, user_prompt_repo
+    ) -> None:
+        """No handles resolves to an empty mapping."""
+        assert (
+            await user_prompt_repo.find_latest_accessible_by_handles(
+                async_session, 1, []
+            )
+            == {}
+        )
+
+    @pytest.mark.asyncio
+    async def test_find_accessible_prompts_page_keyset(
+        self, async_session: AsyncSession, user_prompt_factory, user_prompt_repo
+    ) -> None:
+        """Pages follow (handle, id) order and continue after the cursor."""
+        for handle in ("c-prompt", "a-prompt", "b-prompt"):
+            await user_prompt_factory(user_id=1, handle=handle)
+        await user_prompt_factory(user_id=2, handle="d-prompt", is_shared=True)
+        await user_prompt_factory(user_id=2, handle="e-prompt")
+
+        page1 = await user_prompt_repo.find_accessible_prompts_page(
+            async_session, 1, limit=2
+        )
+        last = page1[-1]
+        page2 = await user_prompt_repo.find_accessible_prompts_page(
+            async_session, 1, limit=2, after=(last["handle"], last["id"])
+        )
+
+        assert [p["handle"] for p in page1] == ["a-prompt", "b-prompt"]
+        assert [p["handle"] for p in page2] == ["c-prompt", "d-prompt"]
+        assert page2[1]["is_own"] is False
+
+    @pytest.mark.asyncio
+    async def test_find_accessible_prompts_page_prefix(
+        self, async_session: AsyncSession, user_prompt_factory, user_prompt_repo
+    ) -> None:
+        """Prefix filtering matches handle prefixes literally."""
+        await user_prompt_factory(user_id=1, handle="tr-one")
+        await user_prompt_factory(user_id=1, handle="trx")
+        await user_prompt_factory(user_id=1, handle="other")
+
+        results = await user_prompt_repo.find_accessible_prompts_page(
+            async_session, 1, prefix="tr-"
+        )
+
+        assert [p["handle"] for p in results] == ["tr-one"]
+
+    @pytest.mark.asyncio
+    async def test_find_all_accessible_prompts_filtered(
+        self, async_session: AsyncSession, user_prompt_factory, user_prompt_repo
+    ) -> None:
+        """Own prompts come first, then shared prompts, honouring the limit."""
+        await user_prompt_factory(user_id=2, handle="a-shared", is_shared=True)
+        await user_prompt_factory(user_id=1, handle="b-own")
+        await user_prompt_factory(user_id=2, handle="c-private")
+
+        results = await user_prompt_repo.find_all_accessible_prompts_filtered(
+            async_session, 1
+        )
+        limited = await user_prompt_repo.find_all_accessible_prompts_filtered(
+            async_session, 1, limit=1
+        )
+
+        assert [(p["handle"], p["is_own"]) for p in results] == [
+            ("b-own", True),
+            ("a-shared", False),
+        ]
+        assert [p["handle"] for p in limited] == ["b-own"]
+
 
 class TestSkillRepository:
     """Test suite for SkillRepository."""
@@ -454,6 +549,97 @@ class TestSkillRepository:
         assert len(results) == 1
         assert results[0].id == active.id
 
+    @pytest.mark.asyncio
+    async def test_bulk_upsert_remote_inserts_and_updates(
+        self, async_session: AsyncSession, skill_factory, skill_repo, query_budget
+    ) -> None:
+        """bulk_upsert_remote updates existing rows and inserts new ones."""
+        existing = await skill_factory(
+            openai_id="skill-1", name="Old", latest_version="1", active=False
+        )
+        remote = [
+            {
+                "id": "skill-1",
+                "name": "Renamed",
+                "description": "updated",
+                "default_version": "2",
+                "latest_version": "2",
+            },
+            {
+                "id": "skill-2",
+                "name": "New",
+                "description": "",
+                "default_version": "1",
+                "latest_version": "1",
+            },
+        ]
+
+        with query_budget(1):
+            count = await skill_repo.bulk_upsert_remote(
+                async_session, remote, api_key_hash="hash-a"
+            )
+        async_session.expire_all()
+
+        assert count == 2
+        updated = await skill_repo.find_by_openai_id(async_session, "skill-1")
+        assert updated.id == existing.id
+        assert updated.name == "Renamed"
+        assert updated.latest_version == "2"
+        assert updated.api_key_hash == "hash-a"
+        # Activation state is owned by the local admin, not the sync
+        assert updated.active is False
+        created = await skill_repo.find_by_openai_id(async_session, "skill-2")
+        assert created.active is True
+        assert created.api_key_hash == "hash-a"
+
+    @pytest.mark.asyncio
+    async def test_bulk_upsert_remote_empty(
+        self, async_session: AsyncSession, skill_repo
+    ) -> None:
+        """bulk_upsert_remote is a no-op for an empty listing."""
+        assert await skill_repo.bulk_upsert_remote(async_session, []) == 0
+
+    @pytest.mark.asyncio
+    async def test_deactivate_missing_scoped_by_hash(
+        self, async_session: AsyncSession, skill_factory, skill_repo
+    ) -> None:
+        """deactivate_missing only touches active skills of the given key."""
+        keep = await skill_factory(openai_id="keep", api_key_hash="hash-a")
+        stale = await skill_factory(openai_id="stale", api_key_hash="hash-a")
+        other = await skill_factory(openai_id="other", api_key_hash="hash-b")
+
+        ids = (keep.id, stale.id, other.id)
+
+        count = await skill_repo.deactivate_missing(
+            async_session, {"keep"}, api_key_hash="hash-a"
+        )
+        async_session.expire_all()
+
+        assert count == 1
+        assert (await skill_repo.find_by_id(async_session, ids[0])).active
+        assert not (await skill_repo.find_by_id(async_session, ids[1])).active
+        assert (await skill_repo.find_by_id(async_session, ids[2])).active
+
+    @pytest.mark.asyncio
+    async def test_deactivate_missing_scoped_by_base_url(
+        self, async_session: AsyncSession, skill_factory, skill_repo
+    ) -> None:
+        """The same key listed against another endpoint keeps its skills."""
+        default = await skill_factory(openai_id="default", api_key_hash="hash-a")
+        proxied = await skill_factory(
+            openai_id="proxied", api_key_hash="hash-a", base_url="https://proxy"
+        )
+        ids = (default.id, proxied.id)
+
+        count = await skill_repo.deactivate_missing(
+            async_session, set(), api_key_hash="hash-a", base_url="https://proxy"
+        )
+        async_session.expire_all()
+
+        assert count == 1
+        assert (await skill_repo.find_by_id(async_session, ids[0])).active
+        assert not (await skill_repo.find_by_id(async_session, ids[1])).active
+
     @pytest.mark.asyncio
     async def test_update_required_role(
         self, async_session: AsyncSession, skill_factory, skill_repo
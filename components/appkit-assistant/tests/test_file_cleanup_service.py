@@ -2,11 +2,15 @@
 """Tests for FileCleanupService and run_cleanup helper.
 
 Covers scheduled cleanup, per-subscription iteration, expired-store
-detection, thread vector_store_id clearing, and the manual trigger.
+detection, batched thread updates, checkpoints, time budgets, and the
+manual trigger.
 """
 
 from __future__ import annotations
 
+import asyncio
+import time
+from collections.abc import Iterator
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
@@ -30,15 +34,36 @@ def _db_context(session: AsyncMock | None = None):
     return cm
 
 
-def _config(interval: int = 60):
+def _config(
+    interval: int = 60,
+    concurrency: int = 8,
+    batch_size: int = 50,
+    budget: int = 0,
+):
     cfg = MagicMock()
     cfg.cleanup_interval_minutes = interval
+    cfg.cleanup_concurrency = concurrency
+    cfg.cleanup_batch_size = batch_size
+    cfg.cleanup_time_budget_minutes = budget
     cfg.max_file_size_mb = 20
     cfg.max_files_per_thread = 10
     cfg.vector_store_expiration_days = 7
     return cfg
 
 
+def _deleted(files: int = 0) -> dict:
+    return {"deleted": True, "files_found": files, "files_deleted": files}
+
+
+@pytest.fixture(autouse=True)
+def mock_checkpoint_repo() -> Iterator[MagicMock]:
+    with patch(f"{_PATCH}.cleanup_checkpoint_repo") as repo:
+        repo.find_by_job = AsyncMock(return_value=None)
+        repo.save = AsyncMock()
+        repo.delete_by_job = AsyncMock(return_value=0)
+        yield repo
+
+
 # ================================================================
 # get_file_upload_config
 # ================================================================
@@ -136,16 +161,15 @@ class TestCheckVectorStoreExpired:
 
 
 # ================================================================
-# _clear_thread_vector_store_ids
+# _complete_batch
 # ================================================================
 
 
-class TestClearThreadVectorStoreIds:
+class TestCompleteBatch:
     @pytest.mark.asyncio
-    async def test_clears_threads(self) -> None:
+    async def test_clears_threads(self, mock_checkpoint_repo: MagicMock) -> None:
         svc = FileCleanupService(config=_config())
         db = AsyncMock()
-        db.commit = AsyncMock()
         with (
             patch(
                 f"{_PATCH}.get_asyncdb_session",
@@ -153,9 +177,63 @@ class TestClearThreadVectorStoreIds:
             ),
             patch(f"{_PATCH}.thread_repo") as tr,
         ):
-            tr.clear_vector_store_id = AsyncMock(return_value=3)
-            result = await svc._clear_thread_vector_store_ids("vs-1")
+            tr.clear_vector_store_ids = AsyncMock(return_value=3)
+            result = await svc._complete_batch(["vs-1", "vs-2"])
         assert result == 3
+        tr.clear_vector_store_ids.assert_awaited_once_with(db, ["vs-1", "vs-2"])
+        mock_checkpoint_repo.save.assert_not_awaited()
+        db.commit.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_saves_checkpoint_in_same_transaction(
+        self, mock_checkpoint_repo: MagicMock
+    ) -> None:
+        svc = FileCleanupService(config=_config())
+        db = AsyncMock()
+        with (
+            patch(
+                f"{_PATCH}.get_asyncdb_session",
+                return_value=_db_context(db),
+            ),
+            patch(f"{_PATCH}.thread_repo") as tr,
+        ):
+            tr.clear_vector_store_ids = AsyncMock(return_value=0)
+            await svc._complete_batch(
+                [],
+                checkpoint_job="file_cleanup",
+                ai_model="gpt-4",
+                last_vector_store_id="vs-9",
+            )
+        mock_checkpoint_repo.save.assert_awaited_once_with(
+            db, "file_cleanup", "gpt-4", "vs-9"
+        )
+        db.commit.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_nothing_to_do(self) -> None:
+        svc = FileCleanupService(config=_config())
+        with patch(f"{_PATCH}.get_asyncdb_session") as db_ctx:
+            assert await svc._complete_batch([]) == 0
+        db_ctx.assert_not_called()
+
+
+# ================================================================
+# time budget
+# ================================================================
+
+
+class TestTimeBudget:
+    def test_explicit_budget(self) -> None:
+        svc = FileCleanupService(config=_config(60, budget=20))
+        assert svc.time_budget_seconds() == 20 * 60
+
+    def test_derived_from_interval(self) -> None:
+        svc = FileCleanupService(config=_config(60))
+        assert svc.time_budget_seconds() == pytest.approx(60 * 60 * 0.9)
+
+    def test_unlimited_when_disabled(self) -> None:
+        svc = FileCleanupService(config=_config(0))
+        assert svc.time_budget_seconds() is None
 
 
 # ================================================================
@@ -167,31 +245,52 @@ class TestExecute:
     @pytest.mark.asyncio
     async def test_disabled_interval(self) -> None:
         svc = FileCleanupService(config=_config(0))
-        await svc.execute()
-        # Should not raise, just return
+        assert await svc.execute() == 0
 
     @pytest.mark.asyncio
     async def test_success(self) -> None:
         svc = FileCleanupService(config=_config(60))
 
-        async def _gen():
-            yield {"status": "completed"}
+        async def _gen(**kwargs):
+            yield {"status": "checking", "vector_stores_deleted": 1}
+            yield {
+                "status": "completed",
+                "vector_stores_deleted": 2,
+                "files_deleted": 3,
+            }
+
+        with patch.object(
+            svc, "cleanup_all_subscriptions", side_effect=_gen
+        ) as cleanup:
+            assert await svc.execute() == 5
+        deadline = cleanup.call_args.kwargs["deadline"]
+        assert deadline > time.monotonic() + 50 * 60
+
+    @pytest.mark.asyncio
+    async def test_paused(self) -> None:
+        svc = FileCleanupService(config=_config(60))
+
+        async def _gen(**kwargs):
+            yield {"status": "paused", "files_deleted": 4}
 
         with patch.object(svc, "cleanup_all_subscriptions", side_effect=_gen):
-            await svc.execute()
+            assert await svc.execute() == 4
 
     @pytest.mark.asyncio
     async def test_error(self) -> None:
         svc = FileCleanupService(config=_config(60))
 
-        async def _gen():
+        async def _gen(**kwargs):
             raise RuntimeError("fail")
             yield  # noqa: B027
 
-        with patch.object(
-            svc,
-            "cleanup_all_subscriptions",
-            side_effect=_gen,
+        with (
+            patch.object(
+                svc,
+                "cleanup_all_subscriptions",
+                side_effect=_gen,
+            ),
+            pytest.raises(RuntimeError, match="fail"),
         ):
             await svc.execute()
 
@@ -267,7 +366,102 @@ class TestCleanupAllSubscriptions:
             oai.create_client_for_model = AsyncMock(return_value=AsyncMock())
             results = [r async for r in svc.cleanup_all_subscriptions()]
         assert results[-1]["status"] == "completed"
-        assert results[-1]["vector_stores_checked"] >= 1
+        assert results[-1]["vector_stores_checked"] == 1
+
+    @pytest.mark.asyncio
+    async def test_aggregates_cumulative_progress(self) -> None:
+        svc = FileCleanupService(config=_config())
+
+        async def _cleanup(*args, **kwargs):
+            for checked in (1, 2):
+                yield {
+                    "vector_stores_checked": checked,
+                    "total_vector_stores": 2,
+                    "status": "checking",
+                }
+            yield {
+                "vector_stores_checked": 2,
+                "total_vector_stores": 2,
+                "status": "completed",
+            }
+
+        with (
+            patch(
+                f"{_PATCH}.get_asyncdb_session",
+                return_value=_db_context(),
+            ),
+            patch(f"{_PATCH}.file_upload_repo") as fu,
+            patch(f"{_PATCH}.OpenAIClientService") as oai,
+            patch(f"{_PATCH}.FileUploadService"),
+            patch.object(svc, "cleanup_expired_files", side_effect=_cleanup),
+        ):
+            fu.find_distinct_ai_models = AsyncMock(return_value=["a", "b"])
+            oai.create_client_for_model = AsyncMock(return_value=AsyncMock())
+            results = [r async for r in svc.cleanup_all_subscriptions()]
+        assert results[-1]["vector_stores_checked"] == 4
+        assert results[-1]["total_vector_stores"] == 4
+
+    @pytest.mark.asyncio
+    async def test_resumes_from_checkpoint(
+        self, mock_checkpoint_repo: MagicMock
+    ) -> None:
+        svc = FileCleanupService(config=_config())
+        mock_checkpoint_repo.find_by_job.return_value = MagicMock(
+            ai_model="b", last_vector_store_id="vs-5"
+        )
+        calls: list[tuple[str, str | None]] = []
+
+        async def _cleanup(client, fus, ai_model="", resume_after=None, **kwargs):
+            calls.append((ai_model, resume_after))
+            assert kwargs["checkpoint_job"] == "file_cleanup"
+            yield {"status": "completed"}
+
+        with (
+            patch(
+                f"{_PATCH}.get_asyncdb_session",
+                return_value=_db_context(),
+            ),
+            patch(f"{_PATCH}.file_upload_repo") as fu,
+            patch(f"{_PATCH}.OpenAIClientService") as oai,
+            patch(f"{_PATCH}.FileUploadService"),
+            patch.object(svc, "cleanup_expired_files", side_effect=_cleanup),
+        ):
+            fu.find_distinct_ai_models = AsyncMock(return_value=["a", "b", "c"])
+            oai.create_client_for_model = AsyncMock(return_value=AsyncMock())
+            results = [r async for r in svc.cleanup_all_subscriptions()]
+
+        assert calls == [("b", "vs-5"), ("c", None)]
+        assert results[-1]["status"] == "completed"
+        mock_checkpoint_repo.delete_by_job.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_paused_keeps_checkpoint(
+        self, mock_checkpoint_repo: MagicMock
+    ) -> None:
+        svc = FileCleanupService(config=_config())
+        calls: list[str] = []
+
+        async def _cleanup(client, fus, ai_model="", **kwargs):
+            calls.append(ai_model)
+            yield {"status": "paused"}
+
+        with (
+            patch(
+                f"{_PATCH}.get_asyncdb_session",
+                return_value=_db_context(),
+            ),
+            patch(f"{_PATCH}.file_upload_repo") as fu,
+            patch(f"{_PATCH}.OpenAIClientService") as oai,
+            patch(f"{_PATCH}.FileUploadService"),
+            patch.object(svc, "cleanup_expired_files", side_effect=_cleanup),
+        ):
+            fu.find_distinct_ai_models = AsyncMock(return_value=["a", "b"])
+            oai.create_client_for_model = AsyncMock(return_value=AsyncMock())
+            results = [r async for r in svc.cleanup_all_subscriptions()]
+
+        assert calls == ["a"]
+        assert results[-1]["status"] == "paused"
+        mock_checkpoint_repo.delete_by_job.assert_not_awaited()
 
 
 # ================================================================
@@ -320,7 +514,7 @@ class TestCleanupExpiredFiles:
             ),
             patch.object(
                 svc,
-                "_clear_thread_vector_store_ids",
+                "_complete_batch",
                 return_value=1,
             ),
         ):
@@ -360,6 +554,136 @@ class TestCleanupExpiredFiles:
             results = [r async for r in svc.cleanup_expired_files(client, fus)]
         assert results[-1]["vector_stores_expired"] == 0
 
+    @pytest.mark.asyncio
+    async def test_batches_resume_and_checkpoint(self) -> None:
+        svc = FileCleanupService(config=_config(batch_size=2))
+        client = AsyncMock()
+        fus = AsyncMock()
+        fus.delete_vector_store = AsyncMock(return_value=_deleted(1))
+        with (
+            patch(
+                f"{_PATCH}.get_asyncdb_session",
+                return_value=_db_context(),
+            ),
+            patch(f"{_PATCH}.file_upload_repo") as fu,
+            patch(f"{_PATCH}.thread_repo") as tr,
+            patch.object(svc, "_check_vector_store_expired", return_value=True),
+            patch.object(svc, "_complete_batch", return_value=0) as complete,
+        ):
+            fu.find_unique_vector_stores_by_ai_model = AsyncMock(
+                return_value=[("vs-4", ""), ("vs-1", ""), ("vs-3", "")]
+            )
+            tr.find_unique_vector_store_ids = AsyncMock(return_value=["vs-2", "vs-5"])
+            results = [
+                r
+                async for r in svc.cleanup_expired_files(
+                    client,
+                    fus,
+                    ai_model="gpt-4",
+                    resume_after="vs-1",
+                    checkpoint_job="file_cleanup",
+                )
+            ]
+
+        final = results[-1]
+        assert final["status"] == "completed"
+        assert final["total_vector_stores"] == 4
+        assert final["vector_stores_deleted"] == 4
+        assert final["files_deleted"] == 4
+        batches = [c.args[0] for c in complete.await_args_list]
+        assert batches == [["vs-2", "vs-3"], ["vs-4", "vs-5"]]
+        assert complete.await_args_list[-1].kwargs == {
+            "checkpoint_job": "file_cleanup",
+            "ai_model": "gpt-4",
+            "last_vector_store_id": "vs-5",
+        }
+
+    @pytest.mark.asyncio
+    async def test_pauses_when_deadline_passed(self) -> None:
+        svc = FileCleanupService(config=_config(batch_size=1))
+        client = AsyncMock()
+        fus = AsyncMock()
+        with (
+            patch(
+                f"{_PATCH}.get_asyncdb_session",
+                return_value=_db_context(),
+            ),
+            patch(f"{_PATCH}.file_upload_repo") as fu,
+            patch(f"{_PATCH}.thread_repo") as tr,
+            patch.object(svc, "_check_vector_store_expired") as check,
+        ):
+            fu.find_unique_vector_stores = AsyncMock(return_value=[("vs-1", "")])
+            tr.find_unique_vector_store_ids = AsyncMock(return_value=[])
+            results = [
+                r
+                async for r in svc.cleanup_expired_files(
+                    client, fus, deadline=time.monotonic() - 1
+                )
+            ]
+        assert results[-1]["status"] == "paused"
+        assert results[-1]["vector_stores_checked"] == 0
+        check.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_bounded_concurrency(self) -> None:
+        svc = FileCleanupService(config=_config(concurrency=2))
+        client = AsyncMock()
+        fus = AsyncMock()
+        running = 0
+        peak = 0
+
+        async def _check(client, vs_id):
+            nonlocal running, peak
+            running += 1
+            peak = max(peak, running)
+            await asyncio.sleep(0)
+            running -= 1
+            return False
+
+        with (
+            patch(
+                f"{_PATCH}.get_asyncdb_session",
+                return_value=_db_context(),
+            ),
+            patch(f"{_PATCH}.file_upload_repo") as fu,
+            patch(f"{_PATCH}.thread_repo") as tr,
+            patch.object(svc, "_check_vector_store_expired", side_effect=_check),
+        ):
+            fu.find_unique_vector_stores = AsyncMock(
+                return_value=[(f"vs-{i}", "") for i in range(6)]
+            )
+            tr.find_unique_vector_store_ids = AsyncMock(return_value=[])
+            results = [r async for r in svc.cleanup_expired_files(client, fus)]
+        assert results[-1]["vector_stores_checked"] == 6
+        assert peak == 2
+
+    @pytest.mark.asyncio
+    async def test_store_failure_does_not_abort(self) -> None:
+        svc = FileCleanupService(config=_config())
+        client = AsyncMock()
+        fus = AsyncMock()
+        fus.delete_vector_store = AsyncMock(
+            side_effect=[RuntimeError("rate limit"), _deleted()]
+        )
+        with (
+            patch(
+                f"{_PATCH}.get_asyncdb_session",
+                return_value=_db_context(),
+            ),
+            patch(f"{_PATCH}.file_upload_repo") as fu,
+            patch(f"{_PATCH}.thread_repo") as tr,
+            patch.object(svc, "_check_vector_store_expired", return_value=True),
+            patch.object(svc, "_complete_batch", return_value=0) as complete,
+        ):
+            fu.find_unique_vector_stores = AsyncMock(
+                return_value=[("vs-1", ""), ("vs-2", "")]
+            )
+            tr.find_unique_vector_store_ids = AsyncMock(return_value=[])
+            results = [r async for r in svc.cleanup_expired_files(client, fus)]
+        assert results[-1]["status"] == "completed"
+        assert results[-1]["vector_stores_deleted"] == 1
+        assert complete.await_args.args[0] == ["vs-2"]
+
     @pytest.mark.asyncio
     async def test_error_propagates(self) -> None:
         svc = FileCleanupService(config=_config())
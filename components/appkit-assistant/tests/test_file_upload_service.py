@@ -4,6 +4,7 @@ Covers file validation, retry logic, vector store lifecycle,
 file deletion cascade, and error handling.
 """
 
+import asyncio
 from pathlib import Path
 from types import SimpleNamespace
 from unittest.mock import AsyncMock, MagicMock, patch
@@ -385,6 +386,60 @@ class TestDeleteFilesFromOpenai:
         assert result["f1"] is True
         assert result["f2"] is False
 
+    @pytest.mark.asyncio
+    async def test_bounded_concurrency(
+        self,
+        mock_client: MagicMock,
+    ) -> None:
+        service = FileUploadService(
+            client=mock_client, config=FileUploadConfig(cleanup_concurrency=2)
+        )
+        running = 0
+        peak = 0
+
+        async def _delete(file_id: str) -> None:
+            nonlocal running, peak
+            running += 1
+            peak = max(peak, running)
+            await asyncio.sleep(0)
+            running -= 1
+
+        mock_client.files.delete.side_effect = _delete
+        file_ids = [f"f{i}" for i in range(6)]
+        result = await service._delete_files_from_openai(file_ids)  # noqa: SLF001
+        assert list(result) == file_ids
+        assert all(result.values())
+        assert peak == 2
+
+
+class TestDeleteFileDbRecords:
+    @pytest.mark.asyncio
+    async def test_single_bulk_delete(
+        self,
+        service: FileUploadService,
+    ) -> None:
+        session = _mock_session()
+        with (
+            patch(
+                f"{_PATCH}.get_asyncdb_session",
+                return_value=_db_context(session),
+            ),
+            patch(f"{_PATCH}.file_upload_repo") as repo,
+        ):
+            repo.delete_by_openai_file_ids = AsyncMock(return_value=2)
+            await service._delete_file_db_records(["f1", "f2"])  # noqa: SLF001
+        repo.delete_by_openai_file_ids.assert_awaited_once_with(session, ["f1", "f2"])
+        session.commit.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_empty(
+        self,
+        service: FileUploadService,
+    ) -> None:
+        with patch(f"{_PATCH}.get_asyncdb_session") as db_ctx:
+            await service._delete_file_db_records([])  # noqa: SLF001
+        db_ctx.assert_not_called()
+
 
 # ============================================================================
 # _wait_for_processing — progress chunks
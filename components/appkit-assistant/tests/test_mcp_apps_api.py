@@ -18,6 +18,10 @@ from appkit_assistant.backend.api.mcp_apps_api import (
     get_resource,
     list_ui_tools,
 )
+from appkit_assistant.backend.mcp_resource_cache import (
+    CachedResource,
+    compute_resource_etag,
+)
 from appkit_assistant.backend.schemas import (
     McpAppResource,
     McpAppToolInfo,
@@ -46,6 +50,15 @@ def _make_server_mock(
     return server
 
 
+def _cached(resource: McpAppResource) -> CachedResource:
+    return CachedResource(
+        resource=resource,
+        etag=compute_resource_etag(resource),
+        fetched_at=0.0,
+        ttl_seconds=300,
+    )
+
+
 # ============================================================================
 # ToolCallRequest schema
 # ============================================================================
@@ -121,7 +134,7 @@ class TestGetResourceEndpoint:
             html_content="<h1>Hello</h1>",
         )
         mock_service = AsyncMock()
-        mock_service.fetch_resource = AsyncMock(return_value=resource)
+        mock_service.get_resource = AsyncMock(return_value=_cached(resource))
 
         with (
             patch.object(
@@ -147,7 +160,7 @@ class TestGetResourceEndpoint:
             prefers_border=True,
         )
         mock_service = AsyncMock()
-        mock_service.fetch_resource = AsyncMock(return_value=resource)
+        mock_service.get_resource = AsyncMock(return_value=_cached(resource))
 
         with (
             patch.object(
@@ -168,7 +181,7 @@ class TestGetResourceEndpoint:
     @pytest.mark.asyncio
     async def test_returns_502_when_resource_is_none(self) -> None:
         mock_service = AsyncMock()
-        mock_service.fetch_resource = AsyncMock(return_value=None)
+        mock_service.get_resource = AsyncMock(return_value=None)
 
         with (
             patch.object(
@@ -191,7 +204,7 @@ class TestGetResourceEndpoint:
             html_content="<p>No extras</p>",
         )
         mock_service = AsyncMock()
-        mock_service.fetch_resource = AsyncMock(return_value=resource)
+        mock_service.get_resource = AsyncMock(return_value=_cached(resource))
 
         with (
             patch.object(
@@ -208,6 +221,71 @@ class TestGetResourceEndpoint:
             assert "x-mcp-permissions" not in response.headers
             assert "x-mcp-prefers-border" not in response.headers
 
+    @pytest.mark.asyncio
+    async def test_returns_etag_and_revalidation_headers(self) -> None:
+        resource = McpAppResource(uri="ui://test/view", html_content="<p>A</p>")
+        mock_service = AsyncMock()
+        mock_service.get_resource = AsyncMock(return_value=_cached(resource))
+
+        with (
+            patch.object(
+                api_module, "_get_mcp_apps_service", return_value=mock_service
+            ),
+            patch(
+                "appkit_assistant.backend.api.mcp_apps_api._get_server",
+                new_callable=AsyncMock,
+                return_value=_make_server_mock(),
+            ),
+        ):
+            response = await get_resource(server_id=1, uri="ui://test/view")
+        assert response.headers["etag"] == compute_resource_etag(resource)
+        assert response.headers["cache-control"] == "private, no-cache"
+
+    @pytest.mark.asyncio
+    async def test_returns_304_for_matching_etag(self) -> None:
+        resource = McpAppResource(uri="ui://test/view", html_content="<p>A</p>")
+        etag = compute_resource_etag(resource)
+        mock_service = AsyncMock()
+        mock_service.get_resource = AsyncMock(return_value=_cached(resource))
+
+        with (
+            patch.object(
+                api_module, "_get_mcp_apps_service", return_value=mock_service
+            ),
+            patch(
+                "appkit_assistant.backend.api.mcp_apps_api._get_server",
+                new_callable=AsyncMock,
+                return_value=_make_server_mock(),
+            ),
+        ):
+            response = await get_resource(
+                server_id=1, uri="ui://test/view", if_none_match=f'"x", {etag}'
+            )
+        assert response.status_code == 304
+        assert response.body == b""
+        assert response.headers["etag"] == etag
+
+    @pytest.mark.asyncio
+    async def test_versioned_resource_is_immutable(self) -> None:
+        resource = McpAppResource(
+            uri="ui://test/view", html_content="<p>A</p>", versioned=True
+        )
+        mock_service = AsyncMock()
+        mock_service.get_resource = AsyncMock(return_value=_cached(resource))
+
+        with (
+            patch.object(
+                api_module, "_get_mcp_apps_service", return_value=mock_service
+            ),
+            patch(
+                "appkit_assistant.backend.api.mcp_apps_api._get_server",
+                new_callable=AsyncMock,
+                return_value=_make_server_mock(),
+            ),
+        ):
+            response = await get_resource(server_id=1, uri="ui://test/view")
+        assert "immutable" in response.headers["cache-control"]
+
 
 # ============================================================================
 # call_tool endpoint
@@ -4,13 +4,17 @@ Covers UI tool discovery, resource fetching, tool call proxying,
 app support detection, caching, auth headers, and session initialization.
 """
 
+import asyncio
 import time
+from collections.abc import Iterator
 from contextlib import asynccontextmanager
+from datetime import UTC, datetime, timedelta
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 
 from appkit_assistant.backend.schemas import (
+    McpAppResource,
     McpAppToolInfo,
     MCPAuthType,
 )
@@ -20,11 +24,34 @@ from appkit_assistant.backend.services.mcp_apps_service import (
     _McpAppsClientSession,
 )
 
+_PATCH = "appkit_assistant.backend.services.mcp_apps_service"
+
 
 @pytest.fixture(autouse=True)
 def _clear_tool_cache() -> None:
     """Reset the class-level tool cache between tests."""
     McpAppsService._tool_cache.clear()
+    McpAppsService._resource_cache.clear()
+    McpAppsService._revalidating.clear()
+
+
+@pytest.fixture(autouse=True)
+def mock_cache_repo() -> Iterator[MagicMock]:
+    """Replace the persisted tool cache with an empty in-memory mock."""
+    repo = MagicMock()
+    repo.find_by_server_and_user = AsyncMock(return_value=None)
+    repo.upsert = AsyncMock()
+    repo.touch = AsyncMock()
+
+    @asynccontextmanager
+    async def _session():
+        yield AsyncMock()
+
+    with (
+        patch(f"{_PATCH}.mcp_tool_cache_repo", repo),
+        patch(f"{_PATCH}.get_asyncdb_session", _session),
+    ):
+        yield repo
 
 
 # ============================================================================
@@ -38,6 +65,7 @@ def _make_server(
     url: str = "https://mcp.test/sse",
     auth_type: str = MCPAuthType.NONE,
     headers: str = "{}",
+    inject_user_id: bool = True,
 ) -> MagicMock:
     server = MagicMock()
     server.id = server_id
@@ -45,6 +73,8 @@ def _make_server(
     server.url = url
     server.auth_type = auth_type
     server.headers = headers
+    server.inject_user_id = inject_user_id
+    server.tool_cache_ttl_seconds = None
     return server
 
 
@@ -76,6 +106,15 @@ def _make_tool_with_ui(
     )
 
 
+def _tool_info(name: str) -> McpAppToolInfo:
+    return McpAppToolInfo(
+        tool_name=name,
+        resource_uri=f"ui://{name}",
+        server_id=1,
+        server_label="Test",
+    )
+
+
 @asynccontextmanager
 async def _mock_streamable_http_client(
     session_mock: AsyncMock | None = None,
@@ -100,7 +139,7 @@ class TestInit:
     def test_defaults(self) -> None:
         service = McpAppsService()
         assert service._token_service is None
-        assert McpAppsService._tool_cache == {}
+        assert len(McpAppsService._tool_cache) == 0
 
     def test_with_token_service(self) -> None:
         token_service = MagicMock()
@@ -275,35 +314,132 @@ class TestDiscoverUiTools:
                 server_label="Test",
             )
         ]
-        service._tool_cache[(1, 1)] = (cached_tools, time.monotonic())
+        service._tool_cache.put((1, 1), cached_tools)
 
         result = await service.discover_ui_tools(_make_server(), user_id=1)
         assert len(result) == 1
         assert result[0].tool_name == "cached_tool"
 
     @pytest.mark.asyncio
-    async def test_expired_cache_triggers_refetch(self) -> None:
+    async def test_expired_cache_served_while_revalidating(self) -> None:
         service = McpAppsService()
-        service._tool_cache[(1, 1)] = (
-            [],
-            time.monotonic() - 400,
-        )
+        stale = [_tool_info("stale")]
+        fresh = [_tool_info("fresh")]
+        service._tool_cache.put((1, 1), stale, validated_at=time.monotonic() - 400)
 
         with (
             patch.object(
                 service,
                 "_list_ui_tools",
                 new_callable=AsyncMock,
-                return_value=[],
+                return_value=fresh,
             ) as mock_list,
             patch.object(service, "_connect_for_apps") as mock_connect,
         ):
             mock_connect.return_value.__aenter__.return_value = AsyncMock()
 
             result = await service.discover_ui_tools(_make_server(), user_id=1)
-            assert result == []
+            assert [t.tool_name for t in result] == ["stale"]
+
+            await asyncio.gather(*McpAppsService._background_tasks)
             mock_list.assert_called_once()
 
+        assert service.get_cached_ui_tools(1, 1)[0].tool_name == "fresh"
+        assert (1, 1) not in McpAppsService._revalidating
+
+    @pytest.mark.asyncio
+    async def test_revalidation_scheduled_once_per_key(self) -> None:
+        service = McpAppsService()
+        service._tool_cache.put((1, 1), [], validated_at=time.monotonic() - 400)
+
+        with patch.object(
+            service, "_refresh_tools", new_callable=AsyncMock
+        ) as mock_refresh:
+            await service.discover_ui_tools(_make_server(), user_id=1)
+            await service.discover_ui_tools(_make_server(), user_id=1)
+            await asyncio.gather(*McpAppsService._background_tasks)
+
+        mock_refresh.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_failed_revalidation_keeps_stale_entry(self) -> None:
+        service = McpAppsService()
+        service._tool_cache.put(
+            (1, 1), [_tool_info("stale")], validated_at=time.monotonic() - 400
+        )
+
+        with patch.object(
+            service, "_connect_for_apps", side_effect=ConnectionError("fail")
+        ):
+            await service.discover_ui_tools(_make_server(), user_id=1)
+            await asyncio.gather(*McpAppsService._background_tasks)
+
+        entry = service._tool_cache.get((1, 1))
+        assert entry is not None
+        assert entry.tools[0].tool_name == "stale"
+        assert (1, 1) not in McpAppsService._revalidating
+
+    @pytest.mark.asyncio
+    async def test_unchanged_tools_only_touch_persisted_entry(
+        self, mock_cache_repo: MagicMock
+    ) -> None:
+        service = McpAppsService()
+        tools = [_tool_info("same")]
+        service._tool_cache.put((1, 1), tools, validated_at=time.monotonic() - 400)
+        original = service._tool_cache.get((1, 1))
+
+        with (
+            patch.object(
+                service, "_list_ui_tools", new_callable=AsyncMock, return_value=tools
+            ),
+            patch.object(service, "_connect_for_apps") as mock_connect,
+        ):
+            mock_connect.return_value.__aenter__.return_value = AsyncMock()
+            await service._refresh_tools(_make_server(), user_id=1)
+
+        entry = service._tool_cache.get((1, 1))
+        assert entry.tools is original.tools
+        assert entry.is_fresh()
+        mock_cache_repo.touch.assert_awaited_once()
+        mock_cache_repo.upsert.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_cold_start_uses_persisted_tools(
+        self, mock_cache_repo: MagicMock
+    ) -> None:
+        service = McpAppsService()
+        tools = [_tool_info("persisted")]
+        mock_cache_repo.find_by_server_and_user.return_value = MagicMock(
+            tools=[t.model_dump(mode="json") for t in tools],
+            content_hash="abc",
+            fetched_at=datetime.now(UTC) - timedelta(seconds=10),
+        )
+
+        with patch.object(service, "_connect_for_apps") as mock_connect:
+            result = await service.discover_ui_tools(_make_server(), user_id=1)
+
+        assert [t.tool_name for t in result] == ["persisted"]
+        mock_connect.assert_not_called()
+        assert service._tool_cache.get((1, 1)).content_hash == "abc"
+
+    @pytest.mark.asyncio
+    async def test_per_server_ttl(self) -> None:
+        service = McpAppsService()
+        server = _make_server()
+        server.tool_cache_ttl_seconds = 3600
+        tools = [_tool_info("long_lived")]
+
+        with (
+            patch.object(
+                service, "_list_ui_tools", new_callable=AsyncMock, return_value=tools
+            ),
+            patch.object(service, "_connect_for_apps") as mock_connect,
+        ):
+            mock_connect.return_value.__aenter__.return_value = AsyncMock()
+            await service.discover_ui_tools(server, user_id=1)
+
+        assert service._tool_cache.get((1, 1)).ttl_seconds == 3600
+
     @pytest.mark.asyncio
     async def test_handles_connection_error(self) -> None:
         service = McpAppsService()
@@ -343,8 +479,8 @@ class TestDiscoverUiTools:
             assert len(result) == 1
             # Verify cache was populated
             assert (1, 1) in service._tool_cache
-            cached_tools, _ = service._tool_cache[(1, 1)]
-            assert cached_tools[0].tool_name == "discovered"
+            cached = service._tool_cache.get((1, 1))
+            assert cached.tools[0].tool_name == "discovered"
 
     @pytest.mark.asyncio
     async def test_cache_shared_across_instances(self) -> None:
@@ -551,6 +687,7 @@ class TestFetchResource:
                 "csp": {"default-src": "'self'"},
                 "permissions": {"allow-scripts": True},
                 "prefersBorder": True,
+                "versioned": True,
             }
         }
 
@@ -588,6 +725,7 @@ class TestFetchResource:
         assert result.csp == {"default-src": "'self'"}
         assert result.permissions == {"allow-scripts": True}
         assert result.prefers_border is True
+        assert result.versioned is True
 
     @pytest.mark.asyncio
     async def test_concatenates_multiple_content_parts(self) -> None:
@@ -636,6 +774,89 @@ class TestFetchResource:
         assert result.html_content == "<h1>Title</h1><p>Body</p>"
 
 
+class TestGetResource:
+    @pytest.mark.asyncio
+    async def test_caches_fresh_resource_per_user(self) -> None:
+        service = McpAppsService()
+        resource = McpAppResource(uri="ui://view", html_content="<p>A</p>")
+
+        with patch.object(
+            service, "fetch_resource", new_callable=AsyncMock, return_value=resource
+        ) as mock_fetch:
+            first = await service.get_resource(_make_server(), 1, "ui://view")
+            again = await service.get_resource(_make_server(), 1, "ui://view")
+            other = await service.get_resource(_make_server(), 2, "ui://view")
+
+        assert mock_fetch.await_count == 2
+        assert first is again
+        assert other is not first
+        assert first.etag.startswith('"')
+
+    @pytest.mark.asyncio
+    async def test_shares_resource_of_user_agnostic_server(self) -> None:
+        service = McpAppsService()
+        server = _make_server(inject_user_id=False)
+        oauth = _make_server(
+            server_id=2, auth_type=MCPAuthType.OAUTH_DISCOVERY, inject_user_id=False
+        )
+        resource = McpAppResource(uri="ui://view", html_content="<p>A</p>")
+
+        with patch.object(
+            service, "fetch_resource", new_callable=AsyncMock, return_value=resource
+        ) as mock_fetch:
+            first = await service.get_resource(server, 1, "ui://view")
+            second = await service.get_resource(server, 2, "ui://view")
+            await service.get_resource(oauth, 1, "ui://view")
+            await service.get_resource(oauth, 2, "ui://view")
+
+        assert first is second
+        assert mock_fetch.await_count == 3
+
+    @pytest.mark.asyncio
+    async def test_refetches_expired_resource_with_same_etag(self) -> None:
+        service = McpAppsService()
+        server = _make_server()
+        server.tool_cache_ttl_seconds = 0
+        resource = McpAppResource(uri="ui://view", html_content="<p>A</p>")
+
+        with patch.object(
+            service, "fetch_resource", new_callable=AsyncMock, return_value=resource
+        ) as mock_fetch:
+            first = await service.get_resource(server, 1, "ui://view")
+            second = await service.get_resource(server, 1, "ui://view")
+
+        assert mock_fetch.await_count == 2
+        assert first.etag == second.etag
+
+    @pytest.mark.asyncio
+    async def test_versioned_resource_never_expires(self) -> None:
+        service = McpAppsService()
+        server = _make_server()
+        server.tool_cache_ttl_seconds = 0
+        resource = McpAppResource(
+            uri="ui://view", html_content="<p>A</p>", versioned=True
+        )
+
+        with patch.object(
+            service, "fetch_resource", new_callable=AsyncMock, return_value=resource
+        ) as mock_fetch:
+            await service.get_resource(server, 1, "ui://view")
+            entry = await service.get_resource(server, 1, "ui://view")
+
+        mock_fetch.assert_awaited_once()
+        assert entry.immutable
+
+    @pytest.mark.asyncio
+    async def test_failed_fetch_is_not_cached(self) -> None:
+        service = McpAppsService()
+
+        with patch.object(
+            service, "fetch_resource", new_callable=AsyncMock, return_value=None
+        ):
+            assert await service.get_resource(_make_server(), 1, "ui://x") is None
+        assert len(McpAppsService._resource_cache) == 0
+
+
 # ============================================================================
 # proxy_tool_call
 # ============================================================================
@@ -778,7 +999,7 @@ class TestGetCachedUiTools:
                 server_label="Test",
             )
         ]
-        service._tool_cache[(1, 1)] = (tools, time.monotonic())
+        service._tool_cache.put((1, 1), tools)
 
         result = service.get_cached_ui_tools(1, 1)
         assert len(result) == 1
@@ -794,10 +1015,7 @@ class TestGetCachedUiTools:
                 server_label="Test",
             )
         ]
-        service._tool_cache[(1, 1)] = (
-            tools,
-            time.monotonic() - 400,
-        )
+        service._tool_cache.put((1, 1), tools, validated_at=time.monotonic() - 400)
 
         result = service.get_cached_ui_tools(1, 1)
         assert result == []
@@ -851,6 +1069,13 @@ class TestGetAuthHeaders:
         headers = await service._get_auth_headers(server, user_id=1)
         assert headers == {"x-user-id": "1"}
 
+    @pytest.mark.asyncio
+    async def test_user_id_not_injected_when_disabled(self) -> None:
+        service = McpAppsService()
+        server = _make_server(inject_user_id=False)
+
+        assert await service._get_auth_headers(server, user_id=1) == {}
+
     @pytest.mark.asyncio
     async def test_api_key_headers_from_json(self) -> None:
         service = McpAppsService()
@@ -0,0 +1,70 @@
+"""Tests for the MCP App resource cache and ETag helpers."""
+
+import time
+
+from appkit_assistant.backend.mcp_resource_cache import (
+    McpResourceCache,
+    compute_resource_etag,
+    etag_matches,
+)
+from appkit_assistant.backend.schemas import McpAppResource
+
+
+def _resource(html: str = "<p>A</p>", **kwargs: object) -> McpAppResource:
+    return McpAppResource(uri="ui://view", html_content=html, **kwargs)
+
+
+class TestComputeResourceEtag:
+    def test_strong_and_stable(self) -> None:
+        etag = compute_resource_etag(_resource())
+        assert etag == compute_resource_etag(_resource())
+        assert etag.startswith('"')
+        assert not etag.startswith("W/")
+
+    def test_changes_with_body_and_metadata(self) -> None:
+        etag = compute_resource_etag(_resource())
+        assert etag != compute_resource_etag(_resource("<p>B</p>"))
+        assert etag != compute_resource_etag(_resource(prefers_border=True))
+
+
+class TestEtagMatches:
+    def test_no_header(self) -> None:
+        assert not etag_matches(None, '"a"')
+
+    def test_list_and_weak_prefix(self) -> None:
+        assert etag_matches('"x", W/"a"', '"a"')
+        assert not etag_matches('"x", "y"', '"a"')
+
+    def test_wildcard(self) -> None:
+        assert etag_matches("*", '"a"')
+
+
+class TestMcpResourceCache:
+    def test_expired_entry_is_not_returned(self) -> None:
+        cache = McpResourceCache()
+        entry = cache.put((1, 1, "ui://view"), _resource(), ttl_seconds=10)
+
+        assert cache.get_fresh((1, 1, "ui://view")) is entry
+        assert not entry.is_fresh(now=time.monotonic() + 11)
+
+    def test_cache_control(self) -> None:
+        cache = McpResourceCache()
+        mutable = cache.put((1, 1, "a"), _resource(), ttl_seconds=0)
+        versioned = cache.put((1, 1, "b"), _resource(versioned=True), ttl_seconds=0)
+
+        assert mutable.cache_control == "private, no-cache"
+        assert "immutable" in versioned.cache_control
+        assert versioned.is_fresh()
+
+    def test_lru_eviction_and_invalidation(self) -> None:
+        cache = McpResourceCache(max_entries=2)
+        cache.put((1, 1, "a"), _resource(), ttl_seconds=60)
+        cache.put((2, 1, "b"), _resource(), ttl_seconds=60)
+        cache.get_fresh((1, 1, "a"))
+        cache.put((2, 1, "c"), _resource(), ttl_seconds=60)
+
+        assert cache.get_fresh((2, 1, "b")) is None
+        assert cache.get_fresh((1, 1, "a")) is not None
+
+        cache.invalidate_server(2)
+        assert len(cache) == 1
@@ -509,6 +509,26 @@ class TestDeleteServer:
             [r async for r in state.delete_server(1)]
         assert state.loading is False
 
+    @pytest.mark.asyncio
+    async def test_success_drops_cached_tools(self) -> None:
+        state = _StubMCPServerState()
+        with (
+            patch(
+                f"{_PATCH}.get_asyncdb_session",
+                return_value=_db_context(),
+            ),
+            patch(f"{_PATCH}.mcp_server_repo") as repo,
+            patch(f"{_PATCH}.mcp_tool_cache_repo") as cache_repo,
+            patch(f"{_PATCH}.McpAppsService") as apps_service,
+        ):
+            repo.find_by_id = AsyncMock(return_value=_server())
+            repo.delete_by_id = AsyncMock(return_value=True)
+            repo.find_all_ordered_by_name = AsyncMock(return_value=[])
+            cache_repo.delete_by_server_id = AsyncMock(return_value=1)
+            [r async for r in state.delete_server(1)]
+        cache_repo.delete_by_server_id.assert_awaited_once()
+        apps_service.invalidate_server.assert_called_once_with(1)
+
     @pytest.mark.asyncio
     async def test_not_found(self) -> None:
         state = _StubMCPServerState()
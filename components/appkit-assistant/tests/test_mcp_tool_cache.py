@@ -0,0 +1,85 @@
+"""Tests for the bounded MCP tool schema cache."""
+
+import time
+
+from appkit_assistant.backend.mcp_tool_cache import (
+    McpToolCache,
+    compute_tools_hash,
+)
+from appkit_assistant.backend.schemas import McpAppToolInfo
+
+
+def _tool(name: str, server_id: int = 1) -> McpAppToolInfo:
+    return McpAppToolInfo(
+        tool_name=name,
+        resource_uri=f"ui://{name}",
+        server_id=server_id,
+        server_label="Test",
+    )
+
+
+class TestComputeToolsHash:
+    def test_order_independent(self) -> None:
+        assert compute_tools_hash([_tool("a"), _tool("b")]) == compute_tools_hash(
+            [_tool("b"), _tool("a")]
+        )
+
+    def test_detects_schema_change(self) -> None:
+        changed = _tool("a").model_copy(update={"input_schema": {"type": "object"}})
+        assert compute_tools_hash([_tool("a")]) != compute_tools_hash([changed])
+
+
+class TestMcpToolCache:
+    def test_put_reports_change(self) -> None:
+        cache = McpToolCache()
+        assert cache.put((1, 1), [_tool("a")]) is True
+        assert cache.put((1, 1), [_tool("a")]) is False
+        assert cache.put((1, 1), [_tool("b")]) is True
+
+    def test_unchanged_put_keeps_tools_and_refreshes(self) -> None:
+        cache = McpToolCache()
+        cache.put((1, 1), [_tool("a")], validated_at=time.monotonic() - 400)
+        original = cache.get((1, 1))
+        assert original is not None
+        assert not original.is_fresh()
+
+        cache.put((1, 1), [_tool("a")], ttl_seconds=60)
+
+        entry = cache.get((1, 1))
+        assert entry is not None
+        assert entry.tools is original.tools
+        assert entry.is_fresh()
+        assert entry.ttl_seconds == 60
+
+    def test_get_fresh_respects_ttl(self) -> None:
+        cache = McpToolCache()
+        cache.put((1, 1), [_tool("a")], ttl_seconds=10)
+        cache.put(
+            (2, 1), [_tool("b")], ttl_seconds=10, validated_at=time.monotonic() - 11
+        )
+
+        assert cache.get_fresh((1, 1)) == [_tool("a")]
+        assert cache.get_fresh((2, 1)) is None
+        assert cache.get((2, 1)) is not None
+
+    def test_lru_eviction(self) -> None:
+        cache = McpToolCache(max_entries=2)
+        cache.put((1, 1), [])
+        cache.put((2, 1), [])
+        cache.get((1, 1))
+        cache.put((3, 1), [])
+
+        assert (1, 1) in cache
+        assert (2, 1) not in cache
+        assert (3, 1) in cache
+
+    def test_invalidate_server(self) -> None:
+        cache = McpToolCache()
+        cache.put((1, 1), [])
+        cache.put((1, 2), [])
+        cache.put((2, 1), [])
+
+        cache.invalidate_server(1)
+
+        assert len(cache) == 1
+        assert (2, 1) in cache
@@ -192,61 +192,40 @@ class TestCreateUserMessages:
 # ============================================================================
 
 
-class TestLoadCommandPromptText:
+class TestLoadCommandPromptTexts:
     @pytest.mark.asyncio
     async def test_found(self) -> None:
         state = _make_state()
 
-        with (
-            patch(f"{_PATCH}.get_asyncdb_session") as mock_session,
-            patch(f"{_PATCH}.user_prompt_repo") as mock_repo,
-        ):
-            session = AsyncMock()
-            mock_session.return_value.__aenter__ = AsyncMock(return_value=session)
-            mock_session.return_value.__aexit__ = AsyncMock(return_value=False)
-            mock_repo.find_latest_accessible_by_handle = AsyncMock(
-                return_value=MagicMock(prompt_text="Loaded prompt")
-            )
+        with patch(f"{_PATCH}.user_prompt_index") as mock_index:
+            mock_index.resolve = AsyncMock(return_value={"test": "Loaded prompt"})
 
-            result = await state._load_command_prompt_text(1, "/test")
+            result = await state._load_command_prompt_texts(1, ["/test"])
 
-        assert result == "Loaded prompt"
+        assert result == {"test": "Loaded prompt"}
+        mock_index.resolve.assert_awaited_once_with(1, ["/test"])
 
     @pytest.mark.asyncio
     async def test_not_found(self) -> None:
         state = _make_state()
 
-        with (
-            patch(f"{_PATCH}.get_asyncdb_session") as mock_session,
-            patch(f"{_PATCH}.user_prompt_repo") as mock_repo,
-        ):
-            session = AsyncMock()
-            mock_session.return_value.__aenter__ = AsyncMock(return_value=session)
-            mock_session.return_value.__aexit__ = AsyncMock(return_value=False)
-            mock_repo.find_latest_accessible_by_handle = AsyncMock(return_value=None)
+        with patch(f"{_PATCH}.user_prompt_index") as mock_index:
+            mock_index.resolve = AsyncMock(return_value={})
 
-            result = await state._load_command_prompt_text(1, "/missing")
+            result = await state._load_command_prompt_texts(1, ["/missing"])
 
-        assert result is None
+        assert result == {}
 
     @pytest.mark.asyncio
-    async def test_error_returns_none(self) -> None:
+    async def test_error_returns_empty(self) -> None:
         state = _make_state()
 
-        with (
-            patch(f"{_PATCH}.get_asyncdb_session") as mock_session,
-            patch(f"{_PATCH}.user_prompt_repo") as mock_repo,
-        ):
-            session = AsyncMock()
-            mock_session.return_value.__aenter__ = AsyncMock(return_value=session)
-            mock_session.return_value.__aexit__ = AsyncMock(return_value=False)
-            mock_repo.find_latest_accessible_by_handle = AsyncMock(
-                side_effect=RuntimeError("db error")
-            )
+        with patch(f"{_PATCH}.user_prompt_index") as mock_index:
+            mock_index.resolve = AsyncMock(side_effect=RuntimeError("db error"))
 
-            result = await state._load_command_prompt_text(1, "/err")
+            result = await state._load_command_prompt_texts(1, ["/err"])
 
-        assert result is None
+        assert result == {}
 
 
 # ============================================================================
@@ -495,40 +474,59 @@ class TestResolveCommandSegments:
             {"type": "command", "handle": "summarize"},
         ]
 
-        with (
-            patch(f"{_PATCH}.get_asyncdb_session") as mock_session,
-            patch(f"{_PATCH}.user_prompt_repo") as mock_repo,
-        ):
-            session = AsyncMock()
-            mock_session.return_value.__aenter__ = AsyncMock(return_value=session)
-            mock_session.return_value.__aexit__ = AsyncMock(return_value=False)
-            mock_repo.find_latest_accessible_by_handle = AsyncMock(
-                return_value=MagicMock(prompt_text="Summary prompt")
-            )
+        with patch(f"{_PATCH}.user_prompt_index") as mock_index:
+            mock_index.resolve = AsyncMock(return_value={"summarize": "Summary prompt"})
 
             await state._resolve_command_segments(segments, 1)
 
         assert segments[1]["resolved_text"] == "Summary prompt"
 
+    @pytest.mark.asyncio
+    async def test_resolves_all_commands_in_one_lookup(self) -> None:
+        state = _make_state()
+        segments = [
+            {"type": "command", "handle": "a"},
+            {"type": "text", "content": "x"},
+            {"type": "command", "handle": "b"},
+            {"type": "command", "handle": "unknown"},
+        ]
+
+        with patch(f"{_PATCH}.user_prompt_index") as mock_index:
+            mock_index.resolve = AsyncMock(return_value={"a": "A", "b": "B"})
+
+            await state._resolve_command_segments(segments, 1)
+
+        mock_index.resolve.assert_awaited_once_with(1, ["a", "b", "unknown"])
+        assert segments[0]["resolved_text"] == "A"
+        assert segments[2]["resolved_text"] == "B"
+        assert segments[3]["resolved_text"] is None
+
+    @pytest.mark.asyncio
+    async def test_no_commands_skips_lookup(self) -> None:
+        state = _make_state()
+
+        with patch(f"{_PATCH}.user_prompt_index") as mock_index:
+            mock_index.resolve = AsyncMock()
+
+            await state._resolve_command_segments(
+                [{"type": "text", "content": "Hello"}], 1
+            )
+
+        mock_index.resolve.assert_not_awaited()
+
     @pytest.mark.asyncio
     async def test_handles_error(self) -> None:
         state = _make_state()
         segments = [{"type": "command", "handle": "bad"}]
 
-        with (
-            patch(f"{_PATCH}.get_asyncdb_session") as mock_session,
-            patch(f"{_PATCH}.user_prompt_repo") as mock_repo,
-        ):
-            session = AsyncMock()
-            mock_session.return_value.__aenter__ = AsyncMock(return_value=session)
-            mock_session.return_value.__aexit__ = AsyncMock(return_value=False)
-            mock_repo.find_latest_accessible_by_handle = AsyncMock(
-                side_effect=RuntimeError("fail")
-            )
+        with patch(f"{_PATCH}.user_prompt_index") as mock_index:
+            mock_index.resolve = AsyncMock(side_effect=RuntimeError("fail"))
 
             # Should not raise
             await state._resolve_command_segments(segments, 1)
 
+        assert segments[0]["resolved_text"] is None
+
 
 # ============================================================================
 # Flush chunk buffer
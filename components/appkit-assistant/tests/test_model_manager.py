@@ -4,6 +4,7 @@ import asyncio
 import logging
 import threading
 from collections.abc import AsyncGenerator
+from unittest.mock import patch
 
 import pytest
 
@@ -425,3 +426,111 @@ class TestModelManager:
         # Assert
         assert len(manager.get_all_models()) == 3  # Old models still there
         assert manager.get_processor_for_model("claude-3") is processor2
+
+
+@pytest.fixture
+def gated_models() -> dict[str, AIModel]:
+    """Models with mixed role requirements and capabilities."""
+    return {
+        "public": AIModel(id="public", text="Public", icon="openai"),
+        "tools": AIModel(id="tools", text="Tools", icon="openai", supports_tools=True),
+        "admin": AIModel(
+            id="admin",
+            text="Admin",
+            icon="anthropic",
+            requires_role="admin",
+            supports_tools=True,
+            supports_attachments=True,
+        ),
+    }
+
+
+class TestModelManagerIndexes:
+    """Test suite for the precomputed model indexes."""
+
+    def test_version_bumps_on_changes(
+        self, reset_model_manager: None, gated_models: dict[str, AIModel]
+    ) -> None:
+        """Registration, unregistration and clearing bump the version."""
+        manager = ModelManager()
+        start = manager.version
+
+        manager.register_processor("p", MockProcessor(gated_models))
+        after_register = manager.version
+        manager.unregister_processors({"p"})
+        after_unregister = manager.version
+        manager.clear_all()
+
+        assert start < after_register < after_unregister < manager.version
+
+    def test_index_reused_between_reads(
+        self, reset_model_manager: None, gated_models: dict[str, AIModel]
+    ) -> None:
+        """Reads without changes reuse the same index and role views."""
+        manager = ModelManager()
+        manager.register_processor("p", MockProcessor(gated_models))
+
+        first = manager.get_models_for_roles(["user"])
+        index = manager._index
+        second = manager.get_models_for_roles(["user"])
+
+        assert first == second
+        assert manager._index is index
+        assert frozenset({"user"}) in index.role_views
+
+    def test_index_rebuilt_after_registration(
+        self, reset_model_manager: None, gated_models: dict[str, AIModel]
+    ) -> None:
+        """A new registration is visible in subsequent reads."""
+        manager = ModelManager()
+        manager.register_processor(
+            "p", MockProcessor({"public": gated_models["public"]})
+        )
+        assert [m.id for m in manager.get_all_models()] == ["public"]
+
+        manager.register_processor("q", MockProcessor({"admin": gated_models["admin"]}))
+
+        assert [m.id for m in manager.get_all_models()] == ["admin", "public"]
+
+    def test_get_models_for_roles(
+        self, reset_model_manager: None, gated_models: dict[str, AIModel]
+    ) -> None:
+        """Role-gated models are only returned for matching roles."""
+        manager = ModelManager()
+        manager.register_processor("p", MockProcessor(gated_models))
+
+        assert {m.id for m in manager.get_models_for_roles(None)} == {
+            "public",
+            "tools",
+        }
+        assert {m.id for m in manager.get_models_for_roles(["admin"])} == {
+            "public",
+            "tools",
+            "admin",
+        }
+
+    def test_role_views_bounded(
+        self, reset_model_manager: None, gated_models: dict[str, AIModel]
+    ) -> None:
+        """Role views beyond MAX_ROLE_VIEWS are computed but not memoized."""
+        manager = ModelManager()
+        manager.register_processor("p", MockProcessor(gated_models))
+
+        with patch("appkit_assistant.backend.model_manager.MAX_ROLE_VIEWS", 1):
+            manager.get_models_for_roles(["a"])
+            admin = manager.get_models_for_roles(["admin"])
+
+        assert "admin" in {m.id for m in admin}
+        assert list(manager._index.role_views) == [frozenset({"a"})]
+
+    def test_returned_lists_do_not_alias_index(
+        self, reset_model_manager: None, gated_models: dict[str, AIModel]
+    ) -> None:
+        """Mutating a returned list leaves the index untouched."""
+        manager = ModelManager()
+        manager.register_processor("p", MockProcessor(gated_models))
+
+        models = manager.get_all_models()
+        models.clear()
+
+        assert len(manager.get_all_models()) == 3
@@ -8,11 +8,13 @@ and event dispatching on model change.
 from __future__ import annotations
 
 from types import SimpleNamespace
+from typing import Any
 from unittest.mock import MagicMock, patch
 
 from appkit_assistant.backend.database.models import ThreadStatus
 from appkit_assistant.backend.schemas import AIModel
 from appkit_assistant.state.thread.model_selection import ModelSelectionMixin
+from appkit_user.authentication.backend.permissions import NO_PERMISSIONS, Permissions
 
 _PATCH = "appkit_assistant.state.thread.model_selection"
 
@@ -42,6 +44,16 @@ def _ai_model(
     )
 
 
+def _accessible(models: list) -> Any:
+    """Stub for ``ModelManager.get_models_for_roles`` over ``models``."""
+
+    def _for_roles(roles: Any) -> list:
+        role_set = set(roles or ())
+        return [m for m in models if not m.requires_role or m.requires_role in role_set]
+
+    return _for_roles
+
+
 class _StubModelSelection(ModelSelectionMixin):
     """Stub providing expected state vars without Reflex runtime."""
 
@@ -194,10 +206,10 @@ class TestSetupModels:
         state = _make_state()
         models = [_ai_model("m1"), _ai_model("m2")]
         mock_mgr = MagicMock()
-        mock_mgr.get_all_models.return_value = models
+        mock_mgr.get_models_for_roles.side_effect = _accessible(models)
         mock_mgr.get_default_model.return_value = "m1"
 
-        user = SimpleNamespace(roles=[])
+        user = NO_PERMISSIONS
         with patch(f"{_PATCH}.ModelManager", return_value=mock_mgr):
             state._setup_models(user)
 
@@ -211,10 +223,10 @@ class TestSetupModels:
             _ai_model("premium", requires_role="admin"),
         ]
         mock_mgr = MagicMock()
-        mock_mgr.get_all_models.return_value = models
+        mock_mgr.get_models_for_roles.side_effect = _accessible(models)
         mock_mgr.get_default_model.return_value = "public"
 
-        user = SimpleNamespace(roles=[])
+        user = NO_PERMISSIONS
         with patch(f"{_PATCH}.ModelManager", return_value=mock_mgr):
             state._setup_models(user)
 
@@ -228,10 +240,10 @@ class TestSetupModels:
             _ai_model("premium", requires_role="admin"),
         ]
         mock_mgr = MagicMock()
-        mock_mgr.get_all_models.return_value = models
+        mock_mgr.get_models_for_roles.side_effect = _accessible(models)
         mock_mgr.get_default_model.return_value = "public"
 
-        user = SimpleNamespace(roles=["admin"])
+        user = Permissions(frozenset({"admin"}))
         with patch(f"{_PATCH}.ModelManager", return_value=mock_mgr):
             state._setup_models(user)
 
@@ -242,11 +254,11 @@ class TestSetupModels:
         state.selected_model = "m2"
         models = [_ai_model("m1"), _ai_model("m2")]
         mock_mgr = MagicMock()
-        mock_mgr.get_all_models.return_value = models
+        mock_mgr.get_models_for_roles.side_effect = _accessible(models)
         mock_mgr.get_default_model.return_value = "m1"
 
         with patch(f"{_PATCH}.ModelManager", return_value=mock_mgr):
-            state._setup_models(SimpleNamespace(roles=[]))
+            state._setup_models(NO_PERMISSIONS)
 
         assert state.selected_model == "m2"
 
@@ -255,11 +267,11 @@ class TestSetupModels:
         state.selected_model = "removed"
         models = [_ai_model("m1"), _ai_model("m2")]
         mock_mgr = MagicMock()
-        mock_mgr.get_all_models.return_value = models
+        mock_mgr.get_models_for_roles.side_effect = _accessible(models)
         mock_mgr.get_default_model.return_value = "m1"
 
         with patch(f"{_PATCH}.ModelManager", return_value=mock_mgr):
-            state._setup_models(SimpleNamespace(roles=[]))
+            state._setup_models(NO_PERMISSIONS)
 
         assert state.selected_model == "m1"
 
@@ -268,11 +280,11 @@ class TestSetupModels:
         state.selected_model = "removed"
         models = [_ai_model("m1")]
         mock_mgr = MagicMock()
-        mock_mgr.get_all_models.return_value = models
+        mock_mgr.get_models_for_roles.side_effect = _accessible(models)
         mock_mgr.get_default_model.return_value = "nonexistent"
 
         with patch(f"{_PATCH}.ModelManager", return_value=mock_mgr):
-            state._setup_models(SimpleNamespace(roles=[]))
+            state._setup_models(NO_PERMISSIONS)
 
         assert state.selected_model == "m1"
 
@@ -280,11 +292,11 @@ class TestSetupModels:
         state = _make_state()
         state.selected_model = "old"
         mock_mgr = MagicMock()
-        mock_mgr.get_all_models.return_value = []
+        mock_mgr.get_models_for_roles.side_effect = _accessible([])
         mock_mgr.get_default_model.return_value = ""
 
         with patch(f"{_PATCH}.ModelManager", return_value=mock_mgr):
-            state._setup_models(SimpleNamespace(roles=[]))
+            state._setup_models(NO_PERMISSIONS)
 
         assert state.selected_model == ""
         assert state.ai_models == []
@@ -293,11 +305,11 @@ class TestSetupModels:
         state = _make_state()
         models = [_ai_model("m1"), _ai_model("m2", requires_role="admin")]
         mock_mgr = MagicMock()
-        mock_mgr.get_all_models.return_value = models
+        mock_mgr.get_models_for_roles.side_effect = _accessible(models)
         mock_mgr.get_default_model.return_value = "m1"
 
         with patch(f"{_PATCH}.ModelManager", return_value=mock_mgr):
-            state._setup_models(None)
+            state._setup_models(NO_PERMISSIONS)
 
         # Only models without requires_role should be available
         assert len(state.ai_models) == 1
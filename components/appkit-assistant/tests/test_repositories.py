@@ -174,6 +174,27 @@ class TestThreadRepository:
         assert thread2.vector_store_id is None
         assert thread3.vector_store_id == "vs-keep"
 
+    @pytest.mark.asyncio
+    async def test_clear_vector_store_ids(
+        self, async_session: AsyncSession, thread_factory, thread_repo
+    ) -> None:
+        """clear_vector_store_ids clears several stores with one statement."""
+        thread1 = await thread_factory(vector_store_id="vs-a")
+        thread2 = await thread_factory(vector_store_id="vs-b")
+        thread3 = await thread_factory(vector_store_id="vs-keep")
+
+        count = await thread_repo.clear_vector_store_ids(
+            async_session, ["vs-a", "vs-b"]
+        )
+
+        assert count == 2
+        assert await thread_repo.clear_vector_store_ids(async_session, []) == 0
+        for thread in (thread1, thread2, thread3):
+            await async_session.refresh(thread)
+        assert thread1.vector_store_id is None
+        assert thread2.vector_store_id is None
+        assert thread3.vector_store_id == "vs-keep"
+
 
 class TestMCPServerRepository:
     """Test suite for MCPServerRepository."""
@@ -240,6 +261,62 @@ class TestMCPServerRepository:
         assert results[1].id == server_z.id
 
 
+class TestMCPToolCacheRepository:
+    """Test suite for MCPToolCacheRepository."""
+
+    @pytest.mark.asyncio
+    async def test_upsert_inserts_and_replaces(
+        self, async_session: AsyncSession, mcp_tool_cache_repo
+    ) -> None:
+        """upsert creates one row per (server, user) and replaces its content."""
+        await mcp_tool_cache_repo.upsert(
+            async_session, 1, 7, "hash-1", [{"tool_name": "a"}]
+        )
+        await mcp_tool_cache_repo.upsert(
+            async_session, 1, 7, "hash-2", [{"tool_name": "b"}]
+        )
+        async_session.expire_all()
+
+        row = await mcp_tool_cache_repo.find_by_server_and_user(async_session, 1, 7)
+
+        assert row is not None
+        assert row.content_hash == "hash-2"
+        assert row.tools == [{"tool_name": "b"}]
+        assert len(await mcp_tool_cache_repo.find_all(async_session)) == 1
+
+    @pytest.mark.asyncio
+    async def test_touch_updates_fetched_at(
+        self, async_session: AsyncSession, mcp_tool_cache_repo
+    ) -> None:
+        """touch refreshes the timestamp without changing the content."""
+        old = datetime.now(UTC) - timedelta(hours=1)
+        await mcp_tool_cache_repo.upsert(async_session, 1, 7, "hash", [], old)
+
+        await mcp_tool_cache_repo.touch(async_session, 1, 7)
+        async_session.expire_all()
+
+        row = await mcp_tool_cache_repo.find_by_server_and_user(async_session, 1, 7)
+        assert row.content_hash == "hash"
+        assert row.fetched_at.replace(tzinfo=UTC) > old
+
+    @pytest.mark.asyncio
+    async def test_delete_by_server_id(
+        self, async_session: AsyncSession, mcp_tool_cache_repo
+    ) -> None:
+        """delete_by_server_id removes the entries of all users of a server."""
+        await mcp_tool_cache_repo.upsert(async_session, 1, 7, "h", [])
+        await mcp_tool_cache_repo.upsert(async_session, 1, 8, "h", [])
+        await mcp_tool_cache_repo.upsert(async_session, 2, 7, "h", [])
+
+        count = await mcp_tool_cache_repo.delete_by_server_id(async_session, 1)
+
+        assert count == 2
+        assert (
+            await mcp_tool_cache_repo.find_by_server_and_user(async_session, 2, 7)
+            is not None
+        )
+
+
 class TestSystemPromptRepository:
     """Test suite for SystemPromptRepository."""
 
@@ -433,3 +510,55 @@ class TestFileUploadRepository:
             async_session, "vs-keep"
         )
         assert len(remaining) == 1
+
+    @pytest.mark.asyncio
+    async def test_delete_by_openai_file_ids(
+        self, async_session: AsyncSession, file_upload_factory, file_upload_repo
+    ) -> None:
+        """delete_by_openai_file_ids deletes matching records in one statement."""
+        await file_upload_factory(openai_file_id="file-1", vector_store_id="vs-1")
+        await file_upload_factory(openai_file_id="file-2", vector_store_id="vs-1")
+        await file_upload_factory(openai_file_id="file-3", vector_store_id="vs-1")
+
+        count = await file_upload_repo.delete_by_openai_file_ids(
+            async_session, ["file-1", "file-2", "file-missing"]
+        )
+
+        assert count == 2
+        assert await file_upload_repo.delete_by_openai_file_ids(async_session, []) == 0
+        remaining = await file_upload_repo.find_by_vector_store(async_session, "vs-1")
+        assert [f.openai_file_id for f in remaining] == ["file-3"]
+
+
+class TestCleanupCheckpointRepository:
+    """Test suite for CleanupCheckpointRepository."""
+
+    @pytest.mark.asyncio
+    async def test_save_inserts_and_replaces(
+        self, async_session: AsyncSession, cleanup_checkpoint_repo
+    ) -> None:
+        """save keeps one checkpoint per job and replaces its position."""
+        await cleanup_checkpoint_repo.save(async_session, "job", "gpt-4", "vs-1")
+        await cleanup_checkpoint_repo.save(async_session, "job", "gpt-5", "vs-2")
+        async_session.expire_all()
+
+        checkpoint = await cleanup_checkpoint_repo.find_by_job(async_session, "job")
+
+        assert checkpoint is not None
+        assert checkpoint.ai_model == "gpt-5"
+        assert checkpoint.last_vector_store_id == "vs-2"
+        assert len(await cleanup_checkpoint_repo.find_all(async_session)) == 1
+
+    @pytest.mark.asyncio
+    async def test_delete_by_job(
+        self, async_session: AsyncSession, cleanup_checkpoint_repo
+    ) -> None:
+        """delete_by_job removes only the checkpoint of the given job."""
+        await cleanup_checkpoint_repo.save(async_session, "job", "gpt-4", None)
+        await cleanup_checkpoint_repo.save(async_session, "other", "gpt-4", None)
+
+        count = await cleanup_checkpoint_repo.delete_by_job(async_session, "job")
+
+        assert count == 1
+        assert await cleanup_checkpoint_repo.find_by_job(async_session, "job") is None
+        assert await cleanup_checkpoint_repo.find_by_job(async_session, "other")
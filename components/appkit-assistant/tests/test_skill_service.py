@@ -14,6 +14,9 @@ from appkit_assistant.backend.services.skill_service import (
     compute_api_key_hash,
     get_skill_service,
 )
+from appkit_assistant.backend.services.skill_sync_service import SkillSyncService
+
+_SYNC_PATCH = "appkit_assistant.backend.services.skill_sync_service"
 
 
 def _mock_session(**overrides: object) -> MagicMock:
@@ -374,7 +377,6 @@ class TestSyncAllSkills:
                 "latest_version": "1",
             }
         ]
-        stale_skill = MagicMock(openai_id="sk-stale", active=True)
 
         with (
             patch.object(
@@ -383,17 +385,127 @@ class TestSyncAllSkills:
                 new_callable=AsyncMock,
                 return_value=remote_skills,
             ),
-            patch.object(svc, "_upsert_skill", new_callable=AsyncMock),
             patch(
                 "appkit_assistant.backend.services.skill_service.skill_repo"
             ) as mock_repo,
         ):
-            mock_repo.find_all_ordered_by_name = AsyncMock(return_value=[stale_skill])
+            mock_repo.bulk_upsert_remote = AsyncMock(return_value=1)
+            mock_repo.deactivate_missing = AsyncMock(return_value=1)
             count = await svc.sync_all_skills(session)
 
         assert count == 1
-        assert stale_skill.active is False
-        session.flush.assert_awaited_once()
+        mock_repo.bulk_upsert_remote.assert_awaited_once_with(
+            session, remote_skills, api_key_hash=None, base_url=None
+        )
+        mock_repo.deactivate_missing.assert_awaited_once_with(
+            session, {"sk-1"}, api_key_hash=None, base_url=None
+        )
+
+    @pytest.mark.asyncio
+    async def test_sync_with_api_key_scopes_by_hash(self) -> None:
+        svc = SkillService()
+        session = _mock_session()
+
+        with (
+            patch.object(
+                svc, "list_remote_skills", new_callable=AsyncMock, return_value=[]
+            ),
+            patch(
+                "appkit_assistant.backend.services.skill_service.skill_repo"
+            ) as mock_repo,
+        ):
+            mock_repo.bulk_upsert_remote = AsyncMock(return_value=0)
+            mock_repo.deactivate_missing = AsyncMock(return_value=2)
+            count = await svc.sync_all_skills(
+                session, api_key="sk-key", base_url="https://proxy"
+            )
+
+        assert count == 0
+        key_hash = compute_api_key_hash("sk-key")
+        mock_repo.deactivate_missing.assert_awaited_once_with(
+            session, set(), api_key_hash=key_hash, base_url="https://proxy"
+        )
+
+
+class TestSyncSkillsForCredentials:
+    @pytest.mark.asyncio
+    async def test_lists_each_key_once(self) -> None:
+        svc = SkillService()
+        session = _mock_session()
+        remote = [
+            {
+                "id": "sk-1",
+                "name": "A",
+                "description": "",
+                "default_version": "1",
+                "latest_version": "1",
+            }
+        ]
+
+        with (
+            patch.object(
+                svc, "list_remote_skills", new_callable=AsyncMock, return_value=remote
+            ) as mock_list,
+            patch.object(
+                svc, "_bulk_sync", new_callable=AsyncMock, return_value=1
+            ) as mock_sync,
+        ):
+            count = await svc.sync_skills_for_credentials(
+                session,
+                [("key-a", None), ("key-a", None), ("key-b", "https://x"), ("", None)],
+            )
+
+        assert count == 2
+        assert mock_list.await_count == 2
+        scopes = [c.args[2:] for c in mock_sync.await_args_list]
+        assert scopes == [
+            (compute_api_key_hash("key-a"), None),
+            (compute_api_key_hash("key-b"), "https://x"),
+        ]
+
+    @pytest.mark.asyncio
+    async def test_failed_listing_is_skipped(self) -> None:
+        svc = SkillService()
+        session = _mock_session()
+
+        async def _list(api_key: str | None = None, base_url: str | None = None):
+            if api_key == "bad":
+                raise RuntimeError("unauthorized")
+            return []
+
+        with (
+            patch.object(svc, "list_remote_skills", side_effect=_list),
+            patch.object(
+                svc, "_bulk_sync", new_callable=AsyncMock, return_value=0
+            ) as mock_sync,
+        ):
+            await svc.sync_skills_for_credentials(
+                session, [("bad", None), ("good", None)]
+            )
+
+        mock_sync.assert_awaited_once_with(
+            session, [], compute_api_key_hash("good"), None
+        )
+
+    @pytest.mark.asyncio
+    async def test_sync_all_model_skills_without_keys(self) -> None:
+        svc = SkillService()
+        session = _mock_session()
+        model = SimpleNamespace(api_key=None, base_url=None)
+
+        with (
+            patch(
+                "appkit_assistant.backend.services.skill_service.ai_model_repo"
+            ) as mock_repo,
+            patch.object(
+                svc, "sync_skills_for_credentials", new_callable=AsyncMock
+            ) as mock_sync,
+        ):
+            mock_repo.find_all_skill_capable = AsyncMock(return_value=[model])
+            count = await svc.sync_all_model_skills(session)
+
+        assert count == 0
+        mock_sync.assert_not_awaited()
 
 
 # ============================================================================
@@ -449,3 +561,63 @@ class TestGetSkillService:
         svc = get_skill_service()
         assert isinstance(svc, SkillService)
         assert get_skill_service() is svc
+
+
+# ============================================================================
+# SkillSyncService
+# ============================================================================
+
+
+class TestSkillSyncService:
+    def test_trigger_minimum_one_minute(self) -> None:
+        service = SkillSyncService(interval_minutes=0)
+        assert service.trigger.interval.total_seconds() == 60
+
+    @pytest.mark.asyncio
+    async def test_execute_disabled(self) -> None:
+        service = SkillSyncService(interval_minutes=0)
+        with patch(f"{_SYNC_PATCH}.get_asyncdb_session") as mock_db:
+            await service.execute()
+        mock_db.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_execute_syncs_model_skills(self) -> None:
+        service = SkillSyncService(interval_minutes=60)
+        session = _mock_session()
+        cm = AsyncMock()
+        cm.__aenter__ = AsyncMock(return_value=session)
+        cm.__aexit__ = AsyncMock(return_value=False)
+        mock_service = MagicMock()
+        mock_service.sync_all_model_skills = AsyncMock(return_value=3)
+
+        with (
+            patch(f"{_SYNC_PATCH}.get_asyncdb_session", return_value=cm),
+            patch(f"{_SYNC_PATCH}.get_skill_service", return_value=mock_service),
+        ):
+            await service.execute()
+
+        mock_service.sync_all_model_skills.assert_awaited_once_with(session)
+
+    @pytest.mark.asyncio
+    async def test_execute_reraises_errors(self) -> None:
+        service = SkillSyncService(interval_minutes=60)
+        with (
+            patch(
+                f"{_SYNC_PATCH}.get_asyncdb_session",
+                side_effect=RuntimeError("db down"),
+            ),
+            pytest.raises(RuntimeError, match="db down"),
+        ):
+            await service.execute()
+
+    def test_disabled_by_default(self) -> None:
+        registry = MagicMock()
+        registry.get.side_effect = KeyError("AssistantConfig")
+        with patch(f"{_SYNC_PATCH}.service_registry", return_value=registry):
+            assert SkillSyncService().interval_minutes == 0
+
+    def test_interval_from_config(self) -> None:
+        registry = MagicMock()
+        registry.get.return_value = MagicMock(skill_sync_interval_minutes=15)
+        with patch(f"{_SYNC_PATCH}.service_registry", return_value=registry):
+            assert SkillSyncService().interval_minutes == 15
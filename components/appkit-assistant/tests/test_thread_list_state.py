@@ -514,7 +514,7 @@ class TestLoadThreads:
         )
 
         with (
-            patch(f"{_PATCH}.get_asyncdb_session") as mock_session,
+            patch(f"{_PATCH}.get_asyncdb_read_session") as mock_session,
             patch(f"{_PATCH}.thread_repo") as mock_repo,
         ):
             session = AsyncMock()
@@ -536,7 +536,7 @@ class TestLoadThreads:
         state.threads = [existing]
 
         with (
-            patch(f"{_PATCH}.get_asyncdb_session") as mock_session,
+            patch(f"{_PATCH}.get_asyncdb_read_session") as mock_session,
             patch(f"{_PATCH}.thread_repo"),
         ):
             mock_session.return_value.__aenter__ = AsyncMock(
@@ -565,7 +565,7 @@ class TestLoadThreads:
         )
 
         with (
-            patch(f"{_PATCH}.get_asyncdb_session") as mock_session,
+            patch(f"{_PATCH}.get_asyncdb_read_session") as mock_session,
             patch(f"{_PATCH}.thread_repo") as mock_repo,
         ):
             session = AsyncMock()
@@ -586,7 +586,7 @@ class TestLoadThreads:
         state._current_user_id = ""  # Reset by page reload
 
         with (
-            patch(f"{_PATCH}.get_asyncdb_session") as mock_session,
+            patch(f"{_PATCH}.get_asyncdb_read_session") as mock_session,
             patch(f"{_PATCH}.thread_repo") as mock_tr,
         ):
             session = AsyncMock()
@@ -28,6 +28,7 @@ from appkit_assistant.backend.schemas import (
 from appkit_assistant.backend.services.response_accumulator import (
     ResponseAccumulator,
 )
+from appkit_assistant.backend.user_prompt_cache import IndexedPrompt
 from appkit_assistant.state.thread.command_palette import (
     CommandPaletteMixin,
 )
@@ -42,6 +43,7 @@ from appkit_assistant.state.thread.model_selection import (
 )
 from appkit_assistant.state.thread.oauth import OAuthMixin
 from appkit_assistant.state.thread.skills import SkillsMixin
+from appkit_user.authentication.backend.permissions import NO_PERMISSIONS, Permissions
 
 # =====================================================================
 # Helper factories
@@ -63,6 +65,30 @@ def _cmd(
     )
 
 
+_CMD_PATCH = "appkit_assistant.state.thread.command_palette"
+
+
+def _prompt(handle: str, prompt_id: int) -> IndexedPrompt:
+    return IndexedPrompt(
+        handle=handle,
+        description="",
+        prompt_text="",
+        user_id=1,
+        is_own=True,
+        id=prompt_id,
+    )
+
+
+def _accessible(models: list) -> Any:
+    """Stub for ``ModelManager.get_models_for_roles`` over ``models``."""
+
+    def _for_roles(roles: Any) -> list:
+        role_set = set(roles or ())
+        return [m for m in models if not m.requires_role or m.requires_role in role_set]
+
+    return _for_roles
+
+
 def _model(
     id: str,  # noqa: A002
     *,
@@ -185,7 +211,7 @@ class TestModelSelectionMixin:
     def test_setup_models_filters_by_role(self) -> None:
         """Models requiring a role the user doesn't have are excluded."""
         st = self._state()
-        user = MagicMock(roles=["user"])
+        user = Permissions(frozenset({"user"}))
 
         models = [_model("m1"), _model("m2", requires_role="admin")]
         with (
@@ -193,7 +219,7 @@ class TestModelSelectionMixin:
             patch("appkit_assistant.state.thread.model_selection.ModelManager") as MM,
         ):
             mm = MM.return_value
-            mm.get_all_models.return_value = models
+            mm.get_models_for_roles.side_effect = _accessible(models)
             mm.get_default_model.return_value = "m1"
             st._setup_models(user)
 
@@ -203,12 +229,12 @@ class TestModelSelectionMixin:
     def test_setup_models_allows_matching_role(self) -> None:
         """Models accessible when user has the required role."""
         st = self._state()
-        user = MagicMock(roles=["admin"])
+        user = Permissions(frozenset({"admin"}))
 
         models = [_model("m1", requires_role="admin")]
         with patch("appkit_assistant.state.thread.model_selection.ModelManager") as MM:
             mm = MM.return_value
-            mm.get_all_models.return_value = models
+            mm.get_models_for_roles.side_effect = _accessible(models)
             mm.get_default_model.return_value = "m1"
             st._setup_models(user)
 
@@ -218,12 +244,12 @@ class TestModelSelectionMixin:
     def test_setup_models_fallback_to_default(self) -> None:
         """Selected model falls back to default when current is invalid."""
         st = self._state(selected_model="old")
-        user = MagicMock(roles=[])
+        user = NO_PERMISSIONS
 
         models = [_model("m1"), _model("m2")]
         with patch("appkit_assistant.state.thread.model_selection.ModelManager") as MM:
             mm = MM.return_value
-            mm.get_all_models.return_value = models
+            mm.get_models_for_roles.side_effect = _accessible(models)
             mm.get_default_model.return_value = "m2"
             st._setup_models(user)
 
@@ -232,12 +258,12 @@ class TestModelSelectionMixin:
     def test_setup_models_fallback_to_first(self) -> None:
         """Falls back to first model when default is not available."""
         st = self._state(selected_model="old")
-        user = MagicMock(roles=[])
+        user = NO_PERMISSIONS
 
         models = [_model("m1")]
         with patch("appkit_assistant.state.thread.model_selection.ModelManager") as MM:
             mm = MM.return_value
-            mm.get_all_models.return_value = models
+            mm.get_models_for_roles.side_effect = _accessible(models)
             mm.get_default_model.return_value = "nonexistent"
             st._setup_models(user)
 
@@ -246,11 +272,11 @@ class TestModelSelectionMixin:
     def test_setup_models_no_models_available(self) -> None:
         """Warning logged and empty model when no models match."""
         st = self._state(selected_model="old")
-        user = MagicMock(roles=[])
+        user = NO_PERMISSIONS
 
         with patch("appkit_assistant.state.thread.model_selection.ModelManager") as MM:
             mm = MM.return_value
-            mm.get_all_models.return_value = []
+            mm.get_models_for_roles.side_effect = _accessible([])
             mm.get_default_model.return_value = ""
             st._setup_models(user)
 
@@ -260,12 +286,12 @@ class TestModelSelectionMixin:
     def test_setup_models_keeps_current_selection(self) -> None:
         """Keeps current selection when it's still available."""
         st = self._state(selected_model="m2")
-        user = MagicMock(roles=[])
+        user = NO_PERMISSIONS
 
         models = [_model("m1"), _model("m2")]
         with patch("appkit_assistant.state.thread.model_selection.ModelManager") as MM:
             mm = MM.return_value
-            mm.get_all_models.return_value = models
+            mm.get_models_for_roles.side_effect = _accessible(models)
             mm.get_default_model.return_value = "m1"
             st._setup_models(user)
 
@@ -361,6 +387,9 @@ class _CmdState(CommandPaletteMixin):
     selected_mcp_servers: list[MCPServerConfigModel] = []
     temp_selected_mcp_servers: list[int] = []
     server_selection_state: dict[int, bool] = {}
+    has_more_commands: bool = False
+    _commands_complete: bool = True
+    _commands_cursor: tuple[str, int] | None = None
     _current_user_id: str = ""
 
 
@@ -419,6 +448,44 @@ class TestCommandPaletteMixin:
         assert st.show_command_palette is True
         assert len(st.filtered_commands) == 0
 
+    # -- server search for truncated prompt indexes ----------------------
+
+    @pytest.mark.asyncio
+    async def test_refresh_uses_index_when_complete(self) -> None:
+        """Complete indexes are filtered in memory without a search."""
+        st = self._state(available_commands=[_cmd("teach")], _current_user_id="42")
+
+        with patch(f"{_CMD_PATCH}.user_prompt_index") as mock_index:
+            mock_index.search = AsyncMock()
+            await st._refresh_command_palette("/te")
+
+        assert [c.id for c in st.filtered_commands] == ["teach"]
+        mock_index.search.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_refresh_searches_server_when_incomplete(self) -> None:
+        """Truncated indexes are searched page by page with a keyset cursor."""
+        st = self._state(_current_user_id="42", _commands_complete=False)
+        first = [_prompt("teach", 1), _prompt("team", 2), _prompt("tea", 3)]
+
+        with (
+            patch(f"{_CMD_PATCH}.user_prompt_index") as mock_index,
+            patch(f"{_CMD_PATCH}.SEARCH_PAGE_SIZE", 2),
+        ):
+            mock_index.search = AsyncMock(side_effect=[first, [_prompt("tech", 4)]])
+            await st._refresh_command_palette("/te")
+            assert [c.id for c in st.filtered_commands] == ["teach", "team"]
+            assert st.has_more_commands is True
+
+            await st.load_more_commands()
+
+        assert [c.id for c in st.filtered_commands] == ["teach", "team", "tech"]
+        assert st.has_more_commands is False
+        first_call, second_call = mock_index.search.await_args_list
+        assert first_call.args == (42, "te")
+        assert first_call.kwargs == {"limit": 3, "after": None}
+        assert second_call.kwargs["after"] == ("team", 2)
+
     # -- _hide_command_palette ------------------------------------------
 
     def test_hide_resets_state(self) -> None:
@@ -681,63 +748,73 @@ class TestCommandPaletteMixin:
 
     # -- _load_user_prompts_as_commands ---------------------------------
 
+    @pytest.mark.asyncio
+    async def test_reload_commands_invalidates_index(self) -> None:
+        """reload_commands drops the user's cached prompt index first."""
+        st = self._state(_current_user_id="42", prompt="")
+
+        with (
+            patch(
+                "appkit_assistant.state.thread.command_palette.user_prompt_index"
+            ) as mock_index,
+            patch.object(st, "_load_user_prompts_as_commands", new_callable=AsyncMock),
+        ):
+            await st.reload_commands()
+
+        mock_index.invalidate.assert_called_once_with(42)
+
     @pytest.mark.asyncio
     async def test_load_user_prompts_builds_commands(self) -> None:
         """Loads own + shared prompts and builds CommandDefinitions."""
         st = self._state()
 
-        own = MagicMock(
+        own = IndexedPrompt(
             handle="translate",
             description="Translate text",
-            mcp_server_ids=[1],
+            prompt_text="Translate",
+            user_id=1,
+            is_own=True,
+            mcp_server_ids=(1,),
+        )
+        shared = IndexedPrompt(
+            handle="review",
+            description="Code review",
+            prompt_text="Review",
+            user_id=99,
+            is_own=False,
         )
-        shared = {
-            "handle": "review",
-            "description": "Code review",
-            "user_id": 99,
-            "mcp_server_ids": [],
-        }
-
-        mock_session = AsyncMock()
-        mock_repo = MagicMock()
-        mock_repo.find_latest_prompts_by_user = AsyncMock(return_value=[own])
-        mock_repo.find_latest_shared_prompts = AsyncMock(return_value=[shared])
 
-        @asynccontextmanager
-        async def _mock_session():
-            yield mock_session
+        mock_index = MagicMock()
+        mock_index.get_prompts = AsyncMock(return_value=[own, shared])
+        mock_index.is_complete = AsyncMock(return_value=False)
 
-        with (
-            patch(
-                "appkit_assistant.state.thread.command_palette.get_asyncdb_session",
-                _mock_session,
-            ),
-            patch(
-                "appkit_assistant.state.thread.command_palette.user_prompt_repo",
-                mock_repo,
-            ),
+        with patch(
+            "appkit_assistant.state.thread.command_palette.user_prompt_index",
+            mock_index,
         ):
             await st._load_user_prompts_as_commands(1)
 
         assert len(st.available_commands) == 2
         assert st.available_commands[0].id == "translate"
         assert st.available_commands[0].is_editable is True
+        assert st.available_commands[0].mcp_server_ids == [1]
         assert st.available_commands[1].id == "review"
         assert st.available_commands[1].is_editable is False
+        assert st.available_commands[1].icon == "share"
+        assert st.available_commands[1].user_id == 99
+        assert st._commands_complete is False
 
     @pytest.mark.asyncio
     async def test_load_user_prompts_error_clears(self) -> None:
         """On error, available_commands is set to empty list."""
         st = self._state(available_commands=[_cmd("old")])
 
-        @asynccontextmanager
-        async def _mock_session():
-            raise RuntimeError("db error")
-            yield  # pragma: no cover
+        mock_index = MagicMock()
+        mock_index.get_prompts = AsyncMock(side_effect=RuntimeError("db error"))
 
         with patch(
-            "appkit_assistant.state.thread.command_palette.get_asyncdb_session",
-            _mock_session,
+            "appkit_assistant.state.thread.command_palette.user_prompt_index",
+            mock_index,
         ):
             await st._load_user_prompts_as_commands(1)
 
@@ -1770,83 +1847,40 @@ class TestMessageProcessingMixin:
             await st._finalize_processing()
             fm.cleanup_uploaded_files.assert_not_called()
 
-    # -- _load_command_prompt_text --------------------------------------
-
-    @pytest.mark.asyncio
-    async def test_load_command_prompt_text_found(self) -> None:
-        """Returns prompt text for a valid command handle."""
-        st = self._state()
-
-        mock_prompt = MagicMock(prompt_text="You are a translator")
-        mock_repo = MagicMock()
-        mock_repo.find_latest_accessible_by_handle = AsyncMock(return_value=mock_prompt)
-        mock_session = AsyncMock()
-
-        @asynccontextmanager
-        async def _mock_session():
-            yield mock_session
-
-        with (
-            patch(
-                "appkit_assistant.state.thread.message_processing.get_asyncdb_session",
-                _mock_session,
-            ),
-            patch(
-                "appkit_assistant.state.thread.message_processing.user_prompt_repo",
-                mock_repo,
-            ),
-        ):
-            result = await st._load_command_prompt_text(1, "/translate")
-
-        assert result == "You are a translator"
-        mock_repo.find_latest_accessible_by_handle.assert_called_once_with(
-            mock_session, 1, "translate"
-        )
+    # -- _load_command_prompt_texts -------------------------------------
 
     @pytest.mark.asyncio
-    async def test_load_command_prompt_text_not_found(self) -> None:
-        """Returns None when prompt not found."""
+    async def test_load_command_prompt_texts_found(self) -> None:
+        """Returns prompt texts for valid command handles."""
         st = self._state()
 
-        mock_repo = MagicMock()
-        mock_repo.find_latest_accessible_by_handle = AsyncMock(return_value=None)
-        mock_session = AsyncMock()
+        mock_index = MagicMock()
+        mock_index.resolve = AsyncMock(return_value={"translate": "You translate"})
 
-        @asynccontextmanager
-        async def _mock_session():
-            yield mock_session
-
-        with (
-            patch(
-                "appkit_assistant.state.thread.message_processing.get_asyncdb_session",
-                _mock_session,
-            ),
-            patch(
-                "appkit_assistant.state.thread.message_processing.user_prompt_repo",
-                mock_repo,
-            ),
+        with patch(
+            "appkit_assistant.state.thread.message_processing.user_prompt_index",
+            mock_index,
         ):
-            result = await st._load_command_prompt_text(1, "unknown")
+            result = await st._load_command_prompt_texts(1, ["/translate"])
 
-        assert result is None
+        assert result == {"translate": "You translate"}
+        mock_index.resolve.assert_awaited_once_with(1, ["/translate"])
 
     @pytest.mark.asyncio
-    async def test_load_command_prompt_text_error(self) -> None:
-        """Returns None on database error."""
+    async def test_load_command_prompt_texts_error(self) -> None:
+        """Returns an empty mapping on database error."""
         st = self._state()
 
-        @asynccontextmanager
-        async def _mock_session():
-            raise RuntimeError("db error")
-            yield  # pragma: no cover
+        mock_index = MagicMock()
+        mock_index.resolve = AsyncMock(side_effect=RuntimeError("db error"))
 
         with patch(
-            "appkit_assistant.state.thread.message_processing.get_asyncdb_session",
-            _mock_session,
+            "appkit_assistant.state.thread.message_processing.user_prompt_index",
+            mock_index,
         ):
-            result = await st._load_command_prompt_text(1, "test")
+            result = await st._load_command_prompt_texts(1, ["test"])
 
-        assert result is None
+        assert result == {}
 
     # -- _resolve_command_segments --------------------------------------
 
@@ -1861,9 +1895,9 @@ class TestMessageProcessingMixin:
 
         with patch.object(
             st,
-            "_load_command_prompt_text",
+            "_load_command_prompt_texts",
             new_callable=AsyncMock,
-            return_value="Translated text",
+            return_value={"translate": "Translated text"},
         ):
             await st._resolve_command_segments(segments, 1)
 
@@ -1872,18 +1906,17 @@ class TestMessageProcessingMixin:
         assert "resolved_text" not in segments[1]
 
     @pytest.mark.asyncio
-    async def test_resolve_command_segments_error(self) -> None:
-        """Errors during resolution are caught and logged."""
+    async def test_resolve_command_segments_unresolved(self) -> None:
+        """Unresolved commands get an empty resolved_text."""
         st = self._state()
         segments = [{"type": "command", "handle": "fail"}]
 
         with patch.object(
             st,
-            "_load_command_prompt_text",
+            "_load_command_prompt_texts",
             new_callable=AsyncMock,
-            side_effect=RuntimeError("db error"),
+            return_value={},
         ):
             await st._resolve_command_segments(segments, 1)
 
-        # Should not crash, resolved_text absent
-        assert "resolved_text" not in segments[0]
+        assert segments[0]["resolved_text"] is None
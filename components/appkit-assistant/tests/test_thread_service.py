@@ -26,6 +26,16 @@ def mock_async_context_manager(return_value) -> Any:
     return _mock_context()
 
 
+def _accessible(models: list) -> Any:
+    """Stub for ``ModelManager.get_models_for_roles`` over ``models``."""
+
+    def _for_roles(roles: Any) -> list:
+        role_set = set(roles or ())
+        return [m for m in models if not m.requires_role or m.requires_role in role_set]
+
+    return _for_roles
+
+
 class TestThreadService:
     """Test suite for ThreadService."""
 
@@ -40,7 +50,11 @@ class TestThreadService:
         service = ThreadService()
 
         with (
-            patch.object(service.model_manager, "get_all_models", return_value=[]),
+            patch.object(
+                service.model_manager,
+                "get_models_for_roles",
+                side_effect=_accessible([]),
+            ),
             patch.object(
                 service.model_manager, "get_default_model", return_value="gpt-4"
             ),
@@ -57,7 +71,9 @@ class TestThreadService:
         mock_model = MagicMock(id="gpt-4", requires_role=None)
 
         with patch.object(
-            service.model_manager, "get_all_models", return_value=[mock_model]
+            service.model_manager,
+            "get_models_for_roles",
+            side_effect=_accessible([mock_model]),
         ):
             thread = service.create_new_thread("gpt-4", user_roles=["user"])
 
@@ -71,8 +87,8 @@ class TestThreadService:
 
         with patch.object(
             service.model_manager,
-            "get_all_models",
-            return_value=[admin_model, user_model],
+            "get_models_for_roles",
+            side_effect=_accessible([admin_model, user_model]),
         ):
             thread = service.create_new_thread("gpt-4-admin", user_roles=["user"])
 
@@ -85,7 +101,9 @@ class TestThreadService:
         admin_model = MagicMock(id="gpt-4-admin", requires_role="admin")
 
         with patch.object(
-            service.model_manager, "get_all_models", return_value=[admin_model]
+            service.model_manager,
+            "get_models_for_roles",
+            side_effect=_accessible([admin_model]),
         ):
             thread = service.create_new_thread("gpt-4-admin", user_roles=["admin"])
 
@@ -98,7 +116,9 @@ class TestThreadService:
 
         with (
             patch.object(
-                service.model_manager, "get_all_models", return_value=[available_model]
+                service.model_manager,
+                "get_models_for_roles",
+                side_effect=_accessible([available_model]),
             ),
             patch.object(
                 service.model_manager, "get_default_model", return_value="gpt-3.5"
@@ -119,8 +139,8 @@ class TestThreadService:
         with (
             patch.object(
                 service.model_manager,
-                "get_all_models",
-                return_value=[restricted_default, accessible_model],
+                "get_models_for_roles",
+                side_effect=_accessible([restricted_default, accessible_model]),
             ),
             patch.object(
                 service.model_manager, "get_default_model", return_value="gpt-4"
@@ -135,7 +155,11 @@ class TestThreadService:
         service = ThreadService()
 
         with (
-            patch.object(service.model_manager, "get_all_models", return_value=[]),
+            patch.object(
+                service.model_manager,
+                "get_models_for_roles",
+                side_effect=_accessible([]),
+            ),
             patch.object(
                 service.model_manager, "get_default_model", return_value="gpt-4"
             ),
@@ -236,6 +236,9 @@ class _StubThreadState:
     def _update_command_palette(self, prompt: str) -> None:  # noqa: ARG002
         """Stub _update_command_palette."""
 
+    async def _refresh_command_palette(self, prompt: str) -> None:  # noqa: ARG002
+        """Stub _refresh_command_palette."""
+
     async def _load_user_prompts_as_commands(self, user_id: int) -> None:  # noqa: ARG002
         """Stub _load_user_prompts_as_commands."""
 
@@ -607,19 +610,21 @@ class TestSetThread:
 
 
 class TestSetPrompt:
-    def test_sets_prompt(self) -> None:
+    @pytest.mark.asyncio
+    async def test_sets_prompt(self) -> None:
         state = _make_state()
         fn = _unwrap("set_prompt")
 
-        fn(state, "hello world")
+        await fn(state, "hello world")
 
         assert state.prompt == "hello world"
 
-    def test_empty_prompt(self) -> None:
+    @pytest.mark.asyncio
+    async def test_empty_prompt(self) -> None:
         state = _make_state()
         fn = _unwrap("set_prompt")
 
-        fn(state, "")
+        await fn(state, "")
 
         assert state.prompt == ""
 
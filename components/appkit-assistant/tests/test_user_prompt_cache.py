@@ -0,0 +1,217 @@
+"""Tests for UserPromptIndex.
+
+Covers index loading, prefix search, handle resolution,
+LRU/TTL eviction and explicit invalidation.
+"""
+
+import time
+from contextlib import asynccontextmanager
+from typing import Any
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from appkit_assistant.backend.user_prompt_cache import (
+    IndexedPrompt,
+    UserPromptIndex,
+)
+
+_PATCH = "appkit_assistant.backend.user_prompt_cache"
+
+
+def _row(
+    handle: str, *, is_own: bool = True, user_id: int = 1, prompt_id: int = 0
+) -> dict[str, Any]:
+    return {
+        "id": prompt_id,
+        "handle": handle,
+        "description": f"{handle} description",
+        "prompt_text": f"{handle} text",
+        "user_id": user_id,
+        "is_own": is_own,
+        "mcp_server_ids": [1],
+        "skill_ids": [],
+    }
+
+
+@asynccontextmanager
+async def _session(*_args: Any):
+    yield AsyncMock()
+
+
+@pytest.fixture
+def mock_repo() -> Any:
+    repo = MagicMock()
+    repo.find_all_accessible_prompts_filtered = AsyncMock(
+        return_value=[
+            _row("translate", prompt_id=1),
+            _row("review", is_own=False, user_id=2, prompt_id=2),
+            _row("translate", is_own=False, user_id=3, prompt_id=3),
+            _row("summarize", prompt_id=4),
+        ]
+    )
+    repo.find_latest_accessible_by_handles = AsyncMock(return_value={})
+    repo.find_accessible_prompts_page = AsyncMock(return_value=[])
+    with (
+        patch(f"{_PATCH}.get_asyncdb_read_session", _session),
+        patch(f"{_PATCH}.user_prompt_repo", repo),
+    ):
+        yield repo
+
+
+class TestGetPrompts:
+    @pytest.mark.asyncio
+    async def test_loads_once_and_orders_own_first(self, mock_repo: Any) -> None:
+        index = UserPromptIndex()
+
+        first = await index.get_prompts(1)
+        second = await index.get_prompts(1)
+
+        assert first == second
+        assert [(p.handle, p.is_own) for p in first] == [
+            ("summarize", True),
+            ("translate", True),
+            ("review", False),
+            ("translate", False),
+        ]
+        mock_repo.find_all_accessible_prompts_filtered.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_ttl_expiry_reloads(self, mock_repo: Any) -> None:
+        index = UserPromptIndex(ttl_seconds=0)
+
+        await index.get_prompts(1)
+        await index.get_prompts(1)
+
+        assert mock_repo.find_all_accessible_prompts_filtered.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_lru_evicts_oldest_user(self, mock_repo: Any) -> None:
+        index = UserPromptIndex(max_users=2)
+
+        await index.get_prompts(1)
+        await index.get_prompts(2)
+        await index.get_prompts(1)
+        await index.get_prompts(3)
+
+        assert list(index._entries) == [1, 3]
+
+
+class TestSearch:
+    @pytest.mark.asyncio
+    async def test_prefix_search_in_memory(self, mock_repo: Any) -> None:
+        index = UserPromptIndex()
+
+        results = await index.search(1, "tr")
+
+        assert [p.handle for p in results] == ["translate", "translate"]
+        assert results[0].is_own is True
+        mock_repo.find_accessible_prompts_page.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_empty_prefix_returns_all(self, mock_repo: Any) -> None:
+        index = UserPromptIndex()
+
+        assert len(await index.search(1, "")) == 4
+        assert len(await index.search(1, "", limit=2)) == 2
+
+    @pytest.mark.asyncio
+    async def test_truncated_index_uses_server_query(self, mock_repo: Any) -> None:
+        index = UserPromptIndex(max_prompts=2)
+        mock_repo.find_accessible_prompts_page.return_value = [_row("zeta")]
+
+        results = await index.search(1, "z", limit=10)
+
+        assert results == [IndexedPrompt.from_dict(_row("zeta"))]
+        mock_repo.find_accessible_prompts_page.assert_awaited_once()
+        _, kwargs = mock_repo.find_accessible_prompts_page.call_args
+        assert kwargs == {"prefix": "z", "limit": 10, "after": None}
+
+    @pytest.mark.asyncio
+    async def test_in_memory_pages_continue_after_cursor(self, mock_repo: Any) -> None:
+        index = UserPromptIndex()
+
+        first = await index.search(1, "", limit=2)
+        rest = await index.search(1, "", after=(first[-1].handle, first[-1].id))
+
+        assert [(p.handle, p.id) for p in first] == [("review", 2), ("summarize", 4)]
+        assert [(p.handle, p.id) for p in rest] == [("translate", 1), ("translate", 3)]
+
+    @pytest.mark.asyncio
+    async def test_is_complete(self, mock_repo: Any) -> None:
+        assert await UserPromptIndex().is_complete(1) is True
+        assert await UserPromptIndex(max_prompts=2).is_complete(1) is False
+
+
+class TestResolve:
+    @pytest.mark.asyncio
+    async def test_cold_index_uses_single_batched_query(self, mock_repo: Any) -> None:
+        index = UserPromptIndex()
+        mock_repo.find_latest_accessible_by_handles.return_value = {
+            "a": MagicMock(prompt_text="A"),
+            "b": MagicMock(prompt_text="B"),
+        }
+
+        resolved = await index.resolve(1, ["/a", "b", "a", "missing"])
+
+        assert resolved == {"a": "A", "b": "B"}
+        mock_repo.find_latest_accessible_by_handles.assert_awaited_once()
+        handles = mock_repo.find_latest_accessible_by_handles.call_args.args[2]
+        assert handles == {"a", "b", "missing"}
+
+    @pytest.mark.asyncio
+    async def test_warm_index_still_queries(self, mock_repo: Any) -> None:
+        """Prompts changed on another worker are never sent from the index."""
+        index = UserPromptIndex()
+        await index.get_prompts(1)
+        mock_repo.find_latest_accessible_by_handles.return_value = {
+            "translate": MagicMock(prompt_text="edited elsewhere"),
+        }
+
+        resolved = await index.resolve(1, ["translate", "review"])
+
+        assert resolved == {"translate": "edited elsewhere"}
+        mock_repo.find_latest_accessible_by_handles.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_empty_handles(self, mock_repo: Any) -> None:
+        assert await UserPromptIndex().resolve(1, []) == {}
+        mock_repo.find_latest_accessible_by_handles.assert_not_awaited()
+
+
+class TestInvalidate:
+    @pytest.mark.asyncio
+    async def test_invalidate_single_user(self, mock_repo: Any) -> None:
+        index = UserPromptIndex()
+        await index.get_prompts(1)
+        await index.get_prompts(2)
+
+        index.invalidate(1)
+
+        assert list(index._entries) == [2]
+
+    @pytest.mark.asyncio
+    async def test_invalidate_all(self, mock_repo: Any) -> None:
+        index = UserPromptIndex()
+        await index.get_prompts(1)
+        await index.get_prompts(2)
+
+        index.invalidate()
+
+        assert not index._entries
+
+    @pytest.mark.asyncio
+    async def test_shared_change_expires_others_after_lag(self, mock_repo: Any) -> None:
+        index = UserPromptIndex()
+        await index.get_prompts(1)
+        await index.get_prompts(2)
+
+        now = time.monotonic()
+        with patch(f"{_PATCH}.time.monotonic", return_value=now):
+            index.invalidate_shared(1, lag_seconds=5)
+        assert list(index._entries) == [2]
+
+        with patch(f"{_PATCH}.time.monotonic", return_value=now + 4):
+            assert index._get_valid_entry(2) is not None
+        with patch(f"{_PATCH}.time.monotonic", return_value=now + 5):
+            assert index._get_valid_entry(2) is None
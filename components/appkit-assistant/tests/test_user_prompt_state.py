@@ -80,6 +80,7 @@ class _StubUserPromptState:
         self.modal_description: str = ""
         self.modal_prompt: str = ""
         self.modal_is_shared: bool = False
+        self._modal_was_shared: bool = False
         self.modal_char_count: int = 0
         self.modal_error: str = ""
         self.modal_textarea_key: int = 0
@@ -111,6 +112,7 @@ class _StubUserPromptState:
     set_modal_prompt = _unwrap("set_modal_prompt")
     set_modal_prompt_and_validate = _unwrap("set_modal_prompt_and_validate")
     set_modal_is_shared = _unwrap("set_modal_is_shared")
+    _invalidate_prompt_index = _unwrap("_invalidate_prompt_index")
     save_from_modal = _unwrap("save_from_modal")
     delete_from_modal = _unwrap("delete_from_modal")
     _load_modal_available_mcp_servers = _unwrap("_load_modal_available_mcp_servers")
@@ -122,6 +124,7 @@ class _StubUserPromptState:
 
         class _Session:
             user_id = "user-1"
+            auth_token = "token-1"
 
             @property
             def authenticated_user(self):  # noqa: ANN202
@@ -693,6 +696,29 @@ class TestDeleteFromModal:
         assert state.modal_open is False
         assert state.is_loading is False
 
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("was_shared", [False, True])
+    async def test_invalidates_affected_indexes(self, was_shared: bool) -> None:
+        state = _StubUserPromptState()
+        state.modal_handle = "to-delete"
+        state._modal_was_shared = was_shared
+        with (
+            patch(f"{_PATCH}.get_asyncdb_session", return_value=_db_context()),
+            patch(f"{_PATCH}.user_prompt_repo") as repo,
+            patch(f"{_PATCH}.ThreadState"),
+            patch(f"{_PATCH}.replica_lag_seconds", return_value=5.0),
+            patch(f"{_PATCH}.user_prompt_index") as index,
+        ):
+            repo.delete_all_versions = AsyncMock()
+            [r async for r in state.delete_from_modal()]
+
+        if was_shared:
+            index.invalidate_shared.assert_called_once_with("user-1", 5.0)
+            index.invalidate.assert_not_called()
+        else:
+            index.invalidate.assert_called_once_with("user-1")
+            index.invalidate_shared.assert_not_called()
+
     @pytest.mark.asyncio
     async def test_exception(self) -> None:
         state = _StubUserPromptState()
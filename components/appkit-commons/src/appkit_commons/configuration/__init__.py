@@ -17,7 +17,9 @@ from appkit_commons.configuration.yaml import (
 __all__ = [
     "ApplicationConfig",
     "BaseConfig",
+    "ConfigSnapshot",
     "Configuration",
+    "ConfigurationSnapshots",
     "DatabaseConfig",
     "Protocol",
     "SecretNotFoundError",
@@ -41,6 +43,8 @@ _lazy_map: dict[str, str] = {
     "WorkerConfig": "appkit_commons.configuration.configuration",
     "Protocol": "appkit_commons.configuration.configuration",
     "init_logging": "appkit_commons.configuration.logging",
+    "ConfigSnapshot": "appkit_commons.configuration.snapshot",
+    "ConfigurationSnapshots": "appkit_commons.configuration.snapshot",
 }
 
 
@@ -1,5 +1,4 @@
 import logging
-import os
 from collections.abc import Callable
 from typing import Any
 
@@ -11,7 +10,10 @@ from pydantic_settings import (
 )
 
 from appkit_commons.configuration.secret_provider import SECRET, get_secret
-from appkit_commons.configuration.yaml import YamlConfigSettingsSource
+from appkit_commons.configuration.yaml import (
+    YamlConfigSettingsSource,
+    active_profiles,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -53,9 +55,7 @@ class BaseConfig(BaseSettings):
         dotenv_settings: PydanticBaseSettingsSource,
         file_secret_settings: PydanticBaseSettingsSource,
     ) -> tuple[PydanticBaseSettingsSource, ...]:
-        profiles: list[str] = [
-            profile.strip() for profile in os.getenv("PROFILES", "").split(",")
-        ]
+        profiles = active_profiles()
         logger.debug("Active profiles: \x1b[31;1m%s\x1b[0m", profiles)
 
         return (
@@ -7,6 +7,7 @@ from pydantic import Field
 
 from appkit_commons.configuration.base import BaseConfig
 from appkit_commons.database.configuration import DatabaseConfig
+from appkit_commons.scheduler.configuration import SchedulerConfig
 
 
 class ConfigurationError(ValueError):
@@ -60,6 +61,9 @@ class ApplicationConfig(BaseConfig):
     logging: str
     environment: Environment | None = Environment.local
     database: DatabaseConfig | None = Field(default=None, alias="database")
+    scheduler: SchedulerConfig | None = Field(default=None, alias="scheduler")
+    # Seconds between checks of the configuration files for changes; 0 disables
+    config_reload_seconds: float = 10.0
 
 
 T = TypeVar("T", bound=ApplicationConfig)
@@ -1,15 +1,31 @@
+import logging
 import os
+import threading
+import time
+from collections.abc import Callable, Iterable
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
 from enum import StrEnum
 from functools import lru_cache
 from typing import Any, Final
 
 from dotenv import load_dotenv
 
+from appkit_commons.configuration.yaml import YamlConfigReader, active_profiles
+
 load_dotenv()
 
+logger = logging.getLogger(__name__)
 
 SECRET_PROVIDER: Final[str] = os.getenv("SECRET_PROVIDER", "local").lower()
 SECRET: Final[str] = "secret:"  # noqa: S105
+# Seconds a secret fetched from the vault is served from memory
+SECRET_CACHE_TTL_SECONDS: Final[float] = float(
+    os.getenv("SECRET_CACHE_TTL_SECONDS", "3600")
+)
+# Fraction of the TTL after which a read refreshes the secret in the background
+SECRET_REFRESH_RATIO: Final[float] = 0.8
+SECRET_FETCH_WORKERS: Final[int] = 8
 
 
 class SecretNotFoundError(Exception):
@@ -44,14 +60,119 @@ def _get_azure_client() -> Any:
     return SecretClient(vault_url=vault_url, credential=credential)
 
 
-def _get_secret_from_azure(key: str) -> str:
+def _fetch_secret_from_azure(key: str) -> str:
     client = _get_azure_client()
-    secret = client.get_secret(key.lower())
+    secret = client.get_secret(key)
     if not secret.value:
         raise SecretNotFoundError(f"Secret '{key}' not found in Azure Key Vault")
     return str(secret.value)
 
 
+@dataclass(slots=True)
+class _CachedSecret:
+    value: str
+    refresh_at: float
+    expires_at: float
+
+
+class SecretCache:
+    """Time-to-live cache in front of a blocking secret fetch function.
+
+    Reads after the refresh point of an entry serve the cached value and
+    refresh it in the background, so hot secrets never expire on a request
+    path. A failed refresh keeps the cached value until it expires.
+    """
+
+    def __init__(
+        self,
+        fetch: Callable[[str], str],
+        ttl_seconds: float = SECRET_CACHE_TTL_SECONDS,
+        refresh_ratio: float = SECRET_REFRESH_RATIO,
+        max_workers: int = SECRET_FETCH_WORKERS,
+    ) -> None:
+        self._fetch = fetch
+        self.ttl_seconds = ttl_seconds
+        self.refresh_ratio = refresh_ratio
+        self._max_workers = max_workers
+        self._entries: dict[str, _CachedSecret] = {}
+        self._refreshing: set[str] = set()
+        self._lock = threading.Lock()
+        self._executor: ThreadPoolExecutor | None = None
+
+    def _pool(self) -> ThreadPoolExecutor:
+        with self._lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=self._max_workers, thread_name_prefix="secrets"
+                )
+            return self._executor
+
+    def _store(self, key: str, value: str) -> str:
+        now = time.monotonic()
+        with self._lock:
+            self._entries[key] = _CachedSecret(
+                value,
+                refresh_at=now + self.ttl_seconds * self.refresh_ratio,
+                expires_at=now + self.ttl_seconds,
+            )
+        return value
+
+    def get(self, key: str) -> str:
+        """Get a secret, fetching it if it is not cached or expired."""
+        now = time.monotonic()
+        entry = self._entries.get(key)
+        if entry is not None and now < entry.expires_at:
+            if now >= entry.refresh_at:
+                self._refresh_in_background(key)
+            return entry.value
+        return self._store(key, self._fetch(key))
+
+    def _refresh_in_background(self, key: str) -> None:
+        with self._lock:
+            if key in self._refreshing:
+                return
+            self._refreshing.add(key)
+        self._pool().submit(self._refresh, key)
+
+    def _refresh(self, key: str) -> None:
+        try:
+            self._store(key, self._fetch(key))
+        except Exception as e:
+            logger.warning("Refreshing secret '%s' failed: %s", key, e)
+        finally:
+            with self._lock:
+                self._refreshing.discard(key)
+
+    def prefetch(self, keys: Iterable[str]) -> int:
+        """Fetch secrets concurrently; returns the number fetched.
+
+        Failures are logged and fetched again, raising, on first use.
+        """
+        missing = [key for key in dict.fromkeys(keys) if key not in self._entries]
+        if not missing:
+            return 0
+        fetched = 0
+        futures = {key: self._pool().submit(self._fetch, key) for key in missing}
+        for key, future in futures.items():
+            try:
+                self._store(key, future.result())
+                fetched += 1
+            except Exception as e:
+                logger.warning("Prefetching secret '%s' failed: %s", key, e)
+        return fetched
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+
+_azure_secrets = SecretCache(_fetch_secret_from_azure)
+
+
+def _get_secret_from_azure(key: str) -> str:
+    return _azure_secrets.get(key.lower())
+
+
 def _get_secret_from_env(key: str) -> str:
     """
     Get secret from environment variables.
@@ -97,3 +218,46 @@ def get_secret(key: str) -> str:
     if _get_secret_provider() == SecretProvider.AZURE:
         return _get_secret_from_azure(key)
     return _get_secret_from_env(key)
+
+
+def declared_secret_keys(data: Any, key: str = "") -> set[str]:
+    """Collect the keys of all ``secret:`` references in configuration data.
+
+    A bare ``secret:`` refers to the secret named like its field.
+    """
+    if isinstance(data, dict):
+        return {
+            secret_key
+            for name, value in data.items()
+            for secret_key in declared_secret_keys(value, str(name))
+        }
+    if isinstance(data, list):
+        return {
+            secret_key
+            for item in data
+            for secret_key in declared_secret_keys(item, key)
+        }
+    if isinstance(data, str) and data.lower().startswith(SECRET):
+        return {data[len(SECRET) :] or key}
+    return set()
+
+
+def prefetch_secrets(reader: YamlConfigReader | None = None) -> int:
+    """Fetch all secrets referenced by the YAML configuration concurrently.
+
+    Only the vault-backed provider is cached; with the local provider this
+    is a no-op. Returns the number of secrets fetched.
+    """
+    if _get_secret_provider() != SecretProvider.AZURE:
+        return 0
+    data = (reader or YamlConfigReader()).read_and_merge_files(active_profiles())
+    keys = {key.lower() for key in declared_secret_keys(data)}
+    start = time.perf_counter()
+    fetched = _azure_secrets.prefetch(keys)
+    logger.info(
+        "Prefetched %d of %d secrets in %.2fs",
+        fetched,
+        len(keys),
+        time.perf_counter() - start,
+    )
+    return fetched
@@ -0,0 +1,195 @@
+"""Hot-reloadable configuration snapshots.
+
+:class:`ConfigurationSnapshots` compiles the YAML files, the environment and
+secrets into a validated :class:`Configuration` and publishes it as a
+versioned :class:`ConfigSnapshot`. A watcher polls the configuration files
+and, when they change, compiles a new snapshot, swaps it in, updates the
+service registry and notifies subscribers with the old and new snapshot so
+they can re-derive cached values. Published configurations are never
+mutated; a reload always builds new objects. An invalid configuration is
+logged and the current snapshot stays active.
+
+Usage:
+    snapshots = ConfigurationSnapshots(AppConfig, initial=configuration)
+    snapshots.subscribe(on_config_change)
+    snapshots.start()
+    ...
+    await snapshots.stop()
+"""
+
+import asyncio
+import contextlib
+import inspect
+import logging
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass, field
+from datetime import UTC, datetime
+from pathlib import Path
+from typing import Generic, TypeVar
+
+from appkit_commons.configuration.configuration import (
+    ApplicationConfig,
+    Configuration,
+)
+from appkit_commons.configuration.yaml import (
+    YamlConfigReader,
+    active_profiles,
+    file_mtime_ns,
+)
+from appkit_commons.registry import ServiceRegistry, service_registry
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T", bound=ApplicationConfig)
+
+Fingerprint = tuple[tuple[str, int], ...]
+
+
+@dataclass(frozen=True, slots=True)
+class ConfigSnapshot(Generic[T]):  # noqa: UP046
+    """One compiled configuration, identified by an increasing version."""
+
+    version: int
+    config: Configuration[T]
+    fingerprint: Fingerprint
+    loaded_at: datetime = field(default_factory=lambda: datetime.now(UTC))
+
+    @property
+    def app(self) -> T:
+        return self.config.app
+
+
+SnapshotListener = Callable[[ConfigSnapshot, ConfigSnapshot], Awaitable[None] | None]
+
+
+class ConfigurationSnapshots(Generic[T]):  # noqa: UP046
+    """Compiles, watches and atomically swaps configuration snapshots."""
+
+    def __init__(
+        self,
+        app_config_class: type[T],
+        env_file: str = ".env",
+        initial: Configuration[T] | None = None,
+        poll_seconds: float = 10.0,
+        registry: ServiceRegistry | None = None,
+    ) -> None:
+        """Initialize the snapshots.
+
+        Args:
+            app_config_class: Application configuration class to compile.
+            env_file: Dotenv file read when compiling and watched for changes.
+            initial: Already compiled configuration to publish as version 1.
+            poll_seconds: Interval of the file watcher.
+            registry: Registry updated on reload; defaults to the global one.
+        """
+        self.app_config_class = app_config_class
+        self.env_file = env_file
+        self.poll_seconds = poll_seconds
+        # The YAML files BaseConfig reads its settings from
+        self._reader = YamlConfigReader()
+        self._registry = registry or service_registry()
+        self._listeners: list[SnapshotListener] = []
+        self._lock = asyncio.Lock()
+        self._task: asyncio.Task | None = None
+        self._current: ConfigSnapshot[T] | None = None
+        if initial is not None:
+            self._current = ConfigSnapshot(1, initial, self.fingerprint())
+
+    @property
+    def current(self) -> ConfigSnapshot[T]:
+        """The active snapshot, compiled on first access if there is none."""
+        if self._current is None:
+            fingerprint = self.fingerprint()
+            self._current = ConfigSnapshot(1, self._compile(), fingerprint)
+        return self._current
+
+    def watched_files(self) -> list[Path]:
+        """The YAML files of the active profiles and the dotenv file."""
+        return [*self._reader.config_files(active_profiles()), Path(self.env_file)]
+
+    def fingerprint(self) -> Fingerprint:
+        """Modification times of the watched files."""
+        return tuple((str(path), file_mtime_ns(path)) for path in self.watched_files())
+
+    def _compile(self) -> Configuration[T]:
+        return Configuration[self.app_config_class](  # type: ignore[name-defined,valid-type]
+            _env_file=self.env_file  # type: ignore[call-arg]
+        )
+
+    def subscribe(self, listener: SnapshotListener) -> Callable[[], None]:
+        """Call ``listener(old, new)`` after each swap; returns an unsubscribe."""
+        self._listeners.append(listener)
+
+        def unsubscribe() -> None:
+            with contextlib.suppress(ValueError):
+                self._listeners.remove(listener)
+
+        return unsubscribe
+
+    async def reload(self, force: bool = False) -> bool:
+        """Compile the configuration and swap it in if it changed.
+
+        Args:
+            force: Compile even if the watched files did not change.
+
+        Returns:
+            True if a new snapshot was published.
+        """
+        async with self._lock:
+            old = self.current
+            fingerprint = self.fingerprint()
+            if not force and fingerprint == old.fingerprint:
+                return False
+            try:
+                # Secret providers may do blocking network calls
+                config = await asyncio.to_thread(self._compile)
+            except Exception as e:
+                logger.error(
+                    "Configuration reload failed, keeping v%d: %s", old.version, e
+                )
+                return False
+            if config.model_dump() == old.config.model_dump():
+                self._current = ConfigSnapshot(
+                    old.version, old.config, fingerprint, old.loaded_at
+                )
+                return False
+
+            new = ConfigSnapshot(old.version + 1, config, fingerprint)
+            self._current = new
+            self._registry.update_configuration(config)
+            logger.info("Configuration reloaded (v%d)", new.version)
+
+        await self._notify(old, new)
+        return True
+
+    async def _notify(self, old: ConfigSnapshot[T], new: ConfigSnapshot[T]) -> None:
+        for listener in list(self._listeners):
+            try:
+                result = listener(old, new)
+                if inspect.isawaitable(result):
+                    await result
+            except Exception as e:
+                logger.error("Configuration listener %r failed: %s", listener, e)
+
+    async def _watch(self) -> None:
+        while True:
+            await asyncio.sleep(self.poll_seconds)
+            try:
+                await self.reload()
+            except Exception as e:
+                logger.error("Configuration watcher error: %s", e)
+
+    def start(self) -> None:
+        """Start watching the configuration files."""
+        if self._task is None and self.poll_seconds > 0:
+            _ = self.current  # compile before the first comparison
+            self._task = asyncio.create_task(self._watch())
+            logger.info("Watching configuration files every %.0fs", self.poll_seconds)
+
+    async def stop(self) -> None:
+        """Stop watching the configuration files."""
+        if self._task is not None:
+            self._task.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await self._task
+            self._task = None
@@ -1,5 +1,6 @@
+import copy
 import logging
-from functools import lru_cache
+import os
 from pathlib import Path
 from typing import Any
 
@@ -12,6 +13,22 @@ DEFAULT_CONFIG_YAML: Path = Path("config.yaml")
 
 logger = logging.getLogger(__name__)
 
+# Parsed YAML files by path, with the modification time they were read at
+_file_cache: dict[Path, tuple[int, Any]] = {}
+
+
+def active_profiles() -> list[str]:
+    """Configuration profiles listed in the ``PROFILES`` environment variable."""
+    return [profile.strip() for profile in os.getenv("PROFILES", "").split(",")]
+
+
+def file_mtime_ns(file_path: Path) -> int:
+    """Modification time of a file, or -1 if it does not exist."""
+    try:
+        return file_path.stat().st_mtime_ns
+    except OSError:
+        return -1
+
 
 class YamlConfigReader:
     def __init__(
@@ -50,22 +67,46 @@ class YamlConfigReader:
         return master
 
     @classmethod
-    @lru_cache
     def read_file(cls, file_path: Path, encoding: str = "utf-8") -> Any:
+        """Read a YAML file, re-parsing it only when it changed on disk.
+
+        The result is shared between callers and must not be mutated.
+        """
+        mtime = file_mtime_ns(file_path)
+        cached = _file_cache.get(file_path)
+        if cached is not None and cached[0] == mtime:
+            return cached[1]
         try:
             with Path.open(file_path, "r", encoding=encoding) as file:
                 result = yaml.safe_load(file)
                 # Handle case where YAML file is empty or contains only comments
-                return result if result is not None else {}
+                result = result if result is not None else {}
         except yaml.YAMLError as ex:
             raise ex
         except FileNotFoundError:
             logger.warning("Configuration file '%s' not found.", file_path)
-            return {}
+            result = {}
+        _file_cache[file_path] = (mtime, result)
+        return result
+
+    def profile_file(self, profile: str) -> Path:
+        return (
+            self.yaml_file_path
+            / f"{self.yaml_file_prefix}.{profile}{self.yaml_file_suffix}"
+        )
+
+    def config_files(self, profiles: list[str] | None) -> list[Path]:
+        """The files read for the given profiles, in merge order."""
+        files = [self.yaml_file_path / self.yaml_file]
+        files.extend(self.profile_file(profile) for profile in profiles or [])
+        return files
 
     def read_and_merge_files(self, profiles: list[str] | None) -> dict[str, Any]:
-        base_config: dict = self.read_file(
-            self.yaml_file_path / self.yaml_file, self.yaml_file_encoding
+        # Copy, as merging updates the base in place and reads are cached
+        base_config: dict = copy.deepcopy(
+            self.read_file(
+                self.yaml_file_path / self.yaml_file, self.yaml_file_encoding
+            )
         )
 
         if profiles is None:
@@ -74,11 +115,9 @@ class YamlConfigReader:
         # Load profiles
         merged_config = base_config
         for environment in profiles:
-            merge_config = (
-                self.yaml_file_path
-                / f"{self.yaml_file_prefix}.{environment}{self.yaml_file_suffix}"
+            updates: dict = copy.deepcopy(
+                self.read_file(self.profile_file(environment), self.yaml_file_encoding)
             )
-            updates: dict = self.read_file(merge_config, self.yaml_file_encoding)
             merged_config = self.__merge(master=merged_config, updates=updates)
 
         return merged_config
@@ -4,11 +4,32 @@ Inspired by org.springframework.data.repository.CrudRepository
 """
 
 from abc import ABC, abstractmethod
-from typing import Any, Protocol, cast
-
-from sqlalchemy import CursorResult, delete, func, literal, select
+from collections.abc import Iterable, Mapping, Sequence
+from typing import Any, Literal, Protocol, cast
+
+from sqlalchemy import (
+    ColumnElement,
+    CursorResult,
+    delete,
+    func,
+    insert,
+    literal,
+    select,
+    text,
+    update,
+)
+from sqlalchemy.dialects import postgresql, sqlite
 from sqlalchemy.ext.asyncio import AsyncSession
 
+# Rows per INSERT ... ON CONFLICT statement, keeping bound parameters well
+# below the PostgreSQL (65535) and SQLite (32766) limits.
+BULK_CHUNK_SIZE = 1000
+# Tables estimated below this many rows are counted exactly
+EXACT_COUNT_THRESHOLD = 10_000
+
+SynchronizeSession = Literal["auto", "evaluate", "fetch", False]
+WhereClause = ColumnElement[bool] | Iterable[ColumnElement[bool]]
+
 
 class HasId(Protocol):
     """Protocol for entities exposing an ``id`` primary-key attribute.
@@ -48,6 +69,10 @@ class BaseRepository[T: HasId, S: AsyncSession](ABC):
       performance: bulk operations (save_all, delete_all, etc.) iterate and
       perform individual operations; subclasses should override these methods
       to implement more efficient bulk SQL if needed.
+    - The set-based methods (bulk_insert, bulk_update, bulk_delete,
+      bulk_upsert) compile to single statements and never load entities.
+      They do not synchronize objects already loaded in the session unless
+      ``synchronize_session`` is given; refresh or expire those explicitly.
 
     Error handling
     - ValueError is raised for invalid or missing IDs in update-like operations
@@ -191,6 +216,34 @@ class BaseRepository[T: HasId, S: AsyncSession](ABC):
         )
         return int(result.scalar_one())
 
+    async def estimated_count(
+        self, session: S, exact_below: int = EXACT_COUNT_THRESHOLD
+    ) -> int:
+        """Approximate number of instances from the planner statistics.
+
+        ``COUNT(*)`` scans the whole table; PostgreSQL's estimate is read from
+        ``pg_class`` instead. Small or never analyzed tables and other
+        databases are counted exactly.
+        """
+        if session.get_bind().dialect.name == "postgresql":
+            result = await session.execute(
+                text(
+                    "SELECT reltuples::bigint FROM pg_class WHERE oid = to_regclass(:t)"
+                ),
+                {"t": cast(Any, self.model_class).__table__.fullname},
+            )
+            estimate = result.scalar()
+            if estimate is not None and estimate >= exact_below:
+                return int(estimate)
+        return await self.count(session)
+
+    async def count_where(self, session: S, where: WhereClause) -> int:
+        """Count the instances matching ``where``."""
+        result = await session.execute(
+            select(func.count()).select_from(self.model_class).where(*_criteria(where))
+        )
+        return int(result.scalar_one())
+
     # Delete operations
     async def delete_by_id(self, session: S, item_id: int) -> bool:
         """Delete an instance by ID."""
@@ -228,3 +281,165 @@ class BaseRepository[T: HasId, S: AsyncSession](ABC):
         result = cast("CursorResult[Any]", await session.execute(stmt))
         await session.flush()
         return result.rowcount
+
+    # Set-based bulk operations
+    async def bulk_insert(self, session: S, rows: Sequence[Mapping[str, Any]]) -> int:
+        """Insert rows with a single executemany INSERT.
+
+        Column defaults of the model are applied. Returns count of inserted rows.
+        """
+        if not rows:
+            return 0
+        await session.execute(insert(self.model_class), list(rows))
+        await session.flush()
+        return len(rows)
+
+    async def bulk_update(
+        self,
+        session: S,
+        where: WhereClause,
+        values: Mapping[str, Any],
+        synchronize_session: SynchronizeSession = False,
+    ) -> int:
+        """Update all rows matching ``where`` with one UPDATE statement.
+
+        Args:
+            where: A criterion or an iterable of criteria combined with AND.
+            values: Column names mapped to new values or SQL expressions.
+            synchronize_session: SQLAlchemy strategy for objects already
+                loaded in the session; disabled by default.
+
+        Returns count of updated rows.
+        """
+        stmt = (
+            update(self.model_class)
+            .where(*_criteria(where))
+            .values(dict(values))
+            .execution_options(synchronize_session=synchronize_session)
+        )
+        result = cast("CursorResult[Any]", await session.execute(stmt))
+        await session.flush()
+        return result.rowcount
+
+    async def bulk_delete(
+        self,
+        session: S,
+        where: WhereClause,
+        synchronize_session: SynchronizeSession = False,
+    ) -> int:
+        """Delete all rows matching ``where`` with one DELETE statement.
+
+        Returns count of deleted rows.
+        """
+        stmt = (
+            delete(self.model_class)
+            .where(*_criteria(where))
+            .execution_options(synchronize_session=synchronize_session)
+        )
+        result = cast("CursorResult[Any]", await session.execute(stmt))
+        await session.flush()
+        return result.rowcount
+
+    async def delete_batch(
+        self,
+        session: S,
+        where: WhereClause,
+        limit: int,
+        order_by: ColumnElement[Any] | None = None,
+    ) -> int:
+        """Delete at most ``limit`` rows matching ``where``.
+
+        PostgreSQL has no ``DELETE ... LIMIT``, so the rows are selected by id
+        in a subquery. Deleting a large set in batches bounds the locks and
+        the WAL written by each statement.
+
+        Args:
+            where: A criterion or an iterable of criteria combined with AND.
+            limit: Maximum number of rows to delete.
+            order_by: Which rows to delete first, e.g. the oldest.
+
+        Returns count of deleted rows.
+        """
+        model_with_id = cast(Any, self.model_class)
+        ids = select(model_with_id.id).where(*_criteria(where)).limit(limit)
+        if order_by is not None:
+            ids = ids.order_by(order_by)
+        stmt = (
+            delete(self.model_class)
+            .where(model_with_id.id.in_(ids.scalar_subquery()))
+            .execution_options(synchronize_session=False)
+        )
+        result = cast("CursorResult[Any]", await session.execute(stmt))
+        await session.flush()
+        return result.rowcount
+
+    async def bulk_upsert(
+        self,
+        session: S,
+        rows: Sequence[Mapping[str, Any]],
+        conflict_keys: Sequence[str],
+        update_columns: Sequence[str] | None = None,
+        chunk_size: int = BULK_CHUNK_SIZE,
+    ) -> int:
+        """Insert rows or update them on conflict (INSERT ... ON CONFLICT).
+
+        Supported on PostgreSQL and SQLite. Rows are written in chunks of
+        ``chunk_size``, one statement per chunk.
+
+        Args:
+            rows: Row dicts; all rows must provide the same columns.
+            conflict_keys: Columns of the unique constraint to match on.
+            update_columns: Columns to overwrite on conflict. Defaults to all
+                given columns except the conflict keys; when empty, conflicting
+                rows are left untouched.
+
+        Returns count of inserted or updated rows.
+
+        Raises:
+            ValueError: If the database is neither PostgreSQL nor SQLite.
+        """
+        if not rows:
+            return 0
+
+        if update_columns is None:
+            update_columns = [c for c in rows[0] if c not in conflict_keys]
+
+        total = 0
+        for start in range(0, len(rows), chunk_size):
+            chunk = [dict(row) for row in rows[start : start + chunk_size]]
+            stmt = _dialect_insert(session, self.model_class).values(chunk)
+            if update_columns:
+                stmt = stmt.on_conflict_do_update(
+                    index_elements=list(conflict_keys),
+                    set_={col: stmt.excluded[col] for col in update_columns},
+                )
+            else:
+                stmt = stmt.on_conflict_do_nothing(index_elements=list(conflict_keys))
+            result = cast("CursorResult[Any]", await session.execute(stmt))
+            total += result.rowcount if result.rowcount >= 0 else len(chunk)
+
+        await session.flush()
+        return total
+
+
+def _criteria(where: WhereClause) -> list[ColumnElement[bool]]:
+    """Normalize a where argument and refuse unconstrained statements."""
+    criteria = [where] if isinstance(where, ColumnElement) else list(where)
+    if not criteria:
+        raise ValueError("Bulk statements require at least one criterion")
+    return criteria
+
+
+def _dialect_insert(
+    session: AsyncSession, table: type[Any]
+) -> postgresql.Insert | sqlite.Insert:
+    """Return an INSERT supporting ``ON CONFLICT`` for the bound database."""
+    dialect = session.get_bind().dialect.name
+    if dialect == "sqlite":
+        return sqlite.insert(table)
+    if dialect == "postgresql":
+        return postgresql.insert(table)
+    raise ValueError(
+        f"bulk_upsert is not supported for the '{dialect}' database. "
+        "Must be one of: postgresql, sqlite."
+    )
@@ -25,12 +25,21 @@ class DatabaseConfig(BaseConfig):
     max_overflow: int = 30
     pool_recycle: int = 1800  # seconds, recycle connections to prevent stale SSL
     echo: bool = False
+    # Warn when one request/event issues more statements, or repeats the same
+    # statement shape this often (likely N+1); 0 disables the check
+    query_warn_statements: int = 50
+    query_warn_repeats: int = 10
     testing: bool = False
     url_override: str | None = Field(
         default=None,
         validation_alias="url",
         serialization_alias="url_override",
     )
+    # Optional read replica DSN (same driver as the primary); heavy read paths
+    # opt in via get_asyncdb_read_session. A user's reads stay on the primary
+    # for replica_lag_seconds after that user's last write.
+    replica_url: SecretStr | None = None
+    replica_lag_seconds: float = 5.0
     # SSL mode: disable, allow, prefer, require, verify-ca, verify-full
     ssl_mode: Literal[
         "disable", "allow", "prefer", "require", "verify-ca", "verify-full"
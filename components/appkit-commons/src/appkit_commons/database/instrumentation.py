@@ -0,0 +1,219 @@
+"""SQL statement instrumentation and N+1 detection.
+
+SQLAlchemy event hooks attribute every statement to the unit of work that is
+active in the current context (an HTTP request, a Reflex event, a scheduled
+job or a test), tracked with :func:`track_queries`. When a unit of work
+exceeds the statement threshold or repeats the same statement shape too
+often, a warning is logged on exit.
+
+Usage:
+    with track_queries("ThreadState.load_threads") as stats:
+        ...
+    stats.statements, stats.rows, stats.duration_ms
+"""
+
+import asyncio
+import logging
+import re
+import time
+from collections import Counter
+from collections.abc import Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from typing import Any
+
+from sqlalchemy import Engine, event
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+logger = logging.getLogger(__name__)
+
+_START_TIMES_KEY = "appkit_query_start_times"
+_WHITESPACE = re.compile(r"\s+")
+# Expanded IN lists and multi-row VALUES differ only in their parameter count
+_PARAM_LIST = re.compile(r"\((?:\s*(?:\?|%\(\w+\)s|%s|\$\d+|:\w+)\s*,?)+\)")
+
+
+@dataclass(slots=True)
+class QueryThresholds:
+    """Limits per unit of work above which a warning is logged; 0 disables."""
+
+    max_statements: int = 50
+    max_repeats: int = 10
+
+
+@dataclass(slots=True)
+class QueryStats:
+    """Statements issued within one tracked unit of work."""
+
+    label: str
+    statements: int = 0
+    rows: int = 0
+    duration_ms: float = 0.0
+    shapes: Counter[str] = field(default_factory=Counter)
+    parent: "QueryStats | None" = field(default=None, repr=False)
+
+    def record(self, statement: str, rows: int, duration_ms: float) -> None:
+        shape = normalize_statement(statement)
+        scope: QueryStats | None = self
+        while scope is not None:
+            scope.statements += 1
+            scope.rows += rows
+            scope.duration_ms += duration_ms
+            scope.shapes[shape] += 1
+            scope = scope.parent
+
+    def repeated(self, min_count: int) -> list[tuple[str, int]]:
+        """Statement shapes issued at least ``min_count`` times, most first."""
+        if min_count <= 0:
+            return []
+        return [(s, n) for s, n in self.shapes.most_common() if n >= min_count]
+
+
+_current_stats: ContextVar[QueryStats | None] = ContextVar(
+    "appkit_query_stats", default=None
+)
+_default_thresholds = QueryThresholds()
+
+
+def normalize_statement(statement: str) -> str:
+    """Reduce a SQL statement to its shape for repeat detection."""
+    return _PARAM_LIST.sub("(?)", _WHITESPACE.sub(" ", statement).strip())
+
+
+def set_query_thresholds(thresholds: QueryThresholds) -> None:
+    """Set the thresholds used by scopes that do not pass their own."""
+    global _default_thresholds  # noqa: PLW0603
+    _default_thresholds = thresholds
+
+
+def get_query_thresholds() -> QueryThresholds:
+    return _default_thresholds
+
+
+def current_query_stats() -> QueryStats | None:
+    """Get the stats of the innermost active unit of work, if any."""
+    return _current_stats.get()
+
+
+@contextmanager
+def track_queries(
+    label: str,
+    thresholds: QueryThresholds | None = None,
+    warn: bool = True,
+) -> Iterator[QueryStats]:
+    """Attribute the statements issued in this context to a unit of work.
+
+    Scopes nest: statements also count towards all enclosing scopes.
+
+    Args:
+        label: Name of the unit of work used in warnings, e.g. the route.
+        thresholds: Limits for this scope; defaults to the configured ones.
+        warn: Log a warning on exit when a threshold is exceeded.
+    """
+    stats = QueryStats(label=label, parent=_current_stats.get())
+    token = _current_stats.set(stats)
+    try:
+        yield stats
+    finally:
+        _current_stats.reset(token)
+        if warn:
+            _report(stats, thresholds or _default_thresholds)
+
+
+def track_task_queries(
+    label: str, thresholds: QueryThresholds | None = None
+) -> QueryStats | None:
+    """Attribute the remaining statements of the current task to a unit of work.
+
+    For frameworks that run each unit of work in its own task but only offer
+    a hook at its start, such as Reflex event middleware. The scope ends
+    with the task, where the thresholds are checked.
+
+    Returns:
+        The stats of the scope, or None outside of a task.
+    """
+    try:
+        task = asyncio.current_task()
+    except RuntimeError:
+        task = None
+    if task is None:
+        return None
+    stats = QueryStats(label=label, parent=_current_stats.get())
+    _current_stats.set(stats)
+    limits = thresholds or _default_thresholds
+    task.add_done_callback(lambda _: _report(stats, limits))
+    return stats
+
+
+def _report(stats: QueryStats, thresholds: QueryThresholds) -> None:
+    if 0 < thresholds.max_statements < stats.statements:
+        logger.warning(
+            "%s issued %d SQL statements (threshold %d, %d rows, %.1f ms)",
+            stats.label,
+            stats.statements,
+            thresholds.max_statements,
+            stats.rows,
+            stats.duration_ms,
+        )
+    for shape, count in stats.repeated(thresholds.max_repeats):
+        logger.warning(
+            "%s repeated a SQL statement %d times (possible N+1): %.200s",
+            stats.label,
+            count,
+            shape,
+        )
+
+
+def _before_cursor_execute(
+    conn: Any,
+    cursor: Any,  # noqa: ARG001
+    statement: str,  # noqa: ARG001
+    parameters: Any,  # noqa: ARG001
+    context: Any,  # noqa: ARG001
+    executemany: bool,  # noqa: ARG001
+) -> None:
+    if _current_stats.get() is not None:
+        conn.info.setdefault(_START_TIMES_KEY, []).append(time.perf_counter())
+
+
+def _after_cursor_execute(
+    conn: Any,
+    cursor: Any,
+    statement: str,
+    parameters: Any,  # noqa: ARG001
+    context: Any,  # noqa: ARG001
+    executemany: bool,  # noqa: ARG001
+) -> None:
+    start_times = conn.info.get(_START_TIMES_KEY)
+    if not start_times:
+        return
+    duration_ms = (time.perf_counter() - start_times.pop()) * 1000
+    stats = _current_stats.get()
+    if stats is None:
+        return
+    stats.record(statement, max(getattr(cursor, "rowcount", 0) or 0, 0), duration_ms)
+
+
+def _handle_error(exception_context: Any) -> None:
+    # A failed statement never reaches after_cursor_execute; drop its start
+    # time so the stack of a pooled connection does not grow
+    conn = exception_context.connection
+    if conn is None or exception_context.execution_context is None:
+        return
+    start_times = conn.info.get(_START_TIMES_KEY)
+    if start_times:
+        start_times.pop()
+
+
+def instrument_engine(engine: Engine | AsyncEngine) -> None:
+    """Install the statement hooks on an engine (idempotent).
+
+    The hooks only do work while a :func:`track_queries` scope is active.
+    """
+    sync_engine = engine.sync_engine if isinstance(engine, AsyncEngine) else engine
+    if event.contains(sync_engine, "before_cursor_execute", _before_cursor_execute):
+        return
+    event.listen(sync_engine, "before_cursor_execute", _before_cursor_execute)
+    event.listen(sync_engine, "after_cursor_execute", _after_cursor_execute)
+    event.listen(sync_engine, "handle_error", _handle_error)
@@ -0,0 +1,125 @@
+"""Batched purge of expired rows.
+
+A single ``DELETE`` of all expired rows of a large table holds its row locks
+until the statement ends and writes the whole WAL in one burst, which shows
+up as latency spikes of concurrent requests. :func:`purge_in_batches`
+deletes in bounded batches instead, each in its own transaction, pausing
+between batches and stopping when the run's time budget is used up. Rows
+left over are reported as backlog and purged by the next run.
+
+Usage:
+    targets = [
+        PurgeTarget(
+            "sessions",
+            delete_batch=lambda s, n: session_repo.delete_expired(s, limit=n),
+            count_backlog=session_repo.count_expired,
+        ),
+    ]
+    results = await purge_in_batches(targets, batch_size=1000)
+"""
+
+import asyncio
+import contextlib
+import logging
+import time
+from collections.abc import Awaitable, Callable, Sequence
+from dataclasses import dataclass
+from typing import Final
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from appkit_commons.database.session import get_asyncdb_session
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_PURGE_BATCH_SIZE: Final[int] = 1000
+DEFAULT_PURGE_PAUSE_SECONDS: Final[float] = 0.1
+
+SessionFactory = Callable[[], contextlib.AbstractAsyncContextManager[AsyncSession]]
+
+
+@dataclass(frozen=True, slots=True)
+class PurgeTarget:
+    """A table to purge.
+
+    Attributes:
+        name: Name used in logs and results.
+        delete_batch: Deletes at most the given number of expired rows and
+            returns how many it deleted.
+        count_backlog: Counts the expired rows still present.
+    """
+
+    name: str
+    delete_batch: Callable[[AsyncSession, int], Awaitable[int]]
+    count_backlog: Callable[[AsyncSession], Awaitable[int]]
+
+
+@dataclass(slots=True)
+class PurgeResult:
+    """Outcome of purging one target."""
+
+    name: str
+    purged: int = 0
+    batches: int = 0
+    # Expired rows left when the time budget ran out; 0 when complete
+    backlog: int = 0
+    complete: bool = False
+    duration_seconds: float = 0.0
+
+
+async def purge_in_batches(
+    targets: Sequence[PurgeTarget],
+    batch_size: int = DEFAULT_PURGE_BATCH_SIZE,
+    pause_seconds: float = DEFAULT_PURGE_PAUSE_SECONDS,
+    time_budget_seconds: float | None = None,
+    session_factory: SessionFactory | None = None,
+) -> list[PurgeResult]:
+    """Purge the targets one after another in batches.
+
+    Args:
+        targets: Tables to purge, in order.
+        batch_size: Maximum rows deleted per batch and transaction.
+        pause_seconds: Pause between two batches.
+        time_budget_seconds: Wall-clock budget of the whole run; no new batch
+            is started after it. None means unlimited.
+        session_factory: Opens a committing session per batch; defaults to
+            :func:`get_asyncdb_session`.
+
+    Returns:
+        One result per target. Targets not reached within the budget report
+        their whole backlog.
+    """
+    if batch_size <= 0:
+        raise ValueError("batch_size must be positive")
+    open_session = session_factory or get_asyncdb_session
+    deadline = (
+        time.monotonic() + time_budget_seconds
+        if time_budget_seconds is not None
+        else None
+    )
+
+    results: list[PurgeResult] = []
+    for target in targets:
+        result = PurgeResult(target.name)
+        started = time.monotonic()
+        while deadline is None or time.monotonic() < deadline:
+            async with open_session() as session:
+                deleted = await target.delete_batch(session, batch_size)
+            result.purged += deleted
+            result.batches += 1
+            if deleted < batch_size:
+                result.complete = True
+                break
+            await asyncio.sleep(pause_seconds)
+
+        if not result.complete:
+            async with open_session() as session:
+                result.backlog = await target.count_backlog(session)
+            logger.debug(
+                "Purge of %s stopped after its time budget, %d rows left",
+                target.name,
+                result.backlog,
+            )
+        result.duration_seconds = time.monotonic() - started
+        results.append(result)
+    return results
@@ -1,14 +1,21 @@
 import contextlib
 import logging
+import time
+from collections import OrderedDict
 from collections.abc import AsyncGenerator, Iterator
 from functools import lru_cache
-from typing import Any
+from typing import Any, Final
 
 from sqlalchemy import Engine
-from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession
 from sqlalchemy.orm import Session
 
 from appkit_commons.database.configuration import DatabaseConfig
+from appkit_commons.database.instrumentation import (
+    QueryThresholds,
+    instrument_engine,
+    set_query_thresholds,
+)
 from appkit_commons.database.sessionmanager import (
     AsyncSessionManager,
     SessionManager,
@@ -17,6 +24,12 @@ from appkit_commons.registry import service_registry
 
 logger = logging.getLogger(__name__)
 
+# Maximum number of users whose last write time is remembered (LRU)
+MAX_TRACKED_WRITERS: Final[int] = 10_000
+
+# user_id -> time.monotonic() of the user's last write in this process
+_recent_writes: OrderedDict[str, float] = OrderedDict()
+
 
 def _get_db_config() -> DatabaseConfig:
     """Get database configuration from registry."""
@@ -27,40 +40,79 @@ def _get_db_config() -> DatabaseConfig:
         raise RuntimeError("DatabaseConfig not initialized in registry") from None
 
 
-def _get_engine_kwargs() -> dict[str, Any]:
-    """Get engine configuration kwargs."""
+def _get_engine_kwargs(read_only: bool = False) -> dict[str, Any]:
+    """Get engine configuration kwargs.
+
+    Args:
+        read_only: Open PostgreSQL transactions read-only, so a replica
+            pointing at the primary DSN still rejects writes.
+    """
     db_config = _get_db_config()
 
     if db_config.type == "postgresql":
+        connect_args: dict[str, Any] = {
+            "keepalives": 1,
+            "keepalives_idle": 30,
+            "keepalives_interval": 10,
+            "keepalives_count": 5,
+        }
+        if read_only:
+            connect_args["options"] = "-c default_transaction_read_only=on"
         return {
             "pool_size": db_config.pool_size,
             "max_overflow": db_config.max_overflow,
             "echo": db_config.echo,
             "pool_pre_ping": True,
             "pool_recycle": db_config.pool_recycle,
-            "connect_args": {
-                "keepalives": 1,
-                "keepalives_idle": 30,
-                "keepalives_interval": 10,
-                "keepalives_count": 5,
-            },
+            "connect_args": connect_args,
         }
 
     return {}
 
 
+def _instrument(engine: Engine | AsyncEngine, db_config: DatabaseConfig) -> None:
+    """Attribute statements to the active unit of work (see instrumentation)."""
+    set_query_thresholds(
+        QueryThresholds(
+            max_statements=db_config.query_warn_statements,
+            max_repeats=db_config.query_warn_repeats,
+        )
+    )
+    instrument_engine(engine)
+
+
 @lru_cache(maxsize=1)
 def get_async_session_manager() -> AsyncSessionManager:
     db_config = _get_db_config()
     engine_kwargs = _get_engine_kwargs()
-    return AsyncSessionManager(db_config.url, engine_kwargs)
+    manager = AsyncSessionManager(db_config.url, engine_kwargs)
+    _instrument(manager.get_engine(), db_config)
+    return manager
+
+
+@lru_cache(maxsize=1)
+def get_read_session_manager() -> AsyncSessionManager | None:
+    """Get the read replica session manager, or None if no replica is set."""
+    db_config = _get_db_config()
+    if db_config.replica_url is None:
+        return None
+    manager = AsyncSessionManager(
+        db_config.replica_url.get_secret_value(),
+        _get_engine_kwargs(read_only=True),
+        read_only=True,
+    )
+    _instrument(manager.get_engine(), db_config)
+    logger.info("Read replica configured for read-only sessions")
+    return manager
 
 
 @lru_cache(maxsize=1)
 def get_session_manager() -> SessionManager:
     db_config = _get_db_config()
     engine_kwargs = _get_engine_kwargs()
-    return SessionManager(db_config.url, engine_kwargs)
+    manager = SessionManager(db_config.url, engine_kwargs)
+    _instrument(manager.get_engine(), db_config)
+    return manager
 
 
 @contextlib.asynccontextmanager
@@ -69,6 +121,61 @@ async def get_asyncdb_session() -> AsyncGenerator[AsyncSession, None]:
         yield session
 
 
+def mark_user_write(user_id: int | str | None) -> None:
+    """Record that a user just wrote data.
+
+    The user's read-only sessions use the primary for ``replica_lag_seconds``,
+    so they see their own changes before the replica has caught up. Tracking
+    is per process.
+    """
+    if not user_id:
+        return
+    key = str(user_id)
+    _recent_writes[key] = time.monotonic()
+    _recent_writes.move_to_end(key)
+    while len(_recent_writes) > MAX_TRACKED_WRITERS:
+        _recent_writes.popitem(last=False)
+
+
+def _wrote_recently(user_id: int | str | None, lag_seconds: float) -> bool:
+    if not user_id:
+        return False
+    key = str(user_id)
+    written_at = _recent_writes.get(key)
+    if written_at is None:
+        return False
+    if time.monotonic() - written_at < lag_seconds:
+        return True
+    del _recent_writes[key]
+    return False
+
+
+def replica_lag_seconds() -> float:
+    """How long replica reads may miss a write; 0 without a read replica."""
+    if get_read_session_manager() is None:
+        return 0.0
+    return _get_db_config().replica_lag_seconds
+
+
+@contextlib.asynccontextmanager
+async def get_asyncdb_read_session(
+    user_id: int | str | None = None,
+) -> AsyncGenerator[AsyncSession, None]:
+    """Get a session for heavy read paths.
+
+    Uses the read replica when one is configured, unless ``user_id`` wrote
+    within ``replica_lag_seconds`` (see :func:`mark_user_write`). Falls back to
+    the primary otherwise. Replica sessions are rolled back, never committed.
+    """
+    manager = get_read_session_manager()
+    if manager is None or _wrote_recently(
+        user_id, _get_db_config().replica_lag_seconds
+    ):
+        manager = get_async_session_manager()
+    async with manager.session() as session:
+        yield session
+
+
 def get_db_session() -> Iterator[Session]:
     with get_session_manager().session() as session:
         yield session
@@ -5,6 +5,7 @@ from typing import Any
 
 from sqlalchemy import Engine, create_engine
 from sqlalchemy.ext.asyncio import (
+    AsyncEngine,
     AsyncSession,
     async_sessionmaker,
     create_async_engine,
@@ -13,23 +14,35 @@ from sqlalchemy.orm import Session, sessionmaker
 
 
 class AsyncSessionManager:
-    def __init__(self, host: str, engine_kwargs: dict[str, Any] | None = None):
+    def __init__(
+        self,
+        host: str,
+        engine_kwargs: dict[str, Any] | None = None,
+        read_only: bool = False,
+    ):
         self._engine = create_async_engine(host, **(engine_kwargs or {}))
         self._sessionmaker = async_sessionmaker(
             bind=self._engine,
             expire_on_commit=False,
         )
+        self.read_only = read_only
 
     async def close(self) -> None:
         if self._engine:
             await self._engine.dispose()
 
+    def get_engine(self) -> AsyncEngine:
+        return self._engine
+
     @contextlib.asynccontextmanager
     async def session(self) -> AsyncIterator[AsyncSession]:
         async with self._sessionmaker() as session:
             try:
                 yield session
-                await session.commit()
+                if self.read_only:
+                    await session.rollback()
+                else:
+                    await session.commit()
             except Exception:
                 await session.rollback()
                 raise
@@ -1,5 +1,7 @@
 from starlette.types import ASGIApp, Receive, Scope, Send
 
+from appkit_commons.database.instrumentation import track_queries
+
 
 class ForceHTTPSMiddleware:
     """Correct the ASGI request scheme to ``https`` behind a TLS-terminating proxy.
@@ -37,3 +39,24 @@ class ForceHTTPSMiddleware:
             if headers.get(b"x-forwarded-proto") == b"https":
                 scope["scheme"] = "https"
         await self.app(scope, receive, send)
+
+
+class QueryTrackingMiddleware:
+    """Attribute the SQL statements of each HTTP request to that request.
+
+    Requests that exceed the configured statement thresholds, or repeat the
+    same statement shape (a likely N+1 loop), are logged with their method
+    and path. Websocket connections are long-lived and not tracked as a
+    whole; Reflex events are tracked per event by a Reflex middleware calling
+    ``track_task_queries``.
+    """
+
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        with track_queries(f"{scope.get('method', '')} {scope.get('path', '')}"):
+            await self.app(scope, receive, send)
@@ -1,4 +1,6 @@
 import logging
+from collections.abc import Iterator
+from contextlib import contextmanager
 from functools import lru_cache
 from typing import TYPE_CHECKING, Any, TypeVar, cast
 
@@ -13,17 +15,37 @@ logger = logging.getLogger(__name__)
 T = TypeVar("T")
 ConfigT = TypeVar("ConfigT", bound="ApplicationConfig")
 
+# Cached result of a type that resolves to no instance
+_MISSING: Any = object()
+
 
 class ServiceRegistry:
-    """Registry for storing and retrieving initialized instances by their class type."""
+    """Registry for storing and retrieving initialized instances by their class type.
+
+    A type resolves to the instance registered for it or, failing that, to the
+    only instance registered for one of its subclasses. Resolutions are cached
+    until the next registration. After :meth:`freeze` the table of every
+    resolvable type is precomputed, lookups are a single dict access and
+    registering new types is rejected, except for types declared with
+    :meth:`allow_late_registration`.
+    """
 
     def __init__(self) -> None:
         self._instances: dict[type[Any], Any] = {}
+        self._resolved: dict[type[Any], Any] = {}
+        self._late_types: set[type[Any]] = set()
+        self._frozen = False
+        self._batching = False
 
     def _register_config_recursively(  # noqa: PLR0912
-        self, obj: Any, visited: set[int] | None = None
+        self, obj: Any, visited: set[int] | None = None, replace: bool = False
     ) -> None:
-        """Recursively register configuration objects and their attributes."""
+        """Recursively register configuration objects and their attributes.
+
+        With ``replace``, already registered configuration types are replaced
+        and types first seen in a reloaded configuration are registered even
+        if the registry is frozen.
+        """
         if visited is None:
             visited = set()
 
@@ -49,9 +71,14 @@ class ServiceRegistry:
                         if (
                             attr_class.__module__ != "builtins"
                             and attr_class.__name__ not in ("SecretStr", "StrEnum")
-                            and not self.has(attr_class)
+                            and (replace or attr_class not in self._instances)
                         ):
-                            self.register_as(attr_class, attr_value)
+                            self._store(
+                                attr_class,
+                                attr_value,
+                                warn=not replace,
+                                allow_new=replace,
+                            )
                             logger.debug(
                                 "Registered service configuration: %s from attribute %s",  # noqa: E501
                                 attr_class.__name__,
@@ -59,7 +86,9 @@ class ServiceRegistry:
                             )
 
                             # Recursively register nested configurations
-                            self._register_config_recursively(attr_value, visited)
+                            self._register_config_recursively(
+                                attr_value, visited, replace
+                            )
 
                 except Exception as e:
                     logger.warning(
@@ -80,9 +109,14 @@ class ServiceRegistry:
                         if (
                             attr_class.__module__ != "builtins"
                             and attr_class.__name__ not in ("SecretStr", "StrEnum")
-                            and not self.has(attr_class)
+                            and (replace or attr_class not in self._instances)
                         ):
-                            self.register_as(attr_class, attr_value)
+                            self._store(
+                                attr_class,
+                                attr_value,
+                                warn=not replace,
+                                allow_new=replace,
+                            )
                             logger.debug(
                                 "Registered service configuration: %s from annotated attribute %s",  # noqa: E501
                                 attr_class.__name__,
@@ -90,7 +124,9 @@ class ServiceRegistry:
                             )
 
                             # Recursively register nested configurations
-                            self._register_config_recursively(attr_value, visited)
+                            self._register_config_recursively(
+                                attr_value, visited, replace
+                            )
 
                 except Exception as e:
                     logger.warning(
@@ -104,10 +140,15 @@ class ServiceRegistry:
         from appkit_commons.configuration.configuration import (  # noqa: PLC0415
             Configuration,
         )
+        from appkit_commons.configuration.secret_provider import (  # noqa: PLC0415
+            prefetch_secrets,
+        )
 
         logger.debug(
             "Configuring application with config class: %s", app_config_class.__name__
         )
+        # Fetch vault secrets concurrently instead of one by one while validating
+        prefetch_secrets()
 
         # Create the configuration instance. The runtime generic parametrization
         # (`Configuration[app_config_class]`) and pydantic-settings' `_env_file`
@@ -127,36 +168,148 @@ class ServiceRegistry:
 
         return configuration
 
-    def register(self, instance: object) -> None:
-        """Register an initialized instance using its class type as the key."""
-        instance_type = type(instance)
+    @property
+    def frozen(self) -> bool:
+        return self._frozen
 
+    def freeze(self) -> None:
+        """Precompute all resolutions and reject registrations of new types.
+
+        Replacing the instance of an already registered type stays possible.
+        :meth:`clear` unfreezes the registry.
+        """
+        self._frozen = True
+        self._build_table()
+        logger.debug("Froze registry with %d resolvable types", len(self._resolved))
+
+    def allow_late_registration(self, instance_type: type[Any]) -> None:
+        """Allow registering ``instance_type`` after :meth:`freeze`.
+
+        For services created at runtime, e.g. from database records that are
+        only available once the application has started.
+        """
+        self._late_types.add(instance_type)
+
+    def _build_table(self) -> None:
+        candidates = {
+            cls
+            for registered_type in self._instances
+            for cls in registered_type.__mro__
+            if cls is not object
+        }
+        resolved = {}
+        for cls in candidates:
+            instance = self._resolve(cls)
+            if instance is not _MISSING:
+                resolved[cls] = instance
+        # Swapped in one step; frozen lookups never see a partial table
+        self._resolved = resolved
+
+    def _invalidate(self) -> None:
+        if self._batching:
+            return
+        if self._frozen:
+            self._build_table()
+        else:
+            self._resolved = {}
+
+    @contextmanager
+    def _batch(self) -> Iterator[None]:
+        """Invalidate the resolutions once after several registrations."""
+        self._batching = True
+        try:
+            yield
+        finally:
+            self._batching = False
+            self._invalidate()
+
+    def _resolve(self, instance_type: type[Any]) -> Any:
+        """Resolve a type to its exact registration or its only subclass match."""
+        instance = self._instances.get(instance_type, _MISSING)
+        if instance is not _MISSING:
+            return instance
+        matches = {
+            id(candidate): candidate
+            for registered_type, candidate in self._instances.items()
+            if instance_type in getattr(registered_type, "__mro__", ())
+        }
+        if len(matches) == 1:
+            return next(iter(matches.values()))
+        if matches:
+            logger.debug(
+                "Type %s matches %d registered instances",
+                instance_type.__name__,
+                len(matches),
+            )
+        return _MISSING
+
+    def _lookup(self, instance_type: type[Any]) -> Any:
+        instance = self._resolved.get(instance_type, _MISSING)
+        if instance is _MISSING and not self._frozen:
+            instance = self._resolve(instance_type)
+            self._resolved[instance_type] = instance
+        return instance
+
+    def _store(
+        self,
+        instance_type: type[Any],
+        instance: Any,
+        warn: bool = True,
+        allow_new: bool = False,
+    ) -> None:
         if instance_type in self._instances:
-            logger.warning(
-                "Overwriting existing instance of type: %s", instance_type.__name__
+            if warn:
+                logger.warning(
+                    "Overwriting existing instance of type: %s", instance_type.__name__
+                )
+        elif self._frozen and not allow_new and instance_type not in self._late_types:
+            raise RuntimeError(
+                f"Cannot register {instance_type.__name__}: the registry is frozen"
             )
-
         self._instances[instance_type] = instance
+        self._invalidate()
+
+    def update_configuration(self, configuration: "Configuration[Any]") -> None:
+        """Replace the registered configuration and its nested configurations."""
+        from appkit_commons.configuration.configuration import (  # noqa: PLC0415
+            Configuration,
+        )
+
+        with self._batch():
+            self._store(Configuration, configuration, warn=False)
+            self._register_config_recursively(configuration, replace=True)
+        logger.debug("Updated the registered application configuration")
+
+    def register(self, instance: object) -> None:
+        """Register an initialized instance using its class type as the key.
+
+        Raises:
+            RuntimeError: If the registry is frozen and the type is new.
+        """
+        instance_type = type(instance)
+        self._store(instance_type, instance)
         logger.debug("Registered instance of type %s", instance_type.__name__)
 
     def register_as(self, instance_type: type[T], instance: T) -> None:
-        """Register an initialized instance with a specific type as the key."""
-        if instance_type in self._instances:
-            logger.warning(
-                "Overwriting existing instance of type: %s", instance_type.__name__
-            )
+        """Register an initialized instance with a specific type as the key.
 
-        self._instances[instance_type] = instance
+        Raises:
+            RuntimeError: If the registry is frozen and the type is new.
+        """
+        self._store(instance_type, instance)
         logger.debug("Registered instance as type %s", instance_type.__name__)
 
     def get(self, instance_type: type[T]) -> T:
         """Retrieve a registered instance by its class type.
 
+        Falls back to the only instance registered for a subclass of
+        ``instance_type``.
+
         Raises:
             KeyError: If no instance is registered for ``instance_type``.
         """
-        instance: T | None = self._instances.get(instance_type)
-        if instance is None:
+        instance = self._lookup(instance_type)
+        if instance is _MISSING or instance is None:
             logger.warning(
                 "Instance of type %s not found in registry", instance_type.__name__
             )
@@ -166,9 +319,18 @@ class ServiceRegistry:
         return cast(T, instance)
 
     def unregister(self, instance_type: type[T]) -> None:
-        """Remove an instance from the registry by its class type."""
+        """Remove an instance from the registry by its class type.
+
+        Raises:
+            RuntimeError: If the registry is frozen.
+        """
+        if self._frozen:
+            raise RuntimeError(
+                f"Cannot unregister {instance_type.__name__}: the registry is frozen"
+            )
         if instance_type in self._instances:
             del self._instances[instance_type]
+            self._invalidate()
             logger.debug("Unregistered instance of type: %s", instance_type.__name__)
         else:
             logger.warning(
@@ -181,12 +343,15 @@ class ServiceRegistry:
 
     def has(self, instance_type: type[T]) -> bool:
         """Check if an instance is registered for the given class type."""
-        return instance_type in self._instances
+        return self._lookup(instance_type) is not _MISSING
 
     def clear(self) -> None:
-        """Clear all registered instances."""
+        """Clear all registered instances and unfreeze the registry."""
         count = len(self._instances)
         self._instances.clear()
+        self._resolved.clear()
+        self._late_types.clear()
+        self._frozen = False
         logger.debug("Cleared %d instances from registry", count)
 
     def snapshot(self) -> dict:
@@ -197,6 +362,7 @@ class ServiceRegistry:
         """Restore the registry to a previously snapshotted state."""
         self._instances.clear()
         self._instances.update(saved)
+        self._invalidate()
 
 
 @lru_cache(maxsize=1)
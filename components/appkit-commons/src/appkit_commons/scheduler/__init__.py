@@ -14,9 +14,16 @@ try:
 except ImportError:
     APScheduler = None  # type: ignore
 
+from appkit_commons.scheduler.configuration import SchedulerConfig
+from appkit_commons.scheduler.history import (
+    JobHistoryRetentionService,
+    JobStats,
+    job_run_repo,
+)
 from appkit_commons.scheduler.scheduler_types import (
     CalendarIntervalTrigger,
     CronTrigger,
+    DateTrigger,
     IntervalTrigger,
     ScheduledService,
     Scheduler,
@@ -27,9 +34,14 @@ __all__ = [
     "APScheduler",
     "CalendarIntervalTrigger",
     "CronTrigger",
+    "DateTrigger",
     "IntervalTrigger",
+    "JobHistoryRetentionService",
+    "JobStats",
     "PGQueuerScheduler",
     "ScheduledService",
     "Scheduler",
+    "SchedulerConfig",
     "Trigger",
+    "job_run_repo",
 ]
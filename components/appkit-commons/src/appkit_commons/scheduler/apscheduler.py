@@ -14,6 +14,7 @@ from apscheduler.triggers.calendarinterval import (
     CalendarIntervalTrigger as APSCalendarIntervalTrigger,
 )
 from apscheduler.triggers.cron import CronTrigger as APSCronTrigger
+from apscheduler.triggers.date import DateTrigger as APSDateTrigger
 from apscheduler.triggers.interval import IntervalTrigger as APSIntervalTrigger
 
 from appkit_commons.database.configuration import DatabaseConfig
@@ -21,6 +22,7 @@ from appkit_commons.registry import service_registry
 from appkit_commons.scheduler.scheduler_types import (
     CalendarIntervalTrigger,
     CronTrigger,
+    DateTrigger,
     IntervalTrigger,
     ScheduledService,
     Scheduler,
@@ -74,6 +76,9 @@ class APScheduler(Scheduler):
 
             return APSCronTrigger(**kwargs)
 
+        if isinstance(trigger, DateTrigger):
+            return APSDateTrigger(run_time=trigger.run_time)
+
         if isinstance(trigger, CalendarIntervalTrigger):
             kwargs = {
                 "years": trigger.years,
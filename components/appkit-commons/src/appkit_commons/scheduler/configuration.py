@@ -0,0 +1,22 @@
+from pydantic_settings import SettingsConfigDict
+
+from appkit_commons.configuration.base import BaseConfig
+
+
+class SchedulerConfig(BaseConfig):
+    model_config = SettingsConfigDict(
+        env_prefix="app_scheduler_",
+        env_file=".env",
+        populate_by_name=True,
+    )
+
+    # Dedicated PGQueuer connections; each one dequeues jobs independently
+    workers: int = 2
+    # Jobs fetched per dequeue round trip
+    batch_size: int = 10
+    # Jobs running at once per worker; must be at least twice the batch size
+    max_concurrent_tasks: int = 20
+    # Seconds running jobs may take to finish on shutdown before cancellation
+    shutdown_timeout_seconds: float = 30.0
+    # Days the run history of scheduled services is kept
+    history_retention_days: int = 30
@@ -0,0 +1,301 @@
+"""Execution history and metrics of scheduled services.
+
+Every run executed by the scheduler is recorded with its duration, the lag
+between its scheduled and actual start, its outcome and the number of rows
+it processed (when ``ScheduledService.execute`` returns one). Rolling
+percentiles over the most recent runs show when jobs slow down or start
+late, and runs that take longer than their trigger interval are flagged as
+overruns, as they start overlapping with the next run.
+"""
+
+import itertools
+import logging
+import math
+import time
+from collections.abc import Sequence
+from dataclasses import dataclass
+from datetime import UTC, datetime, timedelta
+from typing import Any
+
+from sqlalchemy import (
+    Boolean,
+    DateTime,
+    Float,
+    Index,
+    Integer,
+    String,
+    Text,
+    func,
+    select,
+)
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Mapped, mapped_column
+
+from appkit_commons.database.base_repository import BaseRepository
+from appkit_commons.database.entities import Base
+from appkit_commons.database.session import get_asyncdb_session
+from appkit_commons.registry import service_registry
+from appkit_commons.scheduler.configuration import SchedulerConfig
+from appkit_commons.scheduler.scheduler_types import (
+    CronTrigger,
+    ScheduledService,
+    Trigger,
+)
+
+logger = logging.getLogger(__name__)
+
+STATUS_SUCCESS = "success"
+STATUS_FAILED = "failed"
+DEFAULT_STATS_WINDOW = 100
+MAX_ERROR_LENGTH = 2000
+
+
+class JobRun(Base):
+    """One execution of a scheduled service."""
+
+    __tablename__ = "scheduler_job_runs"
+    __table_args__ = (
+        Index("ix_scheduler_job_runs_job_started", "job_id", "started_at"),
+    )
+
+    id: Mapped[int] = mapped_column(primary_key=True, autoincrement=True)
+    job_id: Mapped[str] = mapped_column(String(100), nullable=False)
+    scheduled_at: Mapped[datetime | None] = mapped_column(
+        DateTime(timezone=True), nullable=True
+    )
+    started_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), nullable=False, index=True
+    )
+    duration_ms: Mapped[float] = mapped_column(Float, nullable=False)
+    lag_ms: Mapped[float | None] = mapped_column(Float, nullable=True)
+    status: Mapped[str] = mapped_column(String(20), nullable=False)
+    rows_processed: Mapped[int | None] = mapped_column(Integer, nullable=True)
+    overran: Mapped[bool] = mapped_column(Boolean, default=False, nullable=False)
+    error: Mapped[str | None] = mapped_column(Text, nullable=True)
+
+
+@dataclass(frozen=True, slots=True)
+class JobStats:
+    """Rolling metrics over the most recent runs of a job."""
+
+    job_id: str
+    runs: int
+    failures: int
+    overruns: int
+    p50_duration_ms: float
+    p95_duration_ms: float
+    p50_lag_ms: float | None
+    p95_lag_ms: float | None
+    last_started_at: datetime
+
+
+def percentile(values: list[float], fraction: float) -> float | None:
+    """Nearest-rank percentile of ``values``, e.g. ``fraction=0.95`` for p95."""
+    if not values:
+        return None
+    ordered = sorted(values)
+    rank = max(math.ceil(fraction * len(ordered)), 1)
+    return ordered[rank - 1]
+
+
+def _job_stats(job_id: str, runs: Sequence[Any]) -> JobStats:
+    """Metrics of ``runs``, newest first, as rows or :class:`JobRun` objects."""
+    durations = [run.duration_ms for run in runs]
+    lags = [run.lag_ms for run in runs if run.lag_ms is not None]
+    return JobStats(
+        job_id=job_id,
+        runs=len(runs),
+        failures=sum(run.status == STATUS_FAILED for run in runs),
+        overruns=sum(run.overran for run in runs),
+        p50_duration_ms=percentile(durations, 0.5) or 0.0,
+        p95_duration_ms=percentile(durations, 0.95) or 0.0,
+        p50_lag_ms=percentile(lags, 0.5),
+        p95_lag_ms=percentile(lags, 0.95),
+        last_started_at=runs[0].started_at,
+    )
+
+
+class JobRunRepository(BaseRepository[JobRun, AsyncSession]):
+    """Repository class for the run history of scheduled services."""
+
+    @property
+    def model_class(self) -> type[JobRun]:
+        return JobRun
+
+    async def find_recent(
+        self, session: AsyncSession, job_id: str, limit: int = DEFAULT_STATS_WINDOW
+    ) -> list[JobRun]:
+        """Retrieve the most recent runs of a job, newest first."""
+        stmt = (
+            select(JobRun)
+            .where(JobRun.job_id == job_id)
+            .order_by(JobRun.started_at.desc(), JobRun.id.desc())
+            .limit(limit)
+        )
+        result = await session.execute(stmt)
+        return list(result.scalars().all())
+
+    async def find_job_ids(self, session: AsyncSession) -> list[str]:
+        """Retrieve the ids of all jobs with recorded runs."""
+        stmt = select(JobRun.job_id).distinct().order_by(JobRun.job_id)
+        result = await session.execute(stmt)
+        return list(result.scalars().all())
+
+    async def job_stats(
+        self, session: AsyncSession, job_id: str, window: int = DEFAULT_STATS_WINDOW
+    ) -> JobStats | None:
+        """Compute rolling metrics over the last ``window`` runs of a job."""
+        runs = await self.find_recent(session, job_id, window)
+        return _job_stats(job_id, runs) if runs else None
+
+    async def all_job_stats(
+        self, session: AsyncSession, window: int = DEFAULT_STATS_WINDOW
+    ) -> list[JobStats]:
+        """Compute the metrics of every job with recorded runs in one query.
+
+        The last ``window`` runs of each job are selected with a window
+        function; jobs are ordered by id.
+        """
+        rank = (
+            func.row_number()
+            .over(
+                partition_by=JobRun.job_id,
+                order_by=(JobRun.started_at.desc(), JobRun.id.desc()),
+            )
+            .label("rank")
+        )
+        recent = select(
+            JobRun.job_id,
+            JobRun.started_at,
+            JobRun.duration_ms,
+            JobRun.lag_ms,
+            JobRun.status,
+            JobRun.overran,
+            rank,
+        ).subquery()
+        stmt = (
+            select(recent)
+            .where(recent.c.rank <= window)
+            .order_by(recent.c.job_id, recent.c.rank)
+        )
+        rows = (await session.execute(stmt)).all()
+        return [
+            _job_stats(job_id, list(runs))
+            for job_id, runs in itertools.groupby(rows, key=lambda row: row.job_id)
+        ]
+
+    async def delete_older_than(self, session: AsyncSession, cutoff: datetime) -> int:
+        """Delete runs started before ``cutoff`` with one statement."""
+        return await self.bulk_delete(session, [JobRun.started_at < cutoff])
+
+
+job_run_repo = JobRunRepository()
+
+
+async def execute_recorded(
+    service: ScheduledService,
+    scheduled_at: datetime | None = None,
+    interval: timedelta | None = None,
+) -> None:
+    """Execute a service and record the run in the history.
+
+    Errors raised by the service are logged and recorded, not propagated.
+    Failing to write the history never fails the run.
+
+    Args:
+        service: The service to execute.
+        scheduled_at: When the run was due; used to compute the start lag.
+        interval: Time until the next run; longer runs are flagged as overruns.
+    """
+    started_at = datetime.now(UTC)
+    start = time.perf_counter()
+    status, rows, error = STATUS_SUCCESS, None, None
+    try:
+        result = await service.execute()
+        if isinstance(result, int) and not isinstance(result, bool):
+            rows = result
+    except Exception as e:
+        logger.error("Error executing service %s: %s", service.name, e)
+        status, error = STATUS_FAILED, str(e)[:MAX_ERROR_LENGTH]
+    duration = timedelta(seconds=time.perf_counter() - start)
+
+    overran = False
+    if interval is not None and duration > interval:
+        overran = True
+        logger.warning(
+            "Service %s ran for %.1fs, longer than its interval of %.1fs",
+            service.name,
+            duration.total_seconds(),
+            interval.total_seconds(),
+        )
+    lag_ms = None
+    if scheduled_at is not None:
+        lag_ms = max((started_at - scheduled_at).total_seconds() * 1000, 0.0)
+
+    try:
+        async with get_asyncdb_session() as session:
+            await job_run_repo.create(
+                session,
+                JobRun(
+                    job_id=service.job_id,
+                    scheduled_at=scheduled_at,
+                    started_at=started_at,
+                    duration_ms=duration.total_seconds() * 1000,
+                    lag_ms=lag_ms,
+                    status=status,
+                    rows_processed=rows,
+                    overran=overran,
+                    error=error,
+                ),
+            )
+    except Exception as e:
+        logger.warning("Failed to record run of service %s: %s", service.name, e)
+
+
+class JobHistoryRetentionService(ScheduledService):
+    """Scheduled service that purges run history past its retention.
+
+    Each run also logs the rolling metrics of every job, flagging jobs with
+    recent failures or overruns as warnings.
+    """
+
+    job_id = "scheduler_history_retention"
+    name = "Purge scheduler run history"
+
+    def __init__(self, config: SchedulerConfig | None = None) -> None:
+        registry = service_registry()
+        if config is None and registry.has(SchedulerConfig):
+            config = registry.get(SchedulerConfig)
+        self.config = config or SchedulerConfig()
+
+    @property
+    def trigger(self) -> Trigger:
+        """Run daily at 4:21 AM UTC."""
+        return CronTrigger(hour=4, minute=21)
+
+    async def execute(self) -> int:
+        """Delete runs older than the configured retention."""
+        days = self.config.history_retention_days
+        cutoff = datetime.now(UTC) - timedelta(days=days)
+        async with get_asyncdb_session() as session:
+            count = await job_run_repo.delete_older_than(session, cutoff)
+            await self._log_job_stats(session)
+        if count > 0:
+            logger.info("Purged %d scheduler runs older than %d days", count, days)
+        return count
+
+    async def _log_job_stats(self, session: AsyncSession) -> None:
+        """Log the rolling metrics of every job with recorded runs."""
+        for stats in await job_run_repo.all_job_stats(session):
+            log = logger.warning if stats.failures or stats.overruns else logger.info
+            log(
+                "Job %s: %d runs, %d failed, %d overran, "
+                "duration p50 %.0f ms / p95 %.0f ms, lag p95 %s ms",
+                stats.job_id,
+                stats.runs,
+                stats.failures,
+                stats.overruns,
+                stats.p50_duration_ms,
+                stats.p95_duration_ms,
+                "-" if stats.p95_lag_ms is None else f"{stats.p95_lag_ms:.0f}",
+            )
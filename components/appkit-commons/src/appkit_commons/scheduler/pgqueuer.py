@@ -3,38 +3,96 @@
 import asyncio
 import contextlib
 import logging
+from collections.abc import Awaitable, Callable
+from datetime import UTC, datetime, timedelta
 from typing import Any
 
 import psycopg
+from croniter import croniter
 from pgqueuer import PgQueuer
 from pgqueuer.db import PsycopgDriver
-from pgqueuer.models import Schedule
+from pgqueuer.errors import DuplicateJobError
+from pgqueuer.models import Job, Schedule
 
 from appkit_commons.database.configuration import DatabaseConfig
 from appkit_commons.registry import service_registry
-from appkit_commons.scheduler.scheduler_types import ScheduledService, Scheduler
+from appkit_commons.scheduler.configuration import SchedulerConfig
+from appkit_commons.scheduler.history import execute_recorded
+from appkit_commons.scheduler.scheduler_types import (
+    DateTrigger,
+    IntervalTrigger,
+    ScheduledService,
+    Scheduler,
+    Trigger,
+)
 
 logger = logging.getLogger(__name__)
 
+JobHandler = Callable[[Job], Awaitable[None]]
+
+
+def uses_delayed_jobs(trigger: Trigger) -> bool:
+    """Whether a trigger runs as delayed jobs instead of a cron schedule.
+
+    One-shot triggers and intervals that cron cannot express exactly (sub-
+    minute, or not dividing the hour/day) are enqueued as delayed jobs that
+    re-enqueue their next run.
+    """
+    if isinstance(trigger, DateTrigger):
+        return True
+    return isinstance(trigger, IntervalTrigger) and not trigger.is_cron_exact
+
+
+def _now() -> datetime:
+    return datetime.now(tz=UTC)
+
+
+def _dedupe_key(job_id: str, run_time: datetime) -> str:
+    """Key shared by all instances enqueueing the same run."""
+    return f"{job_id}@{run_time.isoformat()}"
 
-class PGQueuerScheduler(Scheduler):
-    """Central application scheduler service using PGQueuer."""
 
-    def __init__(self) -> None:
-        """Initialize the scheduler."""
+def _cron_slot(cron: str, now: datetime) -> tuple[datetime, timedelta]:
+    """Due time of the current run of a cron schedule and the gap to the next."""
+    due = croniter(cron, now).get_prev(datetime)
+    return due, croniter(cron, due).get_next(datetime) - due
+
+
+def _parse_due(payload: bytes | None) -> datetime | None:
+    """Due time of a delayed run, enqueued as its ISO timestamp."""
+    if not payload:
+        return None
+    try:
+        return datetime.fromisoformat(payload.decode())
+    except ValueError:
+        return None
+
+
+class PGQueuerWorker:
+    """One PGQueuer instance on its own database connection.
+
+    Every worker dequeues jobs, so a slow job only occupies a slot on one
+    connection. Only the first worker of a pool runs the cron schedules.
+    """
+
+    def __init__(self, scheduler: "PGQueuerScheduler", index: int = 0) -> None:
+        self._scheduler = scheduler
+        self.index = index
         self._pgq: PgQueuer | None = None
-        self._is_running = False
-        self._services: dict[str, ScheduledService] = {}
         self._conn: psycopg.AsyncConnection | None = None
         self._task: asyncio.Task | None = None
+        self._is_running = False
 
     @property
-    def is_running(self) -> bool:
-        """Check if the scheduler is currently running."""
-        return self._is_running
+    def runs_schedules(self) -> bool:
+        return self.index == 0
+
+    @property
+    def pgq(self) -> PgQueuer | None:
+        return self._pgq
 
     async def _setup_pgqueuer(self) -> None:
-        """Configure PGQueuer with pooled database connection.
+        """Configure PGQueuer with a dedicated database connection.
 
         Uses DatabaseConfig settings for keepalive and connection lifecycle:
         - pool_recycle: 1800s (recycle stale connections)
@@ -67,47 +125,13 @@ class PGQueuerScheduler(Scheduler):
             driver = PsycopgDriver(self._conn)
             self._pgq = PgQueuer(driver)
 
-            logger.info("Scheduler configured with PGQueuer")
+            logger.info("Scheduler worker %d configured with PGQueuer", self.index)
         except Exception as e:
             logger.exception(
                 "Failed to configure PGQueuer: %s.",
                 e,
             )
 
-    def add_service(self, service: ScheduledService) -> None:
-        """Add a service to the scheduler.
-
-        Schedules the job defined by the service instance.
-
-        Args:
-            service: The initialized service instance to schedule.
-        """
-        self._services[service.job_id] = service
-        # If running, register immediately
-        if self._is_running and self._pgq:
-            self._register_service_on_pgq(service)
-
-    def _register_service_on_pgq(self, service: ScheduledService) -> None:
-        """Register the service with the PGQueuer instance."""
-        if not self._pgq:
-            return
-
-        cron = service.trigger.to_cron()
-
-        # Define the wrapper function that calls execute
-        # Note: PGQueuer passes 'schedule: Schedule' to the function
-        async def wrapper(_schedule: Schedule) -> None:
-            logger.info("Executing scheduled service: %s", service.name)
-            try:
-                await service.execute()
-            except Exception as e:
-                logger.error("Error executing service %s: %s", service.name, e)
-
-        # Register using the .schedule decorator logic programmatically
-        # This effectively does: @pgq.schedule(...)
-        self._pgq.schedule(service.job_id, cron)(wrapper)
-        logger.debug("Registered service '%s' with cron '%s'", service.job_id, cron)
-
     async def _is_connection_alive(self) -> bool:
         """Check if the current connection is still alive."""
         if not self._conn:
@@ -136,7 +160,8 @@ class PGQueuerScheduler(Scheduler):
         self._pgq = None
 
     async def _run_loop(self) -> None:
-        """Main loop for the scheduler with auto-restart on connection loss."""
+        """Main loop of the worker with auto-restart on connection loss."""
+        config = self._scheduler.config
         while self._is_running:
             try:
                 # 1. Setup connection and PGQueuer if needed
@@ -148,8 +173,7 @@ class PGQueuerScheduler(Scheduler):
                         continue
 
                     # 2. Register services on NEW pgq instance
-                    for service in self._services.values():
-                        self._register_service_on_pgq(service)
+                    await self._scheduler._register_on_worker(self)  # noqa: SLF001
 
                 # 3. Check connection health before running
                 if not await self._is_connection_alive():
@@ -159,11 +183,16 @@ class PGQueuerScheduler(Scheduler):
                     continue
 
                 # 4. Run safely
-                logger.info(
-                    "Starting PGQueuer run loop (services=%d)...", len(self._services)
-                )
+                logger.info("Starting PGQueuer worker %d run loop...", self.index)
                 if self._pgq:
-                    await self._pgq.run()
+                    await self._pgq.run(
+                        batch_size=config.batch_size,
+                        max_concurrent_tasks=max(
+                            config.max_concurrent_tasks, 2 * config.batch_size
+                        ),
+                    )
+                # PGQueuer instances cannot be restarted once they stopped
+                await self._cleanup_connection()
 
             except asyncio.CancelledError:
                 logger.debug("PGQueuer loop cancelled.")
@@ -183,26 +212,262 @@ class PGQueuerScheduler(Scheduler):
                 await self._cleanup_connection()
                 await asyncio.sleep(5)
 
+    def start(self) -> None:
+        """Start the worker background task."""
+        self._is_running = True
+        self._task = asyncio.create_task(self._run_loop())
+
+    async def stop(self, drain_seconds: float) -> None:
+        """Stop dequeuing and let running jobs finish.
+
+        Jobs still running after ``drain_seconds`` are cancelled.
+        """
+        self._is_running = False
+        if self._task and self._pgq:
+            self._pgq.shutdown.set()
+            try:
+                await asyncio.wait_for(asyncio.shield(self._task), drain_seconds)
+            except TimeoutError:
+                logger.warning(
+                    "Worker %d did not drain within %.0fs; cancelling jobs",
+                    self.index,
+                    drain_seconds,
+                )
+        if self._task:
+            self._task.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await self._task
+        await self._cleanup_connection()
+
+
+class PGQueuerScheduler(Scheduler):
+    """Central application scheduler service using a pool of PGQueuer workers.
+
+    Features:
+    - ``SchedulerConfig.workers`` connections that dequeue jobs in batches
+    - Per-entrypoint concurrency limits and priorities, enforced in the database
+    - Delayed jobs for intervals cron cannot express and one-shot runs
+    - Graceful drain of running jobs on shutdown
+    - Run history with duration, start lag and overruns (see ``history``)
+    """
+
+    def __init__(self, config: SchedulerConfig | None = None) -> None:
+        """Initialize the scheduler.
+
+        Args:
+            config: Pool settings; defaults to the registered SchedulerConfig.
+        """
+        registry = service_registry()
+        if config is None and registry.has(SchedulerConfig):
+            config = registry.get(SchedulerConfig)
+        self.config = config or SchedulerConfig()
+        self._is_running = False
+        self._services: dict[str, ScheduledService] = {}
+        self._entrypoints: dict[str, tuple[JobHandler, int]] = {}
+        self._workers: list[PGQueuerWorker] = []
+        self._background_tasks: set[asyncio.Task] = set()
+        # Triggers of services that run as delayed jobs, by job id
+        self._delayed_triggers: dict[str, Trigger] = {}
+
+    @property
+    def is_running(self) -> bool:
+        """Check if the scheduler is currently running."""
+        return self._is_running
+
+    def _connected_pgqs(self) -> list[PgQueuer]:
+        return [w.pgq for w in self._workers if w.pgq is not None]
+
+    def _spawn(self, coro: Awaitable[None]) -> None:
+        task = asyncio.ensure_future(coro)
+        self._background_tasks.add(task)
+        task.add_done_callback(self._background_tasks.discard)
+
+    def add_service(self, service: ScheduledService) -> None:
+        """Add a service to the scheduler.
+
+        Schedules the job defined by the service instance.
+
+        Args:
+            service: The initialized service instance to schedule.
+        """
+        self._services[service.job_id] = service
+        trigger = service.trigger
+        if uses_delayed_jobs(trigger):
+            self._delayed_triggers[service.job_id] = trigger
+        # If running, register immediately
+        if self._is_running:
+            for worker in self._workers:
+                if worker.pgq:
+                    self._register_service_on_pgq(
+                        worker.pgq, service, worker.runs_schedules
+                    )
+            if service.job_id in self._delayed_triggers and self._connected_pgqs():
+                self._spawn(self._enqueue_next_run(service))
+
+    def add_entrypoint(
+        self, name: str, handler: JobHandler, concurrency_limit: int = 0
+    ) -> None:
+        """Register a handler for jobs enqueued with :meth:`enqueue`.
+
+        Args:
+            name: Entrypoint name jobs are enqueued under.
+            handler: Coroutine receiving the PGQueuer job.
+            concurrency_limit: Maximum number of jobs of this entrypoint running
+                at once across all workers and instances; 0 means unlimited.
+        """
+        self._entrypoints[name] = (handler, concurrency_limit)
+        for pgq in self._connected_pgqs():
+            pgq.entrypoint(name, concurrency_limit=concurrency_limit)(handler)
+
+    async def enqueue(
+        self,
+        name: str,
+        payload: bytes | None = None,
+        priority: int = 0,
+        delay: timedelta | None = None,
+        dedupe_key: str | None = None,
+    ) -> bool:
+        """Enqueue a job for an entrypoint.
+
+        Higher priorities are dequeued first.
+
+        Returns:
+            False if a job with the same dedupe key is already queued.
+        """
+        pgqs = self._connected_pgqs()
+        if not pgqs:
+            raise RuntimeError("Scheduler is not connected")
+        try:
+            await pgqs[0].queries.enqueue(
+                name,
+                payload,
+                priority=priority,
+                execute_after=delay,
+                dedupe_key=dedupe_key,
+            )
+        except DuplicateJobError:
+            return False
+        return True
+
+    async def _register_on_worker(self, worker: PGQueuerWorker) -> None:
+        """Register all services and entrypoints on a new PGQueuer instance."""
+        if not worker.pgq:
+            return
+        for service in self._services.values():
+            self._register_service_on_pgq(worker.pgq, service, worker.runs_schedules)
+        for name, (handler, limit) in self._entrypoints.items():
+            worker.pgq.entrypoint(name, concurrency_limit=limit)(handler)
+        if worker.runs_schedules:
+            for service in self._services.values():
+                if service.job_id in self._delayed_triggers:
+                    await self._enqueue_next_run(service)
+
+    def _register_service_on_pgq(
+        self, pgq: PgQueuer, service: ScheduledService, with_schedules: bool = True
+    ) -> None:
+        """Register the service with a PGQueuer instance."""
+        trigger = self._delayed_triggers.get(service.job_id)
+        if trigger is not None:
+            self._register_delayed_service(pgq, service, trigger)
+            return
+        if not with_schedules:
+            return
+
+        cron = service.trigger.to_cron()
+
+        # Define the wrapper function that calls execute
+        # Note: PGQueuer passes 'schedule: Schedule' to the function
+        async def wrapper(_schedule: Schedule) -> None:
+            logger.info("Executing scheduled service: %s", service.name)
+            due, interval = _cron_slot(cron, _now())
+            await execute_recorded(service, scheduled_at=due, interval=interval)
+
+        # Register using the .schedule decorator logic programmatically
+        # This effectively does: @pgq.schedule(...)
+        pgq.schedule(service.job_id, cron)(wrapper)
+        logger.debug("Registered service '%s' with cron '%s'", service.job_id, cron)
+
+    def _register_delayed_service(
+        self, pgq: PgQueuer, service: ScheduledService, trigger: Trigger
+    ) -> None:
+        """Register the service as an entrypoint for delayed jobs.
+
+        Each run enqueues the next grid slot before executing, so a crash
+        during execution does not break the chain. The service's
+        ``concurrency_limit`` applies across all workers and instances.
+        """
+
+        async def run(job: Job) -> None:
+            if isinstance(trigger, IntervalTrigger):
+                await self._enqueue_next_run(service)
+            due = _parse_due(job.payload)
+            logger.info(
+                "Executing scheduled service: %s (due %s)", service.name, due or "now"
+            )
+            interval = (
+                trigger.interval if isinstance(trigger, IntervalTrigger) else None
+            )
+            await execute_recorded(service, scheduled_at=due, interval=interval)
+
+        pgq.entrypoint(service.job_id, concurrency_limit=service.concurrency_limit)(run)
+        logger.debug(
+            "Registered service '%s' for delayed runs (%s)",
+            service.job_id,
+            type(trigger).__name__,
+        )
+
+    async def _enqueue_run(
+        self, service: ScheduledService, run_time: datetime | None
+    ) -> None:
+        """Enqueue one run of a delayed service, once across all instances."""
+        if run_time is None:
+            return
+        delay = max(run_time - _now(), timedelta(0))
+        enqueued = await self.enqueue(
+            service.job_id,
+            run_time.isoformat().encode(),
+            priority=service.priority,
+            delay=delay,
+            dedupe_key=_dedupe_key(service.job_id, run_time),
+        )
+        if enqueued:
+            logger.debug("Enqueued '%s' for %s", service.job_id, run_time)
+        else:
+            logger.debug("Run of '%s' at %s already queued", service.job_id, run_time)
+
+    async def _enqueue_next_run(self, service: ScheduledService) -> None:
+        """Enqueue the next run of a delayed service, if there is one."""
+        try:
+            trigger = self._delayed_triggers[service.job_id]
+            await self._enqueue_run(service, trigger.next_fire_time(_now()))
+        except Exception as e:
+            logger.error("Failed to enqueue service %s: %s", service.name, e)
+
     async def start(self) -> None:
-        """Start the scheduler background task."""
+        """Start the worker pool."""
         if not self._is_running:
             self._is_running = True
-            # Start the resilient loop
-            self._task = asyncio.create_task(self._run_loop())
-            logger.info("Scheduler started")
+            self._workers = [
+                PGQueuerWorker(self, index)
+                for index in range(max(self.config.workers, 1))
+            ]
+            for worker in self._workers:
+                worker.start()
+            logger.info("Scheduler started (workers=%d)", len(self._workers))
         else:
             logger.debug("Application scheduler is already running")
 
     async def shutdown(self) -> None:
-        """Shutdown the scheduler."""
+        """Shutdown the scheduler, letting running jobs finish first."""
         if self._is_running:
             self._is_running = False
-            if self._task:
-                self._task.cancel()
-                with contextlib.suppress(asyncio.CancelledError):
-                    await self._task
-
-            await self._cleanup_connection()
+            await asyncio.gather(
+                *(
+                    worker.stop(self.config.shutdown_timeout_seconds)
+                    for worker in self._workers
+                )
+            )
+            self._workers = []
             logger.info("Application scheduler stopped")
 
     # Compatibility method if needed, but we aim to remove direct usage
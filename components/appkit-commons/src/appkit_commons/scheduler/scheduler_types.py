@@ -10,6 +10,14 @@ logger = logging.getLogger(__name__)
 
 MINUTES_PER_HOUR = 60
 HOURS_PER_DAY = 24
+SECONDS_PER_MINUTE = 60
+# Interval grids are anchored here unless a start time is given
+EPOCH = datetime(1970, 1, 1, tzinfo=UTC)
+
+
+def _as_utc(value: datetime) -> datetime:
+    """Treat naive datetimes as UTC."""
+    return value if value.tzinfo else value.replace(tzinfo=UTC)
 
 
 class Trigger(ABC):
@@ -20,6 +28,22 @@ class Trigger(ABC):
         """Convert trigger to cron expression."""
         ...
 
+    def next_fire_time(self, after: datetime) -> datetime | None:
+        """Get the first run strictly after ``after``, or None if done.
+
+        Defaults to the next match of :meth:`to_cron` in UTC; triggers that
+        are not exact as cron override this.
+        """
+        try:
+            from croniter import croniter  # noqa: PLC0415
+        except ImportError as exc:
+            raise ImportError(
+                "The optional 'croniter' dependency is required to compute the "
+                "next run of a cron schedule. Install 'appkit-commons[pgqueuer]'."
+            ) from exc
+
+        return croniter(self.to_cron(), _as_utc(after)).get_next(datetime)
+
     def _warn_ignoring_args(self, **kwargs: Any) -> None:
         """Log warning for ignored arguments."""
         ignored = [k for k, v in kwargs.items() if v]
@@ -64,6 +88,42 @@ class IntervalTrigger(Trigger):
         """Get the interval as a timedelta."""
         return self._interval
 
+    @property
+    def is_cron_exact(self) -> bool:
+        """Whether :meth:`to_cron` fires at exactly this interval."""
+        seconds = self._interval.total_seconds()
+        if seconds <= 0 or seconds % SECONDS_PER_MINUTE:
+            return False
+        minutes = int(seconds) // SECONDS_PER_MINUTE
+        if minutes < MINUTES_PER_HOUR:
+            return MINUTES_PER_HOUR % minutes == 0
+        if minutes % MINUTES_PER_HOUR:
+            return False
+        hours = minutes // MINUTES_PER_HOUR
+        # "*/n" day steps restart every month, so only daily runs are exact
+        return HOURS_PER_DAY % hours == 0
+
+    def next_fire_time(self, after: datetime) -> datetime | None:
+        """Get the first run strictly after ``after``.
+
+        Runs lie on a fixed grid anchored at ``start_time`` (or the Unix
+        epoch), so late or long runs never shift later ones. Returns None
+        once ``end_time`` has passed.
+        """
+        if self._interval <= timedelta(0):
+            raise ValueError("Interval must be positive")
+        after = _as_utc(after)
+        anchor = _as_utc(self.start_time) if self.start_time else EPOCH
+        if after < anchor:
+            next_time = anchor
+        else:
+            next_time = anchor + ((after - anchor) // self._interval + 1) * (
+                self._interval
+            )
+        if self.end_time and next_time > _as_utc(self.end_time):
+            return None
+        return next_time
+
     def to_cron(self) -> str:
         """Convert interval to cron expression."""
         total_seconds = int(self._interval.total_seconds())
@@ -118,6 +178,27 @@ class IntervalTrigger(Trigger):
         return approximation
 
 
+class DateTrigger(Trigger):
+    """Trigger that runs once, at a fixed time or after a delay."""
+
+    def __init__(
+        self,
+        run_time: datetime | None = None,
+        delay: timedelta | None = None,
+    ):
+        if (run_time is None) == (delay is None):
+            raise ValueError("Pass exactly one of run_time or delay")
+        self.run_time = _as_utc(run_time) if run_time else datetime.now(tz=UTC) + delay
+
+    def next_fire_time(self, after: datetime) -> datetime | None:
+        """Get the run time if it is still ahead of ``after``."""
+        return self.run_time if self.run_time > _as_utc(after) else None
+
+    def to_cron(self) -> str:
+        """One-shot triggers have no cron equivalent."""
+        raise ValueError("DateTrigger runs once and cannot be expressed as cron")
+
+
 class CalendarIntervalTrigger(Trigger):
     """Runs the task on specified calendar-based intervals."""
 
@@ -267,6 +348,10 @@ class ScheduledService(ABC):
 
     job_id: ClassVar[str]
     name: ClassVar[str] = "Scheduled Service"
+    # Queue-backed runs (see PGQueuerScheduler): maximum runs at once across
+    # all workers (0 = unlimited) and dequeue priority (higher runs first)
+    concurrency_limit: ClassVar[int] = 1
+    priority: ClassVar[int] = 0
 
     @property
     @abstractmethod
@@ -275,8 +360,11 @@ class ScheduledService(ABC):
         ...
 
     @abstractmethod
-    async def execute(self, *args: Any, **kwargs: Any) -> None:
-        """The actual job logic to execute."""
+    async def execute(self, *args: Any, **kwargs: Any) -> int | None:
+        """The actual job logic to execute.
+
+        May return the number of rows processed, recorded in the run history.
+        """
         ...
 
 
@@ -110,3 +110,19 @@ def check_password_hash(pwhash: str, password: str) -> bool:
         return False
 
     return hmac.compare_digest(_hash_internal(method, salt, password)[0], hashval)
+
+
+def password_fingerprint(password: str, key: str | bytes) -> str:
+    """Keyed HMAC-SHA256 fingerprint of a password.
+
+    Unlike :func:`generate_password_hash` this is fast and deterministic, so it
+    can be compared directly, e.g. to detect password reuse without running the
+    key derivation for every stored hash. It is only as safe as ``key``: anyone
+    holding the key can test password guesses against a fingerprint at HMAC
+    speed, so keep the key out of the database.
+
+    :param password: The plaintext password.
+    :param key: The secret HMAC key.
+    """
+    key_bytes = key.encode() if isinstance(key, str) else key
+    return hmac.new(key_bytes, password.encode(), hashlib.sha256).hexdigest()
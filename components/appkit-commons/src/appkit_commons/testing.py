@@ -2,6 +2,7 @@
 
 This module is a pytest plugin providing foundational test fixtures:
 - Async SQLAlchemy engine and session management (SQLite in-memory)
+- SQL statement budgets (``query_budget``)
 - Service registry cleanup
 - Secret mocking utilities
 - Test data generation utilities
@@ -17,8 +18,12 @@ Individual package tests extend these fixtures with specialized factories.
 
 import asyncio
 import logging
-from collections.abc import AsyncGenerator, Generator
+import threading
+import time
+from collections.abc import AsyncGenerator, Callable, Generator, Iterator
+from contextlib import AbstractContextManager, contextmanager
 from pathlib import Path
+from types import SimpleNamespace
 from typing import Any
 
 import pytest
@@ -33,9 +38,16 @@ from sqlalchemy.ext.asyncio import (
 )
 from sqlalchemy.pool import StaticPool
 
+from appkit_commons.configuration import secret_provider
 from appkit_commons.configuration.configuration import ReflexConfig
+from appkit_commons.configuration.secret_provider import SecretNotFoundError
 from appkit_commons.database.configuration import DatabaseConfig
 from appkit_commons.database.entities import Base
+from appkit_commons.database.instrumentation import (
+    QueryStats,
+    instrument_engine,
+    track_queries,
+)
 from appkit_commons.registry import ServiceRegistry, service_registry
 
 logger = logging.getLogger(__name__)
@@ -177,6 +189,44 @@ async def async_session(
         yield session
 
 
+@pytest.fixture
+def query_budget(
+    async_engine: AsyncEngine,
+) -> Callable[..., AbstractContextManager[QueryStats]]:
+    """Assert how many SQL statements a block of code may issue.
+
+    Catches per-row query loops (N+1) in CI:
+
+        with query_budget(2, max_repeats=1) as stats:
+            await repo.bulk_upsert(session, rows, conflict_keys=["id"])
+
+    Args (of the returned context manager):
+        max_statements: Maximum number of statements in the block.
+        max_repeats: Maximum number of times one statement shape may repeat.
+    """
+    instrument_engine(async_engine)
+
+    @contextmanager
+    def _budget(
+        max_statements: int, max_repeats: int | None = None
+    ) -> Iterator[QueryStats]:
+        with track_queries("query_budget", warn=False) as stats:
+            yield stats
+        shapes = "\n".join(f"{n}x {shape}" for shape, n in stats.shapes.items())
+        if stats.statements > max_statements:
+            pytest.fail(
+                f"Expected at most {max_statements} SQL statements, "
+                f"got {stats.statements}:\n{shapes}"
+            )
+        if max_repeats is not None and stats.repeated(max_repeats + 1):
+            pytest.fail(
+                f"Statement repeated more than {max_repeats} times "
+                f"(possible N+1):\n{shapes}"
+            )
+
+    return _budget
+
+
 # ============================================================================
 # Service Registry Fixtures
 # ============================================================================
@@ -233,6 +283,47 @@ def mock_secrets(monkeypatch: pytest.MonkeyPatch) -> dict[str, str]:
     return secrets
 
 
+class FakeKeyVault:
+    """In-memory stand-in for the Azure Key Vault ``SecretClient``.
+
+    Records every requested secret name in ``requests``.
+    """
+
+    def __init__(
+        self, secrets: dict[str, str] | None = None, latency_seconds: float = 0.0
+    ) -> None:
+        self.secrets = dict(secrets or {})
+        self.latency_seconds = latency_seconds
+        self.requests: list[str] = []
+        self._lock = threading.Lock()
+
+    def get_secret(self, name: str) -> SimpleNamespace:
+        with self._lock:
+            self.requests.append(name)
+        if self.latency_seconds:
+            time.sleep(self.latency_seconds)
+        if name not in self.secrets:
+            raise SecretNotFoundError(f"Secret '{name}' not found in fake vault")
+        return SimpleNamespace(name=name, value=self.secrets[name])
+
+
+@pytest.fixture
+def fake_key_vault(monkeypatch: pytest.MonkeyPatch) -> FakeKeyVault:
+    """Serve secrets from an empty fake vault through the Azure provider.
+
+    Tests populate ``fake_key_vault.secrets``; the secret cache starts empty.
+    """
+    vault = FakeKeyVault()
+    monkeypatch.setenv("SECRET_PROVIDER", "azure")
+    monkeypatch.setattr(secret_provider, "_get_azure_client", lambda: vault)
+    monkeypatch.setattr(
+        secret_provider,
+        "_azure_secrets",
+        secret_provider.SecretCache(secret_provider._fetch_secret_from_azure),  # noqa: SLF001
+    )
+    return vault
+
+
 # ============================================================================
 # Test Data Generation Fixtures
 # ============================================================================
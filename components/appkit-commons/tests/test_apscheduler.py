@@ -13,6 +13,7 @@ from appkit_commons.scheduler.apscheduler import APScheduler
 from appkit_commons.scheduler.scheduler_types import (
     CalendarIntervalTrigger,
     CronTrigger,
+    DateTrigger,
     IntervalTrigger,
     ScheduledService,
 )
@@ -103,6 +104,18 @@ class TestAPSchedulerConvertTrigger:
         assert converted is not None
         assert hasattr(converted, "end_time")
 
+    def test_convert_date_trigger(self) -> None:
+        """_convert_trigger converts DateTrigger."""
+        # Arrange
+        scheduler = APScheduler()
+        run_time = datetime(2026, 1, 1, 12, 0, tzinfo=UTC)
+
+        # Act
+        converted = scheduler._convert_trigger(DateTrigger(run_time=run_time))
+
+        # Assert
+        assert converted.run_time == run_time
+
     def test_convert_cron_trigger_basic(self) -> None:
         """_convert_trigger converts CronTrigger."""
         # Arrange
@@ -1,5 +1,7 @@
 """Tests for BaseRepository generic CRUD operations."""
 
+from unittest.mock import AsyncMock, MagicMock
+
 import pytest
 from sqlalchemy import Integer, String
 from sqlalchemy.ext.asyncio import AsyncSession
@@ -63,3 +65,188 @@ class TestBaseRepository:
 
         # Assert
         assert found is None
+
+    @pytest.mark.asyncio
+    async def test_estimated_count_exact_on_sqlite(
+        self, async_session: AsyncSession, test_repository: SampleEntityRepository
+    ) -> None:
+        await test_repository.bulk_insert(
+            async_session, [{"name": "a", "value": 1}, {"name": "b", "value": 2}]
+        )
+
+        assert await test_repository.estimated_count(async_session) == 2
+
+    @pytest.mark.asyncio
+    async def test_estimated_count_uses_postgres_statistics(
+        self, test_repository: SampleEntityRepository
+    ) -> None:
+        session = MagicMock()
+        session.get_bind.return_value.dialect.name = "postgresql"
+        estimate = MagicMock()
+        estimate.scalar.return_value = 50_000
+        session.execute = AsyncMock(return_value=estimate)
+
+        assert await test_repository.estimated_count(session) == 50_000
+        _, params = session.execute.await_args.args
+        assert params == {"t": "test_sample_entity"}
+
+    @pytest.mark.asyncio
+    async def test_estimated_count_small_postgres_table_counted(
+        self, test_repository: SampleEntityRepository
+    ) -> None:
+        session = MagicMock()
+        session.get_bind.return_value.dialect.name = "postgresql"
+        estimate, exact = MagicMock(), MagicMock()
+        estimate.scalar.return_value = -1  # never analyzed
+        exact.scalar_one.return_value = 7
+        session.execute = AsyncMock(side_effect=[estimate, exact])
+
+        assert await test_repository.estimated_count(session) == 7
+
+
+class TestBaseRepositoryBulkOperations:
+    """Test suite for the set-based bulk operations."""
+
+    @pytest.mark.asyncio
+    async def test_bulk_insert(
+        self, async_session: AsyncSession, test_repository: SampleEntityRepository
+    ) -> None:
+        count = await test_repository.bulk_insert(
+            async_session, [{"name": "a", "value": 1}, {"name": "b"}]
+        )
+
+        assert count == 2
+        entities = await test_repository.find_all(async_session)
+        assert sorted((e.name, e.value) for e in entities) == [("a", 1), ("b", 0)]
+
+    @pytest.mark.asyncio
+    async def test_bulk_insert_empty(
+        self, async_session: AsyncSession, test_repository: SampleEntityRepository
+    ) -> None:
+        assert await test_repository.bulk_insert(async_session, []) == 0
+
+    @pytest.mark.asyncio
+    async def test_bulk_update(
+        self, async_session: AsyncSession, test_repository: SampleEntityRepository
+    ) -> None:
+        await test_repository.bulk_insert(
+            async_session,
+            [
+                {"name": "a", "value": 1},
+                {"name": "b", "value": 2},
+                {"name": "c", "value": 3},
+            ],
+        )
+
+        count = await test_repository.bulk_update(
+            async_session,
+            [SampleEntity.value >= 2, SampleEntity.name != "c"],
+            {"value": SampleEntity.value + 10},
+        )
+
+        assert count == 1
+        async_session.expire_all()
+        entities = await test_repository.find_all(async_session)
+        assert {e.name: e.value for e in entities} == {"a": 1, "b": 12, "c": 3}
+
+    @pytest.mark.asyncio
+    async def test_bulk_update_requires_criteria(
+        self, async_session: AsyncSession, test_repository: SampleEntityRepository
+    ) -> None:
+        with pytest.raises(ValueError, match="criterion"):
+            await test_repository.bulk_update(async_session, [], {"value": 0})
+
+    @pytest.mark.asyncio
+    async def test_bulk_delete(
+        self, async_session: AsyncSession, test_repository: SampleEntityRepository
+    ) -> None:
+        await test_repository.bulk_insert(
+            async_session,
+            [{"name": "a", "value": 1}, {"name": "b", "value": 2}],
+        )
+
+        count = await test_repository.bulk_delete(async_session, SampleEntity.value > 1)
+
+        assert count == 1
+        assert await test_repository.count(async_session) == 1
+
+    @pytest.mark.asyncio
+    async def test_delete_batch(
+        self, async_session: AsyncSession, test_repository: SampleEntityRepository
+    ) -> None:
+        await test_repository.bulk_insert(
+            async_session,
+            [{"name": n, "value": v} for n, v in [("a", 3), ("b", 1), ("c", 2)]],
+        )
+
+        count = await test_repository.delete_batch(
+            async_session, SampleEntity.value > 0, 2, order_by=SampleEntity.value
+        )
+
+        assert count == 2
+        remaining = await test_repository.find_all(async_session)
+        assert [e.name for e in remaining] == ["a"]
+        assert (
+            await test_repository.count_where(async_session, SampleEntity.value > 2)
+            == 1
+        )
+
+    @pytest.mark.asyncio
+    async def test_bulk_upsert(
+        self, async_session: AsyncSession, test_repository: SampleEntityRepository
+    ) -> None:
+        await test_repository.bulk_insert(
+            async_session, [{"id": 1, "name": "a", "value": 1}]
+        )
+
+        count = await test_repository.bulk_upsert(
+            async_session,
+            [
+                {"id": 1, "name": "renamed", "value": 5},
+                {"id": 2, "name": "new", "value": 7},
+            ],
+            conflict_keys=["id"],
+            update_columns=["name"],
+        )
+
+        assert count == 2
+        async_session.expire_all()
+        entities = await test_repository.find_all(async_session)
+        assert {e.id: (e.name, e.value) for e in entities} == {
+            1: ("renamed", 1),
+            2: ("new", 7),
+        }
+
+    @pytest.mark.asyncio
+    async def test_bulk_upsert_rejects_unsupported_database(
+        self, test_repository: SampleEntityRepository
+    ) -> None:
+        session = MagicMock()
+        session.get_bind.return_value.dialect.name = "mysql"
+
+        with pytest.raises(ValueError, match="postgresql, sqlite"):
+            await test_repository.bulk_upsert(
+                session, [{"id": 1, "name": "a", "value": 1}], conflict_keys=["id"]
+            )
+
+    @pytest.mark.asyncio
+    async def test_bulk_upsert_chunks_and_ignores_conflicts(
+        self, async_session: AsyncSession, test_repository: SampleEntityRepository
+    ) -> None:
+        await test_repository.bulk_insert(
+            async_session, [{"id": 1, "name": "keep", "value": 0}]
+        )
+
+        await test_repository.bulk_upsert(
+            async_session,
+            [{"id": i, "name": f"n{i}", "value": i} for i in range(1, 6)],
+            conflict_keys=["id"],
+            update_columns=[],
+            chunk_size=2,
+        )
+
+        async_session.expire_all()
+        assert await test_repository.count(async_session) == 5
+        kept = await test_repository.find_by_id(async_session, 1)
+        assert kept is not None
+        assert kept.name == "keep"
@@ -0,0 +1,231 @@
+"""Tests for hot-reloadable configuration snapshots."""
+
+import asyncio
+import logging
+import os
+from pathlib import Path
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from appkit_commons.configuration.configuration import (
+    ApplicationConfig,
+    Configuration,
+)
+from appkit_commons.configuration.snapshot import (
+    ConfigSnapshot,
+    ConfigurationSnapshots,
+)
+from appkit_commons.registry import ServiceRegistry
+from appkit_commons.scheduler.configuration import SchedulerConfig
+
+
+def _config(version: str, workers: int = 2) -> Configuration[ApplicationConfig]:
+    return Configuration[ApplicationConfig](
+        profile="test",
+        app=ApplicationConfig(
+            version=version,
+            name="appkit",
+            logging="logging.yaml",
+            scheduler=SchedulerConfig(workers=workers),
+        ),
+    )
+
+
+class FakeSnapshots(ConfigurationSnapshots[ApplicationConfig]):
+    """Snapshots compiling from a list and watching one temporary file."""
+
+    def __init__(self, watched: Path, **kwargs: object) -> None:
+        self.watched = watched
+        self.compiled: list[Configuration[ApplicationConfig] | Exception] = []
+        super().__init__(ApplicationConfig, **kwargs)  # type: ignore[arg-type]
+
+    def watched_files(self) -> list[Path]:
+        return [self.watched]
+
+    def _compile(self) -> Configuration[ApplicationConfig]:
+        result = self.compiled.pop(0)
+        if isinstance(result, Exception):
+            raise result
+        return result
+
+
+@pytest.fixture
+def registry() -> ServiceRegistry:
+    registry = ServiceRegistry()
+    registry.update_configuration(_config("1"))
+    return registry
+
+
+@pytest.fixture
+def snapshots(tmp_path: Path, registry: ServiceRegistry) -> FakeSnapshots:
+    watched = tmp_path / "config.yaml"
+    watched.write_text("a: 1")
+    return FakeSnapshots(
+        watched, initial=registry.get(Configuration), registry=registry
+    )
+
+
+def _touch(path: Path, content: str) -> None:
+    path.write_text(content)
+    stat = path.stat()
+    # Make the change visible on filesystems with coarse timestamps
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+
+class TestConfigurationSnapshots:
+    def test_initial_snapshot(self, snapshots: FakeSnapshots) -> None:
+        snapshot = snapshots.current
+
+        assert isinstance(snapshot, ConfigSnapshot)
+        assert snapshot.version == 1
+        assert snapshot.app.version == "1"
+
+    def test_compiles_on_first_access(self, tmp_path: Path) -> None:
+        snapshots = FakeSnapshots(tmp_path / "missing.yaml", registry=MagicMock())
+        snapshots.compiled.append(_config("7"))
+
+        assert snapshots.current.app.version == "7"
+        assert snapshots.current.fingerprint == ((str(tmp_path / "missing.yaml"), -1),)
+
+    @pytest.mark.asyncio
+    async def test_unchanged_files_are_not_compiled(
+        self, snapshots: FakeSnapshots
+    ) -> None:
+        assert await snapshots.reload() is False
+        assert snapshots.compiled == []
+
+    @pytest.mark.asyncio
+    async def test_swaps_and_notifies_on_change(
+        self, snapshots: FakeSnapshots, registry: ServiceRegistry
+    ) -> None:
+        listener = AsyncMock()
+        snapshots.subscribe(listener)
+        snapshots.compiled.append(_config("2", workers=4))
+        old = snapshots.current
+        _touch(snapshots.watched, "a: 2")
+
+        assert await snapshots.reload() is True
+
+        new = snapshots.current
+        assert new.version == 2
+        assert new.app.version == "2"
+        listener.assert_awaited_once_with(old, new)
+        assert registry.get(Configuration) is new.config
+        assert registry.get(SchedulerConfig).workers == 4
+
+    @pytest.mark.asyncio
+    async def test_equal_configuration_keeps_version(
+        self, snapshots: FakeSnapshots
+    ) -> None:
+        listener = MagicMock()
+        snapshots.subscribe(listener)
+        snapshots.compiled.append(_config("1"))
+        _touch(snapshots.watched, "# comment only")
+
+        assert await snapshots.reload() is False
+
+        assert snapshots.current.version == 1
+        assert snapshots.current.fingerprint == snapshots.fingerprint()
+        listener.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_invalid_configuration_keeps_snapshot(
+        self, snapshots: FakeSnapshots, caplog: pytest.LogCaptureFixture
+    ) -> None:
+        snapshots.compiled.append(ValueError("bad port"))
+        _touch(snapshots.watched, "a: [")
+
+        with caplog.at_level(logging.ERROR):
+            assert await snapshots.reload() is False
+
+        assert snapshots.current.version == 1
+        assert "keeping v1: bad port" in caplog.text
+
+    @pytest.mark.asyncio
+    async def test_failing_listener_does_not_stop_others(
+        self, snapshots: FakeSnapshots
+    ) -> None:
+        second = MagicMock()
+        snapshots.subscribe(MagicMock(side_effect=RuntimeError("boom")))
+        snapshots.subscribe(second)
+        snapshots.compiled.append(_config("2"))
+
+        assert await snapshots.reload(force=True) is True
+
+        second.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_unsubscribe(self, snapshots: FakeSnapshots) -> None:
+        listener = MagicMock()
+        unsubscribe = snapshots.subscribe(listener)
+        unsubscribe()
+        unsubscribe()
+        snapshots.compiled.append(_config("2"))
+
+        await snapshots.reload(force=True)
+
+        listener.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_start_and_stop_watcher(self, snapshots: FakeSnapshots) -> None:
+        snapshots.poll_seconds = 0.01
+        snapshots.compiled.append(_config("2"))
+        _touch(snapshots.watched, "a: 3")
+
+        snapshots.start()
+        for _ in range(100):
+            if snapshots.current.version == 2:
+                break
+            await asyncio.sleep(0.01)
+        await snapshots.stop()
+
+        assert snapshots.current.version == 2
+        assert snapshots._task is None
+
+    def test_disabled_watcher_does_not_start(self, snapshots: FakeSnapshots) -> None:
+        snapshots.poll_seconds = 0
+
+        snapshots.start()
+
+        assert snapshots._task is None
+
+
+class TestRegistryUpdateConfiguration:
+    def test_replaces_nested_configurations(self) -> None:
+        registry = ServiceRegistry()
+        registry.update_configuration(_config("1", workers=1))
+        registry.freeze()
+
+        registry.update_configuration(_config("2", workers=3))
+
+        assert registry.get(ApplicationConfig).version == "2"
+        assert registry.get(SchedulerConfig).workers == 3
+
+    def test_rebuilds_frozen_table_once(self) -> None:
+        registry = ServiceRegistry()
+        registry.update_configuration(_config("1"))
+        registry.freeze()
+        table = registry._resolved
+
+        with patch.object(
+            registry, "_build_table", wraps=registry._build_table
+        ) as build_table:
+            registry.update_configuration(_config("2"))
+
+        build_table.assert_called_once()
+        # The previous table is replaced, not refilled in place
+        assert registry._resolved is not table
+        assert table[ApplicationConfig].version == "1"
+        assert registry.get(ApplicationConfig).version == "2"
+
+    def test_registers_new_nested_configurations_when_frozen(self) -> None:
+        registry = ServiceRegistry()
+        config = _config("1")
+        config.app.scheduler = None
+        registry.update_configuration(config)
+        registry.freeze()
+
+        registry.update_configuration(_config("2", workers=3))
+
+        assert registry.get(SchedulerConfig).workers == 3
@@ -1,6 +1,7 @@
 """Tests for configuration modules."""
 
 import os
+from collections.abc import Iterator
 from unittest.mock import MagicMock, patch
 
 import pytest
@@ -13,6 +14,7 @@ from appkit_commons.configuration.base import (
 from appkit_commons.configuration.secret_provider import (
     SECRET,
     SecretNotFoundError,
+    _azure_secrets,
     _get_secret_from_azure,
     _get_secret_from_env,
 )
@@ -299,6 +301,12 @@ class TestBaseConfig:
 class TestAzureSecretProvider:
     """Test suite for Azure secret provider functionality."""
 
+    @pytest.fixture(autouse=True)
+    def clear_secret_cache(self) -> Iterator[None]:
+        _azure_secrets.clear()
+        yield
+        _azure_secrets.clear()
+
     def test_get_secret_from_azure_success(self) -> None:
         """_get_secret_from_azure retrieves secret from Azure."""
         # Arrange
@@ -0,0 +1,230 @@
+"""Tests for SQL statement instrumentation and N+1 detection."""
+
+import asyncio
+import logging
+from collections.abc import Callable, Generator
+from contextlib import AbstractContextManager
+
+import pytest
+from sqlalchemy import create_engine, event, text
+from sqlalchemy.exc import OperationalError
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession
+
+from appkit_commons.database.instrumentation import (
+    QueryStats,
+    QueryThresholds,
+    _after_cursor_execute,
+    current_query_stats,
+    get_query_thresholds,
+    instrument_engine,
+    normalize_statement,
+    set_query_thresholds,
+    track_queries,
+    track_task_queries,
+)
+
+
+@pytest.fixture(autouse=True)
+def restore_thresholds() -> Generator[None, None, None]:
+    saved = get_query_thresholds()
+    yield
+    set_query_thresholds(saved)
+
+
+class TestNormalizeStatement:
+    def test_collapses_whitespace(self) -> None:
+        assert normalize_statement("SELECT  a\n  FROM t ") == "SELECT a FROM t"
+
+    def test_collapses_parameter_lists(self) -> None:
+        two = normalize_statement("SELECT * FROM t WHERE id IN (?, ?)")
+        five = normalize_statement("SELECT * FROM t WHERE id IN (?, ?, ?, ?, ?)")
+        assert two == five == "SELECT * FROM t WHERE id IN (?)"
+
+    def test_postgres_parameters(self) -> None:
+        assert normalize_statement(
+            "SELECT * FROM t WHERE id IN (%(id_1_1)s, %(id_1_2)s)"
+        ) == normalize_statement("SELECT * FROM t WHERE id IN (%(id_1_1)s)")
+
+
+class TestTrackQueries:
+    def test_no_scope_by_default(self) -> None:
+        assert current_query_stats() is None
+
+    def test_sets_and_resets_scope(self) -> None:
+        with track_queries("outer", warn=False) as stats:
+            assert current_query_stats() is stats
+        assert current_query_stats() is None
+
+    def test_nested_scopes_count_towards_parents(self) -> None:
+        with track_queries("outer", warn=False) as outer:
+            with track_queries("inner", warn=False) as inner:
+                inner.record("SELECT 1", rows=1, duration_ms=2.0)
+            outer.record("SELECT 2", rows=0, duration_ms=1.0)
+
+        assert inner.statements == 1
+        assert outer.statements == 2
+        assert outer.rows == 1
+        assert outer.duration_ms == pytest.approx(3.0)
+
+    def test_warns_when_statement_threshold_exceeded(
+        self, caplog: pytest.LogCaptureFixture
+    ) -> None:
+        caplog.set_level(logging.WARNING)
+        thresholds = QueryThresholds(max_statements=2, max_repeats=0)
+        with track_queries("GET /items", thresholds) as stats:
+            for i in range(3):
+                stats.record(f"SELECT {i}", rows=0, duration_ms=0.0)
+
+        assert "GET /items issued 3 SQL statements" in caplog.text
+
+    def test_warns_on_repeated_statement(
+        self, caplog: pytest.LogCaptureFixture
+    ) -> None:
+        caplog.set_level(logging.WARNING)
+        thresholds = QueryThresholds(max_statements=0, max_repeats=3)
+        with track_queries("load", thresholds) as stats:
+            for _ in range(3):
+                stats.record("SELECT * FROM t WHERE id = ?", 1, 0.0)
+
+        assert "repeated a SQL statement 3 times" in caplog.text
+
+    def test_uses_configured_thresholds(self, caplog: pytest.LogCaptureFixture) -> None:
+        caplog.set_level(logging.WARNING)
+        set_query_thresholds(QueryThresholds(max_statements=0, max_repeats=0))
+        with track_queries("quiet") as stats:
+            for _ in range(100):
+                stats.record("SELECT 1", 1, 0.0)
+
+        assert caplog.text == ""
+
+    def test_repeated_sorted_by_count(self) -> None:
+        stats = QueryStats(label="x")
+        for statement in ("A", "B", "B"):
+            stats.record(statement, 0, 0.0)
+
+        assert stats.repeated(1) == [("B", 2), ("A", 1)]
+        assert stats.repeated(0) == []
+
+
+class TestTrackTaskQueries:
+    def test_outside_task(self) -> None:
+        assert track_task_queries("no task") is None
+
+    @pytest.mark.asyncio
+    async def test_scope_ends_with_task(self, caplog: pytest.LogCaptureFixture) -> None:
+        set_query_thresholds(QueryThresholds(max_statements=1, max_repeats=0))
+
+        async def _event() -> QueryStats | None:
+            stats = track_task_queries("State.event")
+            for statement in ("A", "B"):
+                current_query_stats().record(statement, 1, 1.0)
+            return stats
+
+        with caplog.at_level(logging.WARNING):
+            stats = await asyncio.create_task(_event())
+            await asyncio.sleep(0)
+
+        assert stats.statements == 2
+        assert current_query_stats() is None
+        assert "State.event issued 2 SQL statements" in caplog.text
+
+
+class TestInstrumentEngine:
+    def test_counts_sync_statements(self) -> None:
+        engine = create_engine("sqlite:///:memory:")
+        instrument_engine(engine)
+        instrument_engine(engine)  # idempotent
+
+        with engine.connect() as conn, track_queries("sync", warn=False) as stats:
+            for i in range(3):
+                conn.execute(text("SELECT :i"), {"i": i})
+
+        assert stats.statements == 3
+        assert stats.shapes == {"SELECT ?": 3}
+        engine.dispose()
+
+    def test_ignores_statements_outside_scope(self) -> None:
+        engine = create_engine("sqlite:///:memory:")
+        instrument_engine(engine)
+
+        with engine.connect() as conn:
+            conn.execute(text("SELECT 1"))
+            with track_queries("scope", warn=False) as stats:
+                conn.execute(text("SELECT 2"))
+
+        assert stats.statements == 1
+        engine.dispose()
+
+    def test_failed_statement_releases_start_time(self) -> None:
+        engine = create_engine("sqlite:///:memory:")
+        instrument_engine(engine)
+
+        with engine.connect() as conn, track_queries("errors", warn=False):
+            for _ in range(3):
+                with pytest.raises(OperationalError):
+                    conn.execute(text("SELECT * FROM missing"))
+            conn.execute(text("SELECT 1"))
+
+            assert not conn.info.get("appkit_query_start_times")
+        engine.dispose()
+
+    def test_listener_registered_once(self) -> None:
+        engine = create_engine("sqlite:///:memory:")
+        instrument_engine(engine)
+        instrument_engine(engine)
+
+        assert event.contains(engine, "after_cursor_execute", _after_cursor_execute)
+        engine.dispose()
+
+    @pytest.mark.asyncio
+    async def test_counts_async_statements(
+        self, async_engine: AsyncEngine, async_session: AsyncSession
+    ) -> None:
+        instrument_engine(async_engine)
+
+        with track_queries("async", warn=False) as stats:
+            for i in range(4):
+                await async_session.execute(text("SELECT :i"), {"i": i})
+
+        assert stats.statements == 4
+        assert stats.repeated(4) == [("SELECT ?", 4)]
+
+
+class TestQueryBudgetFixture:
+    @pytest.mark.asyncio
+    async def test_within_budget(
+        self,
+        async_session: AsyncSession,
+        query_budget: Callable[..., AbstractContextManager[QueryStats]],
+    ) -> None:
+        with query_budget(2, max_repeats=1) as stats:
+            await async_session.execute(text("SELECT 1"))
+            await async_session.execute(text("SELECT 2"))
+
+        assert stats.statements == 2
+
+    @pytest.mark.asyncio
+    async def test_fails_when_exceeded(
+        self,
+        async_session: AsyncSession,
+        query_budget: Callable[..., AbstractContextManager[QueryStats]],
+    ) -> None:
+        with (
+            pytest.raises(pytest.fail.Exception, match="at most 1 SQL"),
+            query_budget(1),
+        ):
+            await async_session.execute(text("SELECT 1"))
+            await async_session.execute(text("SELECT 2"))
+
+    @pytest.mark.asyncio
+    async def test_fails_on_repeats(
+        self,
+        async_session: AsyncSession,
+        query_budget: Callable[..., AbstractContextManager[QueryStats]],
+    ) -> None:
+        with (
+            pytest.raises(pytest.fail.Exception, match="possible N\\+1"),
+            query_budget(10, max_repeats=2),
+        ):
+            for i in range(3):
+                await async_session.execute(text("SELECT :i"), {"i": i})
@@ -0,0 +1,282 @@
+"""Tests for the run history and metrics of scheduled services."""
+
+import logging
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+from datetime import UTC, datetime, timedelta
+from typing import Any
+from unittest.mock import patch
+
+import pytest
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from appkit_commons.scheduler.configuration import SchedulerConfig
+from appkit_commons.scheduler.history import (
+    STATUS_FAILED,
+    STATUS_SUCCESS,
+    JobHistoryRetentionService,
+    JobRun,
+    execute_recorded,
+    job_run_repo,
+    percentile,
+)
+from appkit_commons.scheduler.scheduler_types import IntervalTrigger, ScheduledService
+
+NOW = datetime(2026, 1, 1, 12, 0, tzinfo=UTC)
+
+
+class CountingService(ScheduledService):
+    job_id = "counting"
+    name = "Counting Service"
+
+    def __init__(self, result: Any = None, error: Exception | None = None) -> None:
+        self.result = result
+        self.error = error
+
+    @property
+    def trigger(self) -> IntervalTrigger:
+        return IntervalTrigger(minutes=5)
+
+    async def execute(self) -> Any:
+        if self.error:
+            raise self.error
+        return self.result
+
+
+def _run(job_id: str = "job", **kwargs: Any) -> JobRun:
+    values: dict[str, Any] = {
+        "job_id": job_id,
+        "started_at": NOW,
+        "duration_ms": 10.0,
+        "status": STATUS_SUCCESS,
+    }
+    values.update(kwargs)
+    return JobRun(**values)
+
+
+@pytest.fixture
+def history_session(async_session: AsyncSession) -> Any:
+    """Route the history writes to the test session."""
+
+    @asynccontextmanager
+    async def session() -> AsyncIterator[AsyncSession]:
+        yield async_session
+
+    with patch("appkit_commons.scheduler.history.get_asyncdb_session", session):
+        yield async_session
+
+
+class TestPercentile:
+    def test_empty(self) -> None:
+        assert percentile([], 0.5) is None
+
+    def test_nearest_rank(self) -> None:
+        values = [float(v) for v in range(1, 101)]
+        assert percentile(values, 0.5) == 50.0
+        assert percentile(values, 0.95) == 95.0
+        assert percentile([3.0, 1.0, 2.0], 0.0) == 1.0
+
+
+class TestJobRunRepository:
+    @pytest.mark.asyncio
+    async def test_job_stats(self, async_session: AsyncSession) -> None:
+        for i in range(1, 21):
+            await job_run_repo.create(
+                async_session,
+                _run(
+                    started_at=NOW + timedelta(minutes=i),
+                    duration_ms=float(i),
+                    lag_ms=float(i * 10),
+                    status=STATUS_FAILED if i % 10 == 0 else STATUS_SUCCESS,
+                    overran=i == 20,
+                ),
+            )
+        await job_run_repo.create(async_session, _run("other"))
+
+        stats = await job_run_repo.job_stats(async_session, "job")
+
+        assert stats is not None
+        assert stats.runs == 20
+        assert stats.failures == 2
+        assert stats.overruns == 1
+        assert stats.p50_duration_ms == 10.0
+        assert stats.p95_duration_ms == 19.0
+        assert stats.p95_lag_ms == 190.0
+        assert stats.last_started_at.replace(tzinfo=UTC) == NOW + timedelta(minutes=20)
+
+    @pytest.mark.asyncio
+    async def test_job_stats_uses_window(self, async_session: AsyncSession) -> None:
+        for i in range(5):
+            await job_run_repo.create(
+                async_session,
+                _run(started_at=NOW + timedelta(minutes=i), duration_ms=float(i)),
+            )
+
+        stats = await job_run_repo.job_stats(async_session, "job", window=2)
+
+        assert stats is not None
+        assert stats.runs == 2
+        assert stats.p50_duration_ms == 3.0
+        assert stats.p50_lag_ms is None
+
+    @pytest.mark.asyncio
+    async def test_all_job_stats_matches_per_job_stats(
+        self, async_session: AsyncSession
+    ) -> None:
+        for i in range(5):
+            await job_run_repo.create(
+                async_session,
+                _run(
+                    started_at=NOW + timedelta(minutes=i),
+                    duration_ms=float(i),
+                    lag_ms=float(i),
+                    status=STATUS_FAILED if i == 4 else STATUS_SUCCESS,
+                ),
+            )
+            await job_run_repo.create(
+                async_session,
+                _run("other", started_at=NOW + timedelta(minutes=i), overran=i < 2),
+            )
+
+        all_stats = await job_run_repo.all_job_stats(async_session, window=3)
+
+        assert [stats.job_id for stats in all_stats] == ["job", "other"]
+        assert all_stats == [
+            await job_run_repo.job_stats(async_session, "job", window=3),
+            await job_run_repo.job_stats(async_session, "other", window=3),
+        ]
+        assert (all_stats[0].runs, all_stats[0].failures) == (3, 1)
+        assert all_stats[1].overruns == 0
+
+    @pytest.mark.asyncio
+    async def test_job_stats_without_runs(self, async_session: AsyncSession) -> None:
+        assert await job_run_repo.job_stats(async_session, "missing") is None
+
+    @pytest.mark.asyncio
+    async def test_find_job_ids(self, async_session: AsyncSession) -> None:
+        for job_id in ("b", "a", "b"):
+            await job_run_repo.create(async_session, _run(job_id))
+
+        assert await job_run_repo.find_job_ids(async_session) == ["a", "b"]
+
+    @pytest.mark.asyncio
+    async def test_delete_older_than(self, async_session: AsyncSession) -> None:
+        await job_run_repo.create(async_session, _run(started_at=NOW))
+        await job_run_repo.create(
+            async_session, _run(started_at=NOW - timedelta(days=40))
+        )
+
+        deleted = await job_run_repo.delete_older_than(
+            async_session, NOW - timedelta(days=30)
+        )
+
+        assert deleted == 1
+        assert await job_run_repo.count(async_session) == 1
+
+
+class TestExecuteRecorded:
+    @pytest.mark.asyncio
+    async def test_records_success_with_rows(
+        self, history_session: AsyncSession
+    ) -> None:
+        scheduled_at = datetime.now(UTC) - timedelta(seconds=2)
+
+        await execute_recorded(CountingService(result=7), scheduled_at=scheduled_at)
+
+        [run] = await job_run_repo.find_recent(history_session, "counting")
+        assert run.status == STATUS_SUCCESS
+        assert run.rows_processed == 7
+        assert run.lag_ms is not None
+        assert run.lag_ms >= 2000
+        assert run.overran is False
+        assert run.error is None
+
+    @pytest.mark.asyncio
+    async def test_ignores_non_integer_results(
+        self, history_session: AsyncSession
+    ) -> None:
+        await execute_recorded(CountingService(result=True))
+
+        [run] = await job_run_repo.find_recent(history_session, "counting")
+        assert run.rows_processed is None
+        assert run.lag_ms is None
+
+    @pytest.mark.asyncio
+    async def test_records_failure(
+        self, history_session: AsyncSession, caplog: pytest.LogCaptureFixture
+    ) -> None:
+        with caplog.at_level(logging.ERROR):
+            await execute_recorded(CountingService(error=RuntimeError("boom")))
+
+        [run] = await job_run_repo.find_recent(history_session, "counting")
+        assert run.status == STATUS_FAILED
+        assert run.error == "boom"
+        assert "boom" in caplog.text
+
+    @pytest.mark.asyncio
+    async def test_flags_overrun(
+        self, history_session: AsyncSession, caplog: pytest.LogCaptureFixture
+    ) -> None:
+        with caplog.at_level(logging.WARNING):
+            await execute_recorded(CountingService(), interval=timedelta(0))
+
+        [run] = await job_run_repo.find_recent(history_session, "counting")
+        assert run.overran is True
+        assert "longer than its interval" in caplog.text
+
+    @pytest.mark.asyncio
+    async def test_history_failure_does_not_fail_run(
+        self, caplog: pytest.LogCaptureFixture
+    ) -> None:
+        @asynccontextmanager
+        async def broken() -> AsyncIterator[AsyncSession]:
+            raise RuntimeError("db down")
+            yield
+
+        with (
+            patch("appkit_commons.scheduler.history.get_asyncdb_session", broken),
+            caplog.at_level(logging.WARNING),
+        ):
+            await execute_recorded(CountingService())
+
+        assert "Failed to record run" in caplog.text
+
+
+class TestJobHistoryRetentionService:
+    @pytest.mark.asyncio
+    async def test_purges_runs_past_retention(
+        self, history_session: AsyncSession
+    ) -> None:
+        now = datetime.now(UTC)
+        await job_run_repo.create(history_session, _run(started_at=now))
+        await job_run_repo.create(
+            history_session, _run(started_at=now - timedelta(days=8))
+        )
+        service = JobHistoryRetentionService(SchedulerConfig(history_retention_days=7))
+
+        assert await service.execute() == 1
+        assert await job_run_repo.count(history_session) == 1
+
+    @pytest.mark.asyncio
+    async def test_logs_job_stats(
+        self, history_session: AsyncSession, caplog: pytest.LogCaptureFixture
+    ) -> None:
+        now = datetime.now(UTC)
+        await job_run_repo.create(history_session, _run("healthy", started_at=now))
+        await job_run_repo.create(
+            history_session, _run("flaky", started_at=now, status=STATUS_FAILED)
+        )
+        service = JobHistoryRetentionService(SchedulerConfig())
+
+        with caplog.at_level(logging.INFO):
+            await service.execute()
+
+        levels = {r.getMessage().split(":")[0]: r.levelno for r in caplog.records}
+        assert levels["Job healthy"] == logging.INFO
+        assert levels["Job flaky"] == logging.WARNING
+        assert "1 runs, 1 failed" in caplog.text
+
+    def test_runs_daily(self) -> None:
+        service = JobHistoryRetentionService(SchedulerConfig())
+
+        assert service.trigger.to_cron() == "21 4 * * *"
@@ -2,7 +2,8 @@
 
 import pytest
 
-from appkit_commons.middleware import ForceHTTPSMiddleware
+from appkit_commons.database.instrumentation import QueryStats, current_query_stats
+from appkit_commons.middleware import ForceHTTPSMiddleware, QueryTrackingMiddleware
 
 
 class MockApp:
@@ -183,3 +184,37 @@ class TestForceHTTPSMiddleware:
         # Assert
         assert app.last_scope is not None
         assert app.last_scope["scheme"] == "http"
+
+
+class TestQueryTrackingMiddleware:
+    """Test suite for QueryTrackingMiddleware."""
+
+    @pytest.mark.asyncio
+    async def test_tracks_http_request(self) -> None:
+        """HTTP requests run inside a scope labelled with method and path."""
+        seen: list[QueryStats | None] = []
+
+        async def app(scope, receive, send) -> None:  # noqa: ARG001
+            seen.append(current_query_stats())
+
+        middleware = QueryTrackingMiddleware(app)
+        await middleware(
+            {"type": "http", "method": "GET", "path": "/api/items"}, None, None
+        )
+
+        assert seen[0] is not None
+        assert seen[0].label == "GET /api/items"
+        assert current_query_stats() is None
+
+    @pytest.mark.asyncio
+    async def test_skips_websocket(self) -> None:
+        """Websocket connections are not tracked as one unit of work."""
+        seen: list[QueryStats | None] = []
+
+        async def app(scope, receive, send) -> None:  # noqa: ARG001
+            seen.append(current_query_stats())
+
+        middleware = QueryTrackingMiddleware(app)
+        await middleware({"type": "websocket", "path": "/_event"}, None, None)
+
+        assert seen == [None]
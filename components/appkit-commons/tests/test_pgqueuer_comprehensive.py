@@ -3,14 +3,24 @@
 import asyncio
 import contextlib
 import logging
+from datetime import UTC, datetime, timedelta
 from typing import Any
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import psycopg
 import pytest
-
-from appkit_commons.scheduler.pgqueuer import PGQueuerScheduler
+from pgqueuer.errors import DuplicateJobError
+
+from appkit_commons.registry import ServiceRegistry
+from appkit_commons.scheduler.configuration import SchedulerConfig
+from appkit_commons.scheduler.pgqueuer import (
+    PGQueuerScheduler,
+    PGQueuerWorker,
+    uses_delayed_jobs,
+)
 from appkit_commons.scheduler.scheduler_types import (
+    CronTrigger,
+    DateTrigger,
     IntervalTrigger,
     ScheduledService,
 )
@@ -31,6 +41,12 @@ class MockScheduledService(ScheduledService):
         MockScheduledService.execute_count += 1
 
 
+def _worker(
+    scheduler: PGQueuerScheduler | None = None, index: int = 0
+) -> PGQueuerWorker:
+    return PGQueuerWorker(scheduler or PGQueuerScheduler(), index)
+
+
 class TestPGQueuerSchedulerInit:
     """Test suite for PGQueuerScheduler initialization."""
 
@@ -40,11 +56,24 @@ class TestPGQueuerSchedulerInit:
         scheduler = PGQueuerScheduler()
 
         # Assert
-        assert scheduler._pgq is None
+        assert scheduler._workers == []
         assert scheduler._is_running is False
         assert scheduler._services == {}
-        assert scheduler._conn is None
-        assert scheduler._task is None
+        assert scheduler.config == SchedulerConfig()
+
+    def test_pgqueuer_scheduler_uses_registered_config(
+        self, clean_service_registry: ServiceRegistry
+    ) -> None:
+        """PGQueuerScheduler picks up the registered SchedulerConfig."""
+        # Arrange
+        config = SchedulerConfig(workers=4)
+        clean_service_registry.register(config)
+
+        # Act
+        scheduler = PGQueuerScheduler()
+
+        # Assert
+        assert scheduler.config is config
 
     def test_pgqueuer_scheduler_is_not_running_initially(self) -> None:
         """PGQueuerScheduler is_running is False initially."""
@@ -120,7 +149,7 @@ class TestPGQueuerSchedulerSetupPGQueuer:
     async def test_setup_pgqueuer_success(self) -> None:
         """_setup_pgqueuer successfully initializes PGQueuer."""
         # Arrange
-        scheduler = PGQueuerScheduler()
+        worker = _worker()
         mock_conn = AsyncMock()
         mock_driver = MagicMock()
         mock_pgq = MagicMock()
@@ -149,17 +178,17 @@ class TestPGQueuerSchedulerSetupPGQueuer:
             mock_registry_instance.get.return_value = mock_config
             mock_registry.return_value = mock_registry_instance
 
-            await scheduler._setup_pgqueuer()
+            await worker._setup_pgqueuer()
 
         # Assert
-        assert scheduler._conn is not None
-        assert scheduler._pgq is not None
+        assert worker._conn is not None
+        assert worker._pgq is not None
 
     @pytest.mark.asyncio
     async def test_setup_pgqueuer_connection_failure_logs_error(self, caplog) -> None:
         """_setup_pgqueuer logs error on connection failure."""
         # Arrange
-        scheduler = PGQueuerScheduler()
+        worker = _worker()
 
         # Act
         with (
@@ -169,7 +198,7 @@ class TestPGQueuerSchedulerSetupPGQueuer:
             ) as mock_registry,
         ):
             mock_registry.side_effect = Exception("Connection failed")
-            await scheduler._setup_pgqueuer()
+            await worker._setup_pgqueuer()
 
         # Assert
         assert "Failed to configure PGQueuer" in caplog.text
@@ -178,7 +207,7 @@ class TestPGQueuerSchedulerSetupPGQueuer:
     async def test_setup_pgqueuer_connects_with_keepalive_params(self) -> None:
         """_setup_pgqueuer connects with keepalive settings."""
         # Arrange
-        scheduler = PGQueuerScheduler()
+        worker = _worker()
         mock_conn = AsyncMock()
 
         # Act
@@ -203,7 +232,7 @@ class TestPGQueuerSchedulerSetupPGQueuer:
             mock_registry_instance.get.return_value = mock_config
             mock_registry.return_value = mock_registry_instance
 
-            await scheduler._setup_pgqueuer()  # noqa: SLF001
+            await worker._setup_pgqueuer()  # noqa: SLF001
 
         # Assert - verify keepalive parameters were used
         assert mock_connect.called
@@ -217,32 +246,57 @@ class TestPGQueuerSchedulerSetupPGQueuer:
 class TestPGQueuerSchedulerRegisterService:
     """Test suite for _register_service_on_pgq method."""
 
-    def test_register_service_on_pgq_no_pgq_instance(self) -> None:
-        """_register_service_on_pgq returns early if no PGQueuer instance."""
+    def test_register_service_on_pgq_skips_schedules(self) -> None:
+        """Cron services are only scheduled on the schedule-running worker."""
         # Arrange
         scheduler = PGQueuerScheduler()
-        scheduler._pgq = None
+        pgq = MagicMock()
         service = MockScheduledService()
 
         # Act
-        result = scheduler._register_service_on_pgq(service)
+        scheduler._register_service_on_pgq(pgq, service, with_schedules=False)
 
         # Assert
-        assert result is None
+        pgq.schedule.assert_not_called()
+        pgq.entrypoint.assert_not_called()
 
     def test_register_service_on_pgq_calls_schedule(self) -> None:
         """_register_service_on_pgq calls schedule on PGQueuer."""
         # Arrange
         scheduler = PGQueuerScheduler()
-        scheduler._pgq = MagicMock()
-        scheduler._pgq.schedule = MagicMock(return_value=lambda f: f)
+        pgq = MagicMock()
+        pgq.schedule = MagicMock(return_value=lambda f: f)
         service = MockScheduledService()
 
         # Act
-        scheduler._register_service_on_pgq(service)
+        scheduler._register_service_on_pgq(pgq, service)
 
         # Assert
-        scheduler._pgq.schedule.assert_called_once()
+        pgq.schedule.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_cron_run_is_recorded_with_due_time_and_interval(self) -> None:
+        scheduler = PGQueuerScheduler()
+        wrappers: list[Any] = []
+        pgq = MagicMock()
+        pgq.schedule = MagicMock(return_value=wrappers.append)
+        service = MockScheduledService()
+        scheduler._register_service_on_pgq(pgq, service)
+        now = datetime(2026, 1, 1, 0, 7, 3, tzinfo=UTC)
+
+        with (
+            patch("appkit_commons.scheduler.pgqueuer._now", return_value=now),
+            patch(
+                "appkit_commons.scheduler.pgqueuer.execute_recorded", new=AsyncMock()
+            ) as recorded,
+        ):
+            await wrappers[0](MagicMock())
+
+        recorded.assert_awaited_once_with(
+            service,
+            scheduled_at=datetime(2026, 1, 1, 0, 5, tzinfo=UTC),
+            interval=timedelta(minutes=5),
+        )
 
 
 class TestPGQueuerSchedulerCleanup:
@@ -252,32 +306,32 @@ class TestPGQueuerSchedulerCleanup:
     async def test_cleanup_connection_closes_conn(self) -> None:
         """_cleanup_connection closes the database connection."""
         # Arrange
-        scheduler = PGQueuerScheduler()
+        worker = _worker()
         mock_conn = AsyncMock()
-        scheduler._conn = mock_conn
-        scheduler._pgq = MagicMock()
+        worker._conn = mock_conn
+        worker._pgq = MagicMock()
 
         # Act
-        await scheduler._cleanup_connection()
+        await worker._cleanup_connection()
 
         # Assert
         mock_conn.close.assert_called_once()
-        assert scheduler._conn is None
-        assert scheduler._pgq is None
+        assert worker._conn is None
+        assert worker._pgq is None
 
     @pytest.mark.asyncio
     async def test_cleanup_connection_handles_close_error(self) -> None:
         """_cleanup_connection handles errors when closing."""
         # Arrange
-        scheduler = PGQueuerScheduler()
+        worker = _worker()
         mock_conn = AsyncMock()
         mock_conn.close.side_effect = Exception("Close error")
-        scheduler._conn = mock_conn
-        scheduler._pgq = MagicMock()
+        worker._conn = mock_conn
+        worker._pgq = MagicMock()
 
         # Act & Assert - should not raise
-        await scheduler._cleanup_connection()
-        assert scheduler._conn is None
+        await worker._cleanup_connection()
+        assert worker._conn is None
 
 
 class TestPGQueuerSchedulerStartShutdown:
@@ -294,7 +348,8 @@ class TestPGQueuerSchedulerStartShutdown:
 
         # Assert
         assert scheduler._is_running is True
-        assert scheduler._task is not None
+        assert len(scheduler._workers) == scheduler.config.workers
+        assert [w.runs_schedules for w in scheduler._workers] == [True, False]
 
         # Cleanup
         await scheduler.shutdown()
@@ -332,7 +387,7 @@ class TestPGQueuerSchedulerStartShutdown:
         # Arrange
         scheduler = PGQueuerScheduler()
         await scheduler.start()
-        task = scheduler._task
+        task = scheduler._workers[0]._task
 
         # Act
         await scheduler.shutdown()
@@ -340,6 +395,7 @@ class TestPGQueuerSchedulerStartShutdown:
         # Assert
         assert task is not None
         assert task.cancelled() or task.done()
+        assert scheduler._workers == []
 
     @pytest.mark.asyncio
     async def test_shutdown_when_not_running(self, caplog) -> None:
@@ -377,12 +433,12 @@ class TestPGQueuerSchedulerRunLoop:
     async def test_run_loop_cancelled(self) -> None:
         """_run_loop handles cancellation gracefully."""
         # Arrange
-        scheduler = PGQueuerScheduler()
-        scheduler._is_running = True
+        worker = _worker()
+        worker._is_running = True
 
         # Create a task and immediately cancel it
         async def run_and_cancel():
-            task = asyncio.create_task(scheduler._run_loop())
+            task = asyncio.create_task(worker._run_loop())
             await asyncio.sleep(0.01)
             task.cancel()
             with contextlib.suppress(asyncio.CancelledError):
@@ -395,11 +451,11 @@ class TestPGQueuerSchedulerRunLoop:
     async def test_run_loop_exits_when_not_running(self) -> None:
         """_run_loop exits when _is_running is False."""
         # Arrange
-        scheduler = PGQueuerScheduler()
-        scheduler._is_running = False
+        worker = _worker()
+        worker._is_running = False
 
         # Act
-        await scheduler._run_loop()
+        await worker._run_loop()
 
         # Assert - should complete without errors
 
@@ -462,120 +518,124 @@ class TestAddServiceWhenRunning:
         """add_service registers on PGQueuer when scheduler is running."""
         scheduler = PGQueuerScheduler()
         scheduler._is_running = True
-        scheduler._pgq = MagicMock()
-        scheduler._pgq.schedule = MagicMock(return_value=lambda f: f)
+        workers = [_worker(scheduler, 0), _worker(scheduler, 1)]
+        for worker in workers:
+            worker._pgq = MagicMock()
+            worker._pgq.schedule = MagicMock(return_value=lambda f: f)
+        scheduler._workers = workers
         service = MockScheduledService()
 
         scheduler.add_service(service)
 
         assert "test_service" in scheduler._services
-        scheduler._pgq.schedule.assert_called_once()
+        workers[0]._pgq.schedule.assert_called_once()
+        workers[1]._pgq.schedule.assert_not_called()
 
 
 class TestIsConnectionAlive:
     @pytest.mark.asyncio
     async def test_no_connection(self) -> None:
-        scheduler = PGQueuerScheduler()
-        scheduler._conn = None
-        assert await scheduler._is_connection_alive() is False
+        worker = _worker()
+        worker._conn = None
+        assert await worker._is_connection_alive() is False
 
     @pytest.mark.asyncio
     async def test_connection_closed(self) -> None:
-        scheduler = PGQueuerScheduler()
+        worker = _worker()
         conn = MagicMock()
         conn.closed = True
-        scheduler._conn = conn
-        assert await scheduler._is_connection_alive() is False
+        worker._conn = conn
+        assert await worker._is_connection_alive() is False
 
     @pytest.mark.asyncio
     async def test_select_1_success(self) -> None:
-        scheduler = PGQueuerScheduler()
+        worker = _worker()
         conn = AsyncMock()
         conn.closed = False
-        scheduler._conn = conn
-        assert await scheduler._is_connection_alive() is True
+        worker._conn = conn
+        assert await worker._is_connection_alive() is True
         conn.execute.assert_awaited_once_with("SELECT 1")
 
     @pytest.mark.asyncio
     async def test_timeout_error(self) -> None:
-        scheduler = PGQueuerScheduler()
+        worker = _worker()
         conn = AsyncMock()
         conn.closed = False
         conn.execute = AsyncMock(side_effect=TimeoutError)
-        scheduler._conn = conn
-        assert await scheduler._is_connection_alive() is False
+        worker._conn = conn
+        assert await worker._is_connection_alive() is False
 
     @pytest.mark.asyncio
     async def test_psycopg_error(self) -> None:
-        scheduler = PGQueuerScheduler()
+        worker = _worker()
         conn = AsyncMock()
         conn.closed = False
         conn.execute = AsyncMock(side_effect=psycopg.Error("conn lost"))
-        scheduler._conn = conn
-        assert await scheduler._is_connection_alive() is False
+        worker._conn = conn
+        assert await worker._is_connection_alive() is False
 
     @pytest.mark.asyncio
     async def test_unexpected_error(self) -> None:
-        scheduler = PGQueuerScheduler()
+        worker = _worker()
         conn = AsyncMock()
         conn.closed = False
         conn.execute = AsyncMock(side_effect=ValueError("unexpected"))
-        scheduler._conn = conn
-        assert await scheduler._is_connection_alive() is False
+        worker._conn = conn
+        assert await worker._is_connection_alive() is False
 
 
 class TestRunLoopPaths:
     @pytest.mark.asyncio
     async def test_setup_fails_retries(self) -> None:
         """_run_loop retries when _setup_pgqueuer fails."""
-        scheduler = PGQueuerScheduler()
+        worker = _worker()
         call_count = 0
 
         async def flaky_setup():
             nonlocal call_count
             call_count += 1
             if call_count >= 2:
-                scheduler._is_running = False
+                worker._is_running = False
 
         with patch.object(
-            scheduler,
+            worker,
             "_setup_pgqueuer",
             side_effect=flaky_setup,
         ):
-            scheduler._is_running = True
+            worker._is_running = True
             with patch(
                 "appkit_commons.scheduler.pgqueuer.asyncio.sleep",
                 new_callable=AsyncMock,
             ):
-                await scheduler._run_loop()
+                await worker._run_loop()
         assert call_count >= 2
 
     @pytest.mark.asyncio
     async def test_health_check_fails_reconnects(self) -> None:
         """_run_loop reconnects when health check fails."""
-        scheduler = PGQueuerScheduler()
-        scheduler._pgq = MagicMock()
+        worker = _worker()
+        worker._pgq = MagicMock()
         call_count = 0
 
         async def fail_health():
             nonlocal call_count
             call_count += 1
             if call_count >= 2:
-                scheduler._is_running = False
+                worker._is_running = False
             return False
 
         with (
-            patch.object(scheduler, "_is_connection_alive", side_effect=fail_health),
+            patch.object(worker, "_is_connection_alive", side_effect=fail_health),
             patch.object(
-                scheduler, "_cleanup_connection", new_callable=AsyncMock
+                worker, "_cleanup_connection", new_callable=AsyncMock
             ) as cleanup,
             patch(
                 "appkit_commons.scheduler.pgqueuer.asyncio.sleep",
                 new_callable=AsyncMock,
             ),
         ):
-            scheduler._is_running = True
-            await scheduler._run_loop()
+            worker._is_running = True
+            await worker._run_loop()
 
         cleanup.assert_awaited()
         assert call_count >= 2
@@ -583,120 +643,434 @@ class TestRunLoopPaths:
     @pytest.mark.asyncio
     async def test_operational_error_reconnects(self) -> None:
         """_run_loop reconnects on psycopg.OperationalError."""
-        scheduler = PGQueuerScheduler()
-        scheduler._pgq = MagicMock()
+        worker = _worker()
+        worker._pgq = MagicMock()
         call_count = 0
 
         async def healthy():
             return True
 
-        async def run_fails():
+        async def run_fails(**_kwargs: Any):
             nonlocal call_count
             call_count += 1
             if call_count >= 2:
-                scheduler._is_running = False
+                worker._is_running = False
                 return
             raise psycopg.OperationalError("connection closed")
 
         with (
-            patch.object(scheduler, "_is_connection_alive", side_effect=healthy),
-            patch.object(scheduler._pgq, "run", side_effect=run_fails),
+            patch.object(worker, "_is_connection_alive", side_effect=healthy),
+            patch.object(worker._pgq, "run", side_effect=run_fails),
             patch.object(
-                scheduler, "_cleanup_connection", new_callable=AsyncMock
+                worker, "_cleanup_connection", new_callable=AsyncMock
             ) as cleanup,
             patch(
                 "appkit_commons.scheduler.pgqueuer.asyncio.sleep",
                 new_callable=AsyncMock,
             ),
         ):
-            scheduler._is_running = True
-            await scheduler._run_loop()
+            worker._is_running = True
+            await worker._run_loop()
 
         cleanup.assert_awaited()
 
     @pytest.mark.asyncio
     async def test_generic_exception_reconnects(self) -> None:
         """_run_loop reconnects on unexpected exception."""
-        scheduler = PGQueuerScheduler()
-        scheduler._pgq = MagicMock()
+        worker = _worker()
+        worker._pgq = MagicMock()
         call_count = 0
 
         async def healthy():
             return True
 
-        async def run_crashes():
+        async def run_crashes(**_kwargs: Any):
             nonlocal call_count
             call_count += 1
             if call_count >= 2:
-                scheduler._is_running = False
+                worker._is_running = False
                 return
             raise RuntimeError("boom")
 
         with (
-            patch.object(scheduler, "_is_connection_alive", side_effect=healthy),
-            patch.object(scheduler._pgq, "run", side_effect=run_crashes),
+            patch.object(worker, "_is_connection_alive", side_effect=healthy),
+            patch.object(worker._pgq, "run", side_effect=run_crashes),
             patch.object(
-                scheduler, "_cleanup_connection", new_callable=AsyncMock
+                worker, "_cleanup_connection", new_callable=AsyncMock
             ) as cleanup,
             patch(
                 "appkit_commons.scheduler.pgqueuer.asyncio.sleep",
                 new_callable=AsyncMock,
             ),
         ):
-            scheduler._is_running = True
-            await scheduler._run_loop()
+            worker._is_running = True
+            await worker._run_loop()
 
         cleanup.assert_awaited()
 
     @pytest.mark.asyncio
     async def test_run_loop_cancelled_error_breaks(self) -> None:
         """_run_loop breaks on CancelledError."""
-        scheduler = PGQueuerScheduler()
-        scheduler._pgq = MagicMock()
+        worker = _worker()
+        worker._pgq = MagicMock()
 
         async def healthy():
             return True
 
-        async def run_cancel():
+        async def run_cancel(**_kwargs: Any):
             raise asyncio.CancelledError
 
         with (
-            patch.object(scheduler, "_is_connection_alive", side_effect=healthy),
-            patch.object(scheduler._pgq, "run", side_effect=run_cancel),
+            patch.object(worker, "_is_connection_alive", side_effect=healthy),
+            patch.object(worker._pgq, "run", side_effect=run_cancel),
         ):
-            scheduler._is_running = True
-            await scheduler._run_loop()
+            worker._is_running = True
+            await worker._run_loop()
 
     @pytest.mark.asyncio
     async def test_run_loop_registers_services_on_new_pgq(
         self,
     ) -> None:
         """_run_loop registers all services on new PGQueuer setup."""
-        scheduler = PGQueuerScheduler()
+        scheduler = PGQueuerScheduler(SchedulerConfig(batch_size=5))
+        worker = _worker(scheduler)
         service = MockScheduledService()
         scheduler.add_service(service)
-
-        setup_called = False
+        pgq = MagicMock()
+        pgq.schedule = MagicMock(return_value=lambda f: f)
+        pgq.run = AsyncMock()
 
         async def setup_pgq():
-            nonlocal setup_called
-            setup_called = True
-            scheduler._pgq = MagicMock()
-            scheduler._pgq.schedule = MagicMock(return_value=lambda f: f)
-            scheduler._pgq.run = AsyncMock()
-            scheduler._is_running = False
+            worker._pgq = pgq
+            worker._is_running = False
 
         with (
-            patch.object(scheduler, "_setup_pgqueuer", side_effect=setup_pgq),
+            patch.object(worker, "_setup_pgqueuer", side_effect=setup_pgq),
             patch.object(
-                scheduler,
+                worker,
                 "_is_connection_alive",
                 new_callable=AsyncMock,
                 return_value=True,
             ),
         ):
-            scheduler._is_running = True
-            await scheduler._run_loop()
+            worker._is_running = True
+            await worker._run_loop()
+
+        pgq.schedule.assert_called_once()
+        pgq.run.assert_awaited_once_with(batch_size=5, max_concurrent_tasks=20)
+        # A stopped PGQueuer instance is discarded
+        assert worker._pgq is None
+
+    @pytest.mark.asyncio
+    async def test_max_concurrent_tasks_at_least_twice_batch_size(self) -> None:
+        """PGQueuer rejects fewer concurrent tasks than two batches."""
+        worker = _worker(
+            PGQueuerScheduler(SchedulerConfig(batch_size=20, max_concurrent_tasks=5))
+        )
+        worker._pgq = MagicMock()
+        worker._pgq.run = AsyncMock(
+            side_effect=lambda **_: setattr(worker, "_is_running", False)
+        )
+
+        with patch.object(
+            worker, "_is_connection_alive", new_callable=AsyncMock, return_value=True
+        ):
+            worker._is_running = True
+            await worker._run_loop()
+
+        assert worker._pgq is None
+
+
+class TestWorkerStop:
+    @pytest.mark.asyncio
+    async def test_drains_running_jobs(self) -> None:
+        """stop() signals PGQueuer to stop dequeuing and waits for the task."""
+        worker = _worker()
+        worker._pgq = MagicMock()
+        worker._pgq.shutdown = asyncio.Event()
+        drained = False
+
+        async def run_until_shutdown() -> None:
+            nonlocal drained
+            await worker._pgq.shutdown.wait()
+            await asyncio.sleep(0.01)  # in-flight job finishing
+            drained = True
+
+        worker._task = asyncio.create_task(run_until_shutdown())
+
+        await worker.stop(drain_seconds=5)
+
+        assert drained is True
+        assert worker._pgq is None
+
+    @pytest.mark.asyncio
+    async def test_cancels_after_timeout(self, caplog) -> None:
+        """Jobs still running after the timeout are cancelled."""
+        worker = _worker()
+        worker._pgq = MagicMock()
+        worker._task = asyncio.create_task(asyncio.sleep(60))
+
+        with caplog.at_level(logging.WARNING):
+            await worker.stop(drain_seconds=0.01)
+
+        assert worker._task.cancelled()
+        assert "did not drain" in caplog.text
+
+    @pytest.mark.asyncio
+    async def test_disconnected_worker_is_cancelled(self) -> None:
+        """A worker waiting to reconnect is cancelled right away."""
+        worker = _worker()
+        worker._task = asyncio.create_task(asyncio.sleep(60))
+
+        await worker.stop(drain_seconds=60)
+
+        assert worker._task.cancelled()
+
+
+class TestEntrypoints:
+    def test_add_entrypoint_registers_on_connected_workers(self) -> None:
+        scheduler = PGQueuerScheduler()
+        workers = [_worker(scheduler, 0), _worker(scheduler, 1), _worker(scheduler, 2)]
+        workers[0]._pgq = MagicMock()
+        workers[1]._pgq = MagicMock()
+        scheduler._workers = workers
+        handler = AsyncMock()
+
+        scheduler.add_entrypoint("render", handler, concurrency_limit=3)
+
+        for worker in workers[:2]:
+            worker._pgq.entrypoint.assert_called_once_with(
+                "render", concurrency_limit=3
+            )
+        assert scheduler._entrypoints["render"] == (handler, 3)
+
+    @pytest.mark.asyncio
+    async def test_register_on_worker_adds_entrypoints(self) -> None:
+        scheduler = PGQueuerScheduler()
+        scheduler.add_entrypoint("render", AsyncMock(), concurrency_limit=2)
+        worker = _worker(scheduler, 1)
+        worker._pgq = MagicMock()
+
+        await scheduler._register_on_worker(worker)
+
+        worker._pgq.entrypoint.assert_called_once_with("render", concurrency_limit=2)
+
+    @pytest.mark.asyncio
+    async def test_enqueue(self) -> None:
+        scheduler = PGQueuerScheduler()
+        worker = _worker(scheduler)
+        worker._pgq = _delayed_pgq()
+        scheduler._workers = [worker]
+
+        enqueued = await scheduler.enqueue(
+            "render", b"{}", priority=5, delay=timedelta(seconds=1), dedupe_key="k"
+        )
+
+        assert enqueued is True
+        worker._pgq.queries.enqueue.assert_awaited_once_with(
+            "render",
+            b"{}",
+            priority=5,
+            execute_after=timedelta(seconds=1),
+            dedupe_key="k",
+        )
+
+    @pytest.mark.asyncio
+    async def test_enqueue_duplicate(self) -> None:
+        scheduler = PGQueuerScheduler()
+        worker = _worker(scheduler)
+        worker._pgq = _delayed_pgq()
+        worker._pgq.queries.enqueue.side_effect = DuplicateJobError("k")
+        scheduler._workers = [worker]
+
+        assert await scheduler.enqueue("render", dedupe_key="k") is False
+
+    @pytest.mark.asyncio
+    async def test_enqueue_requires_connection(self) -> None:
+        scheduler = PGQueuerScheduler()
+
+        with pytest.raises(RuntimeError, match="not connected"):
+            await scheduler.enqueue("render")
+
+
+class DelayedService(ScheduledService):
+    job_id = "delayed_service"
+    name = "Delayed Service"
+
+    def __init__(self, trigger: Any) -> None:
+        self._trigger = trigger
+        self.execute = AsyncMock()
+
+    @property
+    def trigger(self) -> Any:
+        return self._trigger
+
+    async def execute(self) -> Any:  # replaced per instance
+        pass
+
+
+def _delayed_pgq() -> MagicMock:
+    pgq = MagicMock()
+    pgq.entrypoint = MagicMock(return_value=lambda f: f)
+    pgq.queries.enqueue = AsyncMock(return_value=[1])
+    return pgq
+
+
+class TestUsesDelayedJobs:
+    @pytest.mark.parametrize(
+        ("trigger", "delayed"),
+        [
+            (IntervalTrigger(minutes=5), False),
+            (IntervalTrigger(seconds=20), True),
+            (IntervalTrigger(minutes=7), True),
+            (DateTrigger(delay=timedelta(seconds=5)), True),
+            (CronTrigger(minute="5"), False),
+        ],
+    )
+    def test_uses_delayed_jobs(self, trigger: Any, delayed: bool) -> None:
+        assert uses_delayed_jobs(trigger) is delayed
+
+
+def _connected(scheduler: PGQueuerScheduler) -> MagicMock:
+    worker = _worker(scheduler)
+    worker._pgq = _delayed_pgq()
+    scheduler._workers = [worker]
+    return worker._pgq
+
+
+def _handler(scheduler: PGQueuerScheduler, service: ScheduledService) -> Any:
+    pgq = _connected(scheduler)
+    handlers: list[Any] = []
+    pgq.entrypoint = MagicMock(return_value=handlers.append)
+    scheduler.add_service(service)
+    scheduler._register_service_on_pgq(pgq, service)
+    return handlers[0]
+
+
+class TestDelayedServices:
+    def test_inexact_interval_registers_entrypoint(self) -> None:
+        scheduler = PGQueuerScheduler()
+        pgq = _connected(scheduler)
+        service = DelayedService(IntervalTrigger(seconds=20))
+        scheduler.add_service(service)
+
+        scheduler._register_service_on_pgq(pgq, service, with_schedules=False)
+
+        pgq.entrypoint.assert_called_once_with("delayed_service", concurrency_limit=1)
+        pgq.schedule.assert_not_called()
+        assert "delayed_service" in scheduler._delayed_triggers
+
+    @pytest.mark.asyncio
+    async def test_run_enqueues_next_slot_then_executes(self) -> None:
+        scheduler = PGQueuerScheduler()
+        service = DelayedService(IntervalTrigger(seconds=20))
+        service.priority = 3
+        run = _handler(scheduler, service)
+        now = datetime(2026, 1, 1, 0, 0, 5, tzinfo=UTC)
+
+        with patch("appkit_commons.scheduler.pgqueuer._now", return_value=now):
+            await run(MagicMock(payload=b"2026-01-01T00:00:00+00:00"))
+
+        next_run = datetime(2026, 1, 1, 0, 0, 20, tzinfo=UTC)
+        scheduler._workers[0]._pgq.queries.enqueue.assert_awaited_once_with(
+            "delayed_service",
+            next_run.isoformat().encode(),
+            priority=3,
+            execute_after=timedelta(seconds=15),
+            dedupe_key=f"delayed_service@{next_run.isoformat()}",
+        )
+        service.execute.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_run_is_recorded_with_due_time_and_interval(self) -> None:
+        scheduler = PGQueuerScheduler()
+        service = DelayedService(IntervalTrigger(seconds=20))
+        run = _handler(scheduler, service)
+
+        with patch(
+            "appkit_commons.scheduler.pgqueuer.execute_recorded", new=AsyncMock()
+        ) as recorded:
+            await run(MagicMock(payload=b"2026-01-01T00:00:00+00:00"))
+
+        recorded.assert_awaited_once_with(
+            service,
+            scheduled_at=datetime(2026, 1, 1, tzinfo=UTC),
+            interval=timedelta(seconds=20),
+        )
+
+    @pytest.mark.asyncio
+    async def test_one_shot_run_does_not_reenqueue(self) -> None:
+        scheduler = PGQueuerScheduler()
+        service = DelayedService(DateTrigger(delay=timedelta(seconds=5)))
+        run = _handler(scheduler, service)
+
+        await run(MagicMock(payload=None))
+
+        scheduler._workers[0]._pgq.queries.enqueue.assert_not_awaited()
+        service.execute.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_run_logs_execution_errors(self, caplog) -> None:
+        scheduler = PGQueuerScheduler()
+        service = DelayedService(DateTrigger(delay=timedelta(seconds=5)))
+        service.execute.side_effect = RuntimeError("boom")
+        run = _handler(scheduler, service)
+
+        with caplog.at_level(logging.ERROR):
+            await run(MagicMock(payload=None))
+
+        assert "boom" in caplog.text
+
+    @pytest.mark.asyncio
+    async def test_run_is_enqueued_once(self) -> None:
+        scheduler = PGQueuerScheduler()
+        pgq = _connected(scheduler)
+        pgq.queries.enqueue.side_effect = DuplicateJobError("key")
+        run_time = datetime.now(tz=UTC) + timedelta(minutes=1)
+        service = DelayedService(DateTrigger(run_time=run_time))
+        scheduler.add_service(service)
+
+        await scheduler._enqueue_next_run(service)
+
+        kwargs = pgq.queries.enqueue.await_args.kwargs
+        assert kwargs["dedupe_key"] == f"delayed_service@{run_time.isoformat()}"
+        assert timedelta(0) < kwargs["execute_after"] <= timedelta(minutes=1)
+
+    @pytest.mark.asyncio
+    async def test_past_one_shot_is_not_enqueued(self) -> None:
+        scheduler = PGQueuerScheduler()
+        pgq = _connected(scheduler)
+        service = DelayedService(DateTrigger(run_time=datetime(2020, 1, 1, tzinfo=UTC)))
+        scheduler.add_service(service)
+
+        await scheduler._enqueue_next_run(service)
+
+        pgq.queries.enqueue.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_first_run_enqueued_by_schedule_worker_only(self) -> None:
+        scheduler = PGQueuerScheduler()
+        pgq = _connected(scheduler)
+        scheduler.add_service(DelayedService(IntervalTrigger(seconds=30)))
+        other = _worker(scheduler, 1)
+        other._pgq = _delayed_pgq()
+
+        await scheduler._register_on_worker(other)
+        pgq.queries.enqueue.assert_not_awaited()
+        await scheduler._register_on_worker(scheduler._workers[0])
+        pgq.queries.enqueue.assert_awaited_once()
+        # Delayed runs are dequeued by every worker
+        other._pgq.entrypoint.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_add_service_when_running_enqueues_first_run(self) -> None:
+        scheduler = PGQueuerScheduler()
+        scheduler._is_running = True
+        pgq = _connected(scheduler)
+        service = DelayedService(IntervalTrigger(seconds=30))
+
+        scheduler.add_service(service)
+        await asyncio.gather(*scheduler._background_tasks)
 
-        assert setup_called
-        scheduler._pgq.schedule.assert_called_once()
+        pgq.entrypoint.assert_called_once()
+        pgq.queries.enqueue.assert_awaited_once()
@@ -0,0 +1,109 @@
+"""Tests for the batched purge."""
+
+from contextlib import asynccontextmanager
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from appkit_commons.database.purge import PurgeTarget, purge_in_batches
+
+_PATCH = "appkit_commons.database.purge"
+
+
+def _factory():
+    sessions = []
+
+    @asynccontextmanager
+    async def _open():
+        session = object()
+        sessions.append(session)
+        yield session
+
+    return _open, sessions
+
+
+def _target(name: str, deleted: list[int], backlog: int = 0) -> PurgeTarget:
+    return PurgeTarget(
+        name,
+        delete_batch=AsyncMock(side_effect=deleted),
+        count_backlog=AsyncMock(return_value=backlog),
+    )
+
+
+class TestPurgeInBatches:
+    @pytest.mark.asyncio
+    async def test_deletes_until_batch_not_full(self) -> None:
+        factory, sessions = _factory()
+        target = _target("sessions", [10, 10, 3])
+
+        [result] = await purge_in_batches(
+            [target], batch_size=10, pause_seconds=0, session_factory=factory
+        )
+
+        assert (result.purged, result.batches, result.complete) == (23, 3, True)
+        assert result.backlog == 0
+        target.count_backlog.assert_not_awaited()
+        # One transaction per batch
+        assert len(sessions) == 3
+        target.delete_batch.assert_awaited_with(sessions[-1], 10)
+
+    @pytest.mark.asyncio
+    async def test_pauses_between_batches(self) -> None:
+        factory, _ = _factory()
+        with patch(f"{_PATCH}.asyncio.sleep", new=AsyncMock()) as sleep:
+            await purge_in_batches(
+                [_target("t", [5, 5, 0])],
+                batch_size=5,
+                pause_seconds=0.25,
+                session_factory=factory,
+            )
+
+        assert sleep.await_count == 2
+        sleep.assert_awaited_with(0.25)
+
+    @pytest.mark.asyncio
+    async def test_stops_at_time_budget_and_reports_backlog(self) -> None:
+        factory, _ = _factory()
+        now = [0.0]
+
+        async def _slow_batch(_session: object, _limit: int) -> int:
+            now[0] += 2.5
+            return 10
+
+        first = PurgeTarget(
+            "first", _slow_batch, count_backlog=AsyncMock(return_value=70)
+        )
+        second = _target("second", [1], backlog=12)
+
+        with patch(f"{_PATCH}.time") as mock_time:
+            mock_time.monotonic.side_effect = lambda: now[0]
+            results = await purge_in_batches(
+                [first, second],
+                batch_size=10,
+                pause_seconds=0,
+                time_budget_seconds=4,
+                session_factory=factory,
+            )
+
+        assert [(r.name, r.purged, r.backlog, r.complete) for r in results] == [
+            ("first", 20, 70, False),
+            ("second", 0, 12, False),
+        ]
+        second.delete_batch.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_zero_budget_only_counts_backlog(self) -> None:
+        factory, _ = _factory()
+        target = _target("t", [5], backlog=8)
+
+        [result] = await purge_in_batches(
+            [target], batch_size=5, time_budget_seconds=0, session_factory=factory
+        )
+
+        assert (result.purged, result.backlog, result.complete) == (0, 8, False)
+        target.delete_batch.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_rejects_invalid_batch_size(self) -> None:
+        with pytest.raises(ValueError, match="batch_size"):
+            await purge_in_batches([], batch_size=0)
@@ -11,6 +11,7 @@ from appkit_commons.scheduler.scheduler_types import (
     MINUTES_PER_HOUR,
     CalendarIntervalTrigger,
     CronTrigger,
+    DateTrigger,
     IntervalTrigger,
     ScheduledService,
     Scheduler,
@@ -129,6 +130,122 @@ class TestIntervalTriggerComprehensive:
         assert HOURS_PER_DAY == 24
 
 
+class TestIntervalTriggerNativeScheduling:
+    """Test suite for exact interval scheduling outside of cron."""
+
+    @pytest.mark.parametrize(
+        ("kwargs", "exact"),
+        [
+            ({"minutes": 15}, True),
+            ({"minutes": 60}, True),
+            ({"hours": 6}, True),
+            ({"days": 1}, True),
+            ({"seconds": 30}, False),
+            ({"minutes": 7}, False),
+            ({"minutes": 90}, False),
+            ({"hours": 5}, False),
+            ({"days": 2}, False),
+            ({"minutes": 5, "seconds": 30}, False),
+        ],
+    )
+    def test_is_cron_exact(self, kwargs: dict[str, int], exact: bool) -> None:
+        """Only intervals cron fires at exactly are cron-exact."""
+        assert IntervalTrigger(**kwargs).is_cron_exact is exact
+
+    def test_next_fire_time_on_epoch_grid(self) -> None:
+        """Runs lie on a grid anchored at the epoch."""
+        trigger = IntervalTrigger(seconds=45)
+        after = datetime(2026, 1, 1, 0, 0, 10, tzinfo=UTC)
+
+        next_time = trigger.next_fire_time(after)
+
+        assert next_time == datetime(2026, 1, 1, 0, 0, 45, tzinfo=UTC)
+        assert trigger.next_fire_time(next_time) == next_time + timedelta(seconds=45)
+
+    def test_next_fire_time_skips_missed_runs(self) -> None:
+        """A late caller gets the next future slot, not the missed ones."""
+        start = datetime(2026, 1, 1, tzinfo=UTC)
+        trigger = IntervalTrigger(minutes=7, start_time=start)
+
+        next_time = trigger.next_fire_time(start + timedelta(minutes=22))
+
+        assert next_time == start + timedelta(minutes=28)
+
+    def test_next_fire_time_before_start(self) -> None:
+        """The first run is the start time."""
+        start = datetime(2026, 1, 1, 12, 0)  # noqa: DTZ001 - naive is UTC
+        trigger = IntervalTrigger(seconds=10, start_time=start)
+
+        next_time = trigger.next_fire_time(datetime(2026, 1, 1, tzinfo=UTC))
+
+        assert next_time == start.replace(tzinfo=UTC)
+
+    def test_next_fire_time_after_end(self) -> None:
+        """No runs after the end time."""
+        trigger = IntervalTrigger(
+            seconds=30, end_time=datetime(2026, 1, 1, 0, 0, 40, tzinfo=UTC)
+        )
+
+        assert trigger.next_fire_time(datetime(2026, 1, 1, tzinfo=UTC)) is not None
+        assert (
+            trigger.next_fire_time(datetime(2026, 1, 1, 0, 0, 30, tzinfo=UTC)) is None
+        )
+
+    def test_next_fire_time_rejects_empty_interval(self) -> None:
+        """A zero interval has no next run."""
+        with pytest.raises(ValueError, match="positive"):
+            IntervalTrigger().next_fire_time(datetime.now(tz=UTC))
+
+
+class TestCronNextFireTime:
+    def test_next_cron_match(self) -> None:
+        """Cron triggers fire at the next match of their expression."""
+        trigger = CronTrigger(hour=3, minute=30)
+        after = datetime(2026, 1, 1, 3, 30, tzinfo=UTC)
+
+        assert trigger.next_fire_time(after) == datetime(2026, 1, 2, 3, 30, tzinfo=UTC)
+
+    def test_naive_time_is_utc(self) -> None:
+        """Naive times are treated as UTC."""
+        trigger = CronTrigger(minute="*/15")
+
+        next_time = trigger.next_fire_time(datetime(2026, 1, 1, 0, 7))  # noqa: DTZ001
+
+        assert next_time == datetime(2026, 1, 1, 0, 15, tzinfo=UTC)
+
+
+class TestDateTrigger:
+    """Test suite for DateTrigger."""
+
+    def test_run_time(self) -> None:
+        """A fixed run time is used as given."""
+        run_time = datetime(2026, 1, 1, 12, 0, tzinfo=UTC)
+        trigger = DateTrigger(run_time=run_time)
+
+        assert trigger.next_fire_time(run_time - timedelta(seconds=1)) == run_time
+        assert trigger.next_fire_time(run_time) is None
+
+    def test_delay(self) -> None:
+        """A delay is resolved once, relative to now."""
+        before = datetime.now(tz=UTC)
+        trigger = DateTrigger(delay=timedelta(seconds=30))
+
+        assert trigger.run_time >= before + timedelta(seconds=30)
+        assert trigger.run_time <= datetime.now(tz=UTC) + timedelta(seconds=30)
+
+    def test_requires_exactly_one_argument(self) -> None:
+        """Either run_time or delay must be passed."""
+        with pytest.raises(ValueError, match="exactly one"):
+            DateTrigger()
+        with pytest.raises(ValueError, match="exactly one"):
+            DateTrigger(datetime.now(tz=UTC), timedelta(seconds=1))
+
+    def test_to_cron_not_supported(self) -> None:
+        """One-shot runs cannot be expressed as cron."""
+        with pytest.raises(ValueError, match="cannot be expressed as cron"):
+            DateTrigger(delay=timedelta(seconds=1)).to_cron()
+
+
 class TestCalendarIntervalTriggerComprehensive:
     """Comprehensive test suite for CalendarIntervalTrigger."""
 
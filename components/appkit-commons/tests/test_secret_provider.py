@@ -1,18 +1,26 @@
 """Tests for SecretProvider secret management."""
 
+import logging
 import os
+import time
+from pathlib import Path
 from unittest.mock import patch
 
 import pytest
 
 from appkit_commons.configuration.secret_provider import (
     SECRET,
+    SecretCache,
     SecretNotFoundError,
     SecretProvider,
     _get_azure_client,
     _get_secret_from_env,
+    declared_secret_keys,
     get_secret,
+    prefetch_secrets,
 )
+from appkit_commons.configuration.yaml import YamlConfigReader
+from appkit_commons.testing import FakeKeyVault
 
 
 class TestSecretProviderEnv:
@@ -651,3 +659,143 @@ class TestSecretProvider:
 
         # Assert
         assert value == whitespace_value
+
+
+def _wait_for(condition: object, seconds: float = 2.0) -> None:
+    deadline = time.monotonic() + seconds
+    while not condition() and time.monotonic() < deadline:  # type: ignore[operator]
+        time.sleep(0.005)
+
+
+class TestSecretCache:
+    """Test suite for the TTL cache with background refresh."""
+
+    def test_serves_cached_value(self) -> None:
+        vault = FakeKeyVault({"db": "v1"})
+        cache = SecretCache(lambda key: vault.get_secret(key).value)
+
+        assert cache.get("db") == "v1"
+        assert cache.get("db") == "v1"
+        assert vault.requests == ["db"]
+
+    def test_refetches_expired_value(self) -> None:
+        vault = FakeKeyVault({"db": "v1"})
+        cache = SecretCache(lambda key: vault.get_secret(key).value, ttl_seconds=0)
+
+        cache.get("db")
+        vault.secrets["db"] = "v2"
+
+        assert cache.get("db") == "v2"
+        assert vault.requests == ["db", "db"]
+
+    def test_refreshes_in_background_before_expiry(self) -> None:
+        vault = FakeKeyVault({"db": "v1"})
+        cache = SecretCache(lambda key: vault.get_secret(key).value, refresh_ratio=0)
+        cache.get("db")
+        vault.secrets["db"] = "v2"
+
+        # Past the refresh point the cached value is served while refreshing
+        assert cache.get("db") == "v1"
+        _wait_for(lambda: cache.get("db") == "v2")
+
+        assert cache.get("db") == "v2"
+
+    def test_failed_refresh_keeps_value(self, caplog: pytest.LogCaptureFixture) -> None:
+        vault = FakeKeyVault({"db": "v1"})
+        cache = SecretCache(lambda key: vault.get_secret(key).value, refresh_ratio=0)
+        cache.get("db")
+        del vault.secrets["db"]
+
+        with caplog.at_level(logging.WARNING):
+            cache.get("db")
+            _wait_for(lambda: "Refreshing secret 'db' failed" in caplog.text)
+
+        assert cache.get("db") == "v1"
+
+    def test_prefetch_fetches_concurrently(self) -> None:
+        keys = [f"key-{i}" for i in range(8)]
+        vault = FakeKeyVault({key: key.upper() for key in keys}, latency_seconds=0.1)
+        cache = SecretCache(lambda key: vault.get_secret(key).value)
+
+        start = time.perf_counter()
+        fetched = cache.prefetch([*keys, "key-0"])
+        elapsed = time.perf_counter() - start
+
+        assert fetched == 8
+        assert elapsed < 0.5
+        assert sorted(vault.requests) == sorted(keys)
+        assert cache.get("key-3") == "KEY-3"
+        assert len(vault.requests) == 8
+
+    def test_prefetch_skips_cached_and_logs_failures(
+        self, caplog: pytest.LogCaptureFixture
+    ) -> None:
+        vault = FakeKeyVault({"a": "1"})
+        cache = SecretCache(lambda key: vault.get_secret(key).value)
+        cache.get("a")
+
+        with caplog.at_level(logging.WARNING):
+            assert cache.prefetch(["a", "missing"]) == 0
+
+        assert vault.requests == ["a", "missing"]
+        assert "Prefetching secret 'missing' failed" in caplog.text
+        with pytest.raises(SecretNotFoundError):
+            cache.get("missing")
+
+
+class TestAzureSecretProviderWithFakeVault:
+    """Test suite for the cached Azure provider against the fake vault."""
+
+    def test_get_secret_is_cached_and_lowercased(
+        self, fake_key_vault: FakeKeyVault
+    ) -> None:
+        fake_key_vault.secrets["mn-db-user"] = "admin"
+
+        assert get_secret("MN-DB-USER") == "admin"
+        assert get_secret("mn-db-user") == "admin"
+        assert fake_key_vault.requests == ["mn-db-user"]
+
+    def test_missing_secret_raises(self, fake_key_vault: FakeKeyVault) -> None:
+        with pytest.raises(SecretNotFoundError):
+            get_secret("missing")
+
+    def test_prefetch_declared_secrets(
+        self, fake_key_vault: FakeKeyVault, tmp_path: Path
+    ) -> None:
+        (tmp_path / "config.yaml").write_text(
+            "app:\n"
+            "  database:\n"
+            "    username: secret:MN-DB-USER\n"
+            "    password: 'secret:'\n"
+            "    port: 5432\n"
+        )
+        fake_key_vault.secrets.update({"mn-db-user": "admin", "password": "pw"})
+
+        fetched = prefetch_secrets(YamlConfigReader(yaml_file_path=tmp_path))
+
+        assert fetched == 2
+        assert get_secret("password") == "pw"
+        assert sorted(fake_key_vault.requests) == ["mn-db-user", "password"]
+
+    def test_prefetch_is_noop_for_local_provider(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        monkeypatch.setenv("SECRET_PROVIDER", "local")
+
+        assert prefetch_secrets() == 0
+
+
+class TestDeclaredSecretKeys:
+    def test_collects_nested_references(self) -> None:
+        data = {
+            "app": {
+                "database": {"username": "secret:db-user", "port": 5432},
+                "keys": ["secret:key-a", "plain"],
+                "api_key": "SECRET:",
+            }
+        }
+
+        assert declared_secret_keys(data) == {"db-user", "key-a", "api_key"}
+
+    def test_no_references(self) -> None:
+        assert declared_secret_keys({"a": 1, "b": None}) == set()
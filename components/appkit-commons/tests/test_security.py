@@ -9,6 +9,7 @@ from appkit_commons.security import (
     _hash_internal,
     check_password_hash,
     generate_password_hash,
+    password_fingerprint,
 )
 
 
@@ -297,3 +298,16 @@ class TestSecurity:
             # Assert
             assert valid is True
             assert invalid is False
+
+    def test_password_fingerprint_is_keyed_and_deterministic(self) -> None:
+        """Fingerprints are stable per key and differ across keys."""
+        # Act
+        first = password_fingerprint("secret", "key-1")
+        again = password_fingerprint("secret", b"key-1")
+        other_key = password_fingerprint("secret", "key-2")
+        other_password = password_fingerprint("secret!", "key-1")
+
+        # Assert
+        assert first == again
+        assert len(first) == 64
+        assert first not in (other_key, other_password)
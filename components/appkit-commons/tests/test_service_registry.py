@@ -484,3 +484,141 @@ class TestServiceRegistry:
 
         # Assert
         assert "Cleared 2 instances from registry" in caplog.text
+
+
+class TestServiceRegistryResolution:
+    """Test suite for subclass resolution, its cache and the frozen mode."""
+
+    def test_get_resolves_only_subclass(
+        self, clean_service_registry: ServiceRegistry
+    ) -> None:
+        class SpecialService(DummyService):
+            pass
+
+        service = SpecialService("special")
+        clean_service_registry.register(service)
+
+        assert clean_service_registry.get(DummyService) is service
+        assert clean_service_registry.has(DummyService)
+
+    def test_exact_registration_wins(
+        self, clean_service_registry: ServiceRegistry
+    ) -> None:
+        class SpecialService(DummyService):
+            pass
+
+        base = DummyService("base")
+        clean_service_registry.register(SpecialService("special"))
+        clean_service_registry.register(base)
+
+        assert clean_service_registry.get(DummyService) is base
+
+    def test_ambiguous_subclasses_do_not_resolve(
+        self, clean_service_registry: ServiceRegistry
+    ) -> None:
+        class ServiceA(DummyService):
+            pass
+
+        class ServiceB(DummyService):
+            pass
+
+        clean_service_registry.register(ServiceA())
+        clean_service_registry.register(ServiceB())
+
+        assert not clean_service_registry.has(DummyService)
+        with pytest.raises(KeyError):
+            clean_service_registry.get(DummyService)
+
+    def test_same_instance_under_several_keys_resolves(
+        self, clean_service_registry: ServiceRegistry
+    ) -> None:
+        class SpecialService(DummyService):
+            pass
+
+        service = SpecialService()
+        clean_service_registry.register(service)
+        clean_service_registry.register_as(SpecialService, service)
+
+        assert clean_service_registry.get(DummyService) is service
+
+    def test_registration_invalidates_cached_miss(
+        self, clean_service_registry: ServiceRegistry
+    ) -> None:
+        assert not clean_service_registry.has(DummyService)
+
+        service = DummyService()
+        clean_service_registry.register(service)
+
+        assert clean_service_registry.get(DummyService) is service
+
+    def test_unregister_invalidates_cache(
+        self, clean_service_registry: ServiceRegistry
+    ) -> None:
+        clean_service_registry.register(DummyService())
+        clean_service_registry.get(DummyService)
+
+        clean_service_registry.unregister(DummyService)
+
+        assert not clean_service_registry.has(DummyService)
+
+    def test_freeze_precomputes_base_types(
+        self, clean_service_registry: ServiceRegistry
+    ) -> None:
+        class SpecialService(DummyService):
+            pass
+
+        service = SpecialService()
+        clean_service_registry.register(service)
+
+        clean_service_registry.freeze()
+
+        assert clean_service_registry.frozen
+        assert clean_service_registry._resolved[DummyService] is service
+        assert clean_service_registry.get(DummyService) is service
+        assert object not in clean_service_registry._resolved
+
+    def test_frozen_rejects_new_types(
+        self, clean_service_registry: ServiceRegistry
+    ) -> None:
+        clean_service_registry.register(DummyService())
+        clean_service_registry.freeze()
+
+        with pytest.raises(RuntimeError, match="frozen"):
+            clean_service_registry.register(DummyConfig())
+        with pytest.raises(RuntimeError, match="frozen"):
+            clean_service_registry.unregister(DummyService)
+        with pytest.raises(KeyError):
+            clean_service_registry.get(DummyConfig)
+
+    def test_frozen_allows_replacing_instances(
+        self, clean_service_registry: ServiceRegistry
+    ) -> None:
+        class SpecialService(DummyService):
+            pass
+
+        clean_service_registry.register(SpecialService("old"))
+        clean_service_registry.freeze()
+
+        clean_service_registry.register(SpecialService("new"))
+
+        assert clean_service_registry.get(DummyService).name == "new"
+
+    def test_frozen_allows_late_types(
+        self, clean_service_registry: ServiceRegistry
+    ) -> None:
+        clean_service_registry.allow_late_registration(DummyConfig)
+        clean_service_registry.freeze()
+
+        clean_service_registry.register(DummyConfig())
+
+        assert clean_service_registry.has(DummyConfig)
+        with pytest.raises(RuntimeError, match="frozen"):
+            clean_service_registry.register(DummyService())
+
+    def test_clear_unfreezes(self, clean_service_registry: ServiceRegistry) -> None:
+        clean_service_registry.freeze()
+
+        clean_service_registry.clear()
+        clean_service_registry.register(DummyService())
+
+        assert not clean_service_registry.frozen
@@ -3,19 +3,33 @@
 import inspect
 import logging
 from collections.abc import Generator
+from pathlib import Path
 
 import pytest
-from sqlalchemy import Engine
+from pydantic import SecretStr
+from sqlalchemy import Engine, event
 
+from appkit_commons.database import session as session_module
 from appkit_commons.database.configuration import DatabaseConfig
+from appkit_commons.database.instrumentation import (
+    QueryThresholds,
+    _after_cursor_execute,
+    get_query_thresholds,
+    set_query_thresholds,
+)
 from appkit_commons.database.session import (
     _get_db_config,
     _get_engine_kwargs,
+    _recent_writes,
     get_async_session_manager,
+    get_asyncdb_read_session,
     get_asyncdb_session,
     get_db_engine,
     get_db_session,
+    get_read_session_manager,
     get_session_manager,
+    mark_user_write,
+    replica_lag_seconds,
 )
 from appkit_commons.registry import ServiceRegistry
 
@@ -26,11 +40,15 @@ logger = logging.getLogger(__name__)
 def clear_session_caches() -> Generator[None, None, None]:
     """Clear lru_cache for session manager functions."""
     get_async_session_manager.cache_clear()
+    get_read_session_manager.cache_clear()
     get_session_manager.cache_clear()
+    _recent_writes.clear()
     yield
     # Clear after test as well
     get_async_session_manager.cache_clear()
+    get_read_session_manager.cache_clear()
     get_session_manager.cache_clear()
+    _recent_writes.clear()
 
 
 class TestGetDbConfig:
@@ -185,6 +203,34 @@ class TestGetAsyncSessionManager:
         # Assert
         assert manager1 is manager2
 
+    def test_get_async_session_manager_instruments_engine(
+        self, clean_service_registry: ServiceRegistry
+    ) -> None:
+        """The engine reports statements and uses the configured thresholds."""
+        # Arrange
+        db_config = DatabaseConfig(
+            url="sqlite+aiosqlite:///:memory:",
+            type="sqlite",
+            query_warn_statements=7,
+            query_warn_repeats=3,
+        )
+        clean_service_registry.register(db_config)
+        saved = get_query_thresholds()
+
+        try:
+            # Act
+            manager = get_async_session_manager()
+
+            # Assert
+            assert event.contains(
+                manager.get_engine().sync_engine,
+                "after_cursor_execute",
+                _after_cursor_execute,
+            )
+            assert get_query_thresholds() == QueryThresholds(7, 3)
+        finally:
+            set_query_thresholds(saved)
+
 
 class TestGetSessionManager:
     """Test suite for get_session_manager function."""
@@ -302,3 +348,117 @@ class TestGetDbEngine:
 
         # Assert
         assert engine1 is engine2
+
+
+class TestReadReplicaRouting:
+    """Test suite for read-replica routing."""
+
+    @staticmethod
+    def _register(
+        registry: ServiceRegistry, tmp_path: Path, replica: bool = True
+    ) -> None:
+        registry.register(
+            DatabaseConfig(
+                url=f"sqlite+aiosqlite:///{tmp_path / 'primary.db'}",
+                type="sqlite",
+                replica_url=(
+                    SecretStr(f"sqlite+aiosqlite:///{tmp_path / 'replica.db'}")
+                    if replica
+                    else None
+                ),
+                replica_lag_seconds=5.0,
+            )
+        )
+
+    def test_read_only_postgresql_kwargs(
+        self, clean_service_registry: ServiceRegistry
+    ) -> None:
+        """Read-only engines open PostgreSQL transactions read-only."""
+        clean_service_registry.register(
+            DatabaseConfig(url="postgresql://u:p@localhost/db", type="postgresql")
+        )
+
+        options = _get_engine_kwargs(read_only=True)["connect_args"]["options"]
+
+        assert options == "-c default_transaction_read_only=on"
+        assert "options" not in _get_engine_kwargs()["connect_args"]
+
+    def test_no_replica_manager_without_replica_url(
+        self, clean_service_registry: ServiceRegistry, tmp_path: Path
+    ) -> None:
+        """get_read_session_manager returns None when no replica is set."""
+        self._register(clean_service_registry, tmp_path, replica=False)
+
+        assert get_read_session_manager() is None
+        assert replica_lag_seconds() == 0.0
+
+    def test_replica_manager_is_read_only_and_cached(
+        self, clean_service_registry: ServiceRegistry, tmp_path: Path
+    ) -> None:
+        """The replica manager is read-only and created once."""
+        self._register(clean_service_registry, tmp_path)
+
+        manager = get_read_session_manager()
+
+        assert manager is not None
+        assert manager.read_only is True
+        assert get_read_session_manager() is manager
+        assert manager is not get_async_session_manager()
+        assert replica_lag_seconds() == _get_db_config().replica_lag_seconds
+
+    @pytest.mark.asyncio
+    async def test_read_session_uses_replica(
+        self, clean_service_registry: ServiceRegistry, tmp_path: Path
+    ) -> None:
+        """Reads go to the replica when the user did not write recently."""
+        self._register(clean_service_registry, tmp_path)
+
+        async with get_asyncdb_read_session(1) as session:
+            engine = session.bind
+
+        assert engine is get_read_session_manager().get_engine()
+
+    @pytest.mark.asyncio
+    async def test_read_session_falls_back_to_primary(
+        self, clean_service_registry: ServiceRegistry, tmp_path: Path
+    ) -> None:
+        """Without a replica, reads go to the primary."""
+        self._register(clean_service_registry, tmp_path, replica=False)
+
+        async with get_asyncdb_read_session(1) as session:
+            engine = session.bind
+
+        assert engine is get_async_session_manager().get_engine()
+
+    @pytest.mark.asyncio
+    async def test_recent_writer_reads_from_primary(
+        self,
+        clean_service_registry: ServiceRegistry,
+        tmp_path: Path,
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        """Users read their own writes until the replica lag has passed."""
+        self._register(clean_service_registry, tmp_path)
+        primary = get_async_session_manager().get_engine()
+        now = 1000.0
+        monkeypatch.setattr(session_module.time, "monotonic", lambda: now)
+
+        mark_user_write(1)
+        async with get_asyncdb_read_session(1) as session:
+            assert session.bind is primary
+        async with get_asyncdb_read_session(2) as session:
+            assert session.bind is not primary
+
+        now += 5.0
+        async with get_asyncdb_read_session(1) as session:
+            assert session.bind is not primary
+        assert "1" not in _recent_writes
+
+    def test_mark_user_write_is_bounded(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Only the most recent writers are remembered."""
+        monkeypatch.setattr(session_module, "MAX_TRACKED_WRITERS", 2)
+
+        for user_id in (1, 2, 1, 3, None, ""):
+            mark_user_write(user_id)
+
+        assert list(_recent_writes) == ["1", "3"]
@@ -1,5 +1,7 @@
 """Tests for AsyncSessionManager and SessionManager."""
 
+from pathlib import Path
+
 import pytest
 from sqlalchemy import text
 from sqlalchemy.ext.asyncio import AsyncSession
@@ -162,6 +164,31 @@ class TestAsyncSessionManager:
         # Cleanup
         await manager.close()
 
+    @pytest.mark.asyncio
+    async def test_read_only_session_rolls_back(self, tmp_path: Path) -> None:
+        """Read-only managers never commit, even on success."""
+        # Arrange
+        url = f"sqlite+aiosqlite:///{tmp_path / 'replica.db'}"
+        writer = AsyncSessionManager(url)
+        reader = AsyncSessionManager(url, read_only=True)
+        async with writer.session() as session:
+            await session.execute(text("CREATE TABLE items (id INTEGER)"))
+
+        # Act
+        async with reader.session() as session:
+            await session.execute(text("INSERT INTO items VALUES (1)"))
+
+        # Assert
+        async with writer.session() as session:
+            result = await session.execute(text("SELECT COUNT(*) FROM items"))
+            assert result.scalar() == 0
+        assert reader.read_only is True
+        assert writer.read_only is False
+
+        # Cleanup
+        await reader.close()
+        await writer.close()
+
 
 class TestSessionManager:
     """Test suite for SessionManager (sync version)."""
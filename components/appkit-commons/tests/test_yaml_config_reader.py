@@ -1,5 +1,6 @@
 """Tests for YamlConfigReader and YamlConfigSettingsSource."""
 
+import os
 from pathlib import Path
 
 import pytest
@@ -358,3 +359,43 @@ class TestYamlConfigSettingsSource:
         # Assert
         assert "YamlConfigSettingsSource" in repr(source)
         assert "yaml_data" in repr(source)
+
+
+class TestYamlConfigReaderCache:
+    """Test suite for the modification-time based read cache."""
+
+    def test_rereads_changed_file(self, tmp_path: Path) -> None:
+        yaml_file = tmp_path / "config.yaml"
+        yaml_file.write_text("key: 1")
+        assert YamlConfigReader.read_file(yaml_file) == {"key": 1}
+
+        yaml_file.write_text("key: 2")
+        stat = yaml_file.stat()
+        os.utime(yaml_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+        assert YamlConfigReader.read_file(yaml_file) == {"key": 2}
+
+    def test_unchanged_file_is_served_from_cache(self, tmp_path: Path) -> None:
+        yaml_file = tmp_path / "config.yaml"
+        yaml_file.write_text("key: 1")
+
+        first = YamlConfigReader.read_file(yaml_file)
+
+        assert YamlConfigReader.read_file(yaml_file) is first
+
+    def test_merge_does_not_modify_cached_base(self, tmp_path: Path) -> None:
+        (tmp_path / "config.yaml").write_text("app:\n  name: base\n")
+        (tmp_path / "config.prod.yaml").write_text("app:\n  name: prod\n")
+        reader = YamlConfigReader(yaml_file_path=tmp_path)
+
+        assert reader.read_and_merge_files(["prod"]) == {"app": {"name": "prod"}}
+        assert reader.read_and_merge_files(None) == {"app": {"name": "base"}}
+
+    def test_config_files(self, tmp_path: Path) -> None:
+        reader = YamlConfigReader(yaml_file_path=tmp_path)
+
+        assert reader.config_files(["dev", "prod"]) == [
+            tmp_path / "config.yaml",
+            tmp_path / "config.dev.yaml",
+            tmp_path / "config.prod.yaml",
+        ]
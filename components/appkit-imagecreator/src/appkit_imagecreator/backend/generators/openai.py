@@ -2,9 +2,9 @@ import base64
 import logging
 from typing import Literal
 
-import httpx
 from openai import AsyncAzureOpenAI, AsyncOpenAI
 
+from appkit_imagecreator.backend.image_loader import image_loader
 from appkit_imagecreator.backend.models import (
     GeneratedImageData,
     GenerationInput,
@@ -90,28 +90,23 @@ class OpenAIImageGenerator(ImageGenerator):
         self, response_data: list, content_type: str
     ) -> list[GeneratedImageData]:
         """Process API response data (base64 or URL) into GeneratedImageData objects."""
-        generated_images: list[GeneratedImageData] = []
+        urls = [img.url for img in response_data if not img.b64_json and img.url]
+        fetched = await image_loader.fetch_urls(urls) if urls else {}
 
+        generated_images: list[GeneratedImageData] = []
         for img in response_data:
             if img.b64_json:
                 image_bytes = base64.b64decode(img.b64_json)
-                generated_images.append(
-                    self._create_generated_image_data(image_bytes, content_type)
-                )
             elif img.url:
-                try:
-                    async with httpx.AsyncClient() as client:
-                        resp = await client.get(img.url, timeout=60.0)
-                        resp.raise_for_status()
-                        generated_images.append(
-                            self._create_generated_image_data(
-                                resp.content, content_type
-                            )
-                        )
-                except httpx.HTTPError as e:
-                    logger.warning("Failed to fetch image from URL %s: %s", img.url, e)
+                image_bytes = fetched.get(img.url)
+                if image_bytes is None:
+                    continue
             else:
                 logger.warning("Image data from OpenAI is neither b64_json nor a URL.")
+                continue
+            generated_images.append(
+                self._create_generated_image_data(image_bytes, content_type)
+            )
 
         return generated_images
 
@@ -1,13 +1,18 @@
 """API endpoints for serving generated images."""
 
+import asyncio
+import io
 import logging
-from typing import Annotated, Literal
+from collections import OrderedDict
+from typing import Annotated, Final, Literal
 
 from fastapi import APIRouter, HTTPException, Query
-from fastapi.responses import Response
+from fastapi.responses import RedirectResponse, Response, StreamingResponse
+from PIL import Image
 
 from appkit_commons.database.session import get_asyncdb_session
 from appkit_imagecreator.backend.repository import image_repo
+from appkit_imagecreator.backend.storage.factory import get_blob_storage
 
 logger = logging.getLogger(__name__)
 
@@ -15,6 +20,60 @@ router = APIRouter(prefix="/api/images", tags=["images"])
 
 type ContentDisposition = Literal["inline", "attachment"]
 
+# Longest side of the previews shown in the history
+THUMBNAIL_SIZE = 256
+# Memory for generated previews; a preview is about 10-30 KB
+THUMBNAIL_CACHE_BYTES: Final[int] = 32 * 1024 * 1024
+
+
+class ThumbnailCache:
+    """LRU cache of generated previews, bounded by their total size.
+
+    Images never change, so entries only go stale when an image is deleted;
+    deleting code drops them with :meth:`discard` or :meth:`clear`.
+    """
+
+    def __init__(self, max_bytes: int = THUMBNAIL_CACHE_BYTES) -> None:
+        self.max_bytes = max_bytes
+        self._size = 0
+        self._entries: OrderedDict[int, bytes] = OrderedDict()
+
+    def get(self, image_id: int) -> bytes | None:
+        data = self._entries.get(image_id)
+        if data is not None:
+            self._entries.move_to_end(image_id)
+        return data
+
+    def put(self, image_id: int, data: bytes) -> None:
+        if len(data) > self.max_bytes:
+            return
+        self._size -= len(self._entries.pop(image_id, b""))
+        self._entries[image_id] = data
+        self._size += len(data)
+        while self._size > self.max_bytes:
+            _, evicted = self._entries.popitem(last=False)
+            self._size -= len(evicted)
+
+    def discard(self, image_id: int) -> None:
+        self._size -= len(self._entries.pop(image_id, b""))
+
+    def clear(self) -> None:
+        self._entries.clear()
+        self._size = 0
+
+
+thumbnail_cache = ThumbnailCache()
+
+
+def _thumbnail(data: bytes) -> bytes:
+    """Scale an image down to a WebP preview of at most THUMBNAIL_SIZE pixels."""
+    with Image.open(io.BytesIO(data)) as source:
+        source.thumbnail((THUMBNAIL_SIZE, THUMBNAIL_SIZE))
+        preview = source if source.mode in ("RGB", "RGBA") else source.convert("RGBA")
+        buffer = io.BytesIO()
+        preview.save(buffer, format="WEBP", quality=80)
+    return buffer.getvalue()
+
 
 @router.get("/{image_id}")
 async def get_image(
@@ -30,9 +89,70 @@ async def get_image(
     Returns:
         The image binary data with appropriate content type.
 
+    Data kept in the blob storage is streamed from it or, for inline images
+    and if the storage supports it, redirected to a presigned URL.
+
+    Raises:
+        HTTPException: If the image is not found or deleted.
+    """
+    async with get_asyncdb_session() as session:
+        image = await image_repo.find_stored_image(session, image_id)
+
+    if image is None:
+        logger.warning("Image not found: %d", image_id)
+        raise HTTPException(status_code=404, detail="Image not found")
+
+    headers = {
+        "Cache-Control": "public, max-age=31536000",  # Cache for 1 year
+        "Content-Disposition": (
+            f'{content_disposition}; filename="image_{image_id}.png"'
+        ),
+    }
+    if image.storage_key is None:
+        return Response(
+            content=image.image_data, media_type=image.content_type, headers=headers
+        )
+
+    storage = get_blob_storage()
+    if storage is None:
+        logger.error("Image %d is in the blob storage, none is configured", image_id)
+        raise HTTPException(status_code=404, detail="Image not found")
+
+    if content_disposition == "inline" and (
+        url := await storage.presigned_url(image.storage_key)
+    ):
+        # Cached shorter than the URL is valid
+        return RedirectResponse(
+            url,
+            status_code=307,
+            headers={
+                "Cache-Control": f"private, max-age={storage.presign_seconds // 2}"
+            },
+        )
+
+    chunks = await storage.open(image.storage_key)
+    if chunks is None:
+        logger.warning("Image data %s not found", image.storage_key)
+        raise HTTPException(status_code=404, detail="Image not found")
+    headers["ETag"] = f'"{image.storage_key.rsplit("/", 1)[-1]}"'
+    return StreamingResponse(chunks, media_type=image.content_type, headers=headers)
+
+
+@router.get("/{image_id}/thumbnail")
+async def get_thumbnail(image_id: int) -> Response:
+    """Serve a small WebP preview of a generated image.
+
+    Images never change, so the preview is cached in memory and by the
+    browser like the image itself. If the image cannot be decoded, the
+    original is served.
+
     Raises:
-        HTTPException: If the image is not found.
+        HTTPException: If the image is not found or deleted.
     """
+    headers = {"Cache-Control": "public, max-age=31536000"}
+    if (preview := thumbnail_cache.get(image_id)) is not None:
+        return Response(content=preview, media_type="image/webp", headers=headers)
+
     async with get_asyncdb_session() as session:
         result = await image_repo.find_image_data(session, image_id)
 
@@ -41,14 +161,11 @@ async def get_image(
         raise HTTPException(status_code=404, detail="Image not found")
 
     image_data, content_type = result
+    try:
+        image_data = await asyncio.to_thread(_thumbnail, image_data)
+        content_type = "image/webp"
+        thumbnail_cache.put(image_id, image_data)
+    except (OSError, ValueError, Image.DecompressionBombError) as e:
+        logger.warning("Could not create thumbnail of image %d: %s", image_id, e)
 
-    return Response(
-        content=image_data,
-        media_type=content_type,
-        headers={
-            "Cache-Control": "public, max-age=31536000",  # Cache for 1 year
-            "Content-Disposition": (
-                f'{content_disposition}; filename="image_{image_id}.png"'
-            ),
-        },
-    )
+    return Response(content=image_data, media_type=content_type, headers=headers)
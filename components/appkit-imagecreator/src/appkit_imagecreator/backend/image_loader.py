@@ -0,0 +1,153 @@
+"""Loading of reference images and images returned as URLs.
+
+Reference images of an edit are stored in the database and read with one
+query instead of one per image. Generators that return URLs instead of image
+data are downloaded concurrently, up to a limit, through one pooled HTTP
+client shared by the process. Identical sources are loaded once. Downloads
+are streamed and aborted at the size cap instead of being read into memory
+completely.
+"""
+
+import asyncio
+import logging
+from collections.abc import Sequence
+from typing import Final
+
+import httpx
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from appkit_imagecreator.backend.models import GeneratedImageData
+from appkit_imagecreator.backend.repository import image_repo
+
+logger = logging.getLogger(__name__)
+
+MAX_IMAGE_BYTES: Final[int] = 20 * 1024 * 1024
+FETCH_CONCURRENCY: Final[int] = 4
+FETCH_TIMEOUT_SECONDS: Final[float] = 60.0
+
+
+class ImageTooLargeError(ValueError):
+    """A downloaded image exceeds the size cap."""
+
+
+class ImageLoader:
+    """Loads image bytes from the database and from URLs."""
+
+    def __init__(
+        self,
+        max_concurrency: int = FETCH_CONCURRENCY,
+        max_bytes: int = MAX_IMAGE_BYTES,
+        timeout_seconds: float = FETCH_TIMEOUT_SECONDS,
+        http_client: httpx.AsyncClient | None = None,
+    ) -> None:
+        """Initialize the loader.
+
+        Args:
+            max_concurrency: Maximum simultaneous downloads.
+            max_bytes: Size cap of a single image.
+            timeout_seconds: Timeout of a download.
+            http_client: Client to use instead of the pooled default.
+        """
+        self.max_bytes = max_bytes
+        self.timeout_seconds = timeout_seconds
+        self._semaphore = asyncio.Semaphore(max(max_concurrency, 1))
+        self._max_concurrency = max(max_concurrency, 1)
+        self._http_client = http_client
+
+    def _get_client(self) -> httpx.AsyncClient:
+        if self._http_client is None:
+            self._http_client = httpx.AsyncClient(
+                timeout=self.timeout_seconds,
+                follow_redirects=True,
+                limits=httpx.Limits(
+                    max_connections=self._max_concurrency * 2,
+                    max_keepalive_connections=self._max_concurrency,
+                ),
+            )
+        return self._http_client
+
+    async def close(self) -> None:
+        """Close the HTTP client."""
+        if self._http_client is not None:
+            await self._http_client.aclose()
+            self._http_client = None
+
+    async def fetch_url(self, url: str) -> bytes:
+        """Download an image.
+
+        Raises:
+            httpx.HTTPError: If the request fails.
+            ImageTooLargeError: If the image exceeds the size cap.
+        """
+        async with self._semaphore:
+            client = self._get_client()
+            async with client.stream("GET", url) as response:
+                response.raise_for_status()
+                declared = int(response.headers.get("content-length") or 0)
+                if declared > self.max_bytes:
+                    raise ImageTooLargeError(
+                        f"Image of {declared} bytes exceeds {self.max_bytes} bytes"
+                    )
+                data = bytearray()
+                async for chunk in response.aiter_bytes():
+                    data.extend(chunk)
+                    if len(data) > self.max_bytes:
+                        raise ImageTooLargeError(
+                            f"Image exceeds {self.max_bytes} bytes"
+                        )
+                return bytes(data)
+
+    async def fetch_urls(self, urls: Sequence[str]) -> dict[str, bytes | None]:
+        """Download images concurrently; failed downloads map to None."""
+        unique = list(dict.fromkeys(urls))
+        results = await asyncio.gather(
+            *(self.fetch_url(url) for url in unique), return_exceptions=True
+        )
+        fetched: dict[str, bytes | None] = {}
+        for url, result in zip(unique, results, strict=True):
+            if isinstance(result, BaseException):
+                if not isinstance(result, (httpx.HTTPError, ImageTooLargeError)):
+                    raise result
+                logger.error("Failed to fetch image from URL %s: %s", url, result)
+                fetched[url] = None
+            else:
+                fetched[url] = result
+        return fetched
+
+    async def resolve(self, images: Sequence[GeneratedImageData]) -> list[bytes | None]:
+        """The bytes of generated images, downloading those given as URLs.
+
+        Returns:
+            Bytes per image in order; None if an image has no data or its
+            download failed.
+        """
+        urls = [
+            image.external_url
+            for image in images
+            if not image.image_bytes and image.external_url
+        ]
+        fetched = await self.fetch_urls(urls) if urls else {}
+        return [
+            image.image_bytes or fetched.get(image.external_url or "")
+            for image in images
+        ]
+
+    async def load_references(
+        self, session: AsyncSession, image_ids: Sequence[int]
+    ) -> list[tuple[bytes, str]]:
+        """Reference images as ``(bytes, content type)`` in the given order.
+
+        Duplicate ids are loaded once; missing or deleted images are skipped.
+        """
+        unique = list(dict.fromkeys(image_ids))
+        found = await image_repo.find_image_data_by_ids(session, unique)
+        references = []
+        for image_id in unique:
+            if image_id in found:
+                references.append(found[image_id])
+            else:
+                logger.warning("Reference image %d not found", image_id)
+        return references
+
+
+image_loader = ImageLoader()
@@ -8,6 +8,7 @@ from pydantic import BaseModel, computed_field
 from sqlalchemy import (
     JSON,
     DateTime,
+    Index,
     LargeBinary,
     String,
     Unicode,
@@ -87,6 +88,15 @@ class GeneratedImage(Base):
     """Model for storing generated images in the database."""
 
     __tablename__ = "imagecreator_generated_images"
+    __table_args__ = (
+        # Keyset pagination of a user's history by (created_at, id)
+        Index(
+            "ix_imagecreator_generated_images_user_created",
+            "user_id",
+            "created_at",
+            "id",
+        ),
+    )
 
     id: Mapped[int] = mapped_column(primary_key=True, autoincrement=True)
     user_id: Mapped[int] = mapped_column(index=True, nullable=False)
@@ -94,7 +104,11 @@ class GeneratedImage(Base):
     enhanced_prompt: Mapped[str | None] = mapped_column(String(8000), default=None)
     style: Mapped[str | None] = mapped_column(String(100), default=None)
     model: Mapped[str] = mapped_column(String(100), nullable=False)
+    # Empty when the data is kept in the blob storage under storage_key
     image_data: Mapped[bytes] = mapped_column(LargeBinary, nullable=False)
+    storage_key: Mapped[str | None] = mapped_column(
+        String(100), default=None, index=True
+    )
     content_type: Mapped[str] = mapped_column(
         String(50), nullable=False, default="image/png"
     )
@@ -136,6 +150,13 @@ class GeneratedImageModel(BaseModel):
         base_url = get_image_api_base_url()
         return f"{base_url}/api/images/{self.id}"
 
+    @computed_field  # type: ignore[prop-decorator]
+    @property
+    def thumbnail_url(self) -> str:
+        """Generate the API URL of a small preview of the image."""
+        base_url = get_image_api_base_url()
+        return f"{base_url}/api/images/{self.id}/thumbnail"
+
 
 class ImageResponseState(StrEnum):
     SUCCEEDED = "succeeded"
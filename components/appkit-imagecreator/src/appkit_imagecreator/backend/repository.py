@@ -1,17 +1,54 @@
 """Repository for generated images database operations."""
 
+import asyncio
 import logging
+from collections.abc import Sequence
 from datetime import UTC, datetime, timedelta
+from typing import NamedTuple
 
-from sqlalchemy import select
+from sqlalchemy import exists, select, tuple_, update
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import defer
+from sqlalchemy.orm import aliased, defer
 
 from appkit_commons.database.base_repository import BaseRepository
-from appkit_imagecreator.backend.models import GeneratedImage
+from appkit_imagecreator.backend.models import GeneratedImage, GeneratedImageModel
+from appkit_imagecreator.backend.storage.base import BlobStorage, content_key
+from appkit_imagecreator.backend.storage.factory import get_blob_storage
 
 logger = logging.getLogger(__name__)
 
+# Soft delete keeps the record but clears the image data to save space
+_SOFT_DELETE_VALUES = {"is_deleted": True, "image_data": b""}
+# Blob storage requests running at once while moving images
+_MOVE_CONCURRENCY = 4
+# Images per page of the history drawer
+HISTORY_PAGE_SIZE = 60
+# Columns of GeneratedImageModel, i.e. everything but the image data
+_METADATA_COLUMNS = [
+    getattr(GeneratedImage, name) for name in GeneratedImageModel.model_fields
+]
+
+
+class StoredImage(NamedTuple):
+    """Where the data of an image is: in the row or under a storage key."""
+
+    image_data: bytes
+    content_type: str
+    storage_key: str | None
+
+
+async def _load_data(image: StoredImage) -> bytes | None:
+    if image.storage_key is None:
+        return image.image_data
+    storage = get_blob_storage()
+    if storage is None:
+        logger.error(
+            "Image data %s is in the blob storage, but none is configured",
+            image.storage_key,
+        )
+        return None
+    return await storage.get(image.storage_key)
+
 
 class GeneratedImageRepository(BaseRepository[GeneratedImage, AsyncSession]):
     """Repository class for generated image database operations."""
@@ -20,6 +57,28 @@ class GeneratedImageRepository(BaseRepository[GeneratedImage, AsyncSession]):
     def model_class(self) -> type[GeneratedImage]:
         return GeneratedImage
 
+    async def create(
+        self, session: AsyncSession, entity: GeneratedImage
+    ) -> GeneratedImage:
+        """Create an image, writing its data to the blob storage if configured.
+
+        The blob is written after the row is inserted, so a failed insert
+        leaves no blob behind; if the blob cannot be written, the error
+        rolls the insert back with the transaction.
+        """
+        storage = get_blob_storage()
+        if storage is None or not entity.image_data:
+            return await super().create(session, entity)
+
+        data, key = entity.image_data, content_key(entity.image_data)
+        # Wait for a running delete_released_blobs of the same content
+        await self._lock_key_rows(session, [key])
+        entity.storage_key = key
+        entity.image_data = b""
+        created = await super().create(session, entity)
+        await storage.put(key, data, created.content_type)
+        return created
+
     async def find_by_user(
         self, session: AsyncSession, user_id: int, limit: int = 100
     ) -> list[GeneratedImage]:
@@ -59,16 +118,192 @@ class GeneratedImageRepository(BaseRepository[GeneratedImage, AsyncSession]):
         result = await session.execute(stmt)
         return list(result.scalars().all())
 
+    async def find_history_page(
+        self,
+        session: AsyncSession,
+        user_id: int,
+        limit: int = HISTORY_PAGE_SIZE,
+        before: tuple[datetime, int] | None = None,
+    ) -> list[GeneratedImageModel]:
+        """Keyset-paginated image history of a user (excluding deleted).
+
+        Images are ordered newest first by ``(created_at, id)``. Pass the
+        ``(created_at, id)`` of the last image of a page as ``before`` to
+        fetch the next page. Only metadata is loaded, never image data.
+        """
+        stmt = select(*_METADATA_COLUMNS).where(
+            GeneratedImage.user_id == user_id, ~GeneratedImage.is_deleted
+        )
+        if before is not None:
+            stmt = stmt.where(
+                tuple_(GeneratedImage.created_at, GeneratedImage.id) < tuple_(*before)
+            )
+        stmt = stmt.order_by(
+            GeneratedImage.created_at.desc(), GeneratedImage.id.desc()
+        ).limit(limit)
+
+        result = await session.execute(stmt)
+        return [GeneratedImageModel.model_validate(row) for row in result.mappings()]
+
+    async def find_stored_image(
+        self, session: AsyncSession, image_id: int
+    ) -> StoredImage | None:
+        """Retrieve where the data of an image is, without loading blobs.
+
+        Deleted images are not found.
+        """
+        stmt = select(
+            GeneratedImage.image_data,
+            GeneratedImage.content_type,
+            GeneratedImage.storage_key,
+        ).where(GeneratedImage.id == image_id, ~GeneratedImage.is_deleted)
+        row = (await session.execute(stmt)).first()
+        return StoredImage(*row) if row else None
+
     async def find_image_data(
         self, session: AsyncSession, image_id: int
     ) -> tuple[bytes, str] | None:
-        """Retrieve only the image data and content type for an image."""
-        stmt = select(GeneratedImage).where(GeneratedImage.id == image_id)
-        result = await session.execute(stmt)
-        image = result.scalars().first()
-        if image:
-            return image.image_data, image.content_type
-        return None
+        """Retrieve only the image data and content type for an image.
+
+        Deleted images are not found.
+        """
+        image = await self.find_stored_image(session, image_id)
+        if image is None or (data := await _load_data(image)) is None:
+            return None
+        return data, image.content_type
+
+    async def find_image_data_by_ids(
+        self, session: AsyncSession, image_ids: Sequence[int]
+    ) -> dict[int, tuple[bytes, str]]:
+        """Retrieve image data and content type of several images at once.
+
+        Deleted images are not included.
+        """
+        if not image_ids:
+            return {}
+        stmt = select(
+            GeneratedImage.id,
+            GeneratedImage.image_data,
+            GeneratedImage.content_type,
+            GeneratedImage.storage_key,
+        ).where(GeneratedImage.id.in_(image_ids), ~GeneratedImage.is_deleted)
+        images = {row[0]: StoredImage(*row[1:]) for row in await session.execute(stmt)}
+        data = await asyncio.gather(*(_load_data(image) for image in images.values()))
+        return {
+            image_id: (image_data, image.content_type)
+            for (image_id, image), image_data in zip(images.items(), data, strict=True)
+            if image_data is not None
+        }
+
+    def _inline_filter(self) -> list:
+        return [GeneratedImage.storage_key.is_(None), ~GeneratedImage.is_deleted]
+
+    async def count_inline(self, session: AsyncSession) -> int:
+        """Count images whose data is still stored in the database."""
+        return await self.count_where(session, self._inline_filter())
+
+    async def move_to_storage(
+        self, session: AsyncSession, storage: BlobStorage, limit: int
+    ) -> int:
+        """Move the data of up to ``limit`` images to the blob storage.
+
+        Like :meth:`create`, the rows of the keys are locked before the blobs
+        are written, so :meth:`delete_released_blobs` cannot delete a blob
+        an image is being moved to.
+
+        Returns:
+            Number of images moved.
+        """
+        stmt = (
+            select(
+                GeneratedImage.id,
+                GeneratedImage.image_data,
+                GeneratedImage.content_type,
+            )
+            .where(*self._inline_filter())
+            .order_by(GeneratedImage.id)
+            .limit(limit)
+            .with_for_update(skip_locked=True)
+        )
+        rows = (await session.execute(stmt)).all()
+        if not rows:
+            return 0
+        keys = [content_key(row[1]) for row in rows]
+        await self._lock_key_rows(session, sorted(set(keys)))
+        semaphore = asyncio.Semaphore(_MOVE_CONCURRENCY)
+
+        async def _put(key: str, image_data: bytes, content_type: str) -> None:
+            async with semaphore:
+                await storage.put(key, image_data, content_type)
+
+        await asyncio.gather(
+            *(_put(key, row[1], row[2]) for row, key in zip(rows, keys, strict=True))
+        )
+        await session.execute(
+            update(GeneratedImage),
+            [
+                {"id": row[0], "storage_key": key, "image_data": b""}
+                for row, key in zip(rows, keys, strict=True)
+            ],
+        )
+        await session.flush()
+        return len(rows)
+
+    async def delete_released_blobs(
+        self, session: AsyncSession, storage: BlobStorage, limit: int = 1000
+    ) -> int:
+        """Delete the blobs only deleted images reference.
+
+        The rows of the keys stay locked until the transaction ends, and
+        :meth:`create` locks them before storing an identical image, so a
+        blob is never deleted under a new image. Call in a transaction of
+        its own; the keys are detached from the deleted rows.
+
+        Returns:
+            Number of deleted blobs.
+        """
+        active = aliased(GeneratedImage)
+        referenced = exists().where(
+            active.storage_key == GeneratedImage.storage_key, ~active.is_deleted
+        )
+        stmt = (
+            select(GeneratedImage.storage_key)
+            .where(
+                GeneratedImage.storage_key.is_not(None),
+                GeneratedImage.is_deleted,
+                ~referenced,
+            )
+            .distinct()
+            .limit(limit)
+        )
+        keys = list((await session.execute(stmt)).scalars())
+        if not keys:
+            return 0
+        await self._lock_key_rows(session, keys)
+        # Recheck after locking: an identical image may have been saved
+        still_used = select(GeneratedImage.storage_key).where(
+            GeneratedImage.storage_key.in_(keys), ~GeneratedImage.is_deleted
+        )
+        used = set((await session.execute(still_used)).scalars())
+        keys = [key for key in keys if key not in used]
+        for key in keys:
+            await storage.delete(key)
+        if keys:
+            await self.bulk_update(
+                session,
+                [GeneratedImage.storage_key.in_(keys), GeneratedImage.is_deleted],
+                {"storage_key": None},
+            )
+        return len(keys)
+
+    async def _lock_key_rows(self, session: AsyncSession, keys: Sequence[str]) -> None:
+        """Lock the rows referencing ``keys`` until the transaction ends."""
+        stmt = (
+            select(GeneratedImage.id)
+            .where(GeneratedImage.storage_key.in_(keys))
+            .with_for_update()
+        )
+        await session.execute(stmt)
 
     async def delete_by_id_and_user(
         self, session: AsyncSession, image_id: int, user_id: int
@@ -77,16 +312,12 @@ class GeneratedImageRepository(BaseRepository[GeneratedImage, AsyncSession]):
 
         Sets is_deleted flag while keeping the database record intact.
         """
-        stmt = select(GeneratedImage).where(
-            GeneratedImage.id == image_id,
-            GeneratedImage.user_id == user_id,
+        updated = await self.bulk_update(
+            session,
+            [GeneratedImage.id == image_id, GeneratedImage.user_id == user_id],
+            _SOFT_DELETE_VALUES,
         )
-        result = await session.execute(stmt)
-        image = result.scalars().first()
-        if image:
-            image.is_deleted = True
-            image.image_data = b""  # Clear image data to save space
-            await session.flush()
+        if updated:
             logger.debug("Marked image as deleted: %s", image_id)
             return True
         logger.warning(
@@ -102,14 +333,11 @@ class GeneratedImageRepository(BaseRepository[GeneratedImage, AsyncSession]):
         Sets is_deleted flag while keeping database records intact.
         Returns count of images updated.
         """
-        stmt = select(GeneratedImage).where(GeneratedImage.user_id == user_id)
-        result = await session.execute(stmt)
-        images = list(result.scalars().all())
-        for image in images:
-            image.is_deleted = True
-            image.image_data = b""  # Clear image data to save space
-        await session.flush()
-        count = len(images)
+        count = await self.bulk_update(
+            session,
+            [GeneratedImage.user_id == user_id, ~GeneratedImage.is_deleted],
+            _SOFT_DELETE_VALUES,
+        )
         logger.debug(
             "Marked %d generated images as deleted for user %s", count, user_id
         )
@@ -122,16 +350,11 @@ class GeneratedImageRepository(BaseRepository[GeneratedImage, AsyncSession]):
         Returns count of images updated.
         """
         cutoff_date = datetime.now(UTC) - timedelta(days=days)
-        stmt = select(GeneratedImage).where(
-            GeneratedImage.created_at < cutoff_date,
+        count = await self.bulk_update(
+            session,
+            [GeneratedImage.created_at < cutoff_date, ~GeneratedImage.is_deleted],
+            _SOFT_DELETE_VALUES,
         )
-        result = await session.execute(stmt)
-        images = list(result.scalars().all())
-        for image in images:
-            image.is_deleted = True
-            image.image_data = b""  # Clear image data to save space
-        await session.flush()
-        count = len(images)
         logger.debug(
             "Marked %d generated images older than %d days as deleted",
             count,
@@ -1,7 +1,8 @@
 """Image cleanup scheduler for deleting old generated images.
 
 Provides scheduled cleanup of generated images older than a configured threshold.
-The scheduler runs once daily at 3:00 AM.
+The scheduler runs once daily at 3:00 AM. Blobs of deleted images that no other
+image shares are removed from the blob storage.
 """
 
 import logging
@@ -9,7 +10,9 @@ import logging
 from appkit_commons.database.session import get_asyncdb_session
 from appkit_commons.registry import service_registry
 from appkit_commons.scheduler import CronTrigger, ScheduledService, Trigger
+from appkit_imagecreator.backend.image_api import thumbnail_cache
 from appkit_imagecreator.backend.repository import image_repo
+from appkit_imagecreator.backend.storage.factory import get_blob_storage
 from appkit_imagecreator.configuration import ImageGeneratorConfig
 
 logger = logging.getLogger(__name__)
@@ -30,7 +33,7 @@ class ImageCleanupService(ScheduledService):
         """Run daily at 3:07 AM UTC."""
         return CronTrigger(hour=3, minute=7)
 
-    async def execute(self) -> None:
+    async def execute(self) -> int:
         """Run the image cleanup job."""
         try:
             days = self.config.cleanup_days_threshold
@@ -40,6 +43,8 @@ class ImageCleanupService(ScheduledService):
                 count = await image_repo.delete_by_older_than_days(session, days)
 
             if count > 0:
+                # The ids of the deleted images are not known here
+                thumbnail_cache.clear()
                 logger.info(
                     "Marked %d generated images as deleted (older than %d days)",
                     count,
@@ -48,5 +53,18 @@ class ImageCleanupService(ScheduledService):
             else:
                 logger.debug("No images older than %d days found for cleanup", days)
 
+            await self._delete_released_blobs()
+            return count
+
         except Exception as e:
             logger.error("Image cleanup job failed: %s", e)
+            raise
+
+    async def _delete_released_blobs(self) -> None:
+        storage = get_blob_storage()
+        if storage is None:
+            return
+        async with get_asyncdb_session() as session:
+            deleted = await image_repo.delete_released_blobs(session, storage)
+        if deleted:
+            logger.info("Deleted %d image blobs of deleted images", deleted)
@@ -0,0 +1,118 @@
+"""Background migration of image data from the database to the blob storage.
+
+When a blob storage backend is configured, new images are written to it
+directly. Existing images are moved in bounded batches, each in its own
+transaction, until the run's time budget is used up; the next run continues
+where it stopped. Without a blob storage the job does nothing.
+"""
+
+import asyncio
+import logging
+import time
+from dataclasses import dataclass
+
+from appkit_commons.database.session import get_asyncdb_session
+from appkit_commons.registry import service_registry
+from appkit_commons.scheduler import IntervalTrigger, ScheduledService, Trigger
+from appkit_imagecreator.backend.repository import image_repo
+from appkit_imagecreator.backend.storage.base import BlobStorage
+from appkit_imagecreator.backend.storage.factory import get_blob_storage
+from appkit_imagecreator.configuration import ImageGeneratorConfig, ImageStorageConfig
+
+logger = logging.getLogger(__name__)
+
+# Pause between two batches, leaving room for concurrent requests
+_BATCH_PAUSE_SECONDS = 0.1
+
+
+@dataclass(slots=True)
+class MigrationRun:
+    """Outcome of one migration run."""
+
+    moved: int = 0
+    batches: int = 0
+    # Images left in the database when the time budget ran out
+    remaining: int = 0
+    complete: bool = False
+    duration_seconds: float = 0.0
+
+
+class ImageStorageMigrationService(ScheduledService):
+    """Service to move image data out of the database."""
+
+    job_id = "image_storage_migration"
+    name = "Move image data to the blob storage"
+
+    def __init__(
+        self,
+        config: ImageStorageConfig | None = None,
+        storage: BlobStorage | None = None,
+    ) -> None:
+        """Initialize the service.
+
+        Args:
+            config: Storage settings; read from the image generator
+                configuration if not given.
+            storage: Target storage; defaults to the configured one, looked
+                up on each run so a reloaded storage configuration applies.
+        """
+        registry = service_registry()
+        if config is None and registry.has(ImageGeneratorConfig):
+            config = registry.get(ImageGeneratorConfig).storage
+        self.config = config or ImageStorageConfig()
+        self._storage = storage
+        self.last_run: MigrationRun | None = None
+
+    @property
+    def storage(self) -> BlobStorage | None:
+        return self._storage or get_blob_storage()
+
+    @property
+    def trigger(self) -> Trigger:
+        """Run periodically based on configured interval."""
+        return IntervalTrigger(minutes=self.config.migration_interval_minutes)
+
+    async def execute(self) -> int:
+        """Move a time-boxed share of the images; returns how many."""
+        storage = self.storage
+        if storage is None:
+            return 0
+
+        run = await self._move_in_batches(storage)
+        self.last_run = run
+
+        if run.moved:
+            logger.info(
+                "Moved the data of %d images to the %s storage (%.1fs)",
+                run.moved,
+                storage.name,
+                run.duration_seconds,
+            )
+        if not run.complete:
+            logger.info(
+                "Image storage migration continues next run, %d images left",
+                run.remaining,
+            )
+        return run.moved
+
+    async def _move_in_batches(self, storage: BlobStorage) -> MigrationRun:
+        """Move batches, each in its own transaction, until the budget is used."""
+        batch_size = self.config.migration_batch_size
+        started = time.monotonic()
+        deadline = started + self.config.migration_time_budget_seconds
+        run = MigrationRun()
+        while time.monotonic() < deadline:
+            async with get_asyncdb_session() as session:
+                moved = await image_repo.move_to_storage(session, storage, batch_size)
+            run.moved += moved
+            run.batches += 1
+            if moved < batch_size:
+                run.complete = True
+                break
+            await asyncio.sleep(_BATCH_PAUSE_SECONDS)
+
+        if not run.complete:
+            async with get_asyncdb_session() as session:
+                run.remaining = await image_repo.count_inline(session)
+        run.duration_seconds = time.monotonic() - started
+        return run
@@ -0,0 +1,59 @@
+"""Abstract blob storage interface for image data."""
+
+import hashlib
+import re
+from abc import ABC, abstractmethod
+from collections.abc import AsyncIterator
+from typing import Final
+
+STREAM_CHUNK_SIZE: Final[int] = 64 * 1024
+
+_KEY_PATTERN = re.compile(r"images/[0-9a-f]{2}/[0-9a-f]{64}")
+
+
+def content_key(data: bytes) -> str:
+    """The content-addressed key of image data.
+
+    Identical images share one blob, and a key never changes its content, so
+    writes are idempotent and responses can be cached indefinitely.
+    """
+    digest = hashlib.sha256(data).hexdigest()
+    return f"images/{digest[:2]}/{digest}"
+
+
+def validate_key(key: str) -> str:
+    """Return ``key`` if it is a content key; guards paths and URLs."""
+    if not _KEY_PATTERN.fullmatch(key):
+        raise ValueError(f"Invalid storage key: {key!r}")
+    return key
+
+
+class BlobStorage(ABC):
+    """Stores image data outside the database under content keys."""
+
+    name: str
+    # Lifetime of presigned URLs; 0 if the backend has none
+    presign_seconds: int = 0
+
+    @abstractmethod
+    async def put(self, key: str, data: bytes, content_type: str) -> None:
+        """Store ``data`` under ``key``; storing an existing key is a no-op."""
+
+    @abstractmethod
+    async def get(self, key: str) -> bytes | None:
+        """The data stored under ``key``, or None if there is none."""
+
+    @abstractmethod
+    async def open(self, key: str) -> AsyncIterator[bytes] | None:
+        """The data under ``key`` as chunks, or None if there is none."""
+
+    @abstractmethod
+    async def delete(self, key: str) -> None:
+        """Delete ``key``; deleting a missing key is a no-op."""
+
+    async def presigned_url(self, key: str) -> str | None:  # noqa: ARG002
+        """A URL clients can download ``key`` from directly, if supported."""
+        return None
+
+    async def close(self) -> None:  # noqa: B027
+        """Release connections."""
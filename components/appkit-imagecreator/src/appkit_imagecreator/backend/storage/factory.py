@@ -0,0 +1,59 @@
+"""Factory for the image blob storage from configuration."""
+
+from functools import lru_cache
+
+from appkit_commons.registry import service_registry
+from appkit_imagecreator.backend.storage.base import BlobStorage
+from appkit_imagecreator.backend.storage.filesystem import FilesystemBlobStorage
+from appkit_imagecreator.backend.storage.s3 import S3BlobStorage
+from appkit_imagecreator.configuration import ImageGeneratorConfig, ImageStorageConfig
+
+
+def create_blob_storage(config: ImageStorageConfig) -> BlobStorage | None:
+    """Return the :class:`BlobStorage` of ``config.backend``.
+
+    Returns:
+        None for the ``database`` backend, which keeps the data in the
+        image rows.
+
+    Raises:
+        ValueError: If the backend is not a recognised value.
+    """
+    if config.backend == "database":
+        return None
+    if config.backend == "filesystem":
+        return FilesystemBlobStorage(config.directory)
+    if config.backend == "s3":
+        return S3BlobStorage(
+            endpoint_url=config.s3_endpoint_url,
+            bucket=config.s3_bucket,
+            access_key=config.s3_access_key,
+            secret_key=config.s3_secret_key.get_secret_value(),
+            region=config.s3_region,
+            public_url=config.s3_public_url,
+            presign_seconds=config.presigned_url_seconds,
+        )
+    raise ValueError(
+        f"Unknown image storage backend '{config.backend}'. "
+        "Must be one of: database, filesystem, s3."
+    )
+
+
+@lru_cache(maxsize=1)
+def get_blob_storage() -> BlobStorage | None:
+    """The process-wide blob storage; None if image data stays in the database."""
+    registry = service_registry()
+    if not registry.has(ImageGeneratorConfig):
+        return None
+    return create_blob_storage(registry.get(ImageGeneratorConfig).storage)
+
+
+async def reset_blob_storage() -> None:
+    """Recreate the blob storage from the current configuration on next use.
+
+    Called after a configuration reload; the old storage is closed.
+    """
+    old = get_blob_storage()
+    get_blob_storage.cache_clear()
+    if old is not None:
+        await old.close()
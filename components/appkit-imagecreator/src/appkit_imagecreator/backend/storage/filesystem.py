@@ -0,0 +1,70 @@
+"""Filesystem blob storage backend."""
+
+import asyncio
+import logging
+import secrets
+from collections.abc import AsyncIterator
+from pathlib import Path
+
+from appkit_imagecreator.backend.storage.base import (
+    STREAM_CHUNK_SIZE,
+    BlobStorage,
+    validate_key,
+)
+
+logger = logging.getLogger(__name__)
+
+
+class FilesystemBlobStorage(BlobStorage):
+    """Stores image data as files below a root directory.
+
+    Files are written to a temporary name and renamed, so readers never see
+    a partial image.
+    """
+
+    name = "filesystem"
+
+    def __init__(self, root_dir: str | Path) -> None:
+        self.root_dir = Path(root_dir)
+
+    def _path(self, key: str) -> Path:
+        return self.root_dir / validate_key(key)
+
+    def _write(self, path: Path, data: bytes) -> None:
+        if path.exists():
+            return
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_name(f"{path.name}.{secrets.token_hex(4)}.tmp")
+        try:
+            tmp_path.write_bytes(data)
+            tmp_path.replace(path)
+        finally:
+            tmp_path.unlink(missing_ok=True)
+
+    async def put(self, key: str, data: bytes, content_type: str) -> None:  # noqa: ARG002
+        await asyncio.to_thread(self._write, self._path(key), data)
+
+    async def get(self, key: str) -> bytes | None:
+        try:
+            return await asyncio.to_thread(self._path(key).read_bytes)
+        except FileNotFoundError:
+            return None
+
+    async def open(self, key: str) -> AsyncIterator[bytes] | None:
+        try:
+            file = await asyncio.to_thread(self._path(key).open, "rb")
+        except FileNotFoundError:
+            return None
+
+        async def _chunks() -> AsyncIterator[bytes]:
+            try:
+                while chunk := await asyncio.to_thread(file.read, STREAM_CHUNK_SIZE):
+                    yield chunk
+            finally:
+                file.close()
+
+        return _chunks()
+
+    async def delete(self, key: str) -> None:
+        await asyncio.to_thread(self._path(key).unlink, missing_ok=True)
+        logger.debug("Deleted image blob %s", key)
@@ -0,0 +1,261 @@
+"""S3-compatible object store backend (AWS S3, MinIO, Ceph, ...).
+
+Requests are signed with AWS Signature Version 4 and sent with httpx, using
+path-style URLs (``{endpoint}/{bucket}/{key}``) as supported by all
+S3-compatible stores.
+"""
+
+import hashlib
+import hmac
+import logging
+from collections.abc import AsyncIterator, Mapping
+from datetime import UTC, datetime
+from typing import Final
+from urllib.parse import quote, urlencode, urlsplit
+
+import httpx
+
+from appkit_imagecreator.backend.storage.base import BlobStorage, validate_key
+
+logger = logging.getLogger(__name__)
+
+_ALGORITHM: Final[str] = "AWS4-HMAC-SHA256"
+_UNSIGNED_PAYLOAD: Final[str] = "UNSIGNED-PAYLOAD"
+_EMPTY_SHA256: Final[str] = hashlib.sha256(b"").hexdigest()
+
+
+def _hmac(key: bytes, message: str) -> bytes:
+    return hmac.new(key, message.encode(), hashlib.sha256).digest()
+
+
+def _signing_key(secret_key: str, date: str, region: str) -> bytes:
+    key = _hmac(f"AWS4{secret_key}".encode(), date)
+    for part in (region, "s3", "aws4_request"):
+        key = _hmac(key, part)
+    return key
+
+
+def _canonical_query(params: Mapping[str, str]) -> str:
+    return "&".join(
+        f"{quote(k, safe='-_.~')}={quote(v, safe='-_.~')}"
+        for k, v in sorted(params.items())
+    )
+
+
+def _signature(
+    method: str,
+    url: str,
+    headers: Mapping[str, str],
+    payload_hash: str,
+    query: Mapping[str, str],
+    secret_key: str,
+    region: str,
+    timestamp: str,
+) -> str:
+    canonical_headers = "".join(
+        f"{name}:{' '.join(value.split())}\n" for name, value in sorted(headers.items())
+    )
+    canonical_request = "\n".join(
+        [
+            method,
+            quote(urlsplit(url).path or "/", safe="/-_.~"),
+            _canonical_query(query),
+            canonical_headers,
+            ";".join(sorted(headers)),
+            payload_hash,
+        ]
+    )
+    date = timestamp[:8]
+    string_to_sign = "\n".join(
+        [
+            _ALGORITHM,
+            timestamp,
+            f"{date}/{region}/s3/aws4_request",
+            hashlib.sha256(canonical_request.encode()).hexdigest(),
+        ]
+    )
+    key = _signing_key(secret_key, date, region)
+    return hmac.new(key, string_to_sign.encode(), hashlib.sha256).hexdigest()
+
+
+def sign_headers(
+    method: str,
+    url: str,
+    headers: Mapping[str, str],
+    payload_hash: str,
+    access_key: str,
+    secret_key: str,
+    region: str,
+    now: datetime | None = None,
+) -> dict[str, str]:
+    """Headers of a request signed with Signature Version 4.
+
+    All given headers are signed; ``host``, ``x-amz-date`` and
+    ``x-amz-content-sha256`` are added.
+    """
+    timestamp = (now or datetime.now(UTC)).strftime("%Y%m%dT%H%M%SZ")
+    signed = {name.lower(): value for name, value in headers.items()}
+    signed |= {
+        "host": urlsplit(url).netloc,
+        "x-amz-content-sha256": payload_hash,
+        "x-amz-date": timestamp,
+    }
+    signature = _signature(
+        method, url, signed, payload_hash, {}, secret_key, region, timestamp
+    )
+    scope = f"{timestamp[:8]}/{region}/s3/aws4_request"
+    signed["authorization"] = (
+        f"{_ALGORITHM} Credential={access_key}/{scope}, "
+        f"SignedHeaders={';'.join(sorted(signed))}, Signature={signature}"
+    )
+    return signed
+
+
+def presign_url(
+    url: str,
+    expires_seconds: int,
+    access_key: str,
+    secret_key: str,
+    region: str,
+    now: datetime | None = None,
+) -> str:
+    """A presigned GET URL valid for ``expires_seconds``."""
+    timestamp = (now or datetime.now(UTC)).strftime("%Y%m%dT%H%M%SZ")
+    query = {
+        "X-Amz-Algorithm": _ALGORITHM,
+        "X-Amz-Credential": f"{access_key}/{timestamp[:8]}/{region}/s3/aws4_request",
+        "X-Amz-Date": timestamp,
+        "X-Amz-Expires": str(expires_seconds),
+        "X-Amz-SignedHeaders": "host",
+    }
+    signature = _signature(
+        "GET",
+        url,
+        {"host": urlsplit(url).netloc},
+        _UNSIGNED_PAYLOAD,
+        query,
+        secret_key,
+        region,
+        timestamp,
+    )
+    return f"{url}?{urlencode(query)}&X-Amz-Signature={signature}"
+
+
+class S3BlobStorage(BlobStorage):
+    """Stores image data as objects of an S3 bucket."""
+
+    name = "s3"
+
+    def __init__(
+        self,
+        endpoint_url: str,
+        bucket: str,
+        access_key: str,
+        secret_key: str,
+        region: str = "us-east-1",
+        public_url: str | None = None,
+        presign_seconds: int = 0,
+        http_client: httpx.AsyncClient | None = None,
+    ) -> None:
+        """Initialize the backend.
+
+        Args:
+            endpoint_url: Base URL of the store, e.g. ``http://minio:9000``.
+            bucket: Bucket holding the images; it must exist.
+            access_key: Access key id.
+            secret_key: Secret access key.
+            region: Region used in signatures.
+            public_url: Base URL browsers reach the store at, for presigned
+                URLs; defaults to ``endpoint_url``.
+            presign_seconds: Lifetime of presigned URLs; 0 disables them.
+            http_client: Client to use instead of a pooled default.
+        """
+        self.endpoint_url = endpoint_url.rstrip("/")
+        self.public_url = (public_url or endpoint_url).rstrip("/")
+        self.bucket = bucket
+        self.region = region
+        self.presign_seconds = presign_seconds
+        self._access_key = access_key
+        self._secret_key = secret_key
+        self._http_client = http_client
+
+    def _get_client(self) -> httpx.AsyncClient:
+        if self._http_client is None:
+            self._http_client = httpx.AsyncClient(timeout=60.0)
+        return self._http_client
+
+    def _url(self, key: str, base_url: str | None = None) -> str:
+        return f"{base_url or self.endpoint_url}/{self.bucket}/{validate_key(key)}"
+
+    def _request(
+        self,
+        method: str,
+        key: str,
+        content: bytes = b"",
+        headers: Mapping[str, str] | None = None,
+    ) -> httpx.Request:
+        url = self._url(key)
+        signed = sign_headers(
+            method,
+            url,
+            headers or {},
+            hashlib.sha256(content).hexdigest() if content else _EMPTY_SHA256,
+            self._access_key,
+            self._secret_key,
+            self.region,
+        )
+        return self._get_client().build_request(
+            method, url, content=content or None, headers=signed
+        )
+
+    async def put(self, key: str, data: bytes, content_type: str) -> None:
+        request = self._request("PUT", key, data, {"content-type": content_type})
+        response = await self._get_client().send(request)
+        response.raise_for_status()
+
+    async def get(self, key: str) -> bytes | None:
+        response = await self._get_client().send(self._request("GET", key))
+        if response.status_code == httpx.codes.NOT_FOUND:
+            return None
+        response.raise_for_status()
+        return response.content
+
+    async def open(self, key: str) -> AsyncIterator[bytes] | None:
+        response = await self._get_client().send(self._request("GET", key), stream=True)
+        if response.status_code == httpx.codes.NOT_FOUND:
+            await response.aclose()
+            return None
+        if response.is_error:
+            await response.aclose()
+            response.raise_for_status()
+
+        async def _chunks() -> AsyncIterator[bytes]:
+            try:
+                async for chunk in response.aiter_bytes():
+                    yield chunk
+            finally:
+                await response.aclose()
+
+        return _chunks()
+
+    async def delete(self, key: str) -> None:
+        response = await self._get_client().send(self._request("DELETE", key))
+        if response.status_code != httpx.codes.NOT_FOUND:
+            response.raise_for_status()
+        logger.debug("Deleted image blob %s", key)
+
+    async def presigned_url(self, key: str) -> str | None:
+        if not self.presign_seconds:
+            return None
+        return presign_url(
+            self._url(key, self.public_url),
+            self.presign_seconds,
+            self._access_key,
+            self._secret_key,
+            self.region,
+        )
+
+    async def close(self) -> None:
+        if self._http_client is not None:
+            await self._http_client.aclose()
+            self._http_client = None
@@ -65,7 +65,7 @@ def _history_image_card(image: GeneratedImageModel) -> rx.Component:
     return rx.box(
         rx.box(
             rx.image(
-                src=image.image_url,
+                src=image.thumbnail_url,
                 width="120px",
                 height="120px",
                 object_fit="cover",
@@ -129,20 +129,26 @@ def _history_date_group(
 def history_drawer() -> rx.Component:
     """History drawer using rx.drawer that slides in from the right.
 
-    Shows all images of the user grouped by date with delete capability.
-    Clicking an image adds it to the main grid.
+    Shows the images of the user grouped by date with delete capability,
+    loading further pages when scrolled to the bottom. Clicking an image adds
+    it to the main grid.
     """
     drawer_content = rx.vstack(
         rx.cond(
             ImageGalleryState.history_images.length() > 0,
             mn.scroll_area(
-                # rx.box(
                 rx.foreach(
                     ImageGalleryState.history_images_by_date,
                     lambda group: _history_date_group(group[0], group[1]),
                 ),
+                rx.cond(
+                    ImageGalleryState.loading_history,
+                    rx.center(rx.spinner(size="2"), width="100%", padding="12px"),
+                ),
                 width="100%",
                 height="calc(100vh - 102px)",
+                # Infinite scroll: the next page is loaded at the bottom
+                on_bottom_reached=ImageGalleryState.load_more_history_images,
             ),
             rx.center(
                 rx.vstack(
@@ -1,5 +1,36 @@
+from typing import Literal
+
+from pydantic import SecretStr
+
 from appkit_commons.configuration.base import BaseConfig
 
+ImageStorageBackend = Literal["database", "filesystem", "s3"]
+
+
+class ImageStorageConfig(BaseConfig):
+    """Where the data of generated images is stored.
+
+    ``database`` keeps it in the image rows. With ``filesystem`` or ``s3`` new
+    images are written to the blob storage, and existing rows are moved there
+    in the background.
+    """
+
+    backend: ImageStorageBackend = "database"
+    directory: str = "./uploaded_files/images"
+    """root directory of the filesystem backend"""
+    s3_endpoint_url: str = "http://localhost:9000"
+    s3_public_url: str | None = None
+    """endpoint used in presigned URLs if browsers reach the store elsewhere"""
+    s3_bucket: str = "appkit-images"
+    s3_region: str = "us-east-1"
+    s3_access_key: str = ""
+    s3_secret_key: SecretStr = SecretStr("")
+    presigned_url_seconds: int = 3600
+    """redirect image requests to presigned S3 URLs valid this long; 0 streams"""
+    migration_interval_minutes: int = 10
+    migration_batch_size: int = 50
+    migration_time_budget_seconds: float = 300.0
+
 
 class ImageGeneratorConfig(BaseConfig):
     tmp_dir: str = "./uploaded_files"
@@ -8,6 +39,8 @@ class ImageGeneratorConfig(BaseConfig):
     """days threshold for automatic cleanup of old images"""
     openai_model: str = "gpt-4.1-mini"
     """OpenAI model for prompt enhancement"""
+    storage: ImageStorageConfig = ImageStorageConfig()
+    """storage of the image data"""
 
 
 styles_preset = {
@@ -15,26 +15,31 @@ import locale
 import logging
 from collections import defaultdict
 from collections.abc import AsyncGenerator
-from datetime import date
+from datetime import date, datetime
 from typing import Any
 
-import httpx
 import reflex as rx
 from PIL import Image
 
-from appkit_commons.database.session import get_asyncdb_session
+from appkit_commons.database.session import (
+    get_asyncdb_read_session,
+    get_asyncdb_session,
+    mark_user_write,
+)
 from appkit_imagecreator.backend.generator_registry import generator_registry
+from appkit_imagecreator.backend.image_api import thumbnail_cache
+from appkit_imagecreator.backend.image_loader import image_loader
 from appkit_imagecreator.backend.models import (
     GeneratedImage,
-    GeneratedImageData,
     GeneratedImageModel,
     GenerationInput,
     ImageGeneratorResponse,
     ImageResponseState,
 )
-from appkit_imagecreator.backend.repository import image_repo
+from appkit_imagecreator.backend.repository import HISTORY_PAGE_SIZE, image_repo
 from appkit_imagecreator.configuration import styles_preset
-from appkit_user.authentication.states import UserSession
+from appkit_user.authentication.backend.permissions import Permissions
+from appkit_user.authentication.states import UserSession, get_user_permissions
 
 logger = logging.getLogger(__name__)
 
@@ -94,8 +99,10 @@ class ImageGalleryState(rx.State):
 
     # Stored images (today's images for grid)
     images: list[GeneratedImageModel] = []
-    # All images for history
+    # Loaded pages of the history, newest first
     history_images: list[GeneratedImageModel] = []
+    has_more_history: bool = False
+    loading_history: bool = False
     loading_images: bool = False
 
     # Upload state
@@ -148,6 +155,8 @@ class ImageGalleryState(rx.State):
     # Initialization
     _initialized: bool = False
     _current_user_id: int = 0
+    # (created_at, id) of the last loaded history image
+    _history_cursor: tuple[datetime, int] | None = None
 
     # -------------------------------------------------------------------------
     # Computed properties
@@ -246,9 +255,7 @@ class ImageGalleryState(rx.State):
         """
         if not generator_registry._loaded:  # noqa: SLF001
             await generator_registry.initialize()
-        user_session: UserSession = await self.get_state(UserSession)
-        roles = user_session.user.roles if user_session.user else []
-        self._refresh_generators(roles)
+        self._refresh_generators(await get_user_permissions(self))
 
     @rx.event(background=True)
     async def initialize(self) -> AsyncGenerator[Any, Any]:
@@ -262,14 +269,11 @@ class ImageGalleryState(rx.State):
             async for _ in self._load_images():
                 yield
 
-    def _refresh_generators(self, user_roles: list[str]) -> None:
+    def _refresh_generators(self, permissions: Permissions) -> None:
         """Refresh generator list from registry and validate selection."""
-        all_generators = generator_registry.list_generators()
-        self.generators = [
-            gen
-            for gen in all_generators
-            if not gen["required_role"] or gen["required_role"] in user_roles
-        ]
+        self.generators = permissions.filter_by_role(
+            generator_registry.list_generators(), lambda gen: gen["required_role"]
+        )
 
         valid_ids = {g["id"] for g in self.generators}
         if not self.generator or self.generator not in valid_ids:
@@ -287,9 +291,7 @@ class ImageGalleryState(rx.State):
         else:
             await generator_registry.reload()
 
-        user_session: UserSession = await self.get_state(UserSession)
-        roles = user_session.user.roles if user_session.user else []
-        self._refresh_generators(roles)
+        self._refresh_generators(await get_user_permissions(self))
 
     async def _load_images(self) -> AsyncGenerator[Any, Any]:  # noqa: PLR0915
         """Load images from database (internal)."""
@@ -310,7 +312,7 @@ class ImageGalleryState(rx.State):
                 self._initialized = False
                 self._current_user_id = current_user_id
                 self.images = []
-                self.history_images = []
+                self._reset_history()
                 yield
 
             if self._initialized:
@@ -326,7 +328,7 @@ class ImageGalleryState(rx.State):
             # Check authentication
             if not is_authenticated:
                 self.images = []
-                self.history_images = []
+                self._reset_history()
                 self._current_user_id = 0
                 self.loading_images = False
                 yield
@@ -340,29 +342,21 @@ class ImageGalleryState(rx.State):
             yield
             return
 
-        # Fetch images from database
+        # Fetch today's images for the grid; the history is loaded page by
+        # page when the drawer is opened
         try:
-            async with get_asyncdb_session() as session:
-                # Load today's images for grid
+            async with get_asyncdb_read_session(user_id) as session:
                 today_entities = await image_repo.find_today_by_user(session, user_id)
                 today_images = [
                     GeneratedImageModel.model_validate(img) for img in today_entities
                 ]
 
-                # Load all images for history
-                all_raw_entities = await image_repo.find_by_user(session, user_id)
-                all_images = [
-                    GeneratedImageModel.model_validate(img) for img in all_raw_entities
-                ]
-
             async with self:
                 self.images = today_images
-                self.history_images = all_images
                 self._initialized = True
                 logger.debug(
-                    "Loaded %d today's images, %d total for user %s",
+                    "Loaded %d today's images for user %s",
                     len(today_images),
-                    len(all_images),
                     user_id,
                 )
             yield
@@ -370,7 +364,6 @@ class ImageGalleryState(rx.State):
             logger.error("Error loading images: %s", e)
             async with self:
                 self.images = []
-                self.history_images = []
             yield
         finally:
             async with self:
@@ -400,38 +393,26 @@ class ImageGalleryState(rx.State):
             user_id = current_user_id
 
         try:
-            async with get_asyncdb_session() as session:
+            async with get_asyncdb_read_session(user_id) as session:
                 today_entities = await image_repo.find_today_by_user(session, user_id)
                 today_images = [
                     GeneratedImageModel.model_validate(img) for img in today_entities
                 ]
-                all_entities = await image_repo.find_by_user(session, user_id)
-                all_images = [
-                    GeneratedImageModel.model_validate(img) for img in all_entities
-                ]
 
             async with self:
                 # Re-check existing IDs under lock to avoid race with
                 # generate_images which may have prepended the same images
                 # between the initial snapshot and this merge.
                 current_today_ids = {img.id for img in self.images}
-                current_all_ids = {img.id for img in self.history_images}
-
                 new_today = [
                     img for img in today_images if img.id not in current_today_ids
                 ]
-                new_all = [img for img in all_images if img.id not in current_all_ids]
 
                 if new_today:
                     self.images = [*new_today, *self.images]
-                if new_all:
-                    self.history_images = [*new_all, *self.history_images]
-
-                if new_today or new_all:
                     logger.debug(
-                        "Merged %d new today images, %d new history images for user %s",
+                        "Merged %d new today images for user %s",
                         len(new_today),
-                        len(new_all),
                         user_id,
                     )
             yield
@@ -543,30 +524,6 @@ class ImageGalleryState(rx.State):
     # Image generation
     # -------------------------------------------------------------------------
 
-    async def _get_image_bytes(self, img_data: GeneratedImageData) -> bytes | None:
-        """Extract bytes from GeneratedImageData, fetching from URL if needed.
-
-        Args:
-            img_data: Generated image data with either bytes or external URL
-
-        Returns:
-            Raw image bytes or None if extraction failed
-        """
-        if img_data.image_bytes:
-            return img_data.image_bytes
-
-        if img_data.external_url:
-            try:
-                async with httpx.AsyncClient() as client:
-                    resp = await client.get(img_data.external_url, timeout=60.0)
-                    resp.raise_for_status()
-                    return resp.content
-            except httpx.HTTPError as e:
-                logger.error("Failed to fetch image from URL: %s", e)
-                return None
-
-        return None
-
     @rx.event(background=True)
     async def generate_images(  # noqa: PLR0911, PLR0912, PLR0915, C901
         self,
@@ -671,22 +628,10 @@ class ImageGalleryState(rx.State):
 
             # -- 5. Fetch reference images (if any) ----------------------
             if has_references:
-                reference_images: list[tuple[bytes, str]] = []
-                async with get_asyncdb_session() as session:
-                    for img_id in reference_ids:
-                        result = await image_repo.find_by_id(session, img_id)
-                        if result:
-                            reference_images.append(
-                                (
-                                    result.image_data,
-                                    result.content_type,
-                                )
-                            )
-                        else:
-                            logger.warning(
-                                "Reference image %d not found",
-                                img_id,
-                            )
+                async with get_asyncdb_read_session(user_id) as session:
+                    reference_images = await image_loader.load_references(
+                        session, reference_ids
+                    )
 
                 if not reference_images:
                     yield rx.toast.error(
@@ -729,8 +674,12 @@ class ImageGalleryState(rx.State):
             # -- 8. Save images to DB (resilient loop) -------------------
             enhanced_prompt = response.enhanced_prompt or full_prompt
             saved_count = 0
+            # Download images returned as URLs concurrently, not one per save
+            images_bytes = await image_loader.resolve(response.generated_images)
 
-            for img_data in response.generated_images:
+            for img_data, image_bytes in zip(
+                response.generated_images, images_bytes, strict=True
+            ):
                 # Check cancellation between images
                 async with self:
                     if self._generation_cancelled:
@@ -740,7 +689,6 @@ class ImageGalleryState(rx.State):
                         )
                         break
 
-                image_bytes = await self._get_image_bytes(img_data)
                 if not image_bytes:
                     logger.warning("Could not get bytes for generated image")
                     continue
@@ -773,6 +721,7 @@ class ImageGalleryState(rx.State):
                         )
                         saved_entity = await image_repo.create(session, new_image)
                         saved_image = GeneratedImageModel.model_validate(saved_entity)
+                    mark_user_write(user_id)
 
                     # Update in-memory state (short lock)
                     async with self:
@@ -975,6 +924,8 @@ class ImageGalleryState(rx.State):
                     skipped.append(f"{filename} (error: {e!s})")
                     logger.exception("Failed to process %s", filename)
 
+        if uploaded_ids:
+            mark_user_write(user_id)
         return uploaded_ids, skipped
 
     @staticmethod
@@ -1083,14 +1034,13 @@ class ImageGalleryState(rx.State):
             return
 
         try:
-            # Fetch image data from repository — read bytes inside the
-            # session so the lazy-loaded column is accessible.
+            # From the database row or the blob storage
             async with get_asyncdb_session() as session:
-                db_image = await image_repo.find_by_id(session, image_id)
-                if db_image is None:
-                    yield rx.toast.error("Bilddaten nicht gefunden", close_button=True)
-                    return
-                image_data = bytes(db_image.image_data)
+                result = await image_repo.find_image_data(session, image_id)
+            if result is None:
+                yield rx.toast.error("Bilddaten nicht gefunden", close_button=True)
+                return
+            image_data = result[0]
 
             filename = f"image_{image.id}.png"
             yield rx.download(data=image_data, filename=filename)
@@ -1109,31 +1059,56 @@ class ImageGalleryState(rx.State):
         if self.history_drawer_open:
             yield ImageGalleryState.load_history_images  # type: ignore[misc]
 
-    @rx.event(background=True)
-    async def load_history_images(self) -> AsyncGenerator[Any, Any]:
-        """Reload history images from database."""
+    def _reset_history(self) -> None:
+        """Forget the loaded history pages."""
+        self.history_images = []
+        self.has_more_history = False
+        self._history_cursor = None
+
+    async def _load_history_page(self, append: bool) -> AsyncGenerator[Any, Any]:
+        """Load the first history page, or the next one if ``append`` is set."""
         async with self:
             user_id = self._current_user_id
-        if not user_id:
-            return
+            if not user_id or self.loading_history:
+                return
+            if append and not self.has_more_history:
+                return
+            before = self._history_cursor if append else None
+            self.loading_history = True
+        yield
 
         try:
-            async with get_asyncdb_session() as session:
-                all_raw_entities = await image_repo.find_by_user(session, user_id)
-                all_images = [
-                    GeneratedImageModel.model_validate(img) for img in all_raw_entities
-                ]
+            async with get_asyncdb_read_session(user_id) as session:
+                # One extra row tells whether there is a next page
+                page = await image_repo.find_history_page(
+                    session, user_id, limit=HISTORY_PAGE_SIZE + 1, before=before
+                )
 
             async with self:
-                self.history_images = all_images
-                logger.debug(
-                    "Reloaded %d history images for user %s",
-                    len(all_images),
-                    user_id,
-                )
-            yield
+                self.has_more_history = len(page) > HISTORY_PAGE_SIZE
+                page = page[:HISTORY_PAGE_SIZE]
+                self.history_images = [*self.history_images, *page] if append else page
+                if page:
+                    self._history_cursor = (page[-1].created_at, page[-1].id)
+                logger.debug("Loaded %d history images for user %s", len(page), user_id)
         except Exception as e:
             logger.error("Error loading history images: %s", e)
+        finally:
+            async with self:
+                self.loading_history = False
+        yield
+
+    @rx.event(background=True)
+    async def load_history_images(self) -> AsyncGenerator[Any, Any]:
+        """Reload the first page of the history from the database."""
+        async for _ in self._load_history_page(append=False):
+            yield
+
+    @rx.event(background=True)
+    async def load_more_history_images(self) -> AsyncGenerator[Any, Any]:
+        """Append the next page of the history (infinite scroll)."""
+        async for _ in self._load_history_page(append=True):
+            yield
 
     @rx.event
     def close_history_drawer(self) -> None:
@@ -1157,6 +1132,8 @@ class ImageGalleryState(rx.State):
             logger.debug("Deleting image from database: %s", image_id)
             async with get_asyncdb_session() as session:
                 await image_repo.delete_by_id_and_user(session, int(image_id), user_id)
+            thumbnail_cache.discard(int(image_id))
+            mark_user_write(user_id)
 
             async with self:
                 # Remove from both lists
@@ -1,9 +1,14 @@
 """Pytest fixtures for appkit-imagecreator tests."""
 
 import base64
+import hashlib
+from collections.abc import Iterator
 from datetime import UTC, datetime
+from pathlib import Path
 from typing import Any
+from unittest.mock import patch
 
+import httpx
 import pytest
 import pytest_asyncio
 from faker import Faker
@@ -18,6 +23,8 @@ from appkit_imagecreator.backend.models import (
     ImageGeneratorModel,
 )
 from appkit_imagecreator.backend.repository import GeneratedImageRepository
+from appkit_imagecreator.backend.storage.filesystem import FilesystemBlobStorage
+from appkit_imagecreator.backend.storage.s3 import S3BlobStorage
 
 pytest_plugins = ["appkit_commons.testing"]
 
@@ -157,3 +164,64 @@ def sample_image_bytes() -> bytes:
     return base64.b64decode(
         "iVBORw0KGgoAAAANSUhEUgAAAAEAAAABCAYAAAAfFcSJAAAADUlEQVR42mNk+M9QDwADhgGAWjR9awAAAABJRU5ErkJggg=="
     )
+
+
+@pytest.fixture
+def blob_storage(tmp_path: Path) -> Iterator[FilesystemBlobStorage]:
+    """A filesystem blob storage configured as the process-wide storage."""
+    storage = FilesystemBlobStorage(tmp_path / "blobs")
+    with patch(
+        "appkit_imagecreator.backend.repository.get_blob_storage",
+        return_value=storage,
+    ):
+        yield storage
+
+
+class FakeS3:
+    """In-process S3 endpoint storing objects in a dict.
+
+    Rejects requests without a Signature Version 4 authorization or whose
+    payload hash does not match the body.
+    """
+
+    def __init__(self) -> None:
+        self.objects: dict[str, tuple[bytes, str]] = {}
+        self.requests: list[tuple[str, str]] = []
+
+    def handler(self, request: httpx.Request) -> httpx.Response:
+        self.requests.append((request.method, request.url.path))
+        authorization = request.headers.get("authorization", "")
+        payload_hash = request.headers.get("x-amz-content-sha256")
+        if not authorization.startswith("AWS4-HMAC-SHA256 Credential=key/"):
+            return httpx.Response(403)
+        if payload_hash != hashlib.sha256(request.content).hexdigest():
+            return httpx.Response(400)
+
+        path = request.url.path
+        if request.method == "PUT":
+            self.objects[path] = (request.content, request.headers["content-type"])
+            return httpx.Response(200)
+        if request.method == "DELETE":
+            self.objects.pop(path, None)
+            return httpx.Response(204)
+        if path not in self.objects:
+            return httpx.Response(404)
+        data, content_type = self.objects[path]
+        return httpx.Response(200, content=data, headers={"content-type": content_type})
+
+
+@pytest.fixture
+def fake_s3() -> FakeS3:
+    return FakeS3()
+
+
+@pytest.fixture
+def s3_storage(fake_s3: FakeS3) -> S3BlobStorage:
+    """An S3 blob storage backed by :class:`FakeS3`."""
+    return S3BlobStorage(
+        "http://s3.test",
+        "images",
+        "key",
+        "secret",
+        http_client=httpx.AsyncClient(transport=httpx.MockTransport(fake_s3.handler)),
+    )
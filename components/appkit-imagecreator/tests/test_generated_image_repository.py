@@ -1,10 +1,15 @@
 """Tests for GeneratedImageRepository."""
 
 from datetime import UTC, datetime, timedelta
+from unittest.mock import patch
 
 import pytest
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from appkit_imagecreator.backend.models import GeneratedImage, GeneratedImageModel
+from appkit_imagecreator.backend.storage.base import content_key
+
 
 class TestGeneratedImageRepository:
     """Test suite for GeneratedImageRepository."""
@@ -369,3 +374,289 @@ class TestGeneratedImageRepository:
         await async_session.refresh(user2_old)
         assert user1_old.is_deleted is True
         assert user2_old.is_deleted is True
+
+    @pytest.mark.asyncio
+    async def test_find_image_data_by_ids_skips_deleted_and_missing(
+        self, async_session: AsyncSession, generated_image_factory, image_repo
+    ) -> None:
+        """find_image_data_by_ids returns data of existing, active images."""
+        # Arrange
+        first = await generated_image_factory(content_type="image/webp")
+        second = await generated_image_factory()
+        deleted = await generated_image_factory(is_deleted=True)
+
+        # Act
+        result = await image_repo.find_image_data_by_ids(
+            async_session, [first.id, second.id, deleted.id, 9999]
+        )
+
+        # Assert
+        assert set(result) == {first.id, second.id}
+        assert result[first.id] == (first.image_data, "image/webp")
+        assert await image_repo.find_image_data_by_ids(async_session, []) == {}
+
+    @pytest.mark.asyncio
+    async def test_find_history_page_keyset(
+        self, async_session: AsyncSession, generated_image_factory, image_repo
+    ) -> None:
+        """find_history_page pages newest first after the (created_at, id) cursor."""
+        # Arrange
+        created = datetime(2026, 1, 1, tzinfo=UTC)
+        same_time = [await generated_image_factory() for _ in range(2)]
+        older = await generated_image_factory()
+        await generated_image_factory(is_deleted=True)
+        await generated_image_factory(user_id=2)
+        for image in same_time:
+            image.created_at = created
+        older.created_at = created - timedelta(days=1)
+        await async_session.flush()
+
+        # Act
+        first = await image_repo.find_history_page(async_session, 1, limit=2)
+        cursor = (first[-1].created_at, first[-1].id)
+        second = await image_repo.find_history_page(
+            async_session, 1, limit=2, before=cursor
+        )
+
+        # Assert
+        assert [img.id for img in first] == [same_time[1].id, same_time[0].id]
+        assert [img.id for img in second] == [older.id]
+        assert isinstance(first[0], GeneratedImageModel)
+        assert first[0].thumbnail_url.endswith(f"/{same_time[1].id}/thumbnail")
+
+
+class TestGeneratedImageRepositoryBlobStorage:
+    """Image data kept in a blob storage instead of the image rows."""
+
+    @pytest.mark.asyncio
+    async def test_create_writes_data_to_storage(
+        self, async_session: AsyncSession, image_repo, blob_storage
+    ) -> None:
+        """create moves the data to the storage and keeps only the key."""
+        # Arrange
+        image = GeneratedImage(
+            user_id=1,
+            prompt="a cat",
+            model="dall-e-3",
+            image_data=b"cat",
+            content_type="image/png",
+            width=1,
+            height=1,
+        )
+
+        # Act
+        created = await image_repo.create(async_session, image)
+
+        # Assert
+        assert created.storage_key == content_key(b"cat")
+        assert created.image_data == b""
+        assert await blob_storage.get(created.storage_key) == b"cat"
+        assert await image_repo.find_image_data(async_session, created.id) == (
+            b"cat",
+            "image/png",
+        )
+
+    @pytest.mark.asyncio
+    async def test_deleted_stored_image_is_not_found(
+        self, async_session: AsyncSession, image_repo, blob_storage
+    ) -> None:
+        """A deleted image keeps its key until cleanup, but is not served."""
+        # Arrange
+        image = GeneratedImage(
+            user_id=1,
+            prompt="a cat",
+            model="dall-e-3",
+            image_data=b"cat",
+            content_type="image/png",
+            width=1,
+            height=1,
+        )
+        created = await image_repo.create(async_session, image)
+
+        # Act
+        await image_repo.delete_by_id_and_user(async_session, created.id, user_id=1)
+
+        # Assert
+        assert await image_repo.find_stored_image(async_session, created.id) is None
+        assert await image_repo.find_image_data(async_session, created.id) is None
+
+    @pytest.mark.asyncio
+    async def test_find_image_data_by_ids_reads_storage(
+        self,
+        async_session: AsyncSession,
+        generated_image_factory,
+        image_repo,
+        blob_storage,
+    ) -> None:
+        """find_image_data_by_ids resolves stored and inline images alike."""
+        # Arrange
+        key = content_key(b"stored")
+        await blob_storage.put(key, b"stored", "image/png")
+        stored = await generated_image_factory(image_data=b"", storage_key=key)
+        inline = await generated_image_factory(image_data=b"inline")
+        lost = await generated_image_factory(
+            image_data=b"", storage_key=content_key(b"lost")
+        )
+
+        # Act
+        result = await image_repo.find_image_data_by_ids(
+            async_session, [stored.id, inline.id, lost.id]
+        )
+
+        # Assert
+        assert result == {
+            stored.id: (b"stored", "image/png"),
+            inline.id: (b"inline", "image/png"),
+        }
+
+    @pytest.mark.asyncio
+    async def test_move_to_storage_moves_inline_images(
+        self,
+        async_session: AsyncSession,
+        generated_image_factory,
+        image_repo,
+        blob_storage,
+    ) -> None:
+        """move_to_storage moves active inline images in batches."""
+        # Arrange
+        images = [
+            await generated_image_factory(image_data=f"image {i}".encode())
+            for i in range(3)
+        ]
+        await generated_image_factory(is_deleted=True, image_data=b"")
+
+        # Act
+        assert await image_repo.count_inline(async_session) == 3
+        first = await image_repo.move_to_storage(async_session, blob_storage, 2)
+        second = await image_repo.move_to_storage(async_session, blob_storage, 2)
+
+        # Assert
+        assert (first, second) == (2, 1)
+        assert await image_repo.count_inline(async_session) == 0
+        for i, image in enumerate(images):
+            await async_session.refresh(image)
+            assert image.image_data == b""
+            assert await blob_storage.get(image.storage_key) == f"image {i}".encode()
+
+    @pytest.mark.asyncio
+    async def test_move_to_storage_locks_keys_before_writing(
+        self,
+        async_session: AsyncSession,
+        generated_image_factory,
+        image_repo,
+        blob_storage,
+    ) -> None:
+        """A running blob cleanup of the same content is waited for."""
+        # Arrange
+        key = content_key(b"cat")
+        await blob_storage.put(key, b"cat", "image/png")
+        await generated_image_factory(storage_key=key, is_deleted=True)
+        image = await generated_image_factory(image_data=b"cat")
+        lock_rows = image_repo._lock_key_rows  # noqa: SLF001
+        released: list[int] = []
+
+        async def _release_blob_first(session: AsyncSession, keys: list) -> None:
+            # The cleanup holds the lock and finishes before the move goes on
+            if not released:
+                with patch.object(image_repo, "_lock_key_rows", lock_rows):
+                    released.append(
+                        await image_repo.delete_released_blobs(session, blob_storage)
+                    )
+            await lock_rows(session, keys)
+
+        # Act
+        with patch.object(image_repo, "_lock_key_rows", _release_blob_first):
+            moved = await image_repo.move_to_storage(async_session, blob_storage, 10)
+
+        # Assert
+        assert moved == 1
+        assert released == [1]
+        await async_session.refresh(image)
+        assert image.storage_key == key
+        assert await blob_storage.get(key) == b"cat"
+
+    @pytest.mark.asyncio
+    async def test_delete_released_blobs_keeps_shared_keys(
+        self,
+        async_session: AsyncSession,
+        generated_image_factory,
+        image_repo,
+        blob_storage,
+    ) -> None:
+        """Blobs still referenced by an active image are not deleted."""
+        # Arrange
+        shared, single = content_key(b"shared"), content_key(b"single")
+        await blob_storage.put(shared, b"shared", "image/png")
+        await blob_storage.put(single, b"single", "image/png")
+        deleted_shared = await generated_image_factory(
+            storage_key=shared, is_deleted=True
+        )
+        await generated_image_factory(storage_key=shared)
+        deleted_single = await generated_image_factory(
+            storage_key=single, is_deleted=True
+        )
+
+        # Act
+        deleted = await image_repo.delete_released_blobs(async_session, blob_storage)
+
+        # Assert
+        assert deleted == 1
+        assert await blob_storage.get(single) is None
+        assert await blob_storage.get(shared) == b"shared"
+        await async_session.refresh(deleted_single)
+        await async_session.refresh(deleted_shared)
+        assert deleted_single.storage_key is None
+        assert deleted_shared.storage_key == shared
+        assert await image_repo.delete_released_blobs(async_session, blob_storage) == 0
+
+    @pytest.mark.asyncio
+    async def test_delete_released_blobs_rechecks_after_locking(
+        self,
+        async_session: AsyncSession,
+        generated_image_factory,
+        image_repo,
+        blob_storage,
+    ) -> None:
+        """An identical image saved before the lock keeps the blob."""
+        # Arrange
+        key = content_key(b"cat")
+        await blob_storage.put(key, b"cat", "image/png")
+        await generated_image_factory(storage_key=key, is_deleted=True)
+        lock_rows = image_repo._lock_key_rows  # noqa: SLF001
+
+        async def _save_identical_image(session: AsyncSession, keys: list) -> None:
+            await generated_image_factory(storage_key=key)
+            await lock_rows(session, keys)
+
+        # Act
+        with patch.object(image_repo, "_lock_key_rows", _save_identical_image):
+            deleted = await image_repo.delete_released_blobs(
+                async_session, blob_storage
+            )
+
+        # Assert
+        assert deleted == 0
+        assert await blob_storage.get(key) == b"cat"
+
+    @pytest.mark.asyncio
+    async def test_create_writes_no_blob_if_insert_fails(
+        self, async_session: AsyncSession, image_repo, blob_storage
+    ) -> None:
+        """The blob is only written once the row is inserted."""
+        # Arrange
+        image = GeneratedImage(
+            user_id=1,
+            prompt="a cat",
+            model=None,
+            image_data=b"cat",
+            content_type="image/png",
+            width=1,
+            height=1,
+        )
+
+        # Act
+        with pytest.raises(IntegrityError):
+            await image_repo.create(async_session, image)
+
+        # Assert
+        assert await blob_storage.get(content_key(b"cat")) is None
@@ -1,18 +1,29 @@
 # ruff: noqa: ARG002, SLF001, S105, S106
 """Tests for image_api FastAPI router.
 
-Covers GET /api/images/{image_id} — found and not-found paths.
+Covers GET /api/images/{image_id} — found and not-found paths, and data
+kept in the blob storage — and GET /api/images/{image_id}/thumbnail.
 """
 
 from __future__ import annotations
 
+import io
 from unittest.mock import AsyncMock, patch
 
 import pytest
 from fastapi import FastAPI
 from httpx import ASGITransport, AsyncClient
+from PIL import Image
 
-from appkit_imagecreator.backend.image_api import router
+from appkit_imagecreator.backend.image_api import (
+    ThumbnailCache,
+    router,
+    thumbnail_cache,
+)
+from appkit_imagecreator.backend.repository import StoredImage
+from appkit_imagecreator.backend.storage.base import content_key
+from appkit_imagecreator.backend.storage.filesystem import FilesystemBlobStorage
+from appkit_imagecreator.backend.storage.s3 import S3BlobStorage
 
 _PATCH = "appkit_imagecreator.backend.image_api"
 
@@ -47,7 +58,9 @@ class TestGetImage:
             ),
             patch(f"{_PATCH}.image_repo") as repo,
         ):
-            repo.find_image_data = AsyncMock(return_value=(image_bytes, content_type))
+            repo.find_stored_image = AsyncMock(
+                return_value=StoredImage(image_bytes, content_type, None)
+            )
 
             transport = ASGITransport(app=_app)
             async with AsyncClient(
@@ -71,7 +84,7 @@ class TestGetImage:
             ),
             patch(f"{_PATCH}.image_repo") as repo,
         ):
-            repo.find_image_data = AsyncMock(return_value=None)
+            repo.find_stored_image = AsyncMock(return_value=None)
 
             transport = ASGITransport(app=_app)
             async with AsyncClient(
@@ -93,7 +106,9 @@ class TestGetImage:
             ),
             patch(f"{_PATCH}.image_repo") as repo,
         ):
-            repo.find_image_data = AsyncMock(return_value=(b"data", "image/jpeg"))
+            repo.find_stored_image = AsyncMock(
+                return_value=StoredImage(b"data", "image/jpeg", None)
+            )
 
             transport = ASGITransport(app=_app)
             async with AsyncClient(
@@ -117,7 +132,9 @@ class TestGetImage:
             ),
             patch(f"{_PATCH}.image_repo") as repo,
         ):
-            repo.find_image_data = AsyncMock(return_value=(b"data", "image/jpeg"))
+            repo.find_stored_image = AsyncMock(
+                return_value=StoredImage(b"data", "image/jpeg", None)
+            )
 
             transport = ASGITransport(app=_app)
             async with AsyncClient(
@@ -130,3 +147,181 @@ class TestGetImage:
         assert resp.headers.get("content-disposition", "") == (
             'attachment; filename="image_42.png"'
         )
+
+
+class TestGetImageFromBlobStorage:
+    async def _get(self, storage, key: str, query: str = ""):
+        with (
+            patch(f"{_PATCH}.get_asyncdb_session", return_value=_db_context()),
+            patch(f"{_PATCH}.image_repo") as repo,
+            patch(f"{_PATCH}.get_blob_storage", return_value=storage),
+        ):
+            repo.find_stored_image = AsyncMock(
+                return_value=StoredImage(b"", "image/png", key)
+            )
+            async with AsyncClient(
+                transport=ASGITransport(app=_app), base_url="http://test"
+            ) as client:
+                return await client.get(f"/api/images/7{query}")
+
+    @pytest.mark.asyncio
+    async def test_streams_blob(self, tmp_path) -> None:
+        storage = FilesystemBlobStorage(tmp_path)
+        data = b"\x89PNG" * 50_000
+        key = content_key(data)
+        await storage.put(key, data, "image/png")
+
+        resp = await self._get(storage, key)
+
+        assert resp.status_code == 200
+        assert resp.content == data
+        assert resp.headers["content-type"] == "image/png"
+        assert resp.headers["etag"] == f'"{key.rsplit("/", 1)[-1]}"'
+
+    @pytest.mark.asyncio
+    async def test_missing_blob(self, tmp_path) -> None:
+        resp = await self._get(FilesystemBlobStorage(tmp_path), content_key(b"gone"))
+
+        assert resp.status_code == 404
+
+    @pytest.mark.asyncio
+    async def test_no_storage_configured(self) -> None:
+        resp = await self._get(None, content_key(b"data"))
+
+        assert resp.status_code == 404
+
+    @pytest.mark.asyncio
+    async def test_redirects_to_presigned_url(self) -> None:
+        storage = S3BlobStorage(
+            "http://minio:9000",
+            "images",
+            "key",
+            "secret",
+            public_url="https://files.example.com",
+            presign_seconds=600,
+        )
+        key = content_key(b"data")
+
+        resp = await self._get(storage, key)
+
+        assert resp.status_code == 307
+        assert resp.headers["location"].startswith(
+            f"https://files.example.com/images/{key}?X-Amz-Algorithm="
+        )
+        assert resp.headers["cache-control"] == "private, max-age=300"
+
+    @pytest.mark.asyncio
+    async def test_attachment_is_not_redirected(self, tmp_path) -> None:
+        storage = FilesystemBlobStorage(tmp_path)
+        storage.presign_seconds = 600
+        key = content_key(b"data")
+        await storage.put(key, b"data", "image/png")
+
+        resp = await self._get(storage, key, "?content_disposition=attachment")
+
+        assert resp.status_code == 200
+        assert resp.content == b"data"
+
+
+def _png(width: int, height: int) -> bytes:
+    buffer = io.BytesIO()
+    Image.new("P", (width, height)).save(buffer, format="PNG")
+    return buffer.getvalue()
+
+
+class TestGetThumbnail:
+    @pytest.fixture(autouse=True)
+    def _empty_cache(self):
+        thumbnail_cache.clear()
+        yield
+        thumbnail_cache.clear()
+
+    async def _get(
+        self, found: tuple[bytes, str] | None, repo_calls: list | None = None
+    ):
+        with (
+            patch(f"{_PATCH}.get_asyncdb_session", return_value=_db_context()),
+            patch(f"{_PATCH}.image_repo") as repo,
+        ):
+            repo.find_image_data = AsyncMock(return_value=found)
+            async with AsyncClient(
+                transport=ASGITransport(app=_app), base_url="http://test"
+            ) as client:
+                response = await client.get("/api/images/1/thumbnail")
+            if repo_calls is not None:
+                repo_calls.append(repo.find_image_data.await_count)
+            return response
+
+    @pytest.mark.asyncio
+    async def test_scales_image_down(self) -> None:
+        resp = await self._get((_png(1024, 512), "image/png"))
+
+        assert resp.status_code == 200
+        assert resp.headers["content-type"] == "image/webp"
+        assert "max-age=31536000" in resp.headers["cache-control"]
+        assert Image.open(io.BytesIO(resp.content)).size == (256, 128)
+
+    @pytest.mark.asyncio
+    async def test_undecodable_image_served_unchanged(self) -> None:
+        resp = await self._get((b"not an image", "image/png"))
+
+        assert resp.status_code == 200
+        assert resp.content == b"not an image"
+        assert resp.headers["content-type"] == "image/png"
+
+    @pytest.mark.asyncio
+    async def test_not_found(self) -> None:
+        resp = await self._get(None)
+
+        assert resp.status_code == 404
+
+    @pytest.mark.asyncio
+    async def test_preview_served_from_cache(self) -> None:
+        calls: list[int] = []
+        first = await self._get((_png(1024, 512), "image/png"), calls)
+        second = await self._get(None, calls)
+
+        assert calls == [1, 0]
+        assert second.status_code == 200
+        assert second.content == first.content
+        assert second.headers["content-type"] == "image/webp"
+
+    @pytest.mark.asyncio
+    async def test_decompression_bomb_served_unchanged(self) -> None:
+        data = _png(1024, 512)
+
+        with patch.object(Image, "MAX_IMAGE_PIXELS", 1000):
+            resp = await self._get((data, "image/png"))
+
+        assert resp.status_code == 200
+        assert resp.content == data
+        assert thumbnail_cache.get(1) is None
+
+
+class TestThumbnailCache:
+    def test_evicts_least_recently_used_by_size(self) -> None:
+        cache = ThumbnailCache(max_bytes=10)
+        cache.put(1, b"aaaa")
+        cache.put(2, b"bbbb")
+        cache.get(1)
+        cache.put(3, b"cccc")
+
+        assert cache.get(2) is None
+        assert cache.get(1) == b"aaaa"
+        assert cache.get(3) == b"cccc"
+
+    def test_discard(self) -> None:
+        cache = ThumbnailCache(max_bytes=10)
+        cache.put(1, b"aaaa")
+        cache.discard(1)
+        cache.discard(2)
+        cache.put(2, b"bbbbbbbbbb")
+
+        assert cache.get(1) is None
+        assert cache.get(2) == b"bbbbbbbbbb"
+
+    def test_skips_oversized_entries(self) -> None:
+        cache = ThumbnailCache(max_bytes=2)
+        cache.put(1, b"abc")
+
+        assert cache.get(1) is None
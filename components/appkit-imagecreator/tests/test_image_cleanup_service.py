@@ -159,7 +159,7 @@ class TestImageCleanupService:
         mock_repo: MagicMock,
         mock_get_session: MagicMock,
     ) -> None:
-        """execute catches and logs exceptions."""
+        """execute logs and re-raises exceptions."""
         # Arrange
         config = ImageGeneratorConfig(cleanup_days_threshold=30)
         service = ImageCleanupService(config=config)
@@ -169,8 +169,9 @@ class TestImageCleanupService:
         error = Exception("Database connection failed")
         mock_repo.delete_by_older_than_days = AsyncMock(side_effect=error)
 
-        # Act - should not raise
-        await service.execute()
+        # Act
+        with pytest.raises(Exception, match="Database connection failed"):
+            await service.execute()
 
         # Assert
         mock_logger.error.assert_called_once_with("Image cleanup job failed: %s", error)
@@ -250,3 +251,33 @@ class TestImageCleanupService:
 
         # Assert
         assert service1.name == service2.name == "Clean up old generated images"
+
+    @pytest.mark.asyncio
+    @patch(
+        "appkit_imagecreator.backend.services.image_cleanup_service.get_blob_storage"
+    )
+    @patch(
+        "appkit_imagecreator.backend.services.image_cleanup_service.get_asyncdb_session"
+    )
+    @patch("appkit_imagecreator.backend.services.image_cleanup_service.image_repo")
+    async def test_execute_deletes_released_blobs(
+        self,
+        mock_repo: MagicMock,
+        mock_get_session: MagicMock,
+        mock_get_storage: MagicMock,
+    ) -> None:
+        """execute deletes the blobs no active image references anymore."""
+        # Arrange
+        service = ImageCleanupService(config=ImageGeneratorConfig())
+        mock_session = AsyncMock(spec=AsyncSession)
+        mock_get_session.return_value.__aenter__.return_value = mock_session
+        mock_repo.delete_by_older_than_days = AsyncMock(return_value=2)
+        mock_repo.delete_released_blobs = AsyncMock(return_value=2)
+
+        # Act
+        await service.execute()
+
+        # Assert
+        mock_repo.delete_released_blobs.assert_awaited_once_with(
+            mock_session, mock_get_storage.return_value
+        )
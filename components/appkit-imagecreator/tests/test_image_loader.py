@@ -0,0 +1,123 @@
+"""Tests for ImageLoader."""
+
+import asyncio
+
+import httpx
+import pytest
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from appkit_imagecreator.backend.image_loader import ImageLoader, ImageTooLargeError
+from appkit_imagecreator.backend.models import GeneratedImageData
+
+
+def _loader(handler, **kwargs) -> ImageLoader:
+    return ImageLoader(
+        http_client=httpx.AsyncClient(transport=httpx.MockTransport(handler)),
+        **kwargs,
+    )
+
+
+class TestFetch:
+    @pytest.mark.asyncio
+    async def test_fetch_url(self) -> None:
+        loader = _loader(lambda _: httpx.Response(200, content=b"image"))
+
+        assert await loader.fetch_url("https://img.test/a.png") == b"image"
+
+    @pytest.mark.asyncio
+    async def test_fetch_url_aborts_at_size_cap(self) -> None:
+        loader = _loader(
+            lambda _: httpx.Response(200, content=b"x" * 100), max_bytes=10
+        )
+
+        with pytest.raises(ImageTooLargeError):
+            await loader.fetch_url("https://img.test/big.png")
+
+    @pytest.mark.asyncio
+    async def test_streamed_download_aborts_at_size_cap(self) -> None:
+        chunks_sent = 0
+
+        async def chunks():
+            nonlocal chunks_sent
+            for _ in range(100):
+                chunks_sent += 1
+                yield b"x" * 4
+
+        loader = _loader(lambda _: httpx.Response(200, content=chunks()), max_bytes=10)
+
+        with pytest.raises(ImageTooLargeError):
+            await loader.fetch_url("https://img.test/big.png")
+        assert chunks_sent < 100
+
+    @pytest.mark.asyncio
+    async def test_fetch_urls_deduplicates_and_maps_failures(self) -> None:
+        requested: list[str] = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            requested.append(request.url.path)
+            if request.url.path == "/bad.png":
+                return httpx.Response(500)
+            return httpx.Response(200, content=request.url.path.encode())
+
+        loader = _loader(handler)
+        result = await loader.fetch_urls(
+            ["https://img.test/a.png", "https://img.test/bad.png"] * 2
+        )
+
+        assert result == {
+            "https://img.test/a.png": b"/a.png",
+            "https://img.test/bad.png": None,
+        }
+        assert sorted(requested) == ["/a.png", "/bad.png"]
+
+    @pytest.mark.asyncio
+    async def test_fetch_urls_limits_concurrency(self) -> None:
+        running = 0
+        peak = 0
+
+        async def handler(request: httpx.Request) -> httpx.Response:
+            nonlocal running, peak
+            running += 1
+            peak = max(peak, running)
+            await asyncio.sleep(0.01)
+            running -= 1
+            return httpx.Response(200, content=b"image")
+
+        loader = _loader(handler, max_concurrency=2)
+        await loader.fetch_urls([f"https://img.test/{i}.png" for i in range(6)])
+
+        assert peak == 2
+
+
+class TestResolve:
+    @pytest.mark.asyncio
+    async def test_uses_bytes_and_downloads_urls(self) -> None:
+        loader = _loader(lambda _: httpx.Response(200, content=b"fetched"))
+
+        result = await loader.resolve(
+            [
+                GeneratedImageData(image_bytes=b"inline"),
+                GeneratedImageData(external_url="https://img.test/a.png"),
+                GeneratedImageData(),
+            ]
+        )
+
+        assert result == [b"inline", b"fetched", None]
+
+
+class TestLoadReferences:
+    @pytest.mark.asyncio
+    async def test_loads_in_order_once_per_id(
+        self, async_session: AsyncSession, generated_image_factory
+    ) -> None:
+        first = await generated_image_factory(content_type="image/png")
+        second = await generated_image_factory(content_type="image/jpeg")
+
+        references = await ImageLoader().load_references(
+            async_session, [second.id, first.id, second.id, 9999]
+        )
+
+        assert [content_type for _, content_type in references] == [
+            "image/jpeg",
+            "image/png",
+        ]
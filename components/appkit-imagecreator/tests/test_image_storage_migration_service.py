@@ -0,0 +1,93 @@
+"""Tests for ImageStorageMigrationService."""
+
+from datetime import timedelta
+from pathlib import Path
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from appkit_commons.scheduler import IntervalTrigger
+from appkit_imagecreator.backend.services.image_storage_migration_service import (
+    ImageStorageMigrationService,
+)
+from appkit_imagecreator.backend.storage.filesystem import FilesystemBlobStorage
+from appkit_imagecreator.configuration import ImageStorageConfig
+
+_PATCH = "appkit_imagecreator.backend.services.image_storage_migration_service"
+
+
+class TestImageStorageMigrationService:
+    """Test suite for ImageStorageMigrationService."""
+
+    def test_trigger_uses_configured_interval(self) -> None:
+        """trigger runs at the configured interval."""
+        service = ImageStorageMigrationService(
+            config=ImageStorageConfig(migration_interval_minutes=5)
+        )
+
+        assert isinstance(service.trigger, IntervalTrigger)
+        assert service.trigger.interval == timedelta(minutes=5)
+        assert service.job_id == "image_storage_migration"
+
+    @pytest.mark.asyncio
+    async def test_execute_without_storage_does_nothing(self) -> None:
+        """Without a blob storage no image is touched."""
+        with (
+            patch(f"{_PATCH}.get_blob_storage", return_value=None),
+            patch(f"{_PATCH}.image_repo") as mock_repo,
+        ):
+            service = ImageStorageMigrationService(config=ImageStorageConfig())
+
+            assert await service.execute() == 0
+            mock_repo.move_to_storage.assert_not_called()
+
+    @pytest.mark.asyncio
+    @patch(f"{_PATCH}.get_asyncdb_session")
+    @patch(f"{_PATCH}.image_repo")
+    async def test_execute_moves_images_in_batches(
+        self, mock_repo: MagicMock, mock_get_session: MagicMock, tmp_path: Path
+    ) -> None:
+        """execute moves batches until one is not full."""
+        # Arrange
+        storage = FilesystemBlobStorage(tmp_path)
+        service = ImageStorageMigrationService(
+            config=ImageStorageConfig(migration_batch_size=2), storage=storage
+        )
+        mock_session = AsyncMock(spec=AsyncSession)
+        mock_get_session.return_value.__aenter__.return_value = mock_session
+        mock_repo.move_to_storage = AsyncMock(side_effect=[2, 1])
+
+        # Act
+        moved = await service.execute()
+
+        # Assert
+        assert moved == 3
+        assert service.last_run.complete is True
+        assert service.last_run.batches == 2
+        mock_repo.move_to_storage.assert_awaited_with(mock_session, storage, 2)
+
+    @pytest.mark.asyncio
+    @patch(f"{_PATCH}.get_asyncdb_session")
+    @patch(f"{_PATCH}.image_repo")
+    async def test_execute_reports_images_left_after_budget(
+        self, mock_repo: MagicMock, mock_get_session: MagicMock, tmp_path: Path
+    ) -> None:
+        """When the time budget is used up, the remaining images are counted."""
+        # Arrange
+        service = ImageStorageMigrationService(
+            config=ImageStorageConfig(migration_time_budget_seconds=0),
+            storage=FilesystemBlobStorage(tmp_path),
+        )
+        mock_get_session.return_value.__aenter__.return_value = AsyncMock()
+        mock_repo.move_to_storage = AsyncMock()
+        mock_repo.count_inline = AsyncMock(return_value=7)
+
+        # Act
+        moved = await service.execute()
+
+        # Assert
+        assert moved == 0
+        assert service.last_run.complete is False
+        assert service.last_run.remaining == 7
+        mock_repo.move_to_storage.assert_not_awaited()
@@ -14,7 +14,6 @@ from datetime import date as date_type
 from typing import Any
 from unittest.mock import AsyncMock, MagicMock, patch
 
-import httpx
 import pytest
 
 from appkit_imagecreator.backend.models import (
@@ -30,6 +29,7 @@ from appkit_imagecreator.state import (
     SIZE_OPTIONS,
     ImageGalleryState,
 )
+from appkit_user.authentication.backend.permissions import NO_PERMISSIONS, Permissions
 
 # ---------------------------------------------------------------------------
 # Helpers
@@ -89,7 +89,8 @@ class _StubImageGallery:
     _is_image_selected = ImageGalleryState._is_image_selected
     _refresh_generators = ImageGalleryState._refresh_generators
     _auto_select_uploaded_images = ImageGalleryState._auto_select_uploaded_images
-    _get_image_bytes = ImageGalleryState._get_image_bytes
+    _reset_history = ImageGalleryState._reset_history
+    _load_history_page = ImageGalleryState._load_history_page
 
     # staticmethod must stay static — use staticmethod() wrapper
     _format_date_label = staticmethod(ImageGalleryState._format_date_label)
@@ -98,6 +99,9 @@ class _StubImageGallery:
     def __init__(self) -> None:
         self.images: list[GeneratedImageModel] = []
         self.history_images: list[GeneratedImageModel] = []
+        self.has_more_history = False
+        self.loading_history = False
+        self._history_cursor: tuple[datetime, int] | None = None
         self.loading_images = False
         self.is_uploading = False
         self.is_generating = False
@@ -710,62 +714,6 @@ class TestFormatDateLabel:
         assert "2025" in result
 
 
-# ===========================================================================
-# _get_image_bytes (async)
-# ===========================================================================
-class TestGetImageBytes:
-    @pytest.mark.asyncio
-    async def test_returns_bytes_directly(self) -> None:
-        s = _StubImageGallery()
-        img_data = GeneratedImageData(image_bytes=b"hello", content_type="image/png")
-        result = await ImageGalleryState._get_image_bytes(s, img_data)
-        assert result == b"hello"
-
-    @pytest.mark.asyncio
-    async def test_returns_none_no_data(self) -> None:
-        s = _StubImageGallery()
-        img_data = GeneratedImageData()
-        result = await ImageGalleryState._get_image_bytes(s, img_data)
-        assert result is None
-
-    @pytest.mark.asyncio
-    @patch("appkit_imagecreator.state.httpx.AsyncClient")
-    async def test_fetches_from_url(self, mock_client_cls) -> None:
-        s = _StubImageGallery()
-        mock_resp = MagicMock()
-        mock_resp.content = b"fetched-bytes"
-        mock_resp.raise_for_status = MagicMock()
-
-        mock_client = AsyncMock()
-        mock_client.get = AsyncMock(return_value=mock_resp)
-        mock_client.__aenter__ = AsyncMock(return_value=mock_client)
-        mock_client.__aexit__ = AsyncMock(return_value=False)
-        mock_client_cls.return_value = mock_client
-
-        img_data = GeneratedImageData(
-            external_url="https://example.com/img.png",
-            content_type="image/png",
-        )
-        result = await ImageGalleryState._get_image_bytes(s, img_data)
-        assert result == b"fetched-bytes"
-
-    @pytest.mark.asyncio
-    @patch("appkit_imagecreator.state.httpx.AsyncClient")
-    async def test_fetch_url_error(self, mock_client_cls) -> None:
-        s = _StubImageGallery()
-        mock_client = AsyncMock()
-        mock_client.get = AsyncMock(side_effect=httpx.HTTPError("fail"))
-        mock_client.__aenter__ = AsyncMock(return_value=mock_client)
-        mock_client.__aexit__ = AsyncMock(return_value=False)
-        mock_client_cls.return_value = mock_client
-
-        img_data = GeneratedImageData(
-            external_url="https://example.com/bad.png",
-        )
-        result = await ImageGalleryState._get_image_bytes(s, img_data)
-        assert result is None
-
-
 # ===========================================================================
 # _validate_upload_file (static)
 # ===========================================================================
@@ -863,7 +811,7 @@ class TestRefreshGenerators:
             {"id": "g2", "label": "Gen 2", "required_role": "admin"},
             {"id": "g3", "label": "Gen 3", "required_role": "user"},
         ]
-        ImageGalleryState._refresh_generators(s, ["user"])
+        ImageGalleryState._refresh_generators(s, Permissions(frozenset({"user"})))
         assert len(s.generators) == 2
         ids = {g["id"] for g in s.generators}
         assert "g1" in ids
@@ -878,7 +826,7 @@ class TestRefreshGenerators:
             {"id": "g1", "label": "1", "required_role": ""},
             {"id": "g2", "label": "2", "required_role": ""},
         ]
-        ImageGalleryState._refresh_generators(s, [])
+        ImageGalleryState._refresh_generators(s, NO_PERMISSIONS)
         assert s.generator == "g2"
 
     @patch("appkit_imagecreator.state.generator_registry")
@@ -888,14 +836,14 @@ class TestRefreshGenerators:
         mock_reg.list_generators.return_value = [
             {"id": "g1", "label": "1", "required_role": ""},
         ]
-        ImageGalleryState._refresh_generators(s, [])
+        ImageGalleryState._refresh_generators(s, NO_PERMISSIONS)
         assert s.generator == "g1"
 
     @patch("appkit_imagecreator.state.generator_registry")
     def test_no_generators(self, mock_reg) -> None:
         s = _StubImageGallery()
         mock_reg.list_generators.return_value = []
-        ImageGalleryState._refresh_generators(s, [])
+        ImageGalleryState._refresh_generators(s, NO_PERMISSIONS)
         assert s.generators == []
         assert s.generator == ""
 
@@ -922,36 +870,34 @@ class TestClearGridView:
 # ===========================================================================
 class TestInitGenerators:
     @pytest.mark.asyncio
+    @patch("appkit_imagecreator.state.get_user_permissions")
     @patch("appkit_imagecreator.state.generator_registry")
-    async def test_loads_generators(self, mock_reg) -> None:
+    async def test_loads_generators(self, mock_reg, mock_permissions) -> None:
         s = _StubImageGallery()
         mock_reg._loaded = False
         mock_reg.initialize = AsyncMock()
         mock_reg.list_generators.return_value = [
             {"id": "g1", "label": "Gen 1", "required_role": ""},
+            {"id": "g2", "label": "Gen 2", "required_role": "admin"},
+            {"id": "g3", "label": "Gen 3", "required_role": "other"},
         ]
-
-        mock_user = MagicMock()
-        mock_user.user = MagicMock()
-        mock_user.user.roles = ["admin"]
-        s._mock_user_session = mock_user
+        mock_permissions.return_value = Permissions(frozenset({"admin"}))
 
         fn = _unwrap("init_generators")
         await fn(s)
         mock_reg.initialize.assert_awaited_once()
-        assert len(s.generators) == 1
+        mock_permissions.assert_awaited_once_with(s)
+        assert [g["id"] for g in s.generators] == ["g1", "g2"]
 
     @pytest.mark.asyncio
+    @patch("appkit_imagecreator.state.get_user_permissions")
     @patch("appkit_imagecreator.state.generator_registry")
-    async def test_skips_init_if_loaded(self, mock_reg) -> None:
+    async def test_skips_init_if_loaded(self, mock_reg, mock_permissions) -> None:
         s = _StubImageGallery()
         mock_reg._loaded = True
         mock_reg.initialize = AsyncMock()
         mock_reg.list_generators.return_value = []
-
-        mock_user = MagicMock()
-        mock_user.user = None
-        s._mock_user_session = mock_user
+        mock_permissions.return_value = NO_PERMISSIONS
 
         fn = _unwrap("init_generators")
         await fn(s)
@@ -1150,7 +1096,7 @@ class TestDownloadImage:
         mock_sess = AsyncMock()
         mock_session.return_value.__aenter__ = AsyncMock(return_value=mock_sess)
         mock_session.return_value.__aexit__ = AsyncMock(return_value=False)
-        mock_repo.find_by_id = AsyncMock(return_value=None)
+        mock_repo.find_image_data = AsyncMock(return_value=None)
 
         fn = _unwrap("download_image")
         results = [r async for r in fn(s, 10)]
@@ -1164,18 +1110,87 @@ class TestDownloadImage:
         img = _make_image(10)
         s.images = [img]
 
-        mock_db_image = MagicMock()
-        mock_db_image.image_data = b"raw-image-data"
-
         mock_sess = AsyncMock()
         mock_session.return_value.__aenter__ = AsyncMock(return_value=mock_sess)
         mock_session.return_value.__aexit__ = AsyncMock(return_value=False)
-        mock_repo.find_by_id = AsyncMock(return_value=mock_db_image)
+        mock_repo.find_image_data = AsyncMock(
+            return_value=(b"raw-image-data", "image/png")
+        )
 
         fn = _unwrap("download_image")
         results = [r async for r in fn(s, 10)]
         # Should yield rx.download
         assert len(results) >= 1
+        mock_repo.find_image_data.assert_awaited_once_with(mock_sess, 10)
+
+
+# ===========================================================================
+# History pages (background tasks, async generators)
+# ===========================================================================
+def _history_page(*ids: int) -> list[GeneratedImageModel]:
+    return [
+        _make_image(i, created_at=datetime(2025, 1, 15, 12, i, tzinfo=UTC)) for i in ids
+    ]
+
+
+class TestHistoryPages:
+    @pytest.mark.asyncio
+    @patch("appkit_imagecreator.state.HISTORY_PAGE_SIZE", 2)
+    @patch("appkit_imagecreator.state.get_asyncdb_read_session")
+    @patch("appkit_imagecreator.state.image_repo")
+    async def test_first_page(self, mock_repo, mock_session) -> None:
+        s = _StubImageGallery()
+        s._current_user_id = 42
+        s.history_images = [_make_image(99)]
+        mock_sess = AsyncMock()
+        mock_session.return_value.__aenter__ = AsyncMock(return_value=mock_sess)
+        mock_session.return_value.__aexit__ = AsyncMock(return_value=False)
+        mock_repo.find_history_page = AsyncMock(return_value=_history_page(9, 8, 7))
+
+        [r async for r in _unwrap("load_history_images")(s)]
+
+        assert [img.id for img in s.history_images] == [9, 8]
+        assert s.has_more_history is True
+        assert s.loading_history is False
+        assert s._history_cursor == (s.history_images[-1].created_at, 8)
+        mock_repo.find_history_page.assert_awaited_once_with(
+            mock_sess, 42, limit=3, before=None
+        )
+
+    @pytest.mark.asyncio
+    @patch("appkit_imagecreator.state.HISTORY_PAGE_SIZE", 2)
+    @patch("appkit_imagecreator.state.get_asyncdb_read_session")
+    @patch("appkit_imagecreator.state.image_repo")
+    async def test_load_more_appends_after_cursor(
+        self, mock_repo, mock_session
+    ) -> None:
+        s = _StubImageGallery()
+        s._current_user_id = 42
+        s.history_images = _history_page(9, 8)
+        s.has_more_history = True
+        cursor = (s.history_images[-1].created_at, 8)
+        s._history_cursor = cursor
+        mock_session.return_value.__aenter__ = AsyncMock(return_value=AsyncMock())
+        mock_session.return_value.__aexit__ = AsyncMock(return_value=False)
+        mock_repo.find_history_page = AsyncMock(return_value=_history_page(7))
+
+        [r async for r in _unwrap("load_more_history_images")(s)]
+
+        assert [img.id for img in s.history_images] == [9, 8, 7]
+        assert s.has_more_history is False
+        _, kwargs = mock_repo.find_history_page.await_args
+        assert kwargs["before"] == cursor
+
+    @pytest.mark.asyncio
+    @patch("appkit_imagecreator.state.image_repo")
+    async def test_load_more_without_more_pages(self, mock_repo) -> None:
+        s = _StubImageGallery()
+        s._current_user_id = 42
+        mock_repo.find_history_page = AsyncMock()
+
+        [r async for r in _unwrap("load_more_history_images")(s)]
+
+        mock_repo.find_history_page.assert_not_awaited()
 
 
 # ===========================================================================
@@ -1208,11 +1223,13 @@ class TestDeleteImageFromDb:
         mock_repo.delete_by_id_and_user = AsyncMock()
 
         fn = _unwrap("delete_image_from_db")
-        [r async for r in fn(s, "5")]
+        with patch("appkit_imagecreator.state.thumbnail_cache") as cache:
+            [r async for r in fn(s, "5")]
         assert len(s.images) == 0
         assert len(s.history_images) == 0
         assert s.deleting_image_id == 0
         mock_repo.delete_by_id_and_user.assert_awaited_once_with(mock_sess, 5, 42)
+        cache.discard.assert_called_once_with(5)
 
     @pytest.mark.asyncio
     @patch("appkit_imagecreator.state.get_asyncdb_session")
@@ -148,18 +148,27 @@ class TestProcessResponseImages:
         gen = _gen()
         img = SimpleNamespace(b64_json=None, url="https://img.test/a.png")
 
-        mock_resp = MagicMock()
-        mock_resp.content = b"downloaded"
-        mock_resp.raise_for_status = MagicMock()
-
-        with patch("httpx.AsyncClient") as mock_client_cls:
-            ctx = AsyncMock()
-            ctx.get = AsyncMock(return_value=mock_resp)
-            mock_client_cls.return_value.__aenter__ = AsyncMock(return_value=ctx)
-            mock_client_cls.return_value.__aexit__ = AsyncMock(return_value=False)
+        with patch(
+            "appkit_imagecreator.backend.generators.openai.image_loader.fetch_urls",
+            AsyncMock(return_value={"https://img.test/a.png": b"downloaded"}),
+        ):
             result = await gen._process_response_images([img], "image/png")
 
         assert len(result) == 1
+        assert result[0].image_bytes == b"downloaded"
+
+    @pytest.mark.asyncio
+    async def test_failed_url_fetch_is_skipped(self) -> None:
+        gen = _gen()
+        img = SimpleNamespace(b64_json=None, url="https://img.test/a.png")
+
+        with patch(
+            "appkit_imagecreator.backend.generators.openai.image_loader.fetch_urls",
+            AsyncMock(return_value={"https://img.test/a.png": None}),
+        ):
+            result = await gen._process_response_images([img], "image/png")
+
+        assert result == []
 
     @pytest.mark.asyncio
     async def test_no_data(self) -> None:
@@ -182,17 +182,11 @@ class BpmnDiagramRepository(BaseRepository[BpmnDiagram, AsyncSession]):
             Count of records updated.
         """
         cutoff = datetime.now(UTC) - timedelta(days=days)
-        stmt = select(BpmnDiagram).where(
-            BpmnDiagram.created < cutoff,
-            ~BpmnDiagram.is_deleted,
+        count = await self.bulk_update(
+            session,
+            [BpmnDiagram.created < cutoff, ~BpmnDiagram.is_deleted],
+            {"is_deleted": True, "xml_content": b""},
         )
-        result = await session.execute(stmt)
-        diagrams = list(result.scalars().all())
-        for diagram in diagrams:
-            diagram.is_deleted = True
-            diagram.xml_content = b""
-        await session.flush()
-        count = len(diagrams)
         logger.debug("Soft-deleted %d BPMN diagrams older than %d days", count, days)
         return count
 
@@ -28,7 +28,7 @@ class BpmnCleanupService(ScheduledService):
         """Run daily at 3:34 AM UTC."""
         return CronTrigger(hour=3, minute=34)
 
-    async def execute(self) -> None:
+    async def execute(self) -> int | None:
         """Run the BPMN diagram cleanup job."""
         try:
             days = self.config.cleanup_days_threshold
@@ -44,6 +44,8 @@ class BpmnCleanupService(ScheduledService):
                 logger.info("Deleted %d BPMN diagrams older than %d days", count, days)
             else:
                 logger.debug("No BPMN diagrams older than %d days found", days)
+            return count
 
         except Exception as e:
             logger.error("BPMN cleanup job failed: %s", e)
+            return None
@@ -31,6 +31,21 @@ class UserEntity(Entity, Base):
     """User model with relationships to roles and OAuth accounts."""
 
     __tablename__ = "auth_users"
+    __table_args__ = (
+        # Trigram indexes for the substring search of the user administration
+        Index(
+            "ix_auth_users_name_trgm",
+            "name",
+            postgresql_using="gin",
+            postgresql_ops={"name": "gin_trgm_ops"},
+        ),
+        Index(
+            "ix_auth_users_email_trgm",
+            "email",
+            postgresql_using="gin",
+            postgresql_ops={"email": "gin_trgm_ops"},
+        ),
+    )
 
     email: Mapped[str | None] = mapped_column(String(200), nullable=False, unique=True)
     name: Mapped[str | None] = mapped_column(String(200), nullable=True)
@@ -107,6 +122,9 @@ class UserSessionEntity(Entity, Base):
         DateTime(timezone=True), nullable=False
     )
 
+    # Range scans of the batched expiry purge
+    __table_args__ = (Index("ix_auth_sessions_expires_at", "expires_at"),)
+
     # Relationships
     user: Mapped["UserEntity"] = relationship(
         back_populates="sessions", lazy="selectin"
@@ -230,6 +248,7 @@ class PasswordResetTokenEntity(Entity, Base):
     __table_args__ = (
         Index("idx_password_reset_tokens_token_expires", "token", "expires_at"),
         Index("idx_password_reset_tokens_user_id_used", "user_id", "is_used"),
+        Index("idx_password_reset_tokens_expires_at", "expires_at"),
     )
 
 
@@ -244,6 +263,8 @@ class PasswordHistoryEntity(Entity, Base):
         nullable=False,
     )
     password_hash: Mapped[str] = mapped_column(String(200), nullable=False)
+    # Keyed HMAC of the password; lets reuse checks skip the slow hash check
+    password_fingerprint: Mapped[str | None] = mapped_column(String(64), nullable=True)
     changed_at: Mapped[datetime] = mapped_column(
         DateTime, nullable=False, server_default=func.now()
     )
@@ -15,15 +15,30 @@ class OAuthStateRepository(BaseRepository[OAuthStateEntity, AsyncSession]):
     def model_class(self) -> type[OAuthStateEntity]:
         return OAuthStateEntity
 
-    async def delete_expired(self, session: AsyncSession) -> int:
-        """Clean up expired OAuth states and return count of deleted records."""
+    async def delete_expired(
+        self, session: AsyncSession, limit: int | None = None
+    ) -> int:
+        """Clean up expired OAuth states and return count of deleted records.
+
+        With ``limit``, at most that many are deleted, the oldest first.
+        """
         # Use naive datetime to match SQLite's storage of timezone-aware datetimes
         now = datetime.now(UTC).replace(tzinfo=None)
-        stmt = delete(OAuthStateEntity).where(OAuthStateEntity.expires_at < now)
+        expired = OAuthStateEntity.expires_at < now
+        if limit is not None:
+            return await self.delete_batch(
+                session, expired, limit, order_by=OAuthStateEntity.expires_at
+            )
+        stmt = delete(OAuthStateEntity).where(expired)
         result = cast("CursorResult[Any]", await session.execute(stmt))
         await session.flush()
         return result.rowcount
 
+    async def count_expired(self, session: AsyncSession) -> int:
+        """Count the OAuth states past their expiry."""
+        now = datetime.now(UTC).replace(tzinfo=None)
+        return await self.count_where(session, OAuthStateEntity.expires_at < now)
+
     async def delete_by_session_id(self, session: AsyncSession, session_id: str) -> int:
         """Clean up OAuth states for a specific session."""
         stmt = delete(OAuthStateEntity).where(OAuthStateEntity.session_id == session_id)
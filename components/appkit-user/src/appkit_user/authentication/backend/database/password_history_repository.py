@@ -1,7 +1,14 @@
 """Repository for password history management."""
 
+import asyncio
+import hmac
+import itertools
 import logging
+import os
+from collections.abc import Sequence
+from concurrent.futures import ThreadPoolExecutor
 from datetime import UTC, datetime
+from typing import Final
 
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
@@ -12,6 +19,56 @@ from appkit_user.authentication.backend.database.entities import PasswordHistory
 
 logger = logging.getLogger(__name__)
 
+DEFAULT_REUSE_CHECK_TIMEOUT: Final[float] = 5.0
+HASH_CHECK_WORKERS: Final[int] = min(8, max(2, os.cpu_count() or 1))
+
+# hashlib releases the GIL while deriving keys, so the checks run in parallel
+_hash_executor = ThreadPoolExecutor(
+    max_workers=HASH_CHECK_WORKERS, thread_name_prefix="password-history"
+)
+
+
+async def _any_hash_matches(
+    password_hashes: Sequence[str], password: str, timeout_seconds: float
+) -> bool | None:
+    """Check ``password`` against the hashes in parallel.
+
+    Returns True on the first match, False if none matches, or None if the
+    checks did not finish within ``timeout_seconds``.
+
+    A check that has started runs to completion in its thread; cancelling
+    its future only drops the result. So at most :data:`HASH_CHECK_WORKERS`
+    checks are submitted at a time and none is submitted once the result is
+    known or the time is up.
+    """
+    loop = asyncio.get_running_loop()
+    deadline = loop.time() + timeout_seconds
+    unsubmitted = iter(password_hashes)
+    pending: set[asyncio.Future[bool]] = set()
+    try:
+        while True:
+            for pwhash in itertools.islice(
+                unsubmitted, HASH_CHECK_WORKERS - len(pending)
+            ):
+                pending.add(
+                    loop.run_in_executor(
+                        _hash_executor, check_password_hash, pwhash, password
+                    )
+                )
+            if not pending:
+                return False
+            remaining = deadline - loop.time()
+            if remaining <= 0:
+                return None
+            done, pending = await asyncio.wait(
+                pending, timeout=remaining, return_when=asyncio.FIRST_COMPLETED
+            )
+            if any(future.result() for future in done):
+                return True
+    finally:
+        for future in pending:
+            future.cancel()
+
 
 class PasswordHistoryRepository(BaseRepository[PasswordHistoryEntity, AsyncSession]):
     """Repository for managing password history."""
@@ -43,27 +100,68 @@ class PasswordHistoryRepository(BaseRepository[PasswordHistoryEntity, AsyncSessi
         return list(result.scalars().all())
 
     async def check_password_reuse(
-        self, session: AsyncSession, user_id: int, new_password: str, n: int = 6
-    ) -> bool:
+        self,
+        session: AsyncSession,
+        user_id: int,
+        new_password: str,
+        n: int = 6,
+        fingerprint: str | None = None,
+        timeout_seconds: float = DEFAULT_REUSE_CHECK_TIMEOUT,
+    ) -> bool | None:
         """Check if a new password matches any of the last N passwords.
 
+        Entries with a stored fingerprint are compared against ``fingerprint``
+        directly; the remaining hashes are checked in parallel off the event
+        loop, stopping at the first match. If they do not finish within
+        ``timeout_seconds`` the result is undecided and the caller must not
+        accept the password.
+
         Args:
             session: Database session
             user_id: User ID
             new_password: Plaintext password to check
             n: Number of recent passwords to check (default 6)
+            fingerprint: Fingerprint of the new password, if fingerprints are
+                enabled (see :func:`appkit_commons.security.password_fingerprint`)
+            timeout_seconds: Time budget of the hash checks
 
         Returns:
-            True if password was previously used, False otherwise
+            True if password was previously used, False if not, None if the
+            check ran out of time
         """
-        recent_hashes = await self.get_last_n_password_hashes(session, user_id, n)
+        stmt = (
+            select(
+                PasswordHistoryEntity.password_hash,
+                PasswordHistoryEntity.password_fingerprint,
+            )
+            .where(PasswordHistoryEntity.user_id == user_id)
+            .order_by(PasswordHistoryEntity.changed_at.desc())
+            .limit(n)
+        )
+        rows = (await session.execute(stmt)).all()
 
-        for password_hash in recent_hashes:
-            if check_password_hash(password_hash, new_password):
+        slow_hashes: list[str] = []
+        for password_hash, stored_fingerprint in rows:
+            if fingerprint is None or stored_fingerprint is None:
+                slow_hashes.append(password_hash)
+            elif hmac.compare_digest(stored_fingerprint, fingerprint):
                 logger.warning("Password reuse detected for user_id=%d", user_id)
                 return True
 
-        return False
+        if not slow_hashes:
+            return False
+
+        matched = await _any_hash_matches(slow_hashes, new_password, timeout_seconds)
+        if matched is None:
+            logger.warning(
+                "Password reuse check for user_id=%d exceeded %.1fs",
+                user_id,
+                timeout_seconds,
+            )
+            return None
+        if matched:
+            logger.warning("Password reuse detected for user_id=%d", user_id)
+        return matched
 
     async def save_password_to_history(
         self,
@@ -71,6 +169,7 @@ class PasswordHistoryRepository(BaseRepository[PasswordHistoryEntity, AsyncSessi
         user_id: int,
         password_hash: str,
         change_reason: str,
+        fingerprint: str | None = None,
     ) -> PasswordHistoryEntity:
         """Save a password hash to history.
 
@@ -79,6 +178,7 @@ class PasswordHistoryRepository(BaseRepository[PasswordHistoryEntity, AsyncSessi
             user_id: User ID
             password_hash: Hashed password
             change_reason: Reason for password change
+            fingerprint: Keyed fingerprint of the password, if enabled
 
         Returns:
             Created PasswordHistoryEntity
@@ -86,6 +186,7 @@ class PasswordHistoryRepository(BaseRepository[PasswordHistoryEntity, AsyncSessi
         entity = PasswordHistoryEntity(
             user_id=user_id,
             password_hash=password_hash,
+            password_fingerprint=fingerprint,
             changed_at=datetime.now(UTC).replace(tzinfo=None),
             change_reason=change_reason,
         )
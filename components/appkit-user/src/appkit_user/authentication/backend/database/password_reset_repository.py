@@ -128,28 +128,49 @@ class PasswordResetTokenRepository(
             await session.flush()
             logger.info("Marked password reset token id=%d as used", token_id)
 
-    async def delete_expired(self, session: AsyncSession) -> int:
+    async def delete_expired(
+        self, session: AsyncSession, limit: int | None = None
+    ) -> int:
         """Delete expired tokens.
 
         Args:
             session: Database session
+            limit: Delete at most this many, the longest expired first
 
         Returns:
             Number of tokens deleted
         """
         now = datetime.now(UTC).replace(tzinfo=None)
-        stmt = delete(PasswordResetTokenEntity).where(
-            PasswordResetTokenEntity.expires_at < now
-        )
-        result = await session.execute(stmt)
-        await session.flush()
+        expired = PasswordResetTokenEntity.expires_at < now
+        if limit is not None:
+            deleted_count = await self.delete_batch(
+                session, expired, limit, order_by=PasswordResetTokenEntity.expires_at
+            )
+        else:
+            stmt = delete(PasswordResetTokenEntity).where(expired)
+            result = await session.execute(stmt)
+            await session.flush()
+            deleted_count = cast("CursorResult[Any]", result).rowcount or 0
 
-        deleted_count = cast("CursorResult[Any]", result).rowcount or 0
         if deleted_count > 0:
             logger.info("Deleted %d expired password reset tokens", deleted_count)
 
         return deleted_count
 
+    async def count_expired(self, session: AsyncSession) -> int:
+        """Count the tokens past their expiry.
+
+        Args:
+            session: Database session
+
+        Returns:
+            Number of expired tokens
+        """
+        now = datetime.now(UTC).replace(tzinfo=None)
+        return await self.count_where(
+            session, PasswordResetTokenEntity.expires_at < now
+        )
+
     async def delete_by_user_id(self, session: AsyncSession, user_id: int) -> int:
         """Delete all tokens for a specific user.
 
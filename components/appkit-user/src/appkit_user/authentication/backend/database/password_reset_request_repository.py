@@ -4,7 +4,7 @@ import logging
 from datetime import UTC, datetime, timedelta
 from typing import Any, cast
 
-from sqlalchemy import CursorResult, delete, func, select
+from sqlalchemy import ColumnElement, CursorResult, delete, func, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from appkit_commons.database.base_repository import BaseRepository
@@ -77,31 +77,52 @@ class PasswordResetRequestRepository(
         )
         return entity
 
-    async def cleanup_old_requests(self, session: AsyncSession, days: int = 7) -> int:
+    async def cleanup_old_requests(
+        self, session: AsyncSession, days: int = 7, limit: int | None = None
+    ) -> int:
         """Clean up old password reset requests.
 
         Args:
             session: Database session
             days: Age threshold in days (default 7)
+            limit: Delete at most this many, the oldest first
 
         Returns:
             Number of requests deleted
         """
-        cutoff = datetime.now(UTC) - timedelta(days=days)
-        cutoff_naive = cutoff.replace(tzinfo=None)
-
-        stmt = delete(PasswordResetRequestEntity).where(
-            PasswordResetRequestEntity.created < cutoff_naive
-        )
-        result = await session.execute(stmt)
-        await session.flush()
+        old = _older_than(days)
+        if limit is not None:
+            deleted_count = await self.delete_batch(
+                session, old, limit, order_by=PasswordResetRequestEntity.created
+            )
+        else:
+            stmt = delete(PasswordResetRequestEntity).where(old)
+            result = await session.execute(stmt)
+            await session.flush()
+            deleted_count = cast("CursorResult[Any]", result).rowcount or 0
 
-        deleted_count = cast("CursorResult[Any]", result).rowcount or 0
         if deleted_count > 0:
             logger.info("Cleaned up %d old password reset requests", deleted_count)
 
         return deleted_count
 
+    async def count_old_requests(self, session: AsyncSession, days: int = 7) -> int:
+        """Count password reset requests older than ``days``.
+
+        Args:
+            session: Database session
+            days: Age threshold in days (default 7)
+
+        Returns:
+            Number of old requests
+        """
+        return await self.count_where(session, _older_than(days))
+
+
+def _older_than(days: int) -> ColumnElement[bool]:
+    cutoff = datetime.now(UTC) - timedelta(days=days)
+    return PasswordResetRequestEntity.created < cutoff.replace(tzinfo=None)
+
 
 # Singleton instance
 password_reset_request_repo = PasswordResetRequestRepository()
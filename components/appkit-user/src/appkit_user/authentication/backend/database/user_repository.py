@@ -2,7 +2,7 @@ from datetime import UTC, datetime, timedelta
 from enum import StrEnum
 from typing import Any
 
-from sqlalchemy import select
+from sqlalchemy import ColumnElement, func, or_, select, tuple_
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload
 
@@ -11,7 +11,10 @@ from appkit_user.authentication.backend.database.entities import (
     OAuthAccountEntity,
     UserEntity,
 )
-from appkit_user.authentication.backend.models import UserCreate
+from appkit_user.authentication.backend.models import User, UserCreate
+
+# Rows per page of the user administration
+USER_PAGE_SIZE = 50
 
 
 # Helper functions for cleaner code
@@ -357,5 +360,58 @@ class UserRepository(BaseRepository[UserEntity, AsyncSession]):
         result = await session.execute(stmt)
         return list(result.scalars().all())
 
+    @staticmethod
+    def _matches(search: str) -> ColumnElement[bool]:
+        """Case-insensitive substring match on name or email.
+
+        Uses ILIKE so PostgreSQL can answer it from the trigram indexes.
+        """
+        escaped = search.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+        pattern = f"%{escaped}%"
+        return or_(
+            UserEntity.name.ilike(pattern, escape="\\"),
+            UserEntity.email.ilike(pattern, escape="\\"),
+        )
+
+    async def find_page(
+        self,
+        session: AsyncSession,
+        search: str = "",
+        limit: int = USER_PAGE_SIZE,
+        after: tuple[str, int] | None = None,
+    ) -> list[User]:
+        """Keyset-paginated listing for the user administration.
+
+        Rows are ordered by ``(email, id)``. Pass the ``(email, user_id)`` of
+        the last row of a page as ``after`` to fetch the next page, so deep
+        pages cost the same as the first one. Only the columns shown in the
+        list are loaded; ``roles`` of the returned users are empty.
+        """
+        stmt = select(
+            UserEntity.id,
+            UserEntity.name,
+            UserEntity.email,
+            UserEntity.is_active,
+            UserEntity.is_verified,
+            UserEntity.is_admin,
+        )
+        if search:
+            stmt = stmt.where(self._matches(search))
+        if after is not None:
+            stmt = stmt.where(tuple_(UserEntity.email, UserEntity.id) > tuple_(*after))
+        stmt = stmt.order_by(UserEntity.email, UserEntity.id).limit(limit)
+
+        result = await session.execute(stmt)
+        return [User.model_validate(row) for row in result.mappings()]
+
+    async def count_matching(self, session: AsyncSession, search: str = "") -> int:
+        """Number of users matching ``search``; estimated for all users."""
+        if not search:
+            return await self.estimated_count(session)
+        result = await session.execute(
+            select(func.count()).select_from(UserEntity).where(self._matches(search))
+        )
+        return int(result.scalar_one())
+
 
 user_repo = UserRepository()
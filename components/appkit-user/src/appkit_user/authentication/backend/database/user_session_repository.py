@@ -74,18 +74,34 @@ class UserSessionRepository(BaseRepository[UserSessionEntity, AsyncSession]):
             await session.delete(existing_session)
             await session.flush()
 
-    async def delete_expired(self, session: AsyncSession) -> int:
-        """Delete all expired sessions.
+    async def delete_expired(
+        self, session: AsyncSession, limit: int | None = None
+    ) -> int:
+        """Delete expired sessions.
+
+        Args:
+            session: AsyncSession
+            limit: Delete at most this many, the longest expired first.
 
         Returns:
              int: The number of deleted sessions.
         """
         now = datetime.now(UTC).replace(tzinfo=None)
-        stmt = delete(UserSessionEntity).where(UserSessionEntity.expires_at < now)
+        expired = UserSessionEntity.expires_at < now
+        if limit is not None:
+            return await self.delete_batch(
+                session, expired, limit, order_by=UserSessionEntity.expires_at
+            )
+        stmt = delete(UserSessionEntity).where(expired)
         result = cast("CursorResult[Any]", await session.execute(stmt))
         await session.flush()
         return result.rowcount
 
+    async def count_expired(self, session: AsyncSession) -> int:
+        """Count the sessions past their expiry."""
+        now = datetime.now(UTC).replace(tzinfo=None)
+        return await self.count_where(session, UserSessionEntity.expires_at < now)
+
     async def delete_all_by_user_id(self, session: AsyncSession, user_id: int) -> int:
         """Delete all sessions for a user (force logout).
 
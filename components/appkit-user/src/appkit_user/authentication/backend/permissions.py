@@ -0,0 +1,47 @@
+"""Compiled role sets for authorization checks.
+
+Model, MCP server, skill and prompt lists are filtered by the user's roles
+whenever they are loaded. :class:`Permissions` holds the roles as a frozenset,
+so each check is a set lookup instead of a scan of ``User.roles``. It is
+compiled once per validated session and cached with it (see
+``session_cache``); role edits drop the cached sessions of the user.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Callable, Iterable
+from dataclasses import dataclass
+
+from appkit_user.authentication.backend.models import User
+
+
+@dataclass(frozen=True, slots=True)
+class Permissions:
+    """The roles of a user."""
+
+    roles: frozenset[str] = frozenset()
+
+    @classmethod
+    def for_user(cls, user: User | None) -> Permissions:
+        """Compile the permissions of ``user``; None has no roles."""
+        if user is None:
+            return NO_PERMISSIONS
+        return cls(roles=frozenset(user.roles or ()))
+
+    def has_role(self, role: str | None) -> bool:
+        """Whether the user has ``role``; an empty requirement is always met."""
+        return not role or role in self.roles
+
+    def filter_by_role[T](
+        self, items: Iterable[T], required_role: Callable[[T], str | None]
+    ) -> list[T]:
+        """The items whose required role the user has.
+
+        Args:
+            items: Items to filter, e.g. MCP servers or skills.
+            required_role: Returns the role an item requires, or None.
+        """
+        return [item for item in items if self.has_role(required_role(item))]
+
+
+NO_PERMISSIONS = Permissions()
@@ -10,7 +10,9 @@ from appkit_user.authentication.backend.services.email_service import (
 )
 from appkit_user.authentication.backend.services.oauth_service import (
     OAuthService,
+    close_oauth_service,
     generate_pkce_pair,
+    get_oauth_service,
 )
 from appkit_user.authentication.backend.services.password_reset_service import (
     ConfirmResetOutcome,
@@ -35,7 +37,9 @@ __all__ = [
     "RequestResetOutcome",
     "ResendEmailProvider",
     "SessionCleanupService",
+    "close_oauth_service",
     "generate_pkce_pair",
     "get_email_service",
+    "get_oauth_service",
     "get_password_reset_service",
 ]
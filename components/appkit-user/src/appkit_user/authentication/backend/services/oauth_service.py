@@ -1,15 +1,20 @@
 """Simplified OAuth2 configuration and utilities."""
 
+import asyncio
 import base64
 import hashlib
 import logging
 import secrets
 from collections.abc import Sequence
-from typing import Any, cast
+from functools import lru_cache
+from typing import Any, Final, cast
 
+import httpx
+import jwt
 from requests_oauthlib import OAuth2Session
 
 from appkit_commons.registry import service_registry
+from appkit_user.authentication.backend.services.oidc import OIDCDocumentCache
 from appkit_user.configuration import (
     AppleOAuthConfig,
     AuthenticationConfiguration,
@@ -22,6 +27,14 @@ from appkit_user.configuration import (
 
 logger = logging.getLogger(__name__)
 
+# Connections kept open to the identity providers
+HTTP_MAX_CONNECTIONS: Final[int] = 100
+HTTP_MAX_KEEPALIVE_CONNECTIONS: Final[int] = 20
+# Providers whose verified ID token carries all user data we need
+ID_TOKEN_PROVIDERS: Final[frozenset[str]] = frozenset(
+    {OAuthProvider.GOOGLE.value, OAuthProvider.APPLE.value}
+)
+
 
 def generate_pkce_pair() -> tuple[str, str]:
     """Generate PKCE code verifier and challenge (S256)."""
@@ -53,8 +66,17 @@ class OAuthService:
     google_enabled: bool = False
     apple_enabled: bool = False
 
-    def __init__(self, config: AuthenticationConfiguration | None = None) -> None:
-        """Initialize OAuth service with configuration."""
+    def __init__(
+        self,
+        config: AuthenticationConfiguration | None = None,
+        http_client: httpx.AsyncClient | None = None,
+    ) -> None:
+        """Initialize OAuth service with configuration.
+
+        Args:
+            config: Authentication configuration; defaults to the registry's.
+            http_client: Client for the async methods; created on first use.
+        """
         if config is None:
             config = service_registry().get(AuthenticationConfiguration)
 
@@ -65,6 +87,9 @@ class OAuthService:
 
         self.server_url = config.server_url
         self.server_port = config.server_port
+        self.timeout_seconds = config.oauth_timeout_seconds
+        self._http_client = http_client
+        self._oidc = OIDCDocumentCache(self._get_client)
         self.github_config = None  # type: ignore[assignment]
         self.azure_config = None  # type: ignore[assignment]
         self.google_config = None  # type: ignore[assignment]
@@ -253,91 +278,141 @@ class OAuthService:
             or f"{self.server_url}:{self.server_port}/oauth/{provider_value}/callback"
         )
 
-    def exchange_code_for_token(
+    async def _get_client(self) -> httpx.AsyncClient:
+        """Get or create the HTTP client shared by all async requests."""
+        if self._http_client is None:
+            self._http_client = httpx.AsyncClient(
+                timeout=self.timeout_seconds,
+                limits=httpx.Limits(
+                    max_connections=HTTP_MAX_CONNECTIONS,
+                    max_keepalive_connections=HTTP_MAX_KEEPALIVE_CONNECTIONS,
+                ),
+                headers={"Accept": "application/json"},
+            )
+        return self._http_client
+
+    async def close(self) -> None:
+        """Close the HTTP client."""
+        if self._http_client is not None:
+            await self._http_client.aclose()
+            self._http_client = None
+
+    async def authenticate(
+        self,
+        provider: OAuthProvider | str,
+        code: str,
+        code_verifier: str | None = None,
+    ) -> tuple[dict[str, Any], dict[str, Any]]:
+        """Exchange an authorization code and fetch the user's information.
+
+        Does not block the event loop. For OpenID Connect providers the
+        discovery document and signing keys are loaded while the code is
+        exchanged.
+
+        Returns:
+            The token response and the normalized user information.
+        """
+        config = self._get_provider_config(provider)
+        if config.discovery_url:
+            token, _ = await asyncio.gather(
+                self.fetch_token(provider, code, code_verifier),
+                self._oidc.prefetch(config.discovery_url),
+            )
+        else:
+            token = await self.fetch_token(provider, code, code_verifier)
+        return token, await self.fetch_user_info(provider, token)
+
+    async def fetch_token(
         self,
         provider: OAuthProvider | str,
         code: str,
-        state: str,
         code_verifier: str | None = None,
     ) -> dict[str, Any]:
-        """Exchange authorization code for access token."""
+        """Exchange an authorization code for the provider's token."""
         prov = self._as_provider(provider)
-        config: OAuthConfig = self._get_provider_config(prov)
-
-        oauth = OAuth2Session(
-            client_id=config.client_id,
-            redirect_uri=config.redirect_url,
-            state=state,
-        )
+        config = self._get_provider_config(prov)
 
-        token_kwargs: dict[str, Any] = {"code": code}
-        include_client_id: bool = False
+        data: dict[str, str] = {
+            "grant_type": "authorization_code",
+            "code": code,
+            "redirect_uri": config.redirect_url or self.get_redirect_url(prov),
+        }
+        auth: tuple[str, str] | None = (config.client_id, config.client_secret)
 
-        # Include PKCE code_verifier for Azure
         if self._provider_key(prov) == OAuthProvider.AZURE.value:
             if not code_verifier:
                 raise ValueError(
                     "code_verifier required for Azure OAuth token exchange"
                 )
-            token_kwargs["code_verifier"] = code_verifier
-            # For public clients, do not send client_secret
-            az_cfg: AzureOAuthConfig = self.azure_config
-            # Azure public clients: client_id should be included by fetch_token
-            # (via include_client_id), redirect_uri is already bound to session.
-            if az_cfg.is_public_client:
-                include_client_id = True
-            else:
-                # Confidential client: use Basic auth with client_secret
-                token_kwargs["client_secret"] = config.client_secret
-                include_client_id = False
-        else:
-            # Non-Azure providers keep sending client_secret (GitHub)
-            token_kwargs["client_secret"] = config.client_secret
-
-        return cast(
-            "dict[str, Any]",
-            oauth.fetch_token(
-                config.token_url,
-                include_client_id=include_client_id,
-                **token_kwargs,
-            ),
-        )
+            data["code_verifier"] = code_verifier
+            # Public clients authenticate with PKCE only, no client_secret
+            if self.azure_config.is_public_client:
+                data["client_id"] = config.client_id
+                auth = None
+
+        client = await self._get_client()
+        response = await client.post(config.token_url, data=data, auth=auth)
+        response.raise_for_status()
+        token = cast("dict[str, Any]", response.json())
+        # GitHub reports errors with status 200
+        if "error" in token or "access_token" not in token:
+            raise ValueError(
+                "OAuth token request failed: "
+                f"{token.get('error_description') or token.get('error')}"
+            )
+        return token
 
-    def get_user_info(
+    async def fetch_user_info(
         self, provider: OAuthProvider | str, token: dict[str, Any]
     ) -> dict[str, Any]:
-        """Get user information from OAuth provider."""
+        """Get the normalized user information of a token.
+
+        Google and Apple users are read from the verified ID token when there
+        is one, GitHub's profile and email addresses are requested in parallel.
+        """
         prov = self._as_provider(provider)
-        config: OAuthConfig = self._get_provider_config(prov)
+        config = self._get_provider_config(prov)
+        provider_key = self._provider_key(prov)
 
-        oauth = OAuth2Session(config.client_id, token=token)
-        response = oauth.get(config.user_url)
-        response.raise_for_status()
-        user_data = response.json()
+        id_token = token.get("id_token")
+        if provider_key in ID_TOKEN_PROVIDERS and config.discovery_url and id_token:
+            try:
+                claims = await self._oidc.verify_id_token(
+                    id_token, config.discovery_url, config.client_id
+                )
+            except (jwt.PyJWTError, httpx.HTTPError, KeyError) as e:
+                logger.warning("Falling back to %s user info: %s", provider_key, e)
+            else:
+                if claims.get("email"):
+                    return self._normalize_user_data(provider_key, claims)
 
-        provider_key = self._provider_key(prov)
+        client = await self._get_client()
+        headers = {"Authorization": f"Bearer {token['access_token']}"}
 
-        if (
-            user_data.get("email") is None
-            and provider_key == OAuthProvider.GITHUB.value
-        ):
-            email_response = oauth.get(self.github_config.user_email_url)
-            email_response.raise_for_status()
-            emails = email_response.json()
-            user_data["email"] = next(
-                (email["email"] for email in emails if email["primary"]), ""
+        if provider_key == OAuthProvider.GITHUB.value:
+            user_response, email_response = await asyncio.gather(
+                client.get(config.user_url, headers=headers),
+                client.get(self.github_config.user_email_url, headers=headers),
             )
+            user_response.raise_for_status()
+            user_data = user_response.json()
+            if user_data.get("email") is None:
+                email_response.raise_for_status()
+                user_data["email"] = next(
+                    (e["email"] for e in email_response.json() if e["primary"]), ""
+                )
+            return self._normalize_user_data(provider_key, user_data)
 
-        if user_data.get("email") is None and provider_key == OAuthProvider.AZURE.value:
-            email_response = oauth.get(self.azure_config.user_url)
-            email_response.raise_for_status()
-            profile_data = email_response.json()
+        response = await client.get(config.user_url, headers=headers)
+        response.raise_for_status()
+        user_data = response.json()
 
-            # Try multiple email fields in order of preference
+        if user_data.get("email") is None and provider_key == OAuthProvider.AZURE.value:
+            # Graph's profile already carries the alternatives
             user_data["email"] = (
-                profile_data.get("mail")
-                or self._convert_upn_to_email(profile_data.get("userPrincipalName"))
-                or (profile_data.get("otherMails") or [None])[0]
+                user_data.get("mail")
+                or self._convert_upn_to_email(user_data.get("userPrincipalName"))
+                or (user_data.get("otherMails") or [None])[0]
                 or ""
             )
 
@@ -346,3 +421,18 @@ class OAuthService:
     def provider_supported(self, provider: OAuthProvider | str) -> bool:
         prov = self._as_provider(provider)
         return self._provider_key(prov) in self.providers
+
+
+@lru_cache(maxsize=1)
+def get_oauth_service() -> OAuthService:
+    """The process-wide OAuth service; all logins share its HTTP client.
+
+    Kept out of the states, which are pickled by the state manager.
+    """
+    return OAuthService()
+
+
+async def close_oauth_service() -> None:
+    """Close the HTTP client of the shared service, if it was created."""
+    if get_oauth_service.cache_info().currsize:
+        await get_oauth_service().close()
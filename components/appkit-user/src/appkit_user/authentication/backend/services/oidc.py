@@ -0,0 +1,134 @@
+"""Cached OpenID Connect discovery documents and ID token verification.
+
+Discovery documents and JWKS change rarely, so they are fetched once per
+provider and kept for a while instead of on every login. Concurrent requests
+for the same document share one fetch, so a burst of logins causes a single
+request to the identity provider. When an ID token is signed with a key that
+is not in the cached JWKS (key rotation), the JWKS is fetched again.
+"""
+
+import asyncio
+import logging
+import time
+from collections.abc import Awaitable, Callable
+from typing import Any, Final
+
+import httpx
+import jwt
+
+logger = logging.getLogger(__name__)
+
+DISCOVERY_TTL_SECONDS: Final[float] = 24 * 3600
+JWKS_TTL_SECONDS: Final[float] = 3600
+ID_TOKEN_ALGORITHMS: Final[list[str]] = ["RS256", "ES256"]
+ID_TOKEN_LEEWAY_SECONDS: Final[int] = 60
+
+
+class OIDCDocumentCache:
+    """Caches discovery documents and JWKS of OpenID Connect providers."""
+
+    def __init__(self, get_client: Callable[[], Awaitable[httpx.AsyncClient]]) -> None:
+        """Initialize the cache.
+
+        Args:
+            get_client: Returns the HTTP client used to fetch documents.
+        """
+        self._get_client = get_client
+        # url -> (fetched at, expires at, document)
+        self._documents: dict[str, tuple[float, float, dict[str, Any]]] = {}
+        self._locks: dict[str, asyncio.Lock] = {}
+
+    def _cached(self, url: str, newer_than: float, force: bool) -> dict | None:
+        cached = self._documents.get(url)
+        if cached is None:
+            return None
+        fetched_at, expires_at, document = cached
+        if fetched_at >= newer_than:
+            return document
+        if not force and time.monotonic() < expires_at:
+            return document
+        return None
+
+    async def get_json(
+        self, url: str, ttl_seconds: float, force: bool = False
+    ) -> dict[str, Any]:
+        """Get a JSON document, fetching it if it is not cached or expired.
+
+        Args:
+            url: URL of the document.
+            ttl_seconds: How long a fetched document is reused.
+            force: Fetch again unless fetched since this call started.
+        """
+        requested_at = time.monotonic()
+        if (document := self._cached(url, requested_at, force)) is not None:
+            return document
+
+        async with self._locks.setdefault(url, asyncio.Lock()):
+            # Another request may have fetched it while this one waited
+            if (document := self._cached(url, requested_at, force)) is not None:
+                return document
+
+            client = await self._get_client()
+            response = await client.get(url)
+            response.raise_for_status()
+            document = response.json()
+            fetched_at = time.monotonic()
+            self._documents[url] = (fetched_at, fetched_at + ttl_seconds, document)
+            logger.debug("Fetched OIDC document %s", url)
+            return document
+
+    async def discovery(self, discovery_url: str) -> dict[str, Any]:
+        """The provider's discovery document."""
+        return await self.get_json(discovery_url, DISCOVERY_TTL_SECONDS)
+
+    async def jwks(self, discovery_url: str, force: bool = False) -> dict[str, Any]:
+        """The provider's signing keys."""
+        metadata = await self.discovery(discovery_url)
+        return await self.get_json(metadata["jwks_uri"], JWKS_TTL_SECONDS, force)
+
+    async def prefetch(self, discovery_url: str) -> None:
+        """Load the discovery document and JWKS; failures are only logged."""
+        try:
+            await self.jwks(discovery_url)
+        except (httpx.HTTPError, KeyError, ValueError) as e:
+            logger.warning("Failed to prefetch OIDC documents %s: %s", discovery_url, e)
+
+    async def verify_id_token(
+        self, id_token: str, discovery_url: str, audience: str
+    ) -> dict[str, Any]:
+        """Verify an ID token's signature, issuer, audience and expiry.
+
+        Returns:
+            The token's claims.
+
+        Raises:
+            jwt.PyJWTError: If the token is invalid.
+        """
+        metadata = await self.discovery(discovery_url)
+        header = jwt.get_unverified_header(id_token)
+        kid = header.get("kid")
+
+        key = _find_key(await self.jwks(discovery_url), kid)
+        if key is None:
+            key = _find_key(await self.jwks(discovery_url, force=True), kid)
+        if key is None:
+            raise jwt.InvalidKeyError(f"Unknown ID token signing key: {kid}")
+
+        return jwt.decode(
+            id_token,
+            key=jwt.PyJWK(key, algorithm=header.get("alg")).key,
+            algorithms=ID_TOKEN_ALGORITHMS,
+            audience=audience,
+            issuer=metadata.get("issuer"),
+            leeway=ID_TOKEN_LEEWAY_SECONDS,
+        )
+
+    def clear(self) -> None:
+        self._documents.clear()
+
+
+def _find_key(jwks: dict[str, Any], kid: str | None) -> dict[str, Any] | None:
+    keys = jwks.get("keys", [])
+    if kid is None and len(keys) == 1:
+        return keys[0]
+    return next((key for key in keys if key.get("kid") == kid), None)
@@ -8,6 +8,7 @@ email exists — it returns a coarse outcome and the state always shows the
 generic success message.
 """
 
+import asyncio
 import logging
 import re
 from dataclasses import dataclass
@@ -17,7 +18,7 @@ from sqlalchemy.ext.asyncio import AsyncSession
 
 from appkit_commons.database.session import get_asyncdb_session
 from appkit_commons.registry import service_registry
-from appkit_commons.security import generate_password_hash
+from appkit_commons.security import generate_password_hash, password_fingerprint
 from appkit_user.authentication.backend.database import (
     password_history_repo,
     password_reset_request_repo,
@@ -29,9 +30,10 @@ from appkit_user.authentication.backend.database.user_repository import (
     get_name_from_email,
 )
 from appkit_user.authentication.backend.services.email_service import get_email_service
+from appkit_user.authentication.backend.session_cache import get_session_cache
 from appkit_user.authentication.backend.types import PasswordResetType
 from appkit_user.authentication.password_policy import PASSWORD_REGEX
-from appkit_user.configuration import AuthenticationConfiguration
+from appkit_user.configuration import AuthenticationConfiguration, PasswordResetConfig
 
 logger = logging.getLogger(__name__)
 
@@ -60,6 +62,8 @@ class ConfirmResetOutcome(Enum):
     PASSWORD_MISMATCH = auto()
     INVALID_TOKEN = auto()
     PASSWORD_REUSED = auto()
+    # The history check ran out of time; the password was not changed
+    REUSE_CHECK_TIMEOUT = auto()
     USER_NOT_FOUND = auto()
     SUCCESS = auto()
     ERROR = auto()
@@ -215,6 +219,13 @@ class PasswordResetService:
             logger.exception("Error during password reset confirmation")
             return ConfirmResetResult(ConfirmResetOutcome.ERROR)
 
+    @staticmethod
+    def _reset_config() -> PasswordResetConfig:
+        registry = service_registry()
+        if registry.has(AuthenticationConfiguration):
+            return registry.get(AuthenticationConfiguration).password_reset
+        return PasswordResetConfig()
+
     async def _apply_reset(
         self, db: AsyncSession, token: str, new_password: str
     ) -> ConfirmResetOutcome:
@@ -235,10 +246,23 @@ class PasswordResetService:
         token_reset_type = token_entity.reset_type
 
         # 4. Check password history (last 6 passwords)
+        config = self._reset_config()
+        fingerprint = None
+        if config.history_fingerprint_key is not None:
+            fingerprint = password_fingerprint(
+                new_password, config.history_fingerprint_key.get_secret_value()
+            )
         is_reused = await password_history_repo.check_password_reuse(
-            db, token_user_id, new_password, n=_PASSWORD_HISTORY_DEPTH
+            db,
+            token_user_id,
+            new_password,
+            n=_PASSWORD_HISTORY_DEPTH,
+            fingerprint=fingerprint,
+            timeout_seconds=config.history_check_timeout_seconds,
         )
 
+        if is_reused is None:
+            return ConfirmResetOutcome.REUSE_CHECK_TIMEOUT
         if is_reused:
             return ConfirmResetOutcome.PASSWORD_REUSED
 
@@ -249,7 +273,9 @@ class PasswordResetService:
 
         # 6. Hash new password EXACTLY ONCE and thread the same hash into
         # both the user entity and the password-history record.
-        new_password_hash = generate_password_hash(new_password)
+        new_password_hash = await asyncio.to_thread(
+            generate_password_hash, new_password
+        )
 
         # 7. Update password, log history, mark token, clear flag
         user_entity._password = new_password_hash  # noqa: SLF001
@@ -259,6 +285,7 @@ class PasswordResetService:
             user_id=token_user_id,
             password_hash=new_password_hash,
             change_reason=token_reset_type,
+            fingerprint=fingerprint,
         )
 
         await password_reset_token_repo.mark_as_used(db, token_id)
@@ -273,6 +300,7 @@ class PasswordResetService:
         # 8. Clear all existing sessions for user (force re-login)
         await session_repo.delete_all_by_user_id(db, token_user_id)
         await db.commit()
+        get_session_cache().invalidate_user(token_user_id)
 
         logger.info(
             "Password reset completed for user_id=%d, type=%s",
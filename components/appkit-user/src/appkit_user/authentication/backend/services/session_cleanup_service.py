@@ -1,16 +1,27 @@
-"""Session cleanup scheduler."""
+"""Session cleanup scheduler.
+
+Purges expired user sessions, OAuth states, password reset tokens and old
+password reset requests in bounded batches, see
+:mod:`appkit_commons.database.purge`.
+"""
 
 import logging
 
+from appkit_commons.database.purge import PurgeResult, PurgeTarget, purge_in_batches
 from appkit_commons.database.session import get_asyncdb_session
+from appkit_commons.registry import service_registry
 from appkit_commons.scheduler import (
     IntervalTrigger,
     ScheduledService,
     Trigger,
 )
 from appkit_user.authentication.backend.database import (
+    oauth_state_repo,
+    password_reset_request_repo,
+    password_reset_token_repo,
     session_repo,
 )
+from appkit_user.configuration import AuthenticationConfiguration, SessionCleanupConfig
 
 logger = logging.getLogger(__name__)
 
@@ -21,26 +32,100 @@ class SessionCleanupService(ScheduledService):
     job_id = "session_cleanup"
     name = "Clean up expired user sessions"
 
-    def __init__(self, interval_minutes: int = 30) -> None:
+    def __init__(
+        self,
+        interval_minutes: int | None = None,
+        config: SessionCleanupConfig | None = None,
+    ) -> None:
         """Initialize the service.
 
         Args:
-            interval_minutes: How often to run the cleanup job (default: 30 min).
+            interval_minutes: How often to run the cleanup job; defaults to
+                the configured interval (30 min).
+            config: Purge settings; read from the registered authentication
+                configuration on each run if not given, so reloaded settings
+                apply without a restart (except the interval).
         """
-        self.interval_minutes = interval_minutes
+        self._config = config
+        self.interval_minutes = interval_minutes or self.config.interval_minutes
+        self.last_results: list[PurgeResult] = []
+
+    @property
+    def config(self) -> SessionCleanupConfig:
+        if self._config is not None:
+            return self._config
+        registry = service_registry()
+        if registry.has(AuthenticationConfiguration):
+            return registry.get(AuthenticationConfiguration).session_cleanup
+        return SessionCleanupConfig()
 
     @property
     def trigger(self) -> Trigger:
         """Run periodically based on configured interval."""
         return IntervalTrigger(minutes=self.interval_minutes)
 
-    async def execute(self) -> None:
-        """Execute the cleanup logic."""
+    def targets(self) -> list[PurgeTarget]:
+        """The tables purged by a run, in order."""
+        days = self.config.reset_request_retention_days
+        return [
+            PurgeTarget(
+                "user sessions",
+                lambda s, n: session_repo.delete_expired(s, limit=n),
+                session_repo.count_expired,
+            ),
+            PurgeTarget(
+                "OAuth states",
+                lambda s, n: oauth_state_repo.delete_expired(s, limit=n),
+                oauth_state_repo.count_expired,
+            ),
+            PurgeTarget(
+                "password reset tokens",
+                lambda s, n: password_reset_token_repo.delete_expired(s, limit=n),
+                password_reset_token_repo.count_expired,
+            ),
+            PurgeTarget(
+                "password reset requests",
+                lambda s, n: password_reset_request_repo.cleanup_old_requests(
+                    s, days, limit=n
+                ),
+                lambda s: password_reset_request_repo.count_old_requests(s, days),
+            ),
+        ]
+
+    async def execute(self) -> int:
+        """Execute the cleanup logic.
+
+        Returns:
+            The number of purged rows. Errors are logged and re-raised, so
+            the run is recorded as failed.
+        """
         try:
             logger.info("Running session cleanup job")
-            async with get_asyncdb_session() as session:
-                count = await session_repo.delete_expired(session)
-                if count > 0:
-                    logger.info("Cleaned up %d expired user sessions", count)
+            results = await purge_in_batches(
+                self.targets(),
+                batch_size=self.config.batch_size,
+                pause_seconds=self.config.batch_pause_seconds,
+                time_budget_seconds=self.config.time_budget_seconds,
+                session_factory=get_asyncdb_session,
+            )
         except Exception as e:
             logger.error("Session cleanup failed: %s", e)
+            raise
+
+        self.last_results = results
+        for result in results:
+            if result.purged > 0:
+                logger.info(
+                    "Cleaned up %d expired %s in %d batches (%.1fs)",
+                    result.purged,
+                    result.name,
+                    result.batches,
+                    result.duration_seconds,
+                )
+            if result.backlog > 0:
+                logger.warning(
+                    "Session cleanup ran out of time, %d expired %s left",
+                    result.backlog,
+                    result.name,
+                )
+        return sum(result.purged for result in results)
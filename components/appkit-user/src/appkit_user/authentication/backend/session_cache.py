@@ -0,0 +1,178 @@
+"""Per-process cache of session validation results.
+
+``UserSession.authenticated_user`` is evaluated for every guarded page and
+event. Its result for a session id is cached for a short time, never past
+the session's expiry, so open tabs do not query the database on every check.
+Unknown or expired sessions are cached briefly as well. Entries are dropped
+explicitly on logout, on changes to a user (roles, deletion) and when all
+sessions of a user are revoked. Each entry also holds the user's compiled
+:class:`Permissions`, so role checks need neither the database nor a scan of
+the role list.
+
+Sessions revoked in another process stay valid here for at most the TTL.
+"""
+
+import logging
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from datetime import UTC, datetime
+from functools import lru_cache
+from typing import Final
+
+from appkit_commons.registry import service_registry
+from appkit_user.authentication.backend.models import User
+from appkit_user.authentication.backend.permissions import Permissions
+from appkit_user.configuration import AuthenticationConfiguration
+
+logger = logging.getLogger(__name__)
+
+MAX_CACHED_SESSIONS: Final[int] = 10_000
+# Lookups between two debug logs of the hit rate
+STATS_LOG_INTERVAL: Final[int] = 1_000
+
+
+@dataclass(frozen=True, slots=True)
+class CachedSession:
+    """Validation result of a session; ``user`` is None for invalid sessions."""
+
+    user: User | None
+    valid_until: float  # time.monotonic()
+    permissions: Permissions
+
+
+@dataclass(slots=True)
+class SessionCacheStats:
+    hits: int = 0
+    negative_hits: int = 0
+    misses: int = 0
+    invalidations: int = 0
+
+    @property
+    def hit_rate(self) -> float:
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+
+class SessionValidationCache:
+    """LRU cache of session validation results with per-entry expiry."""
+
+    def __init__(
+        self,
+        ttl_seconds: float = 30.0,
+        negative_ttl_seconds: float = 5.0,
+        max_entries: int = MAX_CACHED_SESSIONS,
+    ) -> None:
+        self.ttl_seconds = ttl_seconds
+        self.negative_ttl_seconds = negative_ttl_seconds
+        self.max_entries = max_entries
+        self.stats = SessionCacheStats()
+        self._entries: OrderedDict[str, CachedSession] = OrderedDict()
+        # user_id -> session ids with a cached positive result
+        self._sessions_by_user: dict[int, set[str]] = {}
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, session_id: str) -> CachedSession | None:
+        """Get the cached result of a session, or None on a miss."""
+        entry = self._entries.get(session_id)
+        if (self.stats.hits + self.stats.misses + 1) % STATS_LOG_INTERVAL == 0:
+            logger.debug(
+                "Session cache: %d entries, hit rate %.1f%%",
+                len(self._entries),
+                self.stats.hit_rate * 100,
+            )
+        if entry is None or time.monotonic() >= entry.valid_until:
+            if entry is not None:
+                self._remove(session_id)
+            self.stats.misses += 1
+            return None
+        self._entries.move_to_end(session_id)
+        self.stats.hits += 1
+        if entry.user is None:
+            self.stats.negative_hits += 1
+        return entry
+
+    def peek(self, session_id: str) -> CachedSession | None:
+        """Get a valid entry without counting a lookup or touching the LRU."""
+        entry = self._entries.get(session_id)
+        if entry is None or time.monotonic() >= entry.valid_until:
+            return None
+        return entry
+
+    def put(
+        self, session_id: str, user: User | None, expires_at: datetime | None = None
+    ) -> None:
+        """Cache a validation result.
+
+        Args:
+            session_id: The session's auth token.
+            user: The session's user, or None if the session is not valid.
+            expires_at: Expiry of a valid session; caps the entry's lifetime.
+        """
+        ttl = self.ttl_seconds if user is not None else self.negative_ttl_seconds
+        if expires_at is not None:
+            if expires_at.tzinfo is None:
+                expires_at = expires_at.replace(tzinfo=UTC)
+            ttl = min(ttl, (expires_at - datetime.now(UTC)).total_seconds())
+        if ttl <= 0:
+            return
+
+        self._remove(session_id)
+        self._entries[session_id] = CachedSession(
+            user, time.monotonic() + ttl, Permissions.for_user(user)
+        )
+        if user is not None:
+            self._sessions_by_user.setdefault(user.user_id, set()).add(session_id)
+        while len(self._entries) > self.max_entries:
+            self._remove(next(iter(self._entries)))
+
+    def _remove(self, session_id: str) -> bool:
+        entry = self._entries.pop(session_id, None)
+        if entry is None:
+            return False
+        if entry.user is not None:
+            sessions = self._sessions_by_user.get(entry.user.user_id)
+            if sessions is not None:
+                sessions.discard(session_id)
+                if not sessions:
+                    del self._sessions_by_user[entry.user.user_id]
+        return True
+
+    def invalidate(self, session_id: str) -> None:
+        """Drop a session, e.g. on logout or when its expiry changes."""
+        if self._remove(session_id):
+            self.stats.invalidations += 1
+
+    def invalidate_user(self, user_id: int) -> None:
+        """Drop all sessions of a user, e.g. after changing their roles."""
+        for session_id in list(self._sessions_by_user.get(user_id, ())):
+            self.invalidate(session_id)
+
+    def clear(self) -> None:
+        self._entries.clear()
+        self._sessions_by_user.clear()
+
+
+@lru_cache(maxsize=1)
+def get_session_cache() -> SessionValidationCache:
+    """The process-wide session validation cache."""
+    registry = service_registry()
+    if not registry.has(AuthenticationConfiguration):
+        return SessionValidationCache()
+    config = registry.get(AuthenticationConfiguration)
+    return SessionValidationCache(
+        ttl_seconds=config.session_cache_ttl_seconds,
+        negative_ttl_seconds=config.session_cache_negative_ttl_seconds,
+    )
+
+
+def configure_session_cache(config: AuthenticationConfiguration) -> None:
+    """Apply the TTLs of a reloaded configuration to the process-wide cache.
+
+    Cached entries keep the lifetime they were stored with.
+    """
+    cache = get_session_cache()
+    cache.ttl_seconds = config.session_cache_ttl_seconds
+    cache.negative_ttl_seconds = config.session_cache_negative_ttl_seconds
@@ -190,7 +190,7 @@ def requires_role(
     fallback: rx.Component | None = None,  # noqa: B008
 ) -> rx.Component:
     return rx.cond(
-        UserSession.user.roles.contains(role),
+        UserSession.granted_roles.contains(role),
         rx.fragment(*children),
         fallback,
     )
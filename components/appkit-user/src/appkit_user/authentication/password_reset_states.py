@@ -228,6 +228,12 @@ class PasswordResetConfirmState(rx.State):
                         "Bitte wählen Sie ein anderes Passwort."
                     )
                     yield
+                case ConfirmResetOutcome.REUSE_CHECK_TIMEOUT:
+                    yield rx.toast.error(
+                        "Das Passwort konnte nicht geprüft werden. "  # noqa: S105
+                        "Bitte versuchen Sie es erneut.",
+                        position="top-right",
+                    )
                 case ConfirmResetOutcome.USER_NOT_FOUND:
                     yield rx.toast.error(
                         "Benutzer nicht gefunden.", position="top-right"
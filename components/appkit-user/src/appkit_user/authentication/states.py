@@ -22,7 +22,12 @@ from appkit_user.authentication.backend.database import (
     user_repo,
 )
 from appkit_user.authentication.backend.models import User
-from appkit_user.authentication.backend.services import OAuthService
+from appkit_user.authentication.backend.permissions import (
+    NO_PERMISSIONS,
+    Permissions,
+)
+from appkit_user.authentication.backend.services import get_oauth_service
+from appkit_user.authentication.backend.session_cache import get_session_cache
 from appkit_user.configuration import AuthenticationConfiguration
 
 logger = logging.getLogger(__name__)
@@ -64,6 +69,17 @@ def _generate_auth_token() -> str:
     return "".join(secrets.choice(TOKEN_CHARS) for _ in range(TOKEN_LENGTH))
 
 
+def _session_permissions(auth_token: str, user: User | None) -> Permissions:
+    """The permissions cached with the session, or compiled from ``user``."""
+    if user is None:
+        return NO_PERMISSIONS
+    cached = get_session_cache().peek(auth_token)
+    # Role changes drop the user's cached sessions, so the ids suffice
+    if cached is not None and cached.user and cached.user.user_id == user.user_id:
+        return cached.permissions
+    return Permissions.for_user(user)
+
+
 class UserSession(rx.State):
     """Enhanced session state with client-side storage integration."""
 
@@ -148,30 +164,48 @@ class UserSession(rx.State):
     async def authenticated_user(self) -> User | None:
         """The currently authenticated user, or None if not authenticated.
 
-        This is a read-only check that does NOT prolong the session.
+        This is a read-only check that does NOT prolong the session. Results
+        are cached per process for a short time (see ``session_cache``).
 
         Returns:
             The User instance if authenticated, None otherwise.
         """
+        if not self.auth_token:
+            return None
 
-        async def _check(db: AsyncSession) -> User | None:
-            user_session = await self._find_valid_session(db)
-
-            if user_session is None or user_session.is_expired():
+        cache = get_session_cache()
+        cached = cache.get(self.auth_token)
+        if cached is not None:
+            user = cached.user
+            if user is None or (self.user_id > 0 and user.user_id != self.user_id):
                 return None
+        else:
 
-            if user_session.user:
-                return User.model_validate(user_session.user)
-            return None
+            async def _check(
+                db: AsyncSession,
+            ) -> tuple[User | None, datetime | None]:
+                user_session = await self._find_valid_session(db)
 
-        try:
-            user: User | None = await self._execute_db_operation(_check)
-            if user:
-                self.user = user
-                self.user_id = user.user_id
-            return user
-        except Exception:
-            return None
+                if user_session is None or user_session.is_expired():
+                    return None, None
+
+                if user_session.user:
+                    return (
+                        User.model_validate(user_session.user),
+                        user_session.expires_at,
+                    )
+                return None, None
+
+            try:
+                user, expires_at = await self._execute_db_operation(_check)
+            except Exception:
+                return None
+            cache.put(self.auth_token, user, expires_at)
+
+        if user:
+            self.user = user
+            self.user_id = user.user_id
+        return user
 
     @rx.var(cache=True, interval=AUTH_TOKEN_REFRESH_DELTA)
     async def is_authenticated(self) -> bool:
@@ -183,6 +217,12 @@ class UserSession(rx.State):
         user = await self.authenticated_user
         return user is not None
 
+    @rx.var(cache=True, interval=AUTH_TOKEN_REFRESH_DELTA)
+    async def granted_roles(self) -> dict[str, bool]:
+        """The user's compiled roles as a lookup table for UI role guards."""
+        user = await self.authenticated_user
+        return dict.fromkeys(_session_permissions(self.auth_token, user).roles, True)
+
     @rx.event
     async def terminate_session(self) -> EventSpec | None:
         """Terminate the current session and clear storage.
@@ -197,6 +237,7 @@ class UserSession(rx.State):
                 session, self.user_id, self.auth_token
             )
 
+        get_session_cache().invalidate(self.auth_token)
         try:
             await self._execute_db_operation(_terminate)
         except Exception as e:
@@ -240,6 +281,8 @@ class UserSession(rx.State):
             await self._execute_db_operation(_prolong)
         except Exception as e:
             logger.debug("Failed to prolong session (already logged): %s", e)
+        # The cached entry is capped by the previous expiry
+        get_session_cache().invalidate(self.auth_token)
 
     @rx.event
     async def clear_session_storage_token(self) -> EventSpec:
@@ -247,6 +290,17 @@ class UserSession(rx.State):
         return rx.call_script("sessionStorage.removeItem('token')")
 
 
+async def get_user_permissions(state: rx.State) -> Permissions:
+    """The compiled permissions of the user of ``state``'s session.
+
+    Taken from the session cache when the session was validated recently,
+    otherwise compiled from the authenticated user.
+    """
+    user_session = await state.get_state(UserSession)
+    user = await user_session.authenticated_user
+    return _session_permissions(user_session.auth_token, user)
+
+
 class LoginState(UserSession):
     """Simple authentication state."""
 
@@ -257,7 +311,6 @@ class LoginState(UserSession):
     is_loading: bool = False
     error_message: str = ""
 
-    _oauth_service: OAuthService = OAuthService()
     _last_auth_check: datetime | None = None
 
     # Error messages for login status
@@ -275,22 +328,22 @@ class LoginState(UserSession):
     @rx.var
     def enable_azure_oauth(self) -> bool:
         """Whether Azure OAuth is enabled."""
-        return self._oauth_service.azure_enabled
+        return get_oauth_service().azure_enabled
 
     @rx.var
     def enable_github_oauth(self) -> bool:
         """Whether GitHub OAuth is enabled."""
-        return self._oauth_service.github_enabled
+        return get_oauth_service().github_enabled
 
     @rx.var
     def enable_google_oauth(self) -> bool:
         """Whether Google OAuth is enabled."""
-        return self._oauth_service.google_enabled
+        return get_oauth_service().google_enabled
 
     @rx.var
     def enable_apple_oauth(self) -> bool:
         """Whether Apple OAuth is enabled."""
-        return self._oauth_service.apple_enabled
+        return get_oauth_service().apple_enabled
 
     async def _prepare_login(self) -> str:
         """Prepare for login: save redirect, terminate old session. Returns redirect."""
@@ -342,14 +395,14 @@ class LoginState(UserSession):
 
             provider_str = getattr(provider_name, "value", str(provider_name))
 
-            if not self._oauth_service.provider_supported(provider_str):
+            if not get_oauth_service().provider_supported(provider_str):
                 self.error_message = f"Unknown provider: {provider_name}"
                 return rx.toast.info(  # type: ignore[no-any-return]
                     f"Der Anbieter {provider_name} wird nicht unterstützt.",
                     position="top-right",
                 )
 
-            auth_url, state, code_verifier = self._oauth_service.get_auth_url(
+            auth_url, state, code_verifier = get_oauth_service().get_auth_url(
                 provider_str
             )
 
@@ -412,17 +465,24 @@ class LoginState(UserSession):
                     yield rx.toast.error("Invalid or expired state")
                     return
 
-                try:
-                    user_entity = await self._exchange_oauth_and_get_user(
-                        db, provider, code, state, oauth_state.code_verifier
-                    )
-                except ValueError as e:
-                    yield rx.toast.error(str(e), position="top-right")
-                    return
-
-                await self._create_session(db, user_entity)
+                code_verifier = oauth_state.code_verifier
+                # Single use; consumed before the provider is called
                 await oauth_state_repo.delete(db, oauth_state)
 
+            try:
+                # No database connection is held while the provider responds
+                token, user_info = await get_oauth_service().authenticate(
+                    provider, code, code_verifier
+                )
+                async with get_asyncdb_session() as db:
+                    user_entity = await user_repo.get_or_create_oauth_user(
+                        db, user_info, provider, token
+                    )
+                    await self._create_session(db, user_entity)
+            except ValueError as e:
+                yield rx.toast.error(str(e), position="top-right")
+                return
+
             yield LoginState.redir()  # type: ignore[operator]
 
         except Exception:
@@ -434,21 +494,6 @@ class LoginState(UserSession):
         finally:
             self.is_loading = False
 
-    async def _exchange_oauth_and_get_user(
-        self,
-        db: AsyncSession,
-        provider: str,
-        code: str,
-        state: str,
-        code_verifier: str | None,
-    ) -> UserEntity:
-        """Exchange OAuth code for token and get/create user."""
-        token = self._oauth_service.exchange_code_for_token(
-            provider, code, state, code_verifier
-        )
-        user_info = self._oauth_service.get_user_info(provider, token)
-        return await user_repo.get_or_create_oauth_user(db, user_info, provider, token)
-
     @rx.event
     async def logout(self) -> EventSpec:
         """Logout user and terminate session."""
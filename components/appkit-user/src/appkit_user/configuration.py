@@ -24,6 +24,8 @@ class OAuthConfig(BaseConfig):
     token_url: str = ""
     user_url: str = ""
     redirect_url: str | None = None
+    # OpenID Connect discovery document; enables verifying the ID token
+    discovery_url: str = ""
 
 
 class GithubOAuthConfig(OAuthConfig):
@@ -57,6 +59,7 @@ class GoogleOAuthConfig(OAuthConfig):
     token_url: str = "https://oauth2.googleapis.com/token"  # noqa: S105
     user_url: str = "https://www.googleapis.com/oauth2/v3/userinfo"
     redirect_url: str | None = None
+    discovery_url: str = "https://accounts.google.com/.well-known/openid-configuration"
 
 
 class AppleOAuthConfig(OAuthConfig):
@@ -66,6 +69,7 @@ class AppleOAuthConfig(OAuthConfig):
     token_url: str = "https://appleid.apple.com/auth/token"  # noqa: S105
     user_url: str = "https://appleid.apple.com/auth/userinfo"
     redirect_url: str | None = None
+    discovery_url: str = "https://appleid.apple.com/.well-known/openid-configuration"
 
 
 AnyOAuthSetting = Annotated[
@@ -121,6 +125,21 @@ class PasswordResetConfig(BaseConfig):
     token_expiry_minutes: int = 30
     max_requests_per_hour: int = 3
     templates_dir: Path | None = None
+    # Time budget of the password reuse check; on timeout the change is rejected
+    history_check_timeout_seconds: float = 5.0
+    # HMAC key for password fingerprints in the history; enables the fast check
+    history_fingerprint_key: SecretStr | None = None
+
+
+class SessionCleanupConfig(BaseConfig):
+    """Configuration for purging expired sessions and authentication data."""
+
+    interval_minutes: int = 30
+    batch_size: int = 1000  # rows deleted per transaction
+    batch_pause_seconds: float = 0.1  # lets other writers take the row locks
+    # Wall-clock budget per run; rows left over are purged by the next run
+    time_budget_seconds: float = 120.0
+    reset_request_retention_days: int = 7
 
 
 class AuthenticationConfiguration(BaseSettings):
@@ -129,13 +148,20 @@ class AuthenticationConfiguration(BaseSettings):
     session_timeout: int = 25  # minutes
     auth_token_refresh_delta: int = 10  # minutes
     session_monitor_interval_seconds: int = 60  # seconds between session checks
+    session_cache_ttl_seconds: int = 30  # reuse a valid session check this long
+    session_cache_negative_ttl_seconds: int = 5  # and an invalid one this long
     server_url: str
     server_port: int
 
     oauth_providers: list[AnyOAuthSetting] = []
+    # Timeout of requests to OAuth providers
+    oauth_timeout_seconds: float = 10.0
 
     # Email provider configuration
     email_provider: AnyEmailProviderConfig | None = None
 
     # Password reset configuration
     password_reset: PasswordResetConfig = PasswordResetConfig()
+
+    # Expired session purge
+    session_cleanup: SessionCleanupConfig = SessionCleanupConfig()
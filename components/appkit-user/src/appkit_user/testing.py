@@ -0,0 +1,258 @@
+"""Test infrastructure for appkit-user.
+
+Provides :class:`FakeOAuthProvider`, a local OpenID Connect / OAuth2 identity
+provider for exercising the OAuth flows offline, and the ``fake_oauth_provider``
+fixture.
+
+Usage:
+    Register as a pytest plugin next to the commons one:
+
+        pytest_plugins = ["appkit_commons.testing", "appkit_user.testing"]
+
+    The provider is a Starlette app; services reach it through an httpx
+    transport, or it can be served with uvicorn for manual tests:
+
+        service = OAuthService(
+            config=AuthenticationConfiguration(
+                server_url="http://localhost",
+                server_port=3000,
+                oauth_providers=[fake_oauth_provider.google_config()],
+            ),
+            http_client=fake_oauth_provider.client(),
+        )
+        token, user = await service.authenticate(
+            "google", fake_oauth_provider.issue_code()
+        )
+"""
+
+import asyncio
+import base64
+import json
+import secrets
+import time
+from dataclasses import dataclass, field
+from typing import Any
+
+import httpx
+import jwt
+import pytest
+from cryptography.hazmat.primitives.asymmetric import rsa
+from starlette.applications import Starlette
+from starlette.requests import Request
+from starlette.responses import JSONResponse, RedirectResponse, Response
+from starlette.routing import Route
+
+from appkit_user.configuration import GithubOAuthConfig, GoogleOAuthConfig
+
+FAKE_ISSUER = "https://idp.test"
+FAKE_CLIENT_ID = "fake-client"
+FAKE_CLIENT_SECRET = "fake-secret"  # noqa: S105
+
+
+@dataclass
+class FakeIdentity:
+    """A user known to the fake provider."""
+
+    sub: str
+    email: str
+    name: str = "Test User"
+    picture: str = ""
+    # GitHub style: only returned by the emails endpoint when private
+    email_public: bool = True
+
+
+@dataclass
+class FakeOAuthProvider:
+    """Local OpenID Connect provider signing ID tokens with its own RSA key.
+
+    Attributes:
+        latency_seconds: Delay added to every response, e.g. to simulate a
+            slow provider.
+        requests: Paths of all requests received, in order.
+    """
+
+    issuer: str = FAKE_ISSUER
+    client_id: str = FAKE_CLIENT_ID
+    client_secret: str = FAKE_CLIENT_SECRET
+    latency_seconds: float = 0.0
+    requests: list[str] = field(default_factory=list)
+
+    def __post_init__(self) -> None:
+        self._key = rsa.generate_private_key(public_exponent=65537, key_size=2048)
+        self.key_id = "fake-key-1"
+        self._codes: dict[str, FakeIdentity] = {}
+        self._tokens: dict[str, FakeIdentity] = {}
+        self.app = Starlette(
+            routes=[
+                Route("/.well-known/openid-configuration", self._discovery),
+                Route("/jwks", self._jwks),
+                Route("/authorize", self._authorize),
+                Route("/token", self._token, methods=["POST"]),
+                Route("/userinfo", self._userinfo),
+                Route("/user", self._userinfo),
+                Route("/user/emails", self._user_emails),
+            ]
+        )
+
+    # ------------------------------------------------------------------
+    # Test API
+    # ------------------------------------------------------------------
+
+    def issue_code(self, identity: FakeIdentity | None = None) -> str:
+        """Issue an authorization code for ``identity`` (a random one if None)."""
+        if identity is None:
+            sub = secrets.token_hex(8)
+            identity = FakeIdentity(sub=sub, email=f"user-{sub}@idp.test")
+        code = secrets.token_urlsafe(16)
+        self._codes[code] = identity
+        return code
+
+    def client(self, timeout: float = 10.0) -> httpx.AsyncClient:
+        """An HTTP client routed to this provider instead of the network."""
+        return httpx.AsyncClient(
+            transport=httpx.ASGITransport(app=self.app),
+            timeout=timeout,
+            headers={"Accept": "application/json"},
+        )
+
+    def google_config(self, **overrides: Any) -> GoogleOAuthConfig:
+        """OIDC provider configuration pointing at this provider."""
+        return GoogleOAuthConfig(
+            client_id=self.client_id,
+            client_secret=self.client_secret,
+            auth_url=f"{self.issuer}/authorize",
+            token_url=f"{self.issuer}/token",
+            user_url=f"{self.issuer}/userinfo",
+            discovery_url=f"{self.issuer}/.well-known/openid-configuration",
+            **overrides,
+        )
+
+    def github_config(self, **overrides: Any) -> GithubOAuthConfig:
+        """Plain OAuth2 provider configuration pointing at this provider."""
+        return GithubOAuthConfig(
+            client_id=self.client_id,
+            client_secret=self.client_secret,
+            auth_url=f"{self.issuer}/authorize",
+            token_url=f"{self.issuer}/token",
+            user_url=f"{self.issuer}/user",
+            user_email_url=f"{self.issuer}/user/emails",
+            **overrides,
+        )
+
+    def rotate_key(self) -> None:
+        """Replace the signing key; the JWKS only lists the new key."""
+        self._key = rsa.generate_private_key(public_exponent=65537, key_size=2048)
+        self.key_id = f"fake-key-{int(self.key_id.rsplit('-', 1)[1]) + 1}"
+
+    # ------------------------------------------------------------------
+    # Endpoints
+    # ------------------------------------------------------------------
+
+    async def _respond(self, request: Request) -> None:
+        self.requests.append(request.url.path)
+        if self.latency_seconds:
+            await asyncio.sleep(self.latency_seconds)
+
+    async def _discovery(self, request: Request) -> Response:
+        await self._respond(request)
+        return JSONResponse(
+            {
+                "issuer": self.issuer,
+                "authorization_endpoint": f"{self.issuer}/authorize",
+                "token_endpoint": f"{self.issuer}/token",
+                "userinfo_endpoint": f"{self.issuer}/userinfo",
+                "jwks_uri": f"{self.issuer}/jwks",
+                "id_token_signing_alg_values_supported": ["RS256"],
+            }
+        )
+
+    async def _jwks(self, request: Request) -> Response:
+        await self._respond(request)
+        jwk = json.loads(jwt.algorithms.RSAAlgorithm.to_jwk(self._key.public_key()))
+        jwk.update({"kid": self.key_id, "use": "sig", "alg": "RS256"})
+        return JSONResponse({"keys": [jwk]})
+
+    async def _authorize(self, request: Request) -> Response:
+        await self._respond(request)
+        params = request.query_params
+        code = self.issue_code()
+        return RedirectResponse(
+            f"{params['redirect_uri']}?code={code}&state={params.get('state', '')}"
+        )
+
+    def _client_authenticated(self, request: Request, form: Any) -> bool:
+        header = request.headers.get("authorization", "")
+        if header.startswith("Basic "):
+            decoded = base64.b64decode(header.removeprefix("Basic ")).decode()
+            return decoded == f"{self.client_id}:{self.client_secret}"
+        # Public clients send their id only
+        return form.get("client_id") == self.client_id
+
+    async def _token(self, request: Request) -> Response:
+        await self._respond(request)
+        form = await request.form()
+        if not self._client_authenticated(request, form):
+            return JSONResponse({"error": "invalid_client"}, status_code=401)
+        identity = self._codes.pop(str(form.get("code", "")), None)
+        if identity is None:
+            return JSONResponse({"error": "invalid_grant"}, status_code=400)
+
+        access_token = secrets.token_urlsafe(24)
+        self._tokens[access_token] = identity
+        now = int(time.time())
+        id_token = jwt.encode(
+            {
+                "iss": self.issuer,
+                "aud": self.client_id,
+                "sub": identity.sub,
+                "email": identity.email,
+                "name": identity.name,
+                "picture": identity.picture,
+                "iat": now,
+                "exp": now + 3600,
+            },
+            self._key,
+            algorithm="RS256",
+            headers={"kid": self.key_id},
+        )
+        return JSONResponse(
+            {
+                "access_token": access_token,
+                "token_type": "Bearer",
+                "expires_in": 3600,
+                "id_token": id_token,
+            }
+        )
+
+    def _identity(self, request: Request) -> FakeIdentity | None:
+        token = request.headers.get("authorization", "").removeprefix("Bearer ")
+        return self._tokens.get(token)
+
+    async def _userinfo(self, request: Request) -> Response:
+        await self._respond(request)
+        identity = self._identity(request)
+        if identity is None:
+            return JSONResponse({"error": "invalid_token"}, status_code=401)
+        return JSONResponse(
+            {
+                "id": identity.sub,
+                "sub": identity.sub,
+                "login": identity.sub,
+                "email": identity.email if identity.email_public else None,
+                "name": identity.name,
+                "picture": identity.picture,
+            }
+        )
+
+    async def _user_emails(self, request: Request) -> Response:
+        await self._respond(request)
+        identity = self._identity(request)
+        if identity is None:
+            return JSONResponse({"error": "invalid_token"}, status_code=401)
+        return JSONResponse([{"email": identity.email, "primary": True}])
+
+
+@pytest.fixture
+def fake_oauth_provider() -> FakeOAuthProvider:
+    """A fresh local identity provider."""
+    return FakeOAuthProvider()
@@ -1,4 +1,4 @@
-from typing import Any
+from typing import Any, Final
 
 import reflex as rx
 
@@ -11,6 +11,8 @@ from appkit_ui.styles import sticky_header_style
 from appkit_user.authentication.backend.models import User
 from appkit_user.user_management.states.user_states import UserState
 
+SEARCH_DEBOUNCE_MS: Final[int] = 300
+
 
 def role_checkbox(
     user: User, role: dict[str, str], is_edit_mode: bool = False
@@ -332,14 +334,18 @@ def add_user_button(
 
 
 def search_user_input() -> rx.Component:
-    return mn.text_input(
-        placeholder="Benutzer suchen...",
-        left_section=rx.icon("search", size=16),
-        left_section_pointer_events="none",
-        value=UserState.search_filter,
-        on_change=UserState.set_search_filter,
-        size="sm",
-        w="18rem",
+    # Each change queries the database; wait until typing pauses
+    return rx.debounce_input(
+        mn.text_input(
+            placeholder="Benutzer suchen...",
+            left_section=rx.icon("search", size=16),
+            left_section_pointer_events="none",
+            value=UserState.search_filter,
+            on_change=UserState.set_search_filter,
+            size="sm",
+            w="18rem",
+        ),
+        debounce_timeout=SEARCH_DEBOUNCE_MS,
     )
 
 
@@ -477,7 +483,7 @@ def user_table_view(additional_components: list | None = None) -> rx.Component:
                 UserState.is_loading,
                 loading(),
                 rx.foreach(
-                    UserState.filtered_users,
+                    UserState.users,
                     render_user_row,
                 ),
             )
@@ -495,6 +501,31 @@ def user_table_view(additional_components: list | None = None) -> rx.Component:
     )
 
 
+def users_table_footer() -> rx.Component:
+    """Number of users and a button loading the next page."""
+    return mn.group(
+        mn.text(
+            UserState.users.length(),
+            " von ",
+            UserState.total_users,
+            " Benutzern",
+            size="sm",
+            c="dimmed",
+        ),
+        rx.cond(
+            UserState.has_more_users,
+            mn.button(
+                "Mehr laden",
+                variant="subtle",
+                size="xs",
+                on_click=UserState.load_more_users,
+            ),
+        ),
+        justify="space-between",
+        w="100%",
+    )
+
+
 def users_table(additional_components: list | None = None) -> rx.Component:
     """Create a users table with optional additional components.
 
@@ -519,5 +550,6 @@ def users_table(additional_components: list | None = None) -> rx.Component:
             align="center",
         ),
         user_table_view(additional_components=additional_components),
+        users_table_footer(),
         w="100%",
     )
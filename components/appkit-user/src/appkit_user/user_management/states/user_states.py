@@ -3,15 +3,24 @@ from typing import Any
 
 import reflex as rx
 
-from appkit_commons.database.session import get_asyncdb_session
+from appkit_commons.database.session import (
+    get_asyncdb_read_session,
+    get_asyncdb_session,
+    mark_user_write,
+)
 from appkit_commons.roles import Role
 from appkit_user.authentication.backend.database import user_repo
+from appkit_user.authentication.backend.database.user_repository import USER_PAGE_SIZE
 from appkit_user.authentication.backend.models import User, UserCreate
+from appkit_user.authentication.backend.session_cache import get_session_cache
 from appkit_user.authentication.decorators import requires_admin
+from appkit_user.authentication.states import UserSession
 
 
 class UserState(rx.State):
     users: list[User] = []
+    total_users: int = 0
+    has_more_users: bool = False
     selected_user: User | None = None
     is_loading: bool = False
     available_roles: list[dict[str, str]] = []
@@ -22,22 +31,14 @@ class UserState(rx.State):
     edit_modal_open: bool = False
     search_filter: str = ""
 
-    @rx.event
-    def set_search_filter(self, value: str) -> None:
-        """Update the search filter."""
-        self.search_filter = value
+    # (email, user_id) of the last loaded row
+    _users_cursor: tuple[str, int] | None = None
 
-    @rx.var
-    def filtered_users(self) -> list[User]:
-        """Return users filtered by search text."""
-        if not self.search_filter:
-            return self.users
-        search = self.search_filter.lower()
-        return [
-            u
-            for u in self.users
-            if search in u.name.lower() or search in u.email.lower()
-        ]
+    @requires_admin
+    async def set_search_filter(self, value: str) -> None:
+        """Update the search filter and reload the first page."""
+        self.search_filter = value
+        await self._load_users()
 
     def open_add_modal(self) -> None:
         """Open the add user modal."""
@@ -100,25 +101,51 @@ class UserState(rx.State):
             if key.startswith("role_") and value == "on"
         ]
 
-    async def _load_users(self, limit: int = 200, offset: int = 0) -> None:
-        """Internal load logic."""
-        async with get_asyncdb_session() as session:
-            user_entities = await user_repo.find_all_paginated(
-                session, limit=limit, offset=offset
+    async def _current_admin_id(self) -> int:
+        user_session = await self.get_state(UserSession)
+        return user_session.user_id
+
+    async def _load_users(self, append: bool = False) -> None:
+        """Load the first page of users matching the search filter, or the next
+        page if ``append`` is set.
+
+        Reads from the replica, unless the admin has just changed a user.
+        """
+        after = self._users_cursor if append else None
+        admin_id = await self._current_admin_id()
+        async with get_asyncdb_read_session(admin_id) as session:
+            # One extra row tells whether there is a next page
+            page = await user_repo.find_page(
+                session, self.search_filter, limit=USER_PAGE_SIZE + 1, after=after
             )
-            self.users = [User.model_validate(user) for user in user_entities]
+            if not append:
+                self.total_users = await user_repo.count_matching(
+                    session, self.search_filter
+                )
+
+        self.has_more_users = len(page) > USER_PAGE_SIZE
+        page = page[:USER_PAGE_SIZE]
+        self.users = [*self.users, *page] if append else page
+        if page:
+            self._users_cursor = (page[-1].email, page[-1].user_id)
+        elif not append:
+            self._users_cursor = None
 
     @requires_admin
-    async def load_users(
-        self, limit: int = 200, offset: int = 0
-    ) -> AsyncGenerator[Any, None]:
+    async def load_users(self) -> AsyncGenerator[Any, None]:
         self.is_loading = True
         yield
         try:
-            await self._load_users(limit, offset)
+            await self._load_users()
         finally:
             self.is_loading = False
 
+    @requires_admin
+    async def load_more_users(self) -> None:
+        """Append the next page of users."""
+        if self.has_more_users:
+            await self._load_users(append=True)
+
     @requires_admin
     async def create_user(self, form_data: dict) -> AsyncGenerator[Any, None]:
         self.is_loading = True
@@ -136,6 +163,7 @@ class UserState(rx.State):
 
             async with get_asyncdb_session() as session:
                 await user_repo.create_new_user(session, new_user)
+            mark_user_write(await self._current_admin_id())
 
             await self._load_users()
             self.close_add_modal()
@@ -170,6 +198,9 @@ class UserState(rx.State):
 
             async with get_asyncdb_session() as session:
                 await user_repo.update_from_model(session, user)
+            mark_user_write(await self._current_admin_id())
+            # Active sessions must pick up changed roles and flags
+            get_session_cache().invalidate_user(user.user_id)
 
             await self._load_users()
             self.close_edit_modal()
@@ -206,6 +237,9 @@ class UserState(rx.State):
                     )
                     return
 
+            mark_user_write(await self._current_admin_id())
+            get_session_cache().invalidate_user(user_id)
+
             await self._load_users()
             self.is_loading = False
             yield rx.toast.info("Benutzer wurde gelöscht.", position="top-right")
@@ -26,11 +26,19 @@ from appkit_user.authentication.backend.database import (
     UserSessionRepository,
     password_reset_request_repository,
 )
+from appkit_user.authentication.backend.session_cache import get_session_cache
 from appkit_user.authentication.backend.types import (
     PasswordResetType,
 )
 
-pytest_plugins = ["appkit_commons.testing"]
+pytest_plugins = ["appkit_commons.testing", "appkit_user.testing"]
+
+
+@pytest.fixture(autouse=True)
+def clear_session_cache() -> None:
+    """Start every test with an empty session validation cache."""
+    get_session_cache.cache_clear()
+
 
 PasswordResetRequestRepository = (
     password_reset_request_repository.PasswordResetRequestRepository
@@ -1,4 +1,4 @@
-# ruff: noqa: ARG002, SLF001, S105, S106
+# ruff: noqa: ARG002, SLF001, S105, S106, S107
 """Tests for UserSession and LoginState.
 
 Covers session management, authentication checks, login flows,
@@ -7,6 +7,7 @@ OAuth callback handling, redirect logic, and error paths.
 
 from __future__ import annotations
 
+from collections.abc import Iterator
 from datetime import UTC, datetime, timedelta
 from types import SimpleNamespace
 from unittest.mock import AsyncMock, MagicMock, patch
@@ -14,10 +15,23 @@ from unittest.mock import AsyncMock, MagicMock, patch
 import pytest
 
 from appkit_user.authentication.backend.models import User
-from appkit_user.authentication.states import LoginState, UserSession
+from appkit_user.authentication.backend.permissions import NO_PERMISSIONS
+from appkit_user.authentication.backend.session_cache import get_session_cache
+from appkit_user.authentication.states import (
+    LoginState,
+    UserSession,
+    get_user_permissions,
+)
 
 _PATCH = "appkit_user.authentication.states"
 
+
+@pytest.fixture
+def oauth_service() -> Iterator[MagicMock]:
+    with patch(f"{_PATCH}.get_oauth_service") as get_service:
+        yield get_service.return_value
+
+
 # Access computed-var descriptors via __dict__.
 _US_CV = UserSession.__dict__
 _LS_CV = LoginState.__dict__
@@ -120,7 +134,6 @@ class _StubLoginState:
         self.error_message: str = ""
         self.is_hydrated: bool = True
         self._last_auth_check: datetime | None = None
-        self._oauth_service = MagicMock()
 
         # Mock router for OAuth tests
         self.router = SimpleNamespace(
@@ -142,7 +155,6 @@ class _StubLoginState:
     login_with_provider = _unwrap(LoginState, "login_with_provider")
     _store_oauth_state = _unwrap(LoginState, "_store_oauth_state")
     handle_oauth_callback = _unwrap(LoginState, "handle_oauth_callback")
-    _exchange_oauth_and_get_user = _unwrap(LoginState, "_exchange_oauth_and_get_user")
     logout = _unwrap(LoginState, "logout")
     redir = _unwrap(LoginState, "redir")
     check_auth = _unwrap(LoginState, "check_auth")
@@ -380,15 +392,15 @@ class TestIsOAuthCallbackPath:
 
 
 class TestComputedVars:
-    def test_enable_azure_oauth(self) -> None:
+    def test_enable_azure_oauth(self, oauth_service: MagicMock) -> None:
         state = _StubLoginState()
-        state._oauth_service.azure_enabled = True
+        oauth_service.azure_enabled = True
         result = _LS_CV["enable_azure_oauth"].fget(state)
         assert result is True
 
-    def test_enable_github_oauth(self) -> None:
+    def test_enable_github_oauth(self, oauth_service: MagicMock) -> None:
         state = _StubLoginState()
-        state._oauth_service.github_enabled = False
+        oauth_service.github_enabled = False
         result = _LS_CV["enable_github_oauth"].fget(state)
         assert result is False
 
@@ -526,9 +538,9 @@ class TestLoginWithPassword:
 
 class TestLoginWithProvider:
     @pytest.mark.asyncio
-    async def test_unsupported_provider(self) -> None:
+    async def test_unsupported_provider(self, oauth_service: MagicMock) -> None:
         state = _StubLoginState()
-        state._oauth_service.provider_supported.return_value = False
+        oauth_service.provider_supported.return_value = False
 
         with (
             patch(f"{_PATCH}.get_asyncdb_session") as mock_session,
@@ -544,10 +556,10 @@ class TestLoginWithProvider:
         assert "unknown" in state.error_message.lower() or result is not None
 
     @pytest.mark.asyncio
-    async def test_supported_provider(self) -> None:
+    async def test_supported_provider(self, oauth_service: MagicMock) -> None:
         state = _StubLoginState()
-        state._oauth_service.provider_supported.return_value = True
-        state._oauth_service.get_auth_url.return_value = (
+        oauth_service.provider_supported.return_value = True
+        oauth_service.get_auth_url.return_value = (
             "https://auth.example.com",
             "state123",
             "verifier",
@@ -571,9 +583,9 @@ class TestLoginWithProvider:
         assert result is not None  # redirect to auth URL
 
     @pytest.mark.asyncio
-    async def test_exception_handled(self) -> None:
+    async def test_exception_handled(self, oauth_service: MagicMock) -> None:
         state = _StubLoginState()
-        state._oauth_service.provider_supported.side_effect = RuntimeError("boom")
+        oauth_service.provider_supported.side_effect = RuntimeError("boom")
 
         with (
             patch(f"{_PATCH}.get_asyncdb_session") as mock_session,
@@ -611,7 +623,7 @@ class TestHandleOAuthCallback:
         assert len(chunks) >= 1  # error toast
 
     @pytest.mark.asyncio
-    async def test_success(self) -> None:
+    async def test_success(self, oauth_service: MagicMock) -> None:
         state = _StubLoginState()
         state.router.url.query_parameters = {
             "code": "auth-code",
@@ -636,8 +648,9 @@ class TestHandleOAuthCallback:
             mock_o_repo.delete = AsyncMock()
             mock_s_repo.save = AsyncMock()
 
-            state._oauth_service.exchange_code_for_token.return_value = "token"
-            state._oauth_service.get_user_info.return_value = {"email": "a@b.com"}
+            oauth_service.authenticate = AsyncMock(
+                return_value=("token", {"email": "a@b.com"})
+            )
             mock_u_repo.get_or_create_oauth_user = AsyncMock(return_value=entity)
 
             [c async for c in state.handle_oauth_callback("azure")]
@@ -778,6 +791,7 @@ class TestAuthenticatedUserCV:
         mock_user_session = MagicMock()
         mock_user_session.is_expired.return_value = False
         mock_user_session.user = _user_entity(1, "alice")
+        mock_user_session.expires_at = datetime.now(UTC) + timedelta(hours=1)
 
         with (
             patch(f"{_PATCH}.get_asyncdb_session") as mock_ctx,
@@ -791,10 +805,28 @@ class TestAuthenticatedUserCV:
             )
 
             result = await _US_CV["authenticated_user"].fget(state)
+            # Served from the session cache
+            cached = await _US_CV["authenticated_user"].fget(state)
 
         assert result is not None
         assert result.name == "alice"
         assert state.user_id == 1
+        assert cached == result
+        mock_repo.find_by_user_and_session_id.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_cached_session_of_other_user(self) -> None:
+        """authenticated_user rejects a cached session of a different user."""
+        state = _StubUserSession()
+        state.auth_token = "token"
+        state.user_id = 2
+        get_session_cache().put("token", _user(1, "alice"))
+
+        with patch(f"{_PATCH}.get_asyncdb_session") as mock_ctx:
+            result = await _US_CV["authenticated_user"].fget(state)
+
+        assert result is None
+        mock_ctx.assert_not_called()
 
     @pytest.mark.asyncio
     async def test_expired_session(self) -> None:
@@ -922,6 +954,76 @@ class TestIsAuthenticatedCV:
         assert result is False
 
 
+class TestGetUserPermissions:
+    @staticmethod
+    def _state(user: User | None, auth_token: str = "token") -> MagicMock:
+        user_session = SimpleNamespace(auth_token=auth_token)
+
+        async def _get_user() -> User | None:
+            return user
+
+        user_session.authenticated_user = _get_user()
+        state = MagicMock()
+        state.get_state = AsyncMock(return_value=user_session)
+        return state
+
+    @pytest.mark.asyncio
+    async def test_from_session_cache(self) -> None:
+        """The permissions compiled when the session was cached are reused."""
+        user = User(user_id=1, roles=["a"])
+        get_session_cache().put("token", user)
+
+        permissions = await get_user_permissions(self._state(user))
+
+        assert permissions is get_session_cache().peek("token").permissions
+        assert permissions.has_role("a")
+
+    @pytest.mark.asyncio
+    async def test_compiled_when_not_cached(self) -> None:
+        user = User(user_id=1, roles=["b"])
+
+        permissions = await get_user_permissions(self._state(user))
+
+        assert permissions.roles == frozenset({"b"})
+
+    @pytest.mark.asyncio
+    async def test_other_users_cache_entry_ignored(self) -> None:
+        """An entry cached for another user of the token is not used."""
+        get_session_cache().put("token", User(user_id=2, roles=["other"]))
+
+        permissions = await get_user_permissions(
+            self._state(User(user_id=1, roles=["own"]))
+        )
+
+        assert permissions.roles == frozenset({"own"})
+
+    @pytest.mark.asyncio
+    async def test_unauthenticated(self) -> None:
+        assert await get_user_permissions(self._state(None)) is NO_PERMISSIONS
+
+
+class TestGrantedRolesCV:
+    @pytest.mark.asyncio
+    async def test_roles_of_cached_session(self) -> None:
+        """The UI guard reads the roles compiled with the cached session."""
+        state = _StubUserSession()
+        state.auth_token = "token"
+        state.user_id = 1
+        get_session_cache().put("token", User(user_id=1, roles=["admin", "user"]))
+        state.authenticated_user = _US_CV["authenticated_user"].fget(state)
+
+        roles = await _US_CV["granted_roles"].fget(state)
+
+        assert roles == {"admin": True, "user": True}
+
+    @pytest.mark.asyncio
+    async def test_unauthenticated(self) -> None:
+        state = _StubUserSession()
+        state.authenticated_user = _US_CV["authenticated_user"].fget(state)
+
+        assert await _US_CV["granted_roles"].fget(state) == {}
+
+
 class TestCheckAuth:
     @pytest.mark.asyncio
     async def test_valid_user_syncs_state(self) -> None:
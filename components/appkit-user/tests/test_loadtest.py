@@ -0,0 +1,130 @@
+"""Tests for the authentication load test harness."""
+
+import asyncio
+import time
+
+import pytest
+from loadtest import (
+    AuthLoadTest,
+    LoopLagMonitor,
+    ScenarioResult,
+    check_limits,
+    format_report,
+    main,
+    run_scenario,
+)
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+from appkit_commons.database.instrumentation import instrument_engine
+from appkit_user.authentication.backend.database import (
+    OAuthAccountEntity,
+    UserEntity,
+    UserSessionEntity,
+)
+
+# Cheap hash, the tests measure the queries and not the hashing
+FAST_HASH = "pbkdf2:sha256:1000"
+
+
+async def _count(engine: AsyncEngine, entity: type) -> int:
+    async with engine.connect() as conn:
+        return (await conn.execute(select(func.count()).select_from(entity))).scalar()
+
+
+class TestRunScenario:
+    @pytest.mark.asyncio
+    async def test_counts_operations_and_errors(self) -> None:
+        async def operation(index: int) -> None:
+            await asyncio.sleep(0)
+            if index % 5 == 0:
+                raise RuntimeError("boom")
+
+        result = await run_scenario("op", operation, operations=20, concurrency=4)
+
+        assert result.operations == 20
+        assert result.errors == 4
+        assert len(result.latencies_ms) == 16
+        assert result.throughput > 0
+
+    @pytest.mark.asyncio
+    async def test_lag_monitor_detects_blocking_call(self) -> None:
+        async with LoopLagMonitor(interval_seconds=0.005) as lag:
+            await asyncio.sleep(0.01)
+            time.sleep(0.1)  # noqa: ASYNC251
+            await asyncio.sleep(0.01)
+
+        assert max(lag.samples_ms) >= 50
+
+
+class TestCheckLimits:
+    def _result(self) -> ScenarioResult:
+        return ScenarioResult(
+            "password_login",
+            operations=4,
+            statements=20,
+            latencies_ms=[10.0, 20.0, 30.0, 400.0],
+            lag_ms=[1.0, 80.0],
+        )
+
+    def test_within_limits(self) -> None:
+        assert check_limits([self._result()], 500, 100, 5) == []
+
+    def test_reports_each_violated_limit(self) -> None:
+        result = self._result()
+        result.errors = 1
+
+        violations = check_limits([result], 100, 50, 4)
+
+        assert len(violations) == 4
+        assert "p95 400.0 ms > 100" in violations[1]
+
+    def test_report_has_a_row_per_scenario(self) -> None:
+        report = format_report([self._result(), ScenarioResult("validate")])
+
+        assert len(report.splitlines()) == 4
+        assert "password_login" in report
+
+
+class TestAuthLoadTest:
+    @pytest.mark.asyncio
+    async def test_all_scenarios_within_query_budget(
+        self, async_engine: AsyncEngine
+    ) -> None:
+        instrument_engine(async_engine)
+        load_test = AuthLoadTest(async_engine, 6, 3, hash_method=FAST_HASH)
+        await load_test.setup()
+        try:
+            results = await load_test.run()
+        finally:
+            await load_test.teardown()
+
+        by_name = {r.name: r for r in results}
+        assert check_limits(results) == []
+        # Regression guard for additional queries per login or validation
+        assert by_name["password_login"].statements_per_operation <= 5
+        assert by_name["oauth_login"].statements_per_operation <= 16
+        assert by_name["validate"].statements_per_operation <= 2
+
+    @pytest.mark.asyncio
+    async def test_teardown_removes_created_rows(
+        self, async_engine: AsyncEngine
+    ) -> None:
+        load_test = AuthLoadTest(async_engine, 3, 2, hash_method=FAST_HASH)
+        await load_test.setup()
+        await load_test.run(["oauth_login", "validate"])
+        await load_test.teardown()
+
+        assert await _count(async_engine, UserEntity) == 0
+        assert await _count(async_engine, UserSessionEntity) == 0
+        assert await _count(async_engine, OAuthAccountEntity) == 0
+
+    @pytest.mark.asyncio
+    async def test_main_fails_when_limit_exceeded(
+        self, capsys: pytest.CaptureFixture[str]
+    ) -> None:
+        args = ["--operations", "2", "--concurrency", "2", "--hash-method", FAST_HASH]
+
+        assert await main([*args, "--scenario", "validate"]) == 0
+        assert await main([*args, "--max-statements", "0.5"]) == 1
+        assert "SQL statements per operation" in capsys.readouterr().err
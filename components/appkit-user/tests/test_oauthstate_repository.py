@@ -179,6 +179,24 @@ class TestOAuthStateRepository:
 
         assert deleted_count == 0
 
+    @pytest.mark.asyncio
+    async def test_delete_expired_with_limit_deletes_oldest_first(
+        self, async_session: AsyncSession, oauth_state_factory, oauth_state_repository
+    ) -> None:
+        """delete_expired with a limit deletes the longest expired states."""
+        now = datetime.now(UTC)
+        oldest = await oauth_state_factory(expires_at=now - timedelta(hours=2))
+        await oauth_state_factory(expires_at=now - timedelta(hours=1))
+        await oauth_state_factory(expires_at=now + timedelta(minutes=10))
+
+        deleted_count = await oauth_state_repository.delete_expired(
+            async_session, limit=1
+        )
+
+        assert deleted_count == 1
+        assert await oauth_state_repository.find_by_id(async_session, oldest.id) is None
+        assert await oauth_state_repository.count_expired(async_session) == 1
+
     @pytest.mark.asyncio
     async def test_delete_by_session_id(
         self, async_session: AsyncSession, oauth_state_factory, oauth_state_repository
@@ -1,16 +1,25 @@
 """Tests for PasswordHistoryRepository."""
 
+import time
 from collections.abc import Callable
 from datetime import UTC, datetime, timedelta
+from unittest.mock import patch
 
 import pytest
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from appkit_commons.security import generate_password_hash
+from appkit_commons.security import generate_password_hash, password_fingerprint
 from appkit_user.authentication.backend.database import (
     PasswordHistoryEntity,
     PasswordHistoryRepository,
 )
+from appkit_user.authentication.backend.database.password_history_repository import (
+    HASH_CHECK_WORKERS,
+    _any_hash_matches,
+)
+
+_PATCH = "appkit_user.authentication.backend.database.password_history_repository"
+_KEY = "fingerprint-key"
 
 
 @pytest.fixture
@@ -374,3 +383,143 @@ class TestPasswordHistoryRepository:
 
         # Assert
         assert model_class == PasswordHistoryEntity
+
+
+class TestPasswordReuseCheck:
+    """Parallel hash checks and the fingerprint fast path."""
+
+    @pytest.mark.asyncio
+    async def test_fingerprint_match_skips_hash_checks(
+        self,
+        async_session: AsyncSession,
+        user_factory,
+        password_history_repository: PasswordHistoryRepository,
+        password_hash_factory,
+    ) -> None:
+        """A matching fingerprint is conclusive without checking hashes."""
+        user = await user_factory()
+        await password_history_repository.save_password_to_history(
+            async_session,
+            user_id=user.id,
+            password_hash=password_hash_factory("OldPassword123!"),
+            change_reason="password_change",
+            fingerprint=password_fingerprint("OldPassword123!", _KEY),
+        )
+
+        with patch(f"{_PATCH}.check_password_hash") as mock_check:
+            result = await password_history_repository.check_password_reuse(
+                async_session,
+                user_id=user.id,
+                new_password="OldPassword123!",
+                fingerprint=password_fingerprint("OldPassword123!", _KEY),
+            )
+
+        assert result is True
+        mock_check.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_fingerprint_checked_only_for_legacy_entries(
+        self,
+        async_session: AsyncSession,
+        user_factory,
+        password_history_repository: PasswordHistoryRepository,
+        password_hash_factory,
+    ) -> None:
+        """Entries without a fingerprint still get the full hash check."""
+        user = await user_factory()
+        legacy_hash = password_hash_factory("LegacyPassword123!")
+        await password_history_repository.save_password_to_history(
+            async_session,
+            user_id=user.id,
+            password_hash=password_hash_factory("OtherPassword123!"),
+            change_reason="password_change",
+            fingerprint=password_fingerprint("OtherPassword123!", _KEY),
+        )
+        await password_history_repository.save_password_to_history(
+            async_session,
+            user_id=user.id,
+            password_hash=legacy_hash,
+            change_reason="password_change",
+        )
+
+        with patch(f"{_PATCH}.check_password_hash", return_value=False) as mock_check:
+            result = await password_history_repository.check_password_reuse(
+                async_session,
+                user_id=user.id,
+                new_password="NewPassword123!",
+                fingerprint=password_fingerprint("NewPassword123!", _KEY),
+            )
+
+        assert result is False
+        mock_check.assert_called_once_with(legacy_hash, "NewPassword123!")
+
+    @pytest.mark.asyncio
+    async def test_timeout_is_undecided(
+        self,
+        async_session: AsyncSession,
+        user_factory,
+        password_history_repository: PasswordHistoryRepository,
+        password_hash_factory,
+    ) -> None:
+        """Hashes not checked within the budget leave the result undecided."""
+        user = await user_factory()
+        await password_history_repository.save_password_to_history(
+            async_session,
+            user_id=user.id,
+            password_hash=password_hash_factory("OldPassword123!"),
+            change_reason="password_change",
+        )
+
+        def _slow_check(pwhash: str, password: str) -> bool:
+            time.sleep(0.2)
+            return True
+
+        with patch(f"{_PATCH}.check_password_hash", side_effect=_slow_check):
+            result = await password_history_repository.check_password_reuse(
+                async_session,
+                user_id=user.id,
+                new_password="OldPassword123!",
+                timeout_seconds=0.01,
+            )
+
+        assert result is None
+
+    @pytest.mark.asyncio
+    async def test_first_match_returns_without_waiting_for_others(self) -> None:
+        """A match returns before slower checks finish."""
+
+        def _check(pwhash: str, password: str) -> bool:
+            if pwhash == "slow":
+                time.sleep(1.0)
+                return False
+            return pwhash == password
+
+        started = time.perf_counter()
+        with patch(f"{_PATCH}.check_password_hash", side_effect=_check):
+            result = await _any_hash_matches(["slow", "pw"], "pw", timeout_seconds=5.0)
+
+        assert result is True
+        assert time.perf_counter() - started < 0.5
+
+    @pytest.mark.asyncio
+    async def test_no_match(self) -> None:
+        with patch(f"{_PATCH}.check_password_hash", return_value=False):
+            assert await _any_hash_matches(["a", "b", "c"], "pw", 5.0) is False
+
+    @pytest.mark.asyncio
+    async def test_submits_at_most_one_check_per_worker(self) -> None:
+        """Checks are not queued beyond the workers once a match is found."""
+        checked: list[str] = []
+
+        def _check(pwhash: str, password: str) -> bool:
+            checked.append(pwhash)
+            if pwhash != password:
+                time.sleep(0.05)
+            return pwhash == password
+
+        hashes = ["pw"] + [f"other{i}" for i in range(3 * HASH_CHECK_WORKERS)]
+        with patch(f"{_PATCH}.check_password_hash", side_effect=_check):
+            result = await _any_hash_matches(hashes, "pw", timeout_seconds=5.0)
+
+        assert result is True
+        assert len(checked) <= HASH_CHECK_WORKERS
@@ -82,6 +82,24 @@ class TestRequestReset:
         assert outcome == RequestResetOutcome.ACCEPTED
         mock_user_repo.find_by_email.assert_not_called()
 
+    @pytest.mark.asyncio
+    async def test_reuse_check_timeout_rejects_change(self) -> None:
+        svc = PasswordResetService()
+        token = MagicMock()
+        token.is_valid.return_value = True
+        token.user_id = 42
+        with (
+            patch(f"{_PATCH}.get_asyncdb_session", return_value=_db_context()),
+            patch(f"{_PATCH}.password_reset_token_repo") as mock_token_repo,
+            patch(f"{_PATCH}.password_history_repo") as mock_history_repo,
+            patch(f"{_PATCH}.user_repo") as mock_user_repo,
+        ):
+            mock_token_repo.find_by_token = AsyncMock(return_value=token)
+            mock_history_repo.check_password_reuse = AsyncMock(return_value=None)
+            result = await svc.confirm_reset("tok", "StrongPass1!xx", "StrongPass1!xx")
+        assert result.outcome == ConfirmResetOutcome.REUSE_CHECK_TIMEOUT
+        mock_user_repo.find_by_id.assert_not_called()
+
     @pytest.mark.asyncio
     async def test_user_not_found_is_accepted_and_logged(self) -> None:
         svc = PasswordResetService()
@@ -381,6 +381,18 @@ class TestConfirmPasswordReset:
             _ = [c async for c in state.confirm_password_reset()]
         assert state.password_history_error != ""
 
+    @pytest.mark.asyncio
+    async def test_reuse_check_timeout_asks_to_retry(self) -> None:
+        state = _StubConfirmState()
+        state.new_password = "StrongPass1!xx"
+        state.confirm_password = "StrongPass1!xx"
+        state.token = "tok"
+        svc = _confirm_service(ConfirmResetOutcome.REUSE_CHECK_TIMEOUT)
+        with patch(f"{_PATCH}.get_password_reset_service", return_value=svc):
+            _ = [c async for c in state.confirm_password_reset()]
+        assert state.password_history_error == ""
+        assert state.is_loading is False
+
     @pytest.mark.asyncio
     async def test_successful_reset(self) -> None:
         state = _StubConfirmState()
@@ -0,0 +1,55 @@
+"""Tests for Permissions."""
+
+from types import SimpleNamespace
+
+from appkit_user.authentication.backend.models import User
+from appkit_user.authentication.backend.permissions import (
+    NO_PERMISSIONS,
+    Permissions,
+)
+
+
+class TestPermissions:
+    def test_for_user(self) -> None:
+        user = User(user_id=1, roles=["a", "b", "a"])
+
+        permissions = Permissions.for_user(user)
+
+        assert permissions.roles == frozenset({"a", "b"})
+
+    def test_for_no_user(self) -> None:
+        assert Permissions.for_user(None) is NO_PERMISSIONS
+        assert not NO_PERMISSIONS.has_role("a")
+
+    def test_has_role(self) -> None:
+        permissions = Permissions(frozenset({"a"}))
+
+        assert permissions.has_role("a")
+        assert not permissions.has_role("b")
+        # No requirement
+        assert permissions.has_role(None)
+        assert permissions.has_role("")
+
+    def test_admin_needs_roles_too(self) -> None:
+        user = User(user_id=1, roles=[], is_admin=True)
+
+        assert not Permissions.for_user(user).has_role("a")
+
+    def test_filter_by_role_keeps_order(self) -> None:
+        items = [
+            SimpleNamespace(name="open", required_role=None),
+            SimpleNamespace(name="gated", required_role="b"),
+            SimpleNamespace(name="allowed", required_role="a"),
+        ]
+
+        filtered = Permissions(frozenset({"a"})).filter_by_role(
+            items, lambda item: item.required_role
+        )
+
+        assert [item.name for item in filtered] == ["open", "allowed"]
+
+    def test_equal_role_sets_are_equal(self) -> None:
+        first = Permissions.for_user(User(user_id=1, roles=["a", "b"]))
+        second = Permissions.for_user(User(user_id=2, roles=["b", "a"]))
+
+        assert first == second
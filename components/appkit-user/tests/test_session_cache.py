@@ -0,0 +1,153 @@
+"""Tests for SessionValidationCache."""
+
+from datetime import UTC, datetime, timedelta
+from unittest.mock import MagicMock, patch
+
+from appkit_user.authentication.backend.models import User
+from appkit_user.authentication.backend.session_cache import (
+    SessionValidationCache,
+    configure_session_cache,
+)
+
+_PATCH = "appkit_user.authentication.backend.session_cache"
+
+
+def _user(user_id: int = 1) -> User:
+    return User(user_id=user_id, name=f"user{user_id}", email=f"u{user_id}@x.de")
+
+
+class TestSessionValidationCache:
+    def test_miss_then_hit(self) -> None:
+        cache = SessionValidationCache()
+        assert cache.get("s1") is None
+
+        cache.put("s1", _user())
+        cached = cache.get("s1")
+
+        assert cached is not None
+        assert cached.user.user_id == 1
+        assert cache.stats.hits == 1
+        assert cache.stats.misses == 1
+        assert cache.stats.hit_rate == 0.5
+
+    def test_entry_expires_after_ttl(self) -> None:
+        cache = SessionValidationCache(ttl_seconds=30)
+        with patch(f"{_PATCH}.time.monotonic", return_value=100.0):
+            cache.put("s1", _user())
+        with patch(f"{_PATCH}.time.monotonic", return_value=129.0):
+            assert cache.get("s1") is not None
+        with patch(f"{_PATCH}.time.monotonic", return_value=130.0):
+            assert cache.get("s1") is None
+        assert len(cache) == 0
+
+    def test_ttl_capped_by_session_expiry(self) -> None:
+        cache = SessionValidationCache(ttl_seconds=30)
+        expires_at = datetime.now(UTC) + timedelta(seconds=5)
+        with patch(f"{_PATCH}.time.monotonic", return_value=100.0):
+            cache.put("s1", _user(), expires_at)
+        with patch(f"{_PATCH}.time.monotonic", return_value=106.0):
+            assert cache.get("s1") is None
+
+    def test_expired_session_not_cached(self) -> None:
+        cache = SessionValidationCache()
+        cache.put("s1", _user(), datetime.now(UTC) - timedelta(seconds=1))
+        assert len(cache) == 0
+
+    def test_naive_expiry_treated_as_utc(self) -> None:
+        cache = SessionValidationCache()
+        expires_at = datetime.now(UTC).replace(tzinfo=None) + timedelta(hours=1)
+        cache.put("s1", _user(), expires_at)
+        assert cache.get("s1") is not None
+
+    def test_negative_entries_use_short_ttl(self) -> None:
+        cache = SessionValidationCache(ttl_seconds=30, negative_ttl_seconds=5)
+        with patch(f"{_PATCH}.time.monotonic", return_value=100.0):
+            cache.put("unknown", None)
+        with patch(f"{_PATCH}.time.monotonic", return_value=104.0):
+            cached = cache.get("unknown")
+            assert cached is not None
+            assert cached.user is None
+        with patch(f"{_PATCH}.time.monotonic", return_value=105.0):
+            assert cache.get("unknown") is None
+        assert cache.stats.negative_hits == 1
+
+    def test_evicts_least_recently_used(self) -> None:
+        cache = SessionValidationCache(max_entries=2)
+        cache.put("s1", _user(1))
+        cache.put("s2", _user(2))
+        cache.get("s1")
+        cache.put("s3", _user(3))
+
+        assert cache.get("s2") is None
+        assert cache.get("s1") is not None
+        assert cache.get("s3") is not None
+
+    def test_invalidate(self) -> None:
+        cache = SessionValidationCache()
+        cache.put("s1", _user())
+        cache.invalidate("s1")
+        cache.invalidate("missing")
+
+        assert cache.get("s1") is None
+        assert cache.stats.invalidations == 1
+
+    def test_invalidate_user_drops_all_sessions(self) -> None:
+        cache = SessionValidationCache()
+        cache.put("s1", _user(1))
+        cache.put("s2", _user(1))
+        cache.put("s3", _user(2))
+
+        cache.invalidate_user(1)
+
+        assert cache.get("s1") is None
+        assert cache.get("s2") is None
+        assert cache.get("s3") is not None
+
+    def test_replacing_entry_updates_user_index(self) -> None:
+        cache = SessionValidationCache()
+        cache.put("s1", _user(1))
+        cache.put("s1", None)
+
+        cache.invalidate_user(1)
+
+        cached = cache.get("s1")
+        assert cached is not None
+        assert cached.user is None
+
+    def test_entry_holds_compiled_permissions(self) -> None:
+        cache = SessionValidationCache()
+        cache.put("s1", User(user_id=1, roles=["a"]))
+        cache.put("s2", None)
+
+        assert cache.get("s1").permissions.has_role("a")
+        assert cache.get("s2").permissions.roles == frozenset()
+
+    def test_peek_does_not_count_lookups(self) -> None:
+        cache = SessionValidationCache(ttl_seconds=30)
+        with patch(f"{_PATCH}.time.monotonic", return_value=100.0):
+            cache.put("s1", _user())
+        with patch(f"{_PATCH}.time.monotonic", return_value=110.0):
+            assert cache.peek("s1") is not None
+            assert cache.peek("missing") is None
+        with patch(f"{_PATCH}.time.monotonic", return_value=130.0):
+            assert cache.peek("s1") is None
+        assert cache.stats.hits == cache.stats.misses == 0
+
+    def test_clear(self) -> None:
+        cache = SessionValidationCache()
+        cache.put("s1", _user())
+        cache.clear()
+        assert len(cache) == 0
+        cache.invalidate_user(1)
+
+
+def test_configure_session_cache_applies_ttls() -> None:
+    cache = SessionValidationCache()
+    config = MagicMock(
+        session_cache_ttl_seconds=60, session_cache_negative_ttl_seconds=1
+    )
+
+    with patch(f"{_PATCH}.get_session_cache", return_value=cache):
+        configure_session_cache(config)
+
+    assert (cache.ttl_seconds, cache.negative_ttl_seconds) == (60, 1)
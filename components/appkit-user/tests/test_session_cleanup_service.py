@@ -6,6 +6,7 @@ from unittest.mock import AsyncMock, MagicMock, patch
 import pytest
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from appkit_commons.database.purge import PurgeResult
 from appkit_commons.scheduler import IntervalTrigger
 from appkit_user.authentication.backend.database.user_session_repository import (
     session_repo,
@@ -13,6 +14,7 @@ from appkit_user.authentication.backend.database.user_session_repository import
 from appkit_user.authentication.backend.services import (
     SessionCleanupService,
 )
+from appkit_user.configuration import SessionCleanupConfig
 
 CLEANUP_SERVICE_PATH = (
     "appkit_user.authentication.backend.services.session_cleanup_service"
@@ -53,147 +55,102 @@ class TestSessionCleanupService:
         # IntervalTrigger stores interval as a timedelta
         assert trigger.interval.total_seconds() == 45 * 60  # 45 minutes in seconds
 
-    @pytest.mark.asyncio
-    @patch(f"{CLEANUP_SERVICE_PATH}.get_asyncdb_session")
-    @patch(f"{CLEANUP_SERVICE_PATH}.session_repo")
-    async def test_execute_cleans_expired_sessions(
-        self, mock_session_repo: MagicMock, mock_get_session: MagicMock
-    ) -> None:
-        """execute calls delete_expired on session repository."""
-        # Arrange
-        mock_session = AsyncMock(spec=AsyncSession)
-        mock_get_session.return_value.__aenter__.return_value = mock_session
-        mock_session_repo.delete_expired = AsyncMock(return_value=5)
+    def test_initialization_from_config(self) -> None:
+        """Interval and batch settings are taken from the config."""
+        config = SessionCleanupConfig(interval_minutes=5, batch_size=10)
 
-        service = SessionCleanupService()
+        service = SessionCleanupService(config=config)
 
-        # Act
-        await service.execute()
+        assert service.interval_minutes == 5
+        assert service.config.batch_size == 10
 
-        # Assert
-        mock_session_repo.delete_expired.assert_called_once_with(mock_session)
+    def test_reads_reloaded_config(self) -> None:
+        """Without an explicit config, the registered one is read on access."""
+        registry = MagicMock()
+        registry.has.return_value = True
+        registry.get.return_value.session_cleanup = SessionCleanupConfig(batch_size=10)
+        with patch(f"{CLEANUP_SERVICE_PATH}.service_registry", return_value=registry):
+            service = SessionCleanupService()
+            registry.get.return_value.session_cleanup = SessionCleanupConfig(
+                batch_size=20
+            )
+
+            assert service.config.batch_size == 20
+
+    def test_targets_cover_auth_tables(self) -> None:
+        """Sessions, OAuth states and password reset data are purged."""
+        names = [target.name for target in SessionCleanupService().targets()]
+
+        assert names == [
+            "user sessions",
+            "OAuth states",
+            "password reset tokens",
+            "password reset requests",
+        ]
 
     @pytest.mark.asyncio
-    @patch(f"{CLEANUP_SERVICE_PATH}.get_asyncdb_session")
-    @patch(f"{CLEANUP_SERVICE_PATH}.session_repo")
-    @patch(f"{CLEANUP_SERVICE_PATH}.logger")
-    async def test_execute_logs_cleanup_count(
-        self,
-        mock_logger: MagicMock,
-        mock_session_repo: MagicMock,
-        mock_get_session: MagicMock,
+    @patch(f"{CLEANUP_SERVICE_PATH}.purge_in_batches")
+    async def test_execute_purges_in_configured_batches(
+        self, mock_purge: AsyncMock
     ) -> None:
-        """execute logs number of cleaned sessions."""
-        # Arrange
-        mock_session = AsyncMock(spec=AsyncSession)
-        mock_get_session.return_value.__aenter__.return_value = mock_session
-        mock_session_repo.delete_expired = AsyncMock(return_value=10)
-
-        service = SessionCleanupService()
+        """execute passes the batch settings and returns the purged total."""
+        mock_purge.return_value = [
+            PurgeResult("user sessions", purged=5, batches=1, complete=True),
+            PurgeResult("OAuth states", purged=2, batches=1, complete=True),
+        ]
+        config = SessionCleanupConfig(
+            batch_size=100, batch_pause_seconds=0.5, time_budget_seconds=30
+        )
+        service = SessionCleanupService(config=config)
 
-        # Act
-        await service.execute()
+        count = await service.execute()
 
-        # Assert
-        mock_logger.info.assert_any_call("Running session cleanup job")
-        mock_logger.info.assert_any_call("Cleaned up %d expired user sessions", 10)
+        assert count == 7
+        assert service.last_results == mock_purge.return_value
+        kwargs = mock_purge.call_args.kwargs
+        assert kwargs["batch_size"] == 100
+        assert kwargs["pause_seconds"] == 0.5
+        assert kwargs["time_budget_seconds"] == 30
 
     @pytest.mark.asyncio
-    @patch(f"{CLEANUP_SERVICE_PATH}.get_asyncdb_session")
-    @patch(f"{CLEANUP_SERVICE_PATH}.session_repo")
+    @patch(f"{CLEANUP_SERVICE_PATH}.purge_in_batches")
     @patch(f"{CLEANUP_SERVICE_PATH}.logger")
-    async def test_execute_does_not_log_when_no_sessions_cleaned(
-        self,
-        mock_logger: MagicMock,
-        mock_session_repo: MagicMock,
-        mock_get_session: MagicMock,
+    async def test_execute_logs_counts_and_backlog(
+        self, mock_logger: MagicMock, mock_purge: AsyncMock
     ) -> None:
-        """execute does not log cleanup count when zero sessions deleted."""
-        # Arrange
-        mock_session = AsyncMock(spec=AsyncSession)
-        mock_get_session.return_value.__aenter__.return_value = mock_session
-        mock_session_repo.delete_expired = AsyncMock(return_value=0)
+        """execute logs purged counts and warns about a backlog."""
+        mock_purge.return_value = [
+            PurgeResult("user sessions", purged=10, batches=2, backlog=4),
+            PurgeResult("OAuth states", complete=True),
+        ]
 
-        service = SessionCleanupService()
-
-        # Act
-        await service.execute()
+        await SessionCleanupService().execute()
 
-        # Assert
-        mock_logger.info.assert_called_once_with("Running session cleanup job")
-        # Should not log "Cleaned up X sessions" when count is 0
+        assert mock_logger.info.call_count == 2
+        call_args = mock_logger.info.call_args_list[1]
+        assert call_args[0][0] == "Cleaned up %d expired %s in %d batches (%.1fs)"
+        assert call_args[0][1:4] == (10, "user sessions", 2)
+        mock_logger.warning.assert_called_once_with(
+            "Session cleanup ran out of time, %d expired %s left",
+            4,
+            "user sessions",
+        )
 
     @pytest.mark.asyncio
-    @patch(f"{CLEANUP_SERVICE_PATH}.get_asyncdb_session")
-    @patch(f"{CLEANUP_SERVICE_PATH}.session_repo")
+    @patch(f"{CLEANUP_SERVICE_PATH}.purge_in_batches")
     @patch(f"{CLEANUP_SERVICE_PATH}.logger")
     async def test_execute_handles_exceptions(
-        self,
-        mock_logger: MagicMock,
-        mock_session_repo: MagicMock,
-        mock_get_session: MagicMock,
+        self, mock_logger: MagicMock, mock_purge: AsyncMock
     ) -> None:
-        """execute catches and logs exceptions."""
-        # Arrange
-        mock_session = AsyncMock(spec=AsyncSession)
-        mock_get_session.return_value.__aenter__.return_value = mock_session
+        """execute logs and re-raises exceptions."""
         error = Exception("Database connection failed")
-        mock_session_repo.delete_expired = AsyncMock(side_effect=error)
-
-        service = SessionCleanupService()
+        mock_purge.side_effect = error
 
-        # Act - should not raise
-        await service.execute()
+        with pytest.raises(Exception, match="Database connection failed"):
+            await SessionCleanupService().execute()
 
-        # Assert
         mock_logger.error.assert_called_once_with("Session cleanup failed: %s", error)
 
-    @pytest.mark.asyncio
-    @patch(f"{CLEANUP_SERVICE_PATH}.get_asyncdb_session")
-    @patch(f"{CLEANUP_SERVICE_PATH}.session_repo")
-    async def test_execute_session_context_manager(
-        self, mock_session_repo: MagicMock, mock_get_session: MagicMock
-    ) -> None:
-        """execute properly uses session context manager."""
-        # Arrange
-        mock_session = AsyncMock(spec=AsyncSession)
-        mock_context = MagicMock()
-        mock_context.__aenter__ = AsyncMock(return_value=mock_session)
-        mock_context.__aexit__ = AsyncMock(return_value=None)
-        mock_get_session.return_value = mock_context
-        mock_session_repo.delete_expired = AsyncMock(return_value=3)
-
-        service = SessionCleanupService()
-
-        # Act
-        await service.execute()
-
-        # Assert
-        mock_context.__aenter__.assert_called_once()
-        mock_context.__aexit__.assert_called_once()
-
-    @pytest.mark.asyncio
-    @patch(f"{CLEANUP_SERVICE_PATH}.get_asyncdb_session")
-    @patch(f"{CLEANUP_SERVICE_PATH}.session_repo")
-    async def test_execute_multiple_calls(
-        self, mock_session_repo: MagicMock, mock_get_session: MagicMock
-    ) -> None:
-        """execute can be called multiple times."""
-        # Arrange
-        mock_session = AsyncMock(spec=AsyncSession)
-        mock_get_session.return_value.__aenter__.return_value = mock_session
-        mock_session_repo.delete_expired = AsyncMock(side_effect=[5, 3, 0])
-
-        service = SessionCleanupService()
-
-        # Act
-        await service.execute()
-        await service.execute()
-        await service.execute()
-
-        # Assert
-        assert mock_session_repo.delete_expired.call_count == 3
-
     def test_job_id_is_constant(self) -> None:
         """job_id is a constant class attribute."""
         # Act
@@ -226,34 +183,6 @@ class TestSessionCleanupService:
         assert trigger1.interval.total_seconds() == 10 * 60  # 10 minutes in seconds
         assert trigger2.interval.total_seconds() == 60 * 60  # 60 minutes in seconds
 
-    @pytest.mark.asyncio
-    @patch(f"{CLEANUP_SERVICE_PATH}.get_asyncdb_session")
-    @patch(f"{CLEANUP_SERVICE_PATH}.session_repo")
-    @patch(f"{CLEANUP_SERVICE_PATH}.logger")
-    async def test_execute_logs_with_proper_format(
-        self,
-        mock_logger: MagicMock,
-        mock_session_repo: MagicMock,
-        mock_get_session: MagicMock,
-    ) -> None:
-        """execute uses parameterized logging (not f-strings)."""
-        # Arrange
-        mock_session = AsyncMock(spec=AsyncSession)
-        mock_get_session.return_value.__aenter__.return_value = mock_session
-        mock_session_repo.delete_expired = AsyncMock(return_value=7)
-
-        service = SessionCleanupService()
-
-        # Act
-        await service.execute()
-
-        # Assert - Verify logger.info was called with % formatting
-        assert mock_logger.info.call_count == 2
-        # Check second call (cleanup count log)
-        call_args = mock_logger.info.call_args_list[1]
-        assert call_args[0][0] == "Cleaned up %d expired user sessions"
-        assert call_args[0][1] == 7
-
     @pytest.mark.asyncio
     async def test_execute_integration_with_real_session(
         self, async_session: AsyncSession, session_factory
@@ -291,3 +220,33 @@ class TestSessionCleanupService:
         assert found_expired1 is None
         assert found_expired2 is None
         assert found_valid is not None
+
+    @pytest.mark.asyncio
+    async def test_execute_integration_batches_all_tables(
+        self, async_session: AsyncSession, session_factory, oauth_state_factory
+    ) -> None:
+        """Expired rows of all tables are purged batch by batch."""
+        expired_time = datetime.now(UTC) - timedelta(hours=1)
+        for i in range(3):
+            await session_factory(session_id=f"expired_{i}", expires_at=expired_time)
+        await session_factory(session_id="valid")
+        await oauth_state_factory(expires_at=expired_time)
+        await oauth_state_factory()
+
+        with patch(f"{CLEANUP_SERVICE_PATH}.get_asyncdb_session") as mock_get_session:
+            mock_context = MagicMock()
+            mock_context.__aenter__ = AsyncMock(return_value=async_session)
+            mock_context.__aexit__ = AsyncMock(return_value=None)
+            mock_get_session.return_value = mock_context
+
+            service = SessionCleanupService(
+                config=SessionCleanupConfig(batch_size=2, batch_pause_seconds=0)
+            )
+            count = await service.execute()
+
+        assert count == 4
+        sessions, states = service.last_results[:2]
+        assert (sessions.purged, sessions.batches, sessions.complete) == (3, 2, True)
+        assert (states.purged, states.batches) == (1, 1)
+        assert await session_repo.count(async_session) == 1
+        assert await session_repo.count_expired(async_session) == 0
@@ -570,6 +570,60 @@ class TestUserRepository:
         assert len(users) == 2
         # Should skip first user alphabetically
 
+    @pytest.mark.asyncio
+    async def test_find_page_keyset(
+        self, async_session: AsyncSession, user_factory, user_repository
+    ) -> None:
+        """find_page continues after the (email, id) cursor."""
+        for email in ("c@example.com", "a@example.com", "b@example.com"):
+            await user_factory(email=email)
+
+        first = await user_repository.find_page(async_session, limit=2)
+        cursor = (first[-1].email, first[-1].user_id)
+        second = await user_repository.find_page(async_session, limit=2, after=cursor)
+
+        assert [u.email for u in first] == ["a@example.com", "b@example.com"]
+        assert [u.email for u in second] == ["c@example.com"]
+        assert first[0].user_id > 0
+        assert first[0].roles == []
+
+    @pytest.mark.asyncio
+    async def test_find_page_search(
+        self, async_session: AsyncSession, user_factory, user_repository
+    ) -> None:
+        """find_page matches substrings of name or email, case-insensitively."""
+        await user_factory(email="alice@example.com", name="Alice Smith")
+        await user_factory(email="bob@example.com", name="Bob Jones")
+        await user_factory(email="carol@other.org", name="Carol")
+
+        by_name = await user_repository.find_page(async_session, search="SMITH")
+        by_email = await user_repository.find_page(async_session, search="example")
+
+        assert [u.email for u in by_name] == ["alice@example.com"]
+        assert len(by_email) == 2
+        assert await user_repository.count_matching(async_session, "example") == 2
+
+    @pytest.mark.asyncio
+    async def test_find_page_search_escapes_wildcards(
+        self, async_session: AsyncSession, user_factory, user_repository
+    ) -> None:
+        await user_factory(email="a_b@example.com")
+        await user_factory(email="axb@example.com")
+
+        users = await user_repository.find_page(async_session, search="a_b")
+
+        assert [u.email for u in users] == ["a_b@example.com"]
+        assert await user_repository.find_page(async_session, search="%") == []
+
+    @pytest.mark.asyncio
+    async def test_count_matching_all(
+        self, async_session: AsyncSession, user_factory, user_repository
+    ) -> None:
+        await user_factory()
+        await user_factory()
+
+        assert await user_repository.count_matching(async_session) == 2
+
     @pytest.mark.asyncio
     async def test_get_or_create_oauth_user_creates_new_user(
         self,
@@ -7,6 +7,7 @@ modal management, pagination, and auth-decorated flows.
 
 from __future__ import annotations
 
+from collections.abc import Iterator
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
@@ -50,6 +51,9 @@ class _StubUserState:
 
     def __init__(self, *, authenticated: bool = True, is_admin: bool = True) -> None:
         self.users: list[User] = []
+        self.total_users: int = 0
+        self.has_more_users: bool = False
+        self._users_cursor: tuple[str, int] | None = None
         self.selected_user: User | None = None
         self.is_loading: bool = False
         self.available_roles: list[dict[str, str]] = []
@@ -80,8 +84,13 @@ class _StubUserState:
     select_user_and_open_edit = _unwrap("select_user_and_open_edit")
     set_available_roles = _unwrap("set_available_roles")
     _get_selected_roles = _unwrap("_get_selected_roles")
+
+    async def _current_admin_id(self) -> int:
+        return 1
+
     _load_users = _unwrap("_load_users")
     load_users = _unwrap("load_users")
+    load_more_users = _unwrap("load_more_users")
     create_user = _unwrap("create_user")
     update_user = _unwrap("update_user")
     delete_user = _unwrap("delete_user")
@@ -101,31 +110,65 @@ def _db_context():
     return cm
 
 
-class TestFilteredUsers:
-    def test_no_filter(self) -> None:
-        state = _make_state()
-        state.users = [_user(), _user(2, "Bob", "bob@x.com")]
-        assert len(_CV["filtered_users"].fget(state)) == 2
+@pytest.fixture(autouse=True)
+def mock_read_session() -> Iterator[MagicMock]:
+    with (
+        patch(f"{_PATCH}.get_asyncdb_read_session", return_value=_db_context()) as m,
+        patch(f"{_PATCH}.mark_user_write"),
+    ):
+        yield m
+
+
+def _page_repo(mock_repo: MagicMock, *pages: list[User], total: int = 0) -> None:
+    mock_repo.find_page = AsyncMock(side_effect=list(pages))
+    mock_repo.count_matching = AsyncMock(return_value=total)
 
-    def test_filter_by_name(self) -> None:
+
+class TestUserPages:
+    @pytest.mark.asyncio
+    async def test_first_page(self) -> None:
         state = _make_state()
-        state.users = [_user(), _user(2, "Bob", "bob@x.com")]
-        state.search_filter = "alice"
-        result = _CV["filtered_users"].fget(state)
-        assert len(result) == 1
-        assert result[0].name == "Alice"
+        with patch(f"{_PATCH}.user_repo") as mock_repo:
+            _page_repo(mock_repo, [_user(), _user(2, "Bob", "bob@x.com")], total=2)
+            await state._load_users()
+
+        assert [u.user_id for u in state.users] == [1, 2]
+        assert state.total_users == 2
+        assert state.has_more_users is False
+        assert state._users_cursor == ("bob@x.com", 2)
+        _, kwargs = mock_repo.find_page.await_args
+        assert kwargs["after"] is None
 
-    def test_filter_by_email(self) -> None:
+    @pytest.mark.asyncio
+    async def test_load_more_appends_after_cursor(self) -> None:
         state = _make_state()
-        state.users = [_user(), _user(2, "Bob", "bob@x.com")]
-        state.search_filter = "bob@"
-        assert len(_CV["filtered_users"].fget(state)) == 1
+        first = [_user(i, f"U{i}", f"u{i:03}@x.com") for i in range(1, 52)]
+        second = [_user(60, "Last", "z@x.com")]
+        with (
+            patch(f"{_PATCH}.user_repo") as mock_repo,
+            patch(f"{_PATCH}.USER_PAGE_SIZE", 50),
+        ):
+            _page_repo(mock_repo, first, second, total=51)
+            await state._load_users()
+            assert state.has_more_users is True
+            assert len(state.users) == 50
+
+            await state.load_more_users()
 
-    def test_no_match(self) -> None:
+        assert len(state.users) == 51
+        assert state.users[-1].email == "z@x.com"
+        assert state.has_more_users is False
+        _, kwargs = mock_repo.find_page.await_args
+        assert kwargs["after"] == ("u050@x.com", 50)
+        mock_repo.count_matching.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_load_more_without_more_pages(self) -> None:
         state = _make_state()
-        state.users = [_user()]
-        state.search_filter = "zzz"
-        assert len(_CV["filtered_users"].fget(state)) == 0
+        with patch(f"{_PATCH}.user_repo") as mock_repo:
+            _page_repo(mock_repo)
+            await state.load_more_users()
+        mock_repo.find_page.assert_not_awaited()
 
 
 class TestModals:
@@ -147,10 +190,21 @@ class TestModals:
 
 
 class TestSetSearchFilter:
-    def test_updates(self) -> None:
+    @pytest.mark.asyncio
+    async def test_reloads_first_page(self) -> None:
         state = _make_state()
-        state.set_search_filter("test")
-        assert state.search_filter == "test"
+        state.users = [_user(), _user(2, "Bob", "bob@x.com")]
+        state._users_cursor = ("bob@x.com", 2)
+        with patch(f"{_PATCH}.user_repo") as mock_repo:
+            _page_repo(mock_repo, [_user(2, "Bob", "bob@x.com")], total=1)
+            await state.set_search_filter("bob")
+
+        assert state.search_filter == "bob"
+        assert [u.user_id for u in state.users] == [2]
+        assert state.total_users == 1
+        args, kwargs = mock_repo.find_page.await_args
+        assert args[1] == "bob"
+        assert kwargs["after"] is None
 
 
 class TestSetAvailableRoles:
@@ -188,12 +242,11 @@ class TestLoadUsersInternal:
     @pytest.mark.asyncio
     async def test_loads(self) -> None:
         state = _make_state()
-        entities = [_user_entity(1, "Alice"), _user_entity(2, "Bob")]
         with (
             patch(f"{_PATCH}.get_asyncdb_session", return_value=_db_context()),
             patch(f"{_PATCH}.user_repo") as mock_repo,
         ):
-            mock_repo.find_all_paginated = AsyncMock(return_value=entities)
+            _page_repo(mock_repo, [_user(), _user(2, "Bob", "bob@x.com")])
             await state._load_users()
         assert len(state.users) == 2
 
@@ -206,7 +259,7 @@ class TestLoadUsers:
             patch(f"{_PATCH}.get_asyncdb_session", return_value=_db_context()),
             patch(f"{_PATCH}.user_repo") as mock_repo,
         ):
-            mock_repo.find_all_paginated = AsyncMock(return_value=[])
+            _page_repo(mock_repo, [])
             _ = [c async for c in state.load_users()]
         assert state.is_loading is False
 
@@ -227,7 +280,7 @@ class TestCreateUser:
             patch(f"{_PATCH}.user_repo") as mock_repo,
         ):
             mock_repo.create_new_user = AsyncMock()
-            mock_repo.find_all_paginated = AsyncMock(return_value=[])
+            _page_repo(mock_repo, [])
             _ = [c async for c in state.create_user(form_data)]
         assert state.add_modal_open is False
 
@@ -271,7 +324,7 @@ class TestUpdateUser:
             patch(f"{_PATCH}.user_repo") as mock_repo,
         ):
             mock_repo.update_from_model = AsyncMock()
-            mock_repo.find_all_paginated = AsyncMock(return_value=[])
+            _page_repo(mock_repo, [])
             _ = [c async for c in state.update_user(form_data)]
         assert state.edit_modal_open is False
 
@@ -329,7 +382,7 @@ class TestDeleteUser:
         ):
             mock_repo.find_by_id = AsyncMock(return_value=_user_entity())
             mock_repo.delete_by_id = AsyncMock(return_value=True)
-            mock_repo.find_all_paginated = AsyncMock(return_value=[])
+            _page_repo(mock_repo, [])
             _ = [c async for c in state.delete_user(1)]
         assert state.is_loading is False
 